@@ -0,0 +1,76 @@
+"""Add document_manifest tables for scanner deletion tracking.
+
+Every incremental scan used to learn which documents a user has indexed by
+scrolling Qdrant: one point per note/deck card/news item/mail message, and
+*every chunk* of every readable file. That scroll dominated scanner CPU and
+Qdrant load for users with tens of thousands of chunks, and it ran whether or
+not anything had changed. ``document_manifest`` keeps one compact row per
+(user, document) instead — written by the processor (and the scanner's dedup
+claim) as documents are indexed and released — so the scanner diffs Nextcloud
+against a keyed SQL read rather than the vector store.
+
+Qdrant stays the system of record. ``document_manifest_seeds`` records when a
+user's manifest for one doc_type was last rebuilt from a Qdrant scroll; the
+scanner only trusts the manifest while that reconcile is younger than
+``VECTOR_SYNC_MANIFEST_RECONCILE_INTERVAL``, which both seeds existing
+deployments on upgrade and bounds any drift from a failed best-effort write.
+
+Portable types only (Text + unix-epoch BigInteger), like ``document_paths``
+(migration 009), so the same migration runs on self-host SQLite and cloud
+Postgres.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "document_manifest",
+        # User-leading natural key: the scanner reads "all of one user's
+        # documents of one type", and the processor upserts one row, so the PK
+        # serves both and doubles as the ON CONFLICT target.
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("doc_type", sa.Text(), nullable=False),
+        sa.Column("doc_id", sa.Text(), nullable=False),
+        # Change token and source mtime as of the last index (empty / 0 when
+        # unknown, e.g. rows seeded from a Qdrant scroll).
+        sa.Column("etag", sa.Text(), nullable=False),
+        sa.Column("modified_at", sa.BigInteger(), nullable=False),
+        # "hybrid" or "keyword" (payload_keys.INDEX_MODE_*); files only differ.
+        sa.Column("index_mode", sa.Text(), nullable=False),
+        # Chunks written on the last index; NULL when not known (dedup claim,
+        # seeded rows).
+        sa.Column("chunk_count", sa.BigInteger(), nullable=True),
+        # Unix-epoch seconds of the last write. A reconcile keeps rows written
+        # after its scroll started, so a concurrent index is never dropped.
+        sa.Column("updated_at", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "user_id", "doc_type", "doc_id", name="pk_document_manifest"
+        ),
+    )
+    op.create_table(
+        "document_manifest_seeds",
+        sa.Column("user_id", sa.Text(), nullable=False),
+        sa.Column("doc_type", sa.Text(), nullable=False),
+        # Unix-epoch seconds at which the reconciling Qdrant scroll started.
+        sa.Column("seeded_at", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "user_id", "doc_type", name="pk_document_manifest_seeds"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("document_manifest_seeds")
+    op.drop_table("document_manifest")
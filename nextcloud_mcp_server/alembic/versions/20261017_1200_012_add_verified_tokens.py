@@ -0,0 +1,46 @@
+"""Add verified_tokens table for the shared token-verification cache.
+
+Every replica used to verify each bearer token on its own — a JWKS check,
+an introspection call or (for opaque cross-client tokens) a userinfo
+round-trip per pod. With ``TOKEN_VERIFY_CACHE_SHARED`` the verifier writes
+each successful verification here, keyed on the SHA-256 of the token (never
+the token itself), so the other replicas find it warm. ``expires_at`` is the
+moment the verifying replica would have dropped its own cache entry; rows
+past it are ignored and swept.
+
+Portable types only (Text + unix-epoch BigInteger), like ``document_paths``
+(migration 009), so the same migration runs on self-host SQLite and cloud
+Postgres.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "verified_tokens",
+        # The verifier's cache key: a hex SHA-256 of the token, "mgmt:"-prefixed
+        # for management-API verifications (which skip the audience check).
+        sa.Column("cache_key", sa.Text(), nullable=False),
+        # JSON of the validated claims, as cached in-process.
+        sa.Column("claims", sa.Text(), nullable=False),
+        sa.Column("expires_at", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key", name="pk_verified_tokens"),
+    )
+    op.create_index("idx_verified_tokens_expires_at", "verified_tokens", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_verified_tokens_expires_at", table_name="verified_tokens")
+    op.drop_table("verified_tokens")
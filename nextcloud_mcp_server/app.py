@@ -6,7 +6,7 @@ import logging
 import os
 import time
 import traceback
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import AsyncExitStack, asynccontextmanager
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, cast
@@ -62,6 +62,7 @@ from nextcloud_mcp_server.auth.browser_oauth_routes import (
     oauth_logout,
 )
 from nextcloud_mcp_server.auth.client_registration import ensure_oauth_client
+from nextcloud_mcp_server.auth.credential_cache import credential_invalidation_listener
 from nextcloud_mcp_server.auth.oauth_routes import (
     oauth_as_metadata,
     oauth_authorize,
@@ -85,6 +86,7 @@ from nextcloud_mcp_server.auth.userinfo_routes import (
     vector_sync_status_fragment,
 )
 from nextcloud_mcp_server.client import NextcloudClient
+from nextcloud_mcp_server.client.pool import close_client_pool
 from nextcloud_mcp_server.config import (
     Settings,
     get_document_processor_config,
@@ -119,6 +121,7 @@ from nextcloud_mcp_server.server import (
 )
 from nextcloud_mcp_server.server.auth_tools import register_auth_tools
 from nextcloud_mcp_server.server.oauth_tools import register_oauth_tools
+from nextcloud_mcp_server.vector.bulk_load import bulk_load_task
 from nextcloud_mcp_server.vector.metrics_publisher import (
     usage_stock_task,
     vector_density_snapshot_task,
@@ -134,7 +137,9 @@ from nextcloud_mcp_server.vector.placeholder import sweep_orphan_placeholders
 from nextcloud_mcp_server.vector.processor import processor_task
 from nextcloud_mcp_server.vector.qdrant_client import get_qdrant_client
 from nextcloud_mcp_server.vector.queue import build_transport
+from nextcloud_mcp_server.vector.scan_scheduler import ScanScheduler
 from nextcloud_mcp_server.vector.scanner import scanner_task
+from nextcloud_mcp_server.vector.webhook_coalescer import WebhookCoalescer
 from nextcloud_mcp_server.vector.webhook_receiver import handle_nextcloud_webhook
 
 if TYPE_CHECKING:
@@ -467,6 +472,29 @@ def _wire_vector_sync_state(
             break
 
 
+def _publish_webhook_coalescer(
+    app: Starlette,
+    producer: "TaskProducer",
+    scan_waker: Callable[[str], bool] | None = None,
+) -> WebhookCoalescer | None:
+    """Build the webhook debounce buffer and publish it on ``app.state``.
+
+    The receiver buffers tasks there instead of sending them straight to the
+    producer (see vector/webhook_coalescer.py). Returns ``None`` when webhooks
+    are not mounted (no ``WEBHOOK_SECRET``) or the window is 0; the receiver
+    then sends directly. The caller starts ``run`` in its task group and awaits
+    ``close`` in teardown before the transport is closed.
+    """
+    settings = get_settings()
+    coalescer = None
+    if settings.webhook_secret and settings.webhook_coalesce_window_seconds > 0:
+        coalescer = WebhookCoalescer.from_settings(
+            producer, settings, scan_waker=scan_waker
+        )
+    app.state.webhook_coalescer = coalescer
+    return coalescer
+
+
 def _clear_vector_sync_state() -> None:
     """Drop the module-singleton ingest references on lifespan shutdown.
 
@@ -2203,9 +2231,15 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
             _wire_vector_sync_state(
                 app, ingest_transport, shutdown_event, scanner_wake_event
             )
+            webhook_coalescer = _publish_webhook_coalescer(
+                app, ingest_transport.producer
+            )
 
             # Background-sync work for this mode; the shared runner starts it.
             async def _single_user_start(tg: TaskGroup) -> None:
+                if webhook_coalescer is not None:
+                    await tg.start(webhook_coalescer.run, shutdown_event)
+
                 # Scanner publishes to the transport's producer.
                 await tg.start(
                     scanner_task,
@@ -2250,6 +2284,17 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                     shutdown_event,
                 )
 
+                # Bulk-load mode: pause HNSW indexing while a large backlog
+                # drains, restore it after. Opt-in via
+                # VECTOR_SYNC_BULK_LOAD_THRESHOLD.
+                if settings.vector_sync_bulk_load_threshold > 0:
+                    await tg.start(
+                        bulk_load_task,
+                        ingest_transport.producer,
+                        ingest_transport.receive_stream,
+                        shutdown_event,
+                    )
+
                 # Current-corpus chunk-density snapshot on its own slower cadence
                 # (heavier collection scroll). Opt-out via
                 # VECTOR_DENSITY_SNAPSHOT_ENABLED.
@@ -2269,10 +2314,14 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                 )
 
             async def _single_user_teardown() -> None:
+                # Send buffered webhook tasks while the transport is still open.
+                if webhook_coalescer is not None:
+                    await webhook_coalescer.close()
+                app.state.webhook_coalescer = None
                 shutdown_event.set()
                 # Tear down backend-owned resources (closes the procrastinate
-                # connector pool in postgres mode; no-op for the memory stream,
-                # which task-group cancellation closes).
+                # connector pool in postgres mode; stops the lane dispatcher and
+                # closes the streams for the memory backend).
                 await ingest_transport.aclose()
                 # Drop stale singleton refs to the now-closed transport.
                 _clear_vector_sync_state()
@@ -2343,6 +2392,8 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                     nextcloud_host=nextcloud_host_for_sync,
                     client_id=sync_client_id,
                     client_secret=sync_client_secret,
+                    refresh_ahead=settings.token_broker_refresh_ahead_seconds,
+                    refresh_concurrency=settings.token_broker_refresh_concurrency,
                 )
 
                 # Store token broker in oauth_context for management API (revoke endpoint)
@@ -2405,6 +2456,11 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                 # the manager and the signal helper reach it there.
                 provision_signal = ProvisionSignal()
                 _vector_sync_state.provision_signal = provision_signal
+                # Shared by every per-user scanner: global scan budget, priority
+                # lanes and adaptive intervals. Published on app.state (like
+                # task_producer) so the webhook receiver can wake a user's scan.
+                scan_scheduler = ScanScheduler.from_settings(settings)
+                app.state.scan_scheduler = scan_scheduler
 
                 # User state tracking for user manager
                 user_states: dict = {}
@@ -2418,6 +2474,10 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                 _wire_vector_sync_state(
                     app, ingest_transport, shutdown_event, scanner_wake_event
                 )
+                # Folder-sized webhook bursts become one scan of the user.
+                webhook_coalescer = _publish_webhook_coalescer(
+                    app, ingest_transport.producer, scan_waker=scan_scheduler.wake
+                )
 
                 # Background sync authenticates as each provisioned user via
                 # locally-stored Nextcloud app passwords (Login Flow v2 /
@@ -2428,6 +2488,9 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                 # `token_broker` constructed above is still used by the
                 # management API revoke endpoint (via app.state.oauth_context).
                 async def _multi_user_start(tg: TaskGroup) -> None:
+                    if webhook_coalescer is not None:
+                        await tg.start(webhook_coalescer.run, shutdown_event)
+
                     # User manager supervises per-user scanners. Each per-user
                     # scanner clones the producer; for the bus producer clone()
                     # returns the shared connection.
@@ -2441,6 +2504,7 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                         user_states,
                         tg,
                         provision_signal,
+                        scan_scheduler,
                     )
 
                     # Periodic backstop sweep removing app passwords that no
@@ -2453,6 +2517,11 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                         nextcloud_host_for_sync,
                     )
 
+                    # Renews the broker's cached Nextcloud tokens before they
+                    # expire, so requests never refresh inline. Opt-out via
+                    # TOKEN_BROKER_REFRESH_AHEAD_SECONDS=0.
+                    await tg.start(token_broker.refresh_ahead_task, shutdown_event)
+
                     # In-process consumer pool. ``run_consumers`` is a no-op for
                     # the distributed (postgres) backend — the out-of-process
                     # ``worker`` role consumes there. The closure binds this
@@ -2493,6 +2562,17 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                         shutdown_event,
                     )
 
+                    # Bulk-load mode while a large backlog drains (see the
+                    # single-user path). Opt-in via
+                    # VECTOR_SYNC_BULK_LOAD_THRESHOLD.
+                    if settings.vector_sync_bulk_load_threshold > 0:
+                        await tg.start(
+                            bulk_load_task,
+                            ingest_transport.producer,
+                            ingest_transport.receive_stream,
+                            shutdown_event,
+                        )
+
                     # Current-corpus chunk-density snapshot on its own slower
                     # cadence (heavier collection scroll). Opt-out via
                     # VECTOR_DENSITY_SNAPSHOT_ENABLED.
@@ -2513,12 +2593,18 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                     )
 
                 async def _multi_user_teardown() -> None:
+                    # Send buffered webhook tasks while the transport is open.
+                    if webhook_coalescer is not None:
+                        await webhook_coalescer.close()
+                    app.state.webhook_coalescer = None
                     shutdown_event.set()
                     # Tear down backend-owned resources (closes the procrastinate
-                    # connector pool in postgres mode; no-op for the memory stream).
+                    # connector pool in postgres mode; stops the lane dispatcher
+                    # and closes the streams for the memory backend).
                     await ingest_transport.aclose()
                     # Drop stale singleton refs to the now-closed transport.
                     _clear_vector_sync_state()
+                    app.state.scan_scheduler = None
                     # Close token broker HTTP client
                     if token_broker._http_client:
                         await token_broker._http_client.aclose()
@@ -2560,6 +2646,8 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
             await start(tg)
             # Capture the loop's own CancelScope so shutdown stops just the loop.
             readiness_scope = await tg.start(_readiness_refresh_loop)
+            # Drops credentials cached here when another replica rewrites them.
+            credential_scope = await tg.start(credential_invalidation_listener)
             _vector_sync_state.eviction_task_group = tg
             async with _mcp_session_with_login_flow(app):
                 try:
@@ -2569,6 +2657,8 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
                     # Request path must not spawn into a cancelling group.
                     _vector_sync_state.eviction_task_group = None
                     await teardown()
+                    # Per-user tool-call clients and their shared connections.
+                    await close_client_pool()
             # The readiness loop runs forever with no shutdown_event to observe,
             # and anyio waits for (not cancels) child tasks on normal exit — so
             # without this the lifespan shutdown would hang until uvicorn's
@@ -2576,6 +2666,7 @@ def get_app(transport: str = "streamable-http", enabled_apps: list[str] | None =
             # waits for the sync tasks to drain via shutdown_event (set in
             # teardown) rather than force-cancelling them mid-work.
             readiness_scope.cancel()
+            credential_scope.cancel()
 
     # Health check endpoints for Kubernetes probes
     def health_live(request):
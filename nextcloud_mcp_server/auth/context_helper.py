@@ -9,13 +9,15 @@ from mcp.server.auth.provider import AccessToken
 from mcp.server.fastmcp import Context
 
 from ..client import NextcloudClient
+from ..client.pool import pooled_client
+from .bearer_auth import BearerAuth
 
 logger = logging.getLogger(__name__)
 
 
-def get_client_from_context(ctx: Context, base_url: str) -> NextcloudClient:
+async def get_client_from_context(ctx: Context, base_url: str) -> NextcloudClient:
     """
-    Create NextcloudClient for multi-audience mode (no exchange needed).
+    Get the NextcloudClient for multi-audience mode (no exchange needed).
 
     ADR-005 Mode 1: Use multi-audience tokens directly.
     The UnifiedTokenVerifier validated MCP audience per RFC 7519.
@@ -26,7 +28,8 @@ def get_client_from_context(ctx: Context, base_url: str) -> NextcloudClient:
         base_url: Nextcloud base URL
 
     Returns:
-        NextcloudClient configured with multi-audience token
+        NextcloudClient configured with multi-audience token, from the
+        per-user client pool (``client.pool``)
 
     Raises:
         AttributeError: If context doesn't contain expected OAuth session data
@@ -54,14 +57,17 @@ def get_client_from_context(ctx: Context, base_url: str) -> NextcloudClient:
             raise ValueError("Username not available in OAuth token context")
 
         logger.debug(
-            "Creating NextcloudClient for user %s with multi-audience token (no exchange needed)",
+            "Getting NextcloudClient for user %s with multi-audience token (no exchange needed)",
             username,
         )
 
         # Token was validated to have MCP audience
         # Nextcloud will validate its own audience independently
-        return NextcloudClient.from_token(
-            base_url=base_url, token=access_token.token, username=username
+        return await pooled_client(
+            base_url,
+            username,
+            auth=BearerAuth(access_token.token),
+            token=access_token.token,
         )
 
     except AttributeError as e:
@@ -0,0 +1,196 @@
+"""In-memory cache of decrypted credentials read from token storage.
+
+Every tool call in multi-user BasicAuth / Login Flow mode, and every token
+broker refresh, reads a credential through ``RefreshTokenStorage``: a database
+round-trip plus a Fernet decryption for a value that changes a few times a
+year. :class:`CredentialCache` keeps the decrypted rows of the
+``app_passwords`` and ``refresh_tokens`` tables for
+``CREDENTIAL_CACHE_TTL_SECONDS``:
+
+- **Write-through invalidation.** Every storage method that writes one of the
+  rows drops the user's entry once the write is done. An invalidation also
+  moves the cache's epoch, so a read that started before it cannot put the
+  value it read afterwards.
+- **Across replicas.** On Postgres the same writes send a ``NOTIFY`` on
+  :data:`CREDENTIAL_CHANNEL` in their transaction; :func:`credential_invalidation_listener`
+  drops the entry on every replica when it arrives. The TTL bounds staleness
+  while the listener is reconnecting (the cache is cleared on every
+  reconnect) or when it is not running.
+- **Bounded.** At most ``CREDENTIAL_CACHE_SIZE`` users are kept, least
+  recently used dropped first. Misses are not cached.
+
+One cache per database URL and encryption key is shared by every storage
+instance of the process, so an instance never sees plaintext it could not have
+decrypted itself.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import anyio
+from anyio.abc import TaskStatus
+
+from nextcloud_mcp_server.config import (
+    get_database_url,
+    get_procrastinate_conninfo,
+    get_settings,
+    is_sqlite_url,
+)
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel carrying "<table>:<user_id>" payloads.
+CREDENTIAL_CHANNEL = "mcp_credential_invalidation"
+CREDENTIAL_TABLES = ("app_passwords", "refresh_tokens")
+
+_RECONNECT_BACKOFF_MAX = 60.0
+
+
+class CredentialCache:
+    """TTL-bounded LRU of decrypted credential rows, keyed by (table, user)."""
+
+    def __init__(self, *, ttl_seconds: float, max_entries: int):
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._epoch = 0
+        # Storage is also used from worker threads running their own loops.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def epoch(self) -> int:
+        """Take before reading the database; pass to :meth:`put` afterwards."""
+        return self._epoch
+
+    def get(self, table: str, user_id: str) -> dict[str, Any] | None:
+        """A copy of the cached row, or None when missing or expired."""
+        key = (table, user_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, row = entry
+            if time.monotonic() - stored_at >= self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(row)
+
+    def put(self, table: str, user_id: str, row: dict[str, Any], epoch: int) -> None:
+        """Cache a row read at ``epoch``; dropped if anything was invalidated since."""
+        row = copy.deepcopy(row)
+        key = (table, user_id)
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[key] = (time.monotonic(), row)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, table: str, user_id: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.pop((table, user_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def apply_notification(self, payload: str) -> None:
+        """Handle a ``<table>:<user_id>`` payload from another replica."""
+        table, sep, user_id = payload.partition(":")
+        if not sep or table not in CREDENTIAL_TABLES:
+            logger.warning("Ignoring malformed credential invalidation %r", payload)
+            return
+        self.invalidate(table, user_id)
+
+
+_caches: dict[tuple[str, bytes], CredentialCache] = {}
+
+
+def get_credential_cache(
+    database_url: str, encryption_key: str | bytes | None
+) -> CredentialCache | None:
+    """The process-wide cache for a database and key, or None when off."""
+    settings = get_settings()
+    if settings.credential_cache_ttl_seconds <= 0 or not encryption_key:
+        return None
+    if isinstance(encryption_key, str):
+        encryption_key = encryption_key.encode()
+    key = (database_url, hashlib.sha256(encryption_key).digest())
+    cache = _caches.get(key)
+    if cache is None:
+        cache = _caches[key] = CredentialCache(
+            ttl_seconds=settings.credential_cache_ttl_seconds,
+            max_entries=settings.credential_cache_size,
+        )
+    return cache
+
+
+def _caches_for(database_url: str) -> list[CredentialCache]:
+    return [cache for (url, _), cache in _caches.items() if url == database_url]
+
+
+def clear_credential_caches() -> None:
+    """Forget every process-wide cache (tests)."""
+    _caches.clear()
+
+
+async def credential_invalidation_listener(
+    *, task_status: TaskStatus[anyio.CancelScope] = anyio.TASK_STATUS_IGNORED
+) -> None:
+    """``LISTEN`` for credential writes made by other replicas.
+
+    Reports its own ``CancelScope`` via ``task_status`` like the readiness
+    loop; runs until cancelled. Returns at once on SQLite (one process owns
+    the file) or with the cache off.
+    """
+    database_url = get_database_url()
+    with anyio.CancelScope() as scope:
+        task_status.started(scope)
+        if get_settings().credential_cache_ttl_seconds <= 0 or is_sqlite_url(
+            database_url
+        ):
+            return
+
+        import psycopg  # noqa: PLC0415 — optional [postgres] extra
+
+        conninfo = get_procrastinate_conninfo(database_url)
+        backoff = 1.0
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(
+                    conninfo, autocommit=True
+                ) as conn:
+                    await conn.execute(f"LISTEN {CREDENTIAL_CHANNEL}")
+                    # Writes made while no listener was connected went unseen.
+                    for cache in _caches_for(database_url):
+                        cache.clear()
+                    backoff = 1.0
+                    logger.info("Listening for credential invalidations")
+                    async for notify in conn.notifies():
+                        for cache in _caches_for(database_url):
+                            cache.apply_notification(notify.payload)
+            except Exception as exc:  # noqa: BLE001 — reconnect, the TTL covers the gap
+                logger.warning(
+                    "Credential invalidation listener disconnected: %s; "
+                    "reconnecting in %.0fs",
+                    exc,
+                    backoff,
+                )
+            await anyio.sleep(backoff)
+            backoff = min(backoff * 2, _RECONNECT_BACKOFF_MAX)
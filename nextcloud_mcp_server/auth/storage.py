@@ -28,8 +28,12 @@ IMPORTANT: The database is initialized in both BasicAuth and OAuth modes.
 Token storage requires TOKEN_ENCRYPTION_KEY; the other stores do not.
 
 Sensitive data (tokens, secrets) is encrypted at rest using Fernet symmetric encryption.
+Decrypted app passwords and refresh tokens are kept in memory briefly, see
+:mod:`nextcloud_mcp_server.auth.credential_cache`.
 """
 
+import asyncio
+import functools
 import hashlib
 import importlib.util
 import json
@@ -37,6 +41,7 @@ import logging
 import os
 import socket
 import sqlite3
+import threading
 import time
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from pathlib import Path
@@ -47,13 +52,19 @@ import httpx
 import sqlalchemy as sa
 from anyio import to_thread
 from cryptography.fernet import Fernet
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 
+from nextcloud_mcp_server.auth.credential_cache import (
+    CREDENTIAL_CHANNEL,
+    get_credential_cache,
+)
 from nextcloud_mcp_server.client.ocs import OCS_REQUEST_HEADERS
 from nextcloud_mcp_server.config import (
     cfg,
     get_database_url,
+    get_settings,
     is_ephemeral_token_db,
     is_sqlite_url,
     mask_db_password,
@@ -61,7 +72,9 @@ from nextcloud_mcp_server.config import (
 from nextcloud_mcp_server.migrations import stamp_database, upgrade_database
 from nextcloud_mcp_server.observability.metrics import (
     record_db_connect,
+    record_db_connection_opened,
     record_db_operation,
+    update_db_pool_connections,
 )
 from nextcloud_mcp_server.observability.tracing import trace_db_connect
 
@@ -78,6 +91,10 @@ _MIGRATION_LOCK_ID = int.from_bytes(
     signed=True,
 )
 
+# Pooled Postgres connections older than this are closed on checkout, so a
+# PgBouncer / server-side idle timeout never hands a request a dead socket.
+_POOL_RECYCLE_SECONDS = 300
+
 
 def _qmark_to_named(sql: str) -> tuple[str, list[str]]:
     """Rewrite ``?`` positional placeholders to ``:p0, :p1, ...`` named binds.
@@ -125,6 +142,20 @@ def _qmark_to_named(sql: str) -> tuple[str, list[str]]:
     return "".join(out), names
 
 
+@functools.lru_cache(maxsize=512)
+def _compiled_statement(sql: str) -> tuple[sa.TextClause, tuple[str, ...]]:
+    """``sa.text`` clause and bind names for a ``?``-style statement, cached.
+
+    The storage methods issue a fixed set of statements, so each is rewritten
+    once and the same ``TextClause`` is reused, which also lets SQLAlchemy's
+    compiled cache hit. On Postgres with ``DATABASE_PREPARED_STATEMENTS=true``,
+    psycopg also prepares a statement server-side once a pooled connection has
+    run it a few times (``prepare_threshold``).
+    """
+    text_sql, names = _qmark_to_named(sql)
+    return sa.text(text_sql), tuple(names)
+
+
 class _Row:
     """Hybrid tuple/dict row mirroring ``aiosqlite.Row`` semantics.
 
@@ -245,14 +276,14 @@ class _ExecuteCtx:
     async def _resolve(self) -> _Cursor:
         if self._cursor is not None:
             return self._cursor
-        text_sql, names = _qmark_to_named(self._sql)
+        clause, names = _compiled_statement(self._sql)
         if len(names) != len(self._params):
             raise ValueError(
                 f"Placeholder count mismatch: SQL has {len(names)} '?' "
                 f"but got {len(self._params)} params"
             )
         bind = dict(zip(names, self._params, strict=True))
-        result = await self._conn.execute(sa.text(text_sql), bind)
+        result = await self._conn.execute(clause, bind)
         self._cursor = _Cursor(result)
         return self._cursor
 
@@ -350,8 +381,16 @@ class RefreshTokenStorage:
             self.db_path = ""
         self.cipher = Fernet(encryption_key) if encryption_key else None
         self.engine: AsyncEngine | None = None
+        # One engine per event loop (``engine`` is the initializing loop's);
+        # see ``_engine_for_running_loop``.
+        self._loop_engines: dict[asyncio.AbstractEventLoop, AsyncEngine] = {}
+        self._loop_engines_lock = threading.Lock()
         self._dialect: str = "unknown"
         self._initialized = False
+        # Decrypted app passwords / refresh tokens, shared by every instance
+        # on this database and key (None when CREDENTIAL_CACHE_TTL_SECONDS
+        # is 0).
+        self._credentials = get_credential_cache(database_url, encryption_key)
 
     @classmethod
     def from_env(cls) -> "RefreshTokenStorage":
@@ -454,20 +493,11 @@ class RefreshTokenStorage:
             if Path(self.db_path).exists():
                 os.chmod(self.db_path, 0o600)
 
-        # Create the shared async engine for the chosen backend. Both
-        # SQLite and Postgres use NullPool (per-call connections, no
-        # cross-loop bookkeeping). SQLite mirrors the prior
-        # aiosqlite-direct behavior; see ``_build_postgres_engine`` for
-        # the Postgres rationale.
-        if is_sqlite:
-            self.engine = create_async_engine(
-                self.database_url,
-                poolclass=NullPool,
-                connect_args={"check_same_thread": False},
-                future=True,
-            )
-        else:
-            self.engine = self._build_postgres_engine()
+        # Create the async engine for the chosen backend in this loop; other
+        # loops get their own on first use (``_engine_for_running_loop``).
+        self.engine = self._create_engine()
+        with self._loop_engines_lock:
+            self._loop_engines[asyncio.get_running_loop()] = self.engine
         self._dialect = self.engine.dialect.name
 
         # Check database state with the SQLAlchemy inspector so the legacy
@@ -518,37 +548,75 @@ class RefreshTokenStorage:
             mask_db_password(self.database_url),
         )
 
+    def _create_engine(self) -> AsyncEngine:
+        """A new AsyncEngine for ``database_url``.
+
+        SQLite keeps NullPool (per-call connections), mirroring the prior
+        aiosqlite-direct behavior; Postgres pools, see
+        :meth:`_build_postgres_engine`.
+        """
+        if is_sqlite_url(self.database_url):
+            return create_async_engine(
+                self.database_url,
+                poolclass=NullPool,
+                connect_args={"check_same_thread": False},
+                future=True,
+            )
+        return self._build_postgres_engine()
+
+    def _engine_for_running_loop(self) -> AsyncEngine:
+        """The engine whose pooled connections belong to the running loop.
+
+        A psycopg connection is bound to the event loop it was opened on, and
+        checking one out from a task on another loop failed with ``got Future
+        attached to a different loop`` (#799) -- the background sync tasks and
+        the request path do not always share a loop. So each loop gets its own
+        engine and pool, built on the loop's first operation. Engines of loops
+        that have since closed are dropped without touching their connections.
+        """
+        assert self.engine is not None, "RefreshTokenStorage.initialize() not called"
+        loop = asyncio.get_running_loop()
+        engine = self._loop_engines.get(loop)
+        if engine is not None:
+            return engine
+        with self._loop_engines_lock:
+            engine = self._loop_engines.get(loop)
+            if engine is None:
+                for stale in [lp for lp in self._loop_engines if lp.is_closed()]:
+                    self._loop_engines.pop(stale).sync_engine.dispose(close=False)
+                engine = self._loop_engines[loop] = self._create_engine()
+        return engine
+
+    def _record_pool_usage(self) -> None:
+        in_use = idle = 0
+        for engine in list(self._loop_engines.values()):
+            pool = engine.sync_engine.pool
+            if isinstance(pool, QueuePool):
+                in_use += pool.checkedout()
+                idle += pool.checkedin()
+            else:
+                return  # NullPool (SQLite): nothing is pooled
+        update_db_pool_connections(self._dialect, in_use=in_use, idle=idle)
+
     def _build_postgres_engine(self) -> AsyncEngine:
-        """Construct the AsyncEngine for a Postgres ``DATABASE_URL``.
-
-        Split out from :meth:`initialize` so cognitive complexity stays
-        under the SonarQube ``S3776`` threshold and so a future
-        engine-arg unit test has a single seam to mock.
-
-        Uses :class:`NullPool` (one fresh psycopg connection per
-        checkout, no caching). The original ADR-026 design used a
-        small bounded ``QueuePool`` with ``pool_pre_ping=True``, but
-        that combination is unsafe under the server's anyio task
-        layout: cached connections are bound to the event
-        loop they were opened on, and a checkout from a task running
-        under a different anyio TaskGroup / loop triggers
-        ``RuntimeError: got Future attached to a different loop`` on
-        the pre-ping probe (and then the pool closes the connection
-        with another ``Event loop is closed`` while cleaning up).
-        Observed in production against shared-postgres on cloudfleet,
-        where the background ``vector.oauth_sync.user_manager_task``
-        and the request-path code paths share an engine across loops.
-
-        NullPool sidesteps the entire class of bugs: every
-        ``engine.connect()`` opens a fresh psycopg connection in the
-        caller's current loop, and disposes it on close. psycopg
-        connection setup is cheap (~5 ms LAN, single round-trip when
-        the server is local) so the throughput cost is negligible for
-        the MCP server's traffic shape (low-concurrency, bursty).
-        ``DATABASE_POOL_SIZE`` / ``DATABASE_MAX_OVERFLOW`` are still
-        accepted for backward compat but no longer have an effect on
-        the Postgres backend — they were never propagated to SQLite,
-        which has always used NullPool.
+        """Construct the pooled AsyncEngine for a Postgres ``DATABASE_URL``.
+
+        Split out from :meth:`_create_engine` so a future engine-arg unit test
+        has a single seam to mock. Called once per event loop.
+
+        A ``QueuePool`` of ``DATABASE_POOL_SIZE`` connections (plus
+        ``DATABASE_MAX_OVERFLOW`` in bursts) keeps connections open across
+        operations, so the connect and TLS handshake leave the request path
+        (it was ~600 ms per operation behind a remote PgBouncer, Deck #678).
+        The NullPool this replaces was the fix for cross-loop checkouts, which
+        the per-loop engines of :meth:`_engine_for_running_loop` now rule out.
+        ``pool_pre_ping`` and ``_POOL_RECYCLE_SECONDS`` keep a connection the
+        server dropped while idle from failing a request.
+
+        psycopg's automatic server-side prepared statements are off unless
+        ``DATABASE_PREPARED_STATEMENTS=true``: a PgBouncer in transaction mode
+        (the Deck #678 deployment) only routes them with
+        ``max_prepared_statements`` set, which needs 1.21 or later.
         """
         # psycopg (psycopg3) ships as an optional PyPI extra
         # (`[postgres]`) so the default `pip install nextcloud-mcp-server`
@@ -571,29 +639,53 @@ class RefreshTokenStorage:
         # accepts the operator-supplied DSN as-is (ADR-026). When the URL omits
         # ``sslmode`` libpq's default (``prefer``) applies, keeping
         # cluster-local Postgres without TLS working out of the box.
+        settings = get_settings()
+        connect_args: dict[str, Any] = {}
+        if not settings.database_prepared_statements:
+            connect_args["prepare_threshold"] = None
         engine = create_async_engine(
             self.database_url,
-            poolclass=NullPool,
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=_POOL_RECYCLE_SECONDS,
+            connect_args=connect_args,
             future=True,
         )
+        event.listen(
+            engine.sync_engine,
+            "connect",
+            lambda *_: record_db_connection_opened("postgresql"),
+        )
         logger.info(
-            "Postgres engine ready: NullPool (one connection per "
-            "checkout, see ADR-026 § 'Connection pool')"
+            "Postgres engine ready: pool_size=%d max_overflow=%d (max %d "
+            "connections per event loop, see ADR-026 § 'Concurrency model and "
+            "pool sizing')",
+            settings.database_pool_size,
+            settings.database_max_overflow,
+            settings.database_pool_size + settings.database_max_overflow,
         )
         return engine
 
     async def close(self) -> None:
-        """Dispose the underlying AsyncEngine on shutdown.
+        """Dispose the engines on shutdown.
 
-        With ``NullPool`` the dispose call has no idle pool to drain,
-        but it still cleanly tears down any in-flight psycopg
-        connections held by active checkouts so shutdown hooks don't
-        leave dangling transports behind. Idempotent: safe to call
-        from any number of shutdown hooks.
+        The running loop's engine closes its pooled connections; engines of
+        other loops are only dereferenced, since their connections can't be
+        closed from this loop. Idempotent: safe to call from any number of
+        shutdown hooks.
         """
         if self.engine is None:
             return
-        await self.engine.dispose()
+        loop = asyncio.get_running_loop()
+        with self._loop_engines_lock:
+            engines = dict(self._loop_engines)
+            self._loop_engines.clear()
+        for engine_loop, engine in engines.items():
+            if engine_loop is loop:
+                await engine.dispose()
+            else:
+                engine.sync_engine.dispose(close=False)
         self.engine = None
         self._initialized = False
         logger.info("Disposed token storage engine")
@@ -657,34 +749,37 @@ class RefreshTokenStorage:
         ``fetchall`` / ``rowcount``) so the existing storage method bodies
         work against either SQLite or Postgres without per-call rewrites.
 
-        The connect is measured and traced separately from the operation it
-        serves. Under ``NullPool`` (ADR-026) ``engine.connect()`` *is* the
-        physical connect, so this is a genuine per-operation cost — one that
-        callers' spans previously bundled with execute, hiding a ~600ms
-        handshake inside an apparently slow insert (Deck #678). Instrumenting
-        here rather than at the call sites covers every caller for free.
+        The connection comes from the running loop's engine
+        (:meth:`_engine_for_running_loop`). The acquire is measured and traced
+        separately from the operation it serves: callers' spans used to bundle
+        it with execute, hiding a ~600ms handshake inside an apparently slow
+        insert (Deck #678). On Postgres it is a pool checkout, and a physical
+        connect only when the pool has none idle. Instrumenting here rather
+        than at the call sites covers every caller for free.
         """
-        assert self.engine is not None, "RefreshTokenStorage.initialize() not called"
+        engine = self._engine_for_running_loop()
         start = time.time()
         try:
             with trace_db_connect(self._dialect):
-                conn = await self.engine.connect()
+                conn = await engine.connect()
         finally:
             # Recorded in a finally so a connect that fails *slowly* — a timeout,
             # an unreachable host — is still measured. Those are precisely the
             # samples worth seeing; dropping them would leave the histogram
             # reporting only the healthy connects.
             record_db_connect(self._dialect, time.time() - start)
+        self._record_pool_usage()
         try:
             yield _DBConn(conn)
         finally:
             await conn.close()
+            self._record_pool_usage()
 
     def acquire(self) -> AbstractAsyncContextManager["_DBConn"]:
         """Public alias for :meth:`_db`: a backend-agnostic connection cm.
 
         Lets sibling stores (e.g. :class:`UsageEventStore`) reuse this
-        instance's engine, NullPool, and ``_DBConn`` shim without reaching
+        instance's per-loop engines, pools, and ``_DBConn`` shim without reaching
         into the underscored internal. Use as ``async with storage.acquire()
         as db:``.
         """
@@ -695,6 +790,22 @@ class RefreshTokenStorage:
         """Backend dialect name ("sqlite" / "postgresql"), or "unknown" pre-init."""
         return self._dialect
 
+    async def _notify_credential_change(
+        self, db: "_DBConn", table: str, user_id: str
+    ) -> None:
+        """Tell every replica to drop its cached credential (Postgres only).
+
+        Sent inside the write's transaction, so it is delivered on commit.
+        """
+        if self._dialect == "postgresql":
+            await db.execute(
+                "SELECT pg_notify(?, ?)", (CREDENTIAL_CHANNEL, f"{table}:{user_id}")
+            )
+
+    def _invalidate_credential(self, table: str, user_id: str) -> None:
+        if self._credentials is not None:
+            self._credentials.invalidate(table, user_id)
+
     async def store_refresh_token(
         self,
         user_id: str,
@@ -771,6 +882,7 @@ class RefreshTokenStorage:
                         scopes_json,
                     ),
                 )
+                await self._notify_credential_change(db, "refresh_tokens", user_id)
                 await db.commit()
             duration = time.time() - start_time
             record_db_operation(self._dialect, "insert", duration, "success")
@@ -783,6 +895,8 @@ class RefreshTokenStorage:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "insert", duration, "error")
             raise
+        finally:
+            self._invalidate_credential("refresh_tokens", user_id)
 
         # Audit log
         await self._audit_log(
@@ -791,6 +905,62 @@ class RefreshTokenStorage:
             auth_method="offline_access",
         )
 
+    async def rotate_refresh_token(
+        self, user_id: str, refresh_token: str, expires_at: int | None = None
+    ) -> None:
+        """
+        Replace a user's stored refresh token with the one the IdP rotated it to.
+
+        Unlike :meth:`store_refresh_token`, only the token and its expiry change:
+        the row's provisioning metadata (``flow_type``, ``provisioned_at``,
+        ``provisioning_client_id``, ``scopes``) is what the user consented to and
+        must survive every refresh. A user without a row (revoked meanwhile) is
+        left without one.
+
+        Args:
+            user_id: User identifier
+            refresh_token: The rotated refresh token
+            expires_at: Token expiration timestamp (Unix epoch), if known
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        if self.cipher is None:
+            raise RuntimeError(
+                "TOKEN_ENCRYPTION_KEY is not set — token storage operations unavailable"
+            )
+        encrypted_token = self.cipher.encrypt(refresh_token.encode())
+        now = int(time.time())
+
+        start_time = time.time()
+        try:
+            async with self._db() as db:
+                await db.execute(
+                    """
+                    UPDATE refresh_tokens
+                    SET encrypted_token = ?, expires_at = ?, updated_at = ?
+                    WHERE user_id = ?
+                    """,
+                    (encrypted_token, expires_at, now, user_id),
+                )
+                await self._notify_credential_change(db, "refresh_tokens", user_id)
+                await db.commit()
+            duration = time.time() - start_time
+            record_db_operation(self._dialect, "update", duration, "success")
+            logger.debug("Rotated refresh token for user %s", user_id)
+        except Exception:
+            duration = time.time() - start_time
+            record_db_operation(self._dialect, "update", duration, "error")
+            raise
+        finally:
+            self._invalidate_credential("refresh_tokens", user_id)
+
+        await self._audit_log(
+            event="rotate_refresh_token",
+            user_id=user_id,
+            auth_method="offline_access",
+        )
+
     async def store_user_profile(
         self, user_id: str, profile_data: dict[str, Any]
     ) -> None:
@@ -893,6 +1063,17 @@ class RefreshTokenStorage:
                 "TOKEN_ENCRYPTION_KEY is not set — token storage operations unavailable"
             )
 
+        epoch = 0
+        if self._credentials is not None:
+            epoch = self._credentials.epoch
+            cached = self._credentials.get("refresh_tokens", user_id)
+            # An expired token falls through to the database path, which
+            # deletes it.
+            if cached is not None and (
+                cached["expires_at"] is None or cached["expires_at"] >= time.time()
+            ):
+                return cached
+
         start_time = time.time()
         try:
             async with self._db() as db:
@@ -946,7 +1127,7 @@ class RefreshTokenStorage:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "select", duration, "success")
 
-            return {
+            token_data = {
                 "refresh_token": decrypted_token,
                 "expires_at": expires_at,
                 "flow_type": flow_type or "hybrid",  # Default for existing tokens
@@ -956,6 +1137,9 @@ class RefreshTokenStorage:
                 "provisioning_client_id": provisioning_client_id,
                 "scopes": scopes,
             }
+            if self._credentials is not None:
+                self._credentials.put("refresh_tokens", user_id, token_data, epoch)
+            return token_data
         except Exception as e:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "select", duration, "error")
@@ -1075,6 +1259,7 @@ class RefreshTokenStorage:
                     "DELETE FROM refresh_tokens WHERE user_id = ?",
                     (user_id,),
                 )
+                await self._notify_credential_change(db, "refresh_tokens", user_id)
                 await db.commit()
                 deleted = cursor.rowcount > 0
 
@@ -1096,6 +1281,8 @@ class RefreshTokenStorage:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "delete", duration, "error")
             raise
+        finally:
+            self._invalidate_credential("refresh_tokens", user_id)
 
     async def get_all_user_ids(self) -> list[str]:
         """
@@ -1883,6 +2070,7 @@ class RefreshTokenStorage:
                     """,
                     (user_id, encrypted_password, now, now),
                 )
+                await self._notify_credential_change(db, "app_passwords", user_id)
                 await db.commit()
 
             duration = time.time() - start_time
@@ -1893,6 +2081,8 @@ class RefreshTokenStorage:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "insert", duration, "error")
             raise
+        finally:
+            self._invalidate_credential("app_passwords", user_id)
 
         # Audit log
         await self._audit_log(
@@ -1920,35 +2110,15 @@ class RefreshTokenStorage:
                 "Set TOKEN_ENCRYPTION_KEY for app password retrieval."
             )
 
-        start_time = time.time()
         try:
-            async with self._db() as db:
-                async with db.execute(
-                    "SELECT encrypted_password FROM app_passwords WHERE user_id = ?",
-                    (user_id,),
-                ) as cursor:
-                    row = await cursor.fetchone()
-
-            if not row:
-                logger.debug("No app password found for user %s", user_id)
-                duration = time.time() - start_time
-                record_db_operation(self._dialect, "select", duration, "success")
-                return None
-
-            encrypted_password = row[0]
-            decrypted_password = self.cipher.decrypt(encrypted_password).decode()
-
-            duration = time.time() - start_time
-            record_db_operation(self._dialect, "select", duration, "success")
-            logger.debug("Retrieved app password for user %s", user_id)
-
-            return decrypted_password
-
+            app_data = await self._read_app_password(user_id, self.cipher)
         except Exception as e:
-            duration = time.time() - start_time
-            record_db_operation(self._dialect, "select", duration, "error")
             logger.error("Failed to decrypt app password for user %s: %s", user_id, e)
             return None
+        if app_data is None:
+            return None
+        logger.debug("Retrieved app password for user %s", user_id)
+        return app_data["app_password"]
 
     async def delete_app_password(self, user_id: str) -> bool:
         """
@@ -1970,6 +2140,7 @@ class RefreshTokenStorage:
                     "DELETE FROM app_passwords WHERE user_id = ?",
                     (user_id,),
                 )
+                await self._notify_credential_change(db, "app_passwords", user_id)
                 await db.commit()
                 deleted = cursor.rowcount > 0
 
@@ -1992,6 +2163,8 @@ class RefreshTokenStorage:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "delete", duration, "error")
             raise
+        finally:
+            self._invalidate_credential("app_passwords", user_id)
 
     async def get_all_app_password_user_ids(self) -> list[str]:
         """
@@ -2151,6 +2324,7 @@ class RefreshTokenStorage:
                         username,
                     ),
                 )
+                await self._notify_credential_change(db, "app_passwords", user_id)
                 await db.commit()
 
             duration = time.time() - start_time
@@ -2168,6 +2342,8 @@ class RefreshTokenStorage:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "insert", duration, "error")
             raise
+        finally:
+            self._invalidate_credential("app_passwords", user_id)
 
         await self._audit_log(
             event="store_app_password_with_scopes",
@@ -2194,6 +2370,19 @@ class RefreshTokenStorage:
                 "Set TOKEN_ENCRYPTION_KEY for app password retrieval."
             )
 
+        return await self._read_app_password(user_id, self.cipher)
+
+    async def _read_app_password(
+        self, user_id: str, cipher: Fernet
+    ) -> dict[str, Any] | None:
+        """The decrypted ``app_passwords`` row, from the credential cache if held."""
+        epoch = 0
+        if self._credentials is not None:
+            epoch = self._credentials.epoch
+            cached = self._credentials.get("app_passwords", user_id)
+            if cached is not None:
+                return cached
+
         start_time = time.time()
         try:
             async with self._db() as db:
@@ -2213,19 +2402,22 @@ class RefreshTokenStorage:
                 return None
 
             encrypted_password, scopes_json, username, created_at, updated_at = row
-            decrypted_password = self.cipher.decrypt(encrypted_password).decode()
+            decrypted_password = cipher.decrypt(encrypted_password).decode()
             scopes = json.loads(scopes_json) if scopes_json else None
 
             duration = time.time() - start_time
             record_db_operation(self._dialect, "select", duration, "success")
 
-            return {
+            app_data = {
                 "app_password": decrypted_password,
                 "scopes": scopes,
                 "username": username,
                 "created_at": created_at,
                 "updated_at": updated_at,
             }
+            if self._credentials is not None:
+                self._credentials.put("app_passwords", user_id, app_data, epoch)
+            return app_data
 
         except Exception:
             duration = time.time() - start_time
@@ -2254,6 +2446,7 @@ class RefreshTokenStorage:
                     "UPDATE app_passwords SET scopes = ?, updated_at = ? WHERE user_id = ?",
                     (scopes_json, now, user_id),
                 )
+                await self._notify_credential_change(db, "app_passwords", user_id)
                 await db.commit()
                 updated = cursor.rowcount > 0
 
@@ -2273,6 +2466,8 @@ class RefreshTokenStorage:
             duration = time.time() - start_time
             record_db_operation(self._dialect, "update", duration, "error")
             raise
+        finally:
+            self._invalidate_credential("app_passwords", user_id)
 
     # ── Login Flow v2: Session Tracking ──────────────────────────────────
 
@@ -9,17 +9,20 @@ the dual OAuth flow pattern where:
 The Token Broker provides:
 - Automatic token refresh when expired
 - Short-lived token caching (5-minute TTL)
+- Refresh-ahead of tokens in use, off the request path
 - Master refresh token rotation
 - Audience-specific token validation
 - Background token management
 """
 
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Optional, Tuple
 
 import anyio
 import httpx
+from anyio.abc import TaskStatus
 
 from nextcloud_mcp_server.auth.storage import RefreshTokenStorage
 
@@ -28,8 +31,29 @@ from ..http import nextcloud_httpx_client
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _CachedToken:
+    token: str
+    expiry: datetime
+    # Served since it was cached; only tokens in use are refreshed ahead.
+    used: bool = False
+
+
+@dataclass
+class _Refresh:
+    """A refresh in flight, awaited by concurrent requests for the same token."""
+
+    done: anyio.Event = field(default_factory=anyio.Event)
+    finished: bool = False
+    result: Optional[str] = None
+
+
 class TokenCache:
-    """In-memory cache for short-lived Nextcloud access tokens."""
+    """In-memory cache for short-lived Nextcloud access tokens.
+
+    Every operation is a plain dict access with no await in between, so on
+    the single event loop it needs no lock and users never wait on each other.
+    """
 
     def __init__(self, ttl_seconds: int = 300, early_refresh_seconds: int = 30):
         """
@@ -39,52 +63,58 @@ class TokenCache:
             ttl_seconds: Default TTL for cached tokens (5 minutes default)
             early_refresh_seconds: How many seconds before expiry to trigger early refresh (30s default)
         """
-        self._cache: Dict[str, Tuple[str, datetime]] = {}
+        self._cache: Dict[str, _CachedToken] = {}
         self._ttl = timedelta(seconds=ttl_seconds)
         self._early_refresh = timedelta(seconds=early_refresh_seconds)
-        self._lock = anyio.Lock()
 
     async def get(self, user_id: str) -> Optional[str]:
         """Get cached token if valid."""
-        async with self._lock:
-            if user_id not in self._cache:
-                return None
+        entry = self._cache.get(user_id)
+        if entry is None:
+            return None
 
-            token, expiry = self._cache[user_id]
-            now = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
 
-            # Check if token has expired
-            if now >= expiry:
-                del self._cache[user_id]
-                logger.debug("Cached token expired for user %s", user_id)
-                return None
+        # Check if token has expired
+        if now >= entry.expiry:
+            del self._cache[user_id]
+            logger.debug("Cached token expired for user %s", user_id)
+            return None
 
-            # Check if token will expire soon (refresh early)
-            if now >= expiry - self._early_refresh:
-                logger.debug("Cached token expiring soon for user %s", user_id)
-                return None
+        # Check if token will expire soon (refresh early)
+        if now >= entry.expiry - self._early_refresh:
+            logger.debug("Cached token expiring soon for user %s", user_id)
+            return None
 
-            logger.debug("Using cached token for user %s", user_id)
-            return token
+        logger.debug("Using cached token for user %s", user_id)
+        entry.used = True
+        return entry.token
 
     async def set(self, user_id: str, token: str, expires_in: int | None = None):
         """Store token in cache."""
-        async with self._lock:
-            # Use provided expiry or default TTL
-            if expires_in:
-                expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
-            else:
-                expiry = datetime.now(timezone.utc) + self._ttl
+        # Use provided expiry or default TTL
+        if expires_in:
+            expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+        else:
+            expiry = datetime.now(timezone.utc) + self._ttl
 
-            self._cache[user_id] = (token, expiry)
-            logger.debug("Cached token for user %s until %s", user_id, expiry)
+        self._cache[user_id] = _CachedToken(token, expiry)
+        logger.debug("Cached token for user %s until %s", user_id, expiry)
 
     async def invalidate(self, user_id: str):
         """Remove token from cache."""
-        async with self._lock:
-            if user_id in self._cache:
-                del self._cache[user_id]
-                logger.debug("Invalidated cached token for user %s", user_id)
+        if self._cache.pop(user_id, None) is not None:
+            logger.debug("Invalidated cached token for user %s", user_id)
+
+    def due(self, within_seconds: float) -> list[str]:
+        """Keys of tokens in use that expire within ``within_seconds``."""
+        now = datetime.now(timezone.utc)
+        horizon = now + timedelta(seconds=within_seconds)
+        return [
+            key
+            for key, entry in self._cache.items()
+            if entry.used and now < entry.expiry <= horizon
+        ]
 
 
 class TokenBrokerService:
@@ -94,6 +124,7 @@ class TokenBrokerService:
     This service handles:
     - Getting or refreshing Nextcloud access tokens
     - Managing a short-lived token cache
+    - Renewing cached tokens in use before they expire (refresh_ahead_task)
     - Refreshing master refresh tokens periodically
     - Validating token audiences
     """
@@ -107,6 +138,8 @@ class TokenBrokerService:
         client_secret: str,
         cache_ttl: int = 300,
         cache_early_refresh: int = 30,
+        refresh_ahead: int = 120,
+        refresh_concurrency: int = 8,
     ):
         """
         Initialize the Token Broker Service.
@@ -119,6 +152,10 @@ class TokenBrokerService:
             client_secret: OAuth client secret for token operations
             cache_ttl: Cache TTL in seconds (default: 5 minutes)
             cache_early_refresh: Early refresh threshold in seconds (default: 30 seconds)
+            refresh_ahead: Renew tokens in use this many seconds before expiry
+                from refresh_ahead_task (default: 2 minutes; 0 disables)
+            refresh_concurrency: Maximum token-endpoint refreshes in flight
+                at once (default: 8)
         """
         self.storage = storage
         self.oidc_discovery_url = oidc_discovery_url
@@ -133,6 +170,16 @@ class TokenBrokerService:
         self._locks_lock = anyio.Lock()  # Protects the locks dict itself
         self._http_client = None
 
+        self._refresh_ahead = refresh_ahead
+        self._refresh_concurrency = refresh_concurrency
+        # Created on first refresh: anyio primitives need a running loop.
+        self._refresh_limiter: anyio.CapacityLimiter | None = None
+        # Refreshes in flight, by cache key (single-flight)
+        self._inflight: dict[str, _Refresh] = {}
+        # How to renew each cached token: cache key -> (user_id, scopes), where
+        # scopes is None for get_nextcloud_token()'s default scope set
+        self._refreshable: dict[str, tuple[str, tuple[str, ...] | None]] = {}
+
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._http_client is None:
@@ -211,29 +258,7 @@ class TokenBrokerService:
         if cached_token:
             return cached_token
 
-        # Get stored refresh token
-        refresh_data = await self.storage.get_refresh_token(user_id)
-        if not refresh_data:
-            logger.info("No refresh token found for user %s", user_id)
-            return None
-
-        try:
-            # storage.get_refresh_token() returns already-decrypted token
-            refresh_token = refresh_data["refresh_token"]
-
-            # Exchange refresh token for new access token
-            access_token, expires_in = await self._refresh_access_token(refresh_token)
-
-            # Cache the new token
-            await self.cache.set(user_id, access_token, expires_in)
-
-            return access_token
-
-        except Exception as e:
-            logger.error("Failed to get Nextcloud token for user %s: %s", user_id, e)
-            # Invalidate cache on error
-            await self.cache.invalidate(user_id)
-            return None
+        return await self._refresh_once(user_id, user_id, None)
 
     async def get_background_token(
         self, user_id: str, required_scopes: list[str]
@@ -259,80 +284,142 @@ class TokenBrokerService:
         """
         # Check cache first (background tokens can be cached)
         cache_key = f"{user_id}:background:{','.join(sorted(required_scopes))}"
-        refresh_in_progress_key = f"{user_id}:refresh_in_progress"
 
         cached_token = await self.cache.get(cache_key)
         if cached_token:
             return cached_token
 
-        # Acquire per-user lock BEFORE refresh operation to prevent race conditions
-        refresh_lock = await self._get_user_refresh_lock(user_id)
-        async with refresh_lock:
-            # Double-check cache after acquiring lock
-            # (another thread may have refreshed while we waited)
-            cached_token = await self.cache.get(cache_key)
-            if cached_token:
-                logger.debug(
-                    "Token found in cache after lock acquisition for user %s", user_id
-                )
-                return cached_token
+        return await self._refresh_once(
+            cache_key, user_id, tuple(sorted(required_scopes))
+        )
 
-            # Check if another thread is currently refreshing
-            if await self.cache.get(refresh_in_progress_key):
-                logger.debug(
-                    "Refresh in progress for user %s, waiting briefly", user_id
-                )
-                await anyio.sleep(0.1)  # Brief wait for in-progress refresh
-                # Check cache one more time after wait
-                cached_token = await self.cache.get(cache_key)
-                if cached_token:
-                    logger.debug(
-                        "Token refreshed by another thread for user %s", user_id
-                    )
-                    return cached_token
+    async def _refresh_once(
+        self, cache_key: str, user_id: str, scopes: tuple[str, ...] | None
+    ) -> Optional[str]:
+        """Refresh a cached token unless a refresh for it is already running.
 
-            # Mark refresh as in-progress
-            await self.cache.set(refresh_in_progress_key, "true", expires_in=5)
+        Concurrent requests for the same token, and the refresh-ahead task,
+        wait for the first caller's refresh instead of each spending a
+        (rotating) refresh token on the IdP.
+        """
+        while (pending := self._inflight.get(cache_key)) is not None:
+            await pending.done.wait()
+            if pending.finished:
+                return pending.result
+            # The refreshing caller was cancelled; take over.
+
+        refresh = self._inflight[cache_key] = _Refresh()
+        try:
+            refresh.result = await self._refresh_cache_entry(cache_key, user_id, scopes)
+            refresh.finished = True
+            return refresh.result
+        finally:
+            del self._inflight[cache_key]
+            refresh.done.set()
+
+    async def _refresh_cache_entry(
+        self, cache_key: str, user_id: str, scopes: tuple[str, ...] | None
+    ) -> Optional[str]:
+        """Obtain a new access token for ``cache_key`` and cache it.
 
+        Returns None when the user is not provisioned or the refresh fails; a
+        failed refresh leaves any still-valid cached token in place.
+        """
+        if self._refresh_limiter is None:
+            self._refresh_limiter = anyio.CapacityLimiter(self._refresh_concurrency)
+
+        # Refresh tokens rotate on every use, so one refresh per user at a time
+        # (across scope sets); the limiter bounds the load on the IdP when many
+        # users' tokens lapse together, e.g. after a restart.
+        refresh_lock = await self._get_user_refresh_lock(user_id)
+        async with refresh_lock, self._refresh_limiter:
             try:
                 # Get stored refresh token
                 refresh_data = await self.storage.get_refresh_token(user_id)
                 if not refresh_data:
                     logger.info("No refresh token found for user %s", user_id)
+                    self._refreshable.pop(cache_key, None)
+                    await self.cache.invalidate(cache_key)
                     return None
 
                 # storage.get_refresh_token() returns already-decrypted token
                 refresh_token = refresh_data["refresh_token"]
 
-                # Get token with specific scopes for background operation
                 # Pass user_id to enable refresh token rotation storage
-                access_token, expires_in = await self._refresh_access_token_with_scopes(
-                    refresh_token, required_scopes, user_id=user_id
+                if scopes is None:
+                    access_token, expires_in = await self._refresh_access_token(
+                        refresh_token, user_id=user_id
+                    )
+                else:
+                    (
+                        access_token,
+                        expires_in,
+                    ) = await self._refresh_access_token_with_scopes(
+                        refresh_token, list(scopes), user_id=user_id
+                    )
+            except Exception as e:
+                logger.error(
+                    "Failed to refresh Nextcloud token for user %s: %s", user_id, e
                 )
+                return None
 
-                # Cache the background token
-                await self.cache.set(cache_key, access_token, expires_in)
+            await self.cache.set(cache_key, access_token, expires_in)
+            self._refreshable[cache_key] = (user_id, scopes)
 
+            if scopes is not None:
                 logger.info(
                     "Generated background token for user %s with scopes: %s",
                     user_id,
-                    required_scopes,
+                    list(scopes),
                 )
+            return access_token
 
-                return access_token
+    async def refresh_due_tokens(self) -> int:
+        """Renew every cached token in use that expires within the
+        refresh-ahead window. Returns how many were due."""
+        due = [
+            (cache_key, *self._refreshable[cache_key])
+            for cache_key in self.cache.due(self._refresh_ahead)
+            if cache_key in self._refreshable
+        ]
+        if not due:
+            return 0
+
+        # _refresh_cache_entry bounds how many reach the IdP at once.
+        async with anyio.create_task_group() as tg:
+            for cache_key, user_id, scopes in due:
+                tg.start_soon(self._refresh_once, cache_key, user_id, scopes)
+
+        logger.debug("Refreshed %s token(s) ahead of expiry", len(due))
+        return len(due)
+
+    async def refresh_ahead_task(
+        self,
+        shutdown_event: anyio.Event,
+        *,
+        task_status: TaskStatus = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        """Renew tokens in use before they expire, until ``shutdown_event``.
+
+        Checks four times per refresh-ahead window, so a token in use is
+        renewed well before the cache stops serving it and no request waits
+        on the IdP. Tokens nobody used since they were cached are left to
+        expire. Returns at once with refresh-ahead disabled.
+        """
+        task_status.started()
+        if self._refresh_ahead <= 0:
+            return
 
-            except Exception as e:
-                logger.error(
-                    "Failed to get background token for user %s: %s",
-                    user_id,
-                    e,
-                )
-                await self.cache.invalidate(cache_key)
-                return None
+        interval = max(1.0, self._refresh_ahead / 4)
+        logger.info("Token refresh-ahead task started (interval: %ss)", interval)
+        while not shutdown_event.is_set():
+            with anyio.move_on_after(interval):
+                await shutdown_event.wait()
+            if shutdown_event.is_set():
+                break
+            await self.refresh_due_tokens()
 
-            finally:
-                # Always clear the in-progress marker
-                await self.cache.invalidate(refresh_in_progress_key)
+        logger.info("Token refresh-ahead task stopped")
 
     async def _refresh_access_token(
         self, refresh_token: str, user_id: str | None = None
@@ -395,7 +482,7 @@ class TokenBrokerService:
             expires_at = int(
                 (datetime.now(timezone.utc) + timedelta(days=90)).timestamp()
             )
-            await self.storage.store_refresh_token(
+            await self.storage.rotate_refresh_token(
                 user_id=user_id,
                 refresh_token=new_refresh_token,
                 expires_at=expires_at,
@@ -483,7 +570,7 @@ class TokenBrokerService:
             expires_at = int(
                 (datetime.now(timezone.utc) + timedelta(days=90)).timestamp()
             )
-            await self.storage.store_refresh_token(
+            await self.storage.rotate_refresh_token(
                 user_id=user_id,
                 refresh_token=new_refresh_token,
                 expires_at=expires_at,
@@ -554,12 +641,13 @@ class TokenBrokerService:
             new_refresh_token = token_data.get("refresh_token")
 
             if new_refresh_token and new_refresh_token != current_refresh_token:
-                # storage.store_refresh_token() handles encryption internally
+                # storage.rotate_refresh_token() handles encryption internally
+                # and keeps the row's provisioning metadata.
                 # Convert datetime to Unix timestamp (int) for database storage
                 expires_at = int(
                     (datetime.now(timezone.utc) + timedelta(days=90)).timestamp()
                 )
-                await self.storage.store_refresh_token(
+                await self.storage.rotate_refresh_token(
                     user_id=user_id,
                     refresh_token=new_refresh_token,
                     expires_at=expires_at,
@@ -615,8 +703,12 @@ class TokenBrokerService:
             # Remove from storage
             await self.storage.delete_refresh_token(user_id)
 
-            # Clear cache
+            # Clear cache, background tokens included
             await self.cache.invalidate(user_id)
+            for cache_key, (owner, _) in list(self._refreshable.items()):
+                if owner == user_id:
+                    del self._refreshable[cache_key]
+                    await self.cache.invalidate(cache_key)
 
             logger.info("Revoked Nextcloud access for user %s", user_id)
             return True
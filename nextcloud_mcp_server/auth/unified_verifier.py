@@ -17,9 +17,12 @@ import hashlib
 import json
 import logging
 import time
-from collections.abc import Mapping
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
+import anyio
 import httpx
 import jwt
 from jwt import PyJWKClient
@@ -33,8 +36,23 @@ from nextcloud_mcp_server.observability.metrics import (
 
 from ..http import nextcloud_httpx_client
 
+if TYPE_CHECKING:
+    from nextcloud_mcp_server.auth.verified_token_store import SharedTokenCache
+
 logger = logging.getLogger(__name__)
 
+# Seconds between sweeps of expired entries from the in-process cache.
+_CACHE_SWEEP_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class _Verification:
+    """A verification in flight, awaited by concurrent requests for the token."""
+
+    done: anyio.Event = field(default_factory=anyio.Event)
+    finished: bool = False
+    result: AccessToken | None = None
+
 
 class UnifiedTokenVerifier(TokenVerifier):
     """
@@ -45,15 +63,22 @@ class UnifiedTokenVerifier(TokenVerifier):
     1. Validates tokens using JWT verification with JWKS or introspection fallback
     2. Enforces MCP audience validation (per RFC 7519); Nextcloud independently
        validates its own audience when receiving API calls
-    3. Caches successful validations to avoid repeated API calls
+    3. Caches successful validations to avoid repeated API calls: in-process
+       (bounded LRU, concurrent misses for one token share one verification)
+       and optionally in a tier shared by all replicas
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self, settings: Settings, *, shared_cache: "SharedTokenCache | None" = None
+    ):
         """
         Initialize the unified token verifier.
 
         Args:
             settings: Application settings containing OAuth configuration
+            shared_cache: Cache shared between replicas. Defaults to the
+                ``verified_tokens`` table when ``TOKEN_VERIFY_CACHE_SHARED`` is
+                set, otherwise none.
         """
         self.settings = settings
 
@@ -99,8 +124,20 @@ class UnifiedTokenVerifier(TokenVerifier):
             if host not in self.valid_issuers:
                 self.valid_issuers.append(host)
 
-        # Token cache: token_hash -> (userinfo, expiry_timestamp)
-        self._token_cache: dict[str, tuple[dict[str, Any], float]] = {}
+        # Token cache: token_hash -> (userinfo, expiry_timestamp), least
+        # recently used first. Bounded by TOKEN_VERIFY_CACHE_SIZE; expired
+        # entries are swept on insert (see _cache_put).
+        self._token_cache: OrderedDict[str, tuple[dict[str, Any], float]] = (
+            OrderedDict()
+        )
+        self.cache_max_entries = settings.token_verify_cache_size
+        self._last_cache_sweep = time.monotonic()
+        # Verifications in flight, by cache key (single-flight).
+        self._inflight: dict[str, _Verification] = {}
+        self._shared_cache = shared_cache
+        self._use_shared_store = (
+            shared_cache is None and settings.token_verify_cache_shared
+        )
         self.cache_ttl = 3600  # 1 hour default
         # Userinfo responses carry no token `exp`, so userinfo-validated opaque
         # tokens fall back to a TTL here. Keep it short: a revoked/expired token
@@ -167,7 +204,12 @@ class UnifiedTokenVerifier(TokenVerifier):
 
         oauth_token_cache_hits_total.labels(hit="false").inc()
 
-        return await self._verify_mcp_audience(token)
+        access_token, _ = await self._verify_once(
+            hashlib.sha256(token.encode()).hexdigest(),
+            token,
+            lambda: self._verify_mcp_audience(token),
+        )
+        return access_token
 
     async def verify_token_for_management_api(self, token: str) -> AccessToken | None:
         """
@@ -218,30 +260,22 @@ class UnifiedTokenVerifier(TokenVerifier):
         # Check cache first (using separate cache key to avoid mixing with MCP tokens)
         cache_key = f"mgmt:{hashlib.sha256(token.encode()).hexdigest()}"
         access_token: AccessToken | None = None
-        if cache_key in self._token_cache:
-            userinfo, expiry = self._token_cache[cache_key]
-            if time.time() < expiry:
-                logger.debug("Management API token found in cache")
-                oauth_token_cache_hits_total.labels(hit="true").inc()
-                username = userinfo.get("sub") or userinfo.get("preferred_username")
-                scope_string = userinfo.get("scope", "")
-                scopes = scope_string.split() if scope_string else []
-                access_token = AccessToken(
-                    token=token,
-                    client_id=self._client_id_from_claims(userinfo),
-                    scopes=scopes,
-                    expires_at=int(expiry),
-                    resource=username,
-                )
-            else:
-                del self._token_cache[cache_key]
+        entry = self._cache_get(cache_key)
+        if entry is not None:
+            logger.debug("Management API token found in cache")
+            oauth_token_cache_hits_total.labels(hit="true").inc()
+            access_token = self._access_token_from_entry(token, *entry)
 
         from_cache = access_token is not None
         outcome: dict[str, str] = {}
         if access_token is None:
             oauth_token_cache_hits_total.labels(hit="false").inc()
-            access_token = await self._verify_without_audience_check(
-                token, cache_key, outcome
+            # A token another request or replica verified meanwhile counts as
+            # served from cache: no validation was recorded for it here.
+            access_token, from_cache = await self._verify_once(
+                cache_key,
+                token,
+                lambda: self._verify_without_audience_check(token, cache_key, outcome),
             )
 
         if access_token is None:
@@ -252,10 +286,9 @@ class UnifiedTokenVerifier(TokenVerifier):
         # tokens are stamped with ``_auth_via_userinfo`` in the cache; for them
         # we rely on the per-user authorization every management endpoint
         # enforces (token sub == requested resource owner).
-        # Recover the via-userinfo flag from the cache entry. On a cache miss
-        # this is the entry _verify_without_audience_check just wrote (no await
-        # between that write and this read, so it is always present); on a cache
-        # hit it was written by an earlier call.
+        # Recover the via-userinfo flag from the cache entry, written by the
+        # verification that produced access_token. Should it have been evicted
+        # since, the flag reads False and the allowlist applies (fail-closed).
         cached_entry = self._token_cache.get(cache_key)
         via_userinfo = bool(cached_entry and cached_entry[0].get("_auth_via_userinfo"))
         if via_userinfo:
@@ -1110,7 +1143,7 @@ class UnifiedTokenVerifier(TokenVerifier):
         }
         if via_userinfo:
             userinfo["_auth_via_userinfo"] = True
-        self._token_cache[cache_key] = (userinfo, exp)
+        self._cache_put(cache_key, userinfo, exp)
 
         return AccessToken(
             token=token,
@@ -1130,19 +1163,14 @@ class UnifiedTokenVerifier(TokenVerifier):
         Returns:
             AccessToken if cached and valid, None otherwise
         """
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
-        if token_hash not in self._token_cache:
-            return None
-
-        userinfo, expiry = self._token_cache[token_hash]
-
-        # Check if expired
-        if time.time() >= expiry:
-            logger.debug("Cached token expired, removing from cache")
-            del self._token_cache[token_hash]
+        entry = self._cache_get(hashlib.sha256(token.encode()).hexdigest())
+        if entry is None:
             return None
+        return self._access_token_from_entry(token, *entry)
 
-        # Return cached AccessToken
+    def _access_token_from_entry(
+        self, token: str, userinfo: dict[str, Any], expiry: float
+    ) -> AccessToken:
         username = userinfo.get("sub") or userinfo.get("preferred_username")
         scope_string = userinfo.get("scope", "")
         scopes = scope_string.split() if scope_string else []
@@ -1155,8 +1183,108 @@ class UnifiedTokenVerifier(TokenVerifier):
             resource=username,
         )
 
+    def _cache_get(self, cache_key: str) -> tuple[dict[str, Any], float] | None:
+        """The cached (userinfo, expiry) for a key, or None if missing or expired."""
+        entry = self._token_cache.get(cache_key)
+        if entry is None:
+            return None
+        if time.time() >= entry[1]:
+            logger.debug("Cached token expired, removing from cache")
+            del self._token_cache[cache_key]
+            return None
+        self._token_cache.move_to_end(cache_key)
+        return entry
+
+    def _cache_put(
+        self, cache_key: str, userinfo: dict[str, Any], expiry: float
+    ) -> None:
+        """Cache a verification, evicting expired and then least recently used entries."""
+        self._token_cache[cache_key] = (userinfo, expiry)
+        self._token_cache.move_to_end(cache_key)
+        now = time.monotonic()
+        if now - self._last_cache_sweep >= _CACHE_SWEEP_INTERVAL_SECONDS:
+            self._last_cache_sweep = now
+            wall = time.time()
+            expired = [k for k, (_, exp) in self._token_cache.items() if wall >= exp]
+            for key in expired:
+                del self._token_cache[key]
+        while len(self._token_cache) > self.cache_max_entries:
+            self._token_cache.popitem(last=False)
+
+    async def _verify_once(
+        self,
+        cache_key: str,
+        token: str,
+        verify: Callable[[], Awaitable[AccessToken | None]],
+    ) -> tuple[AccessToken | None, bool]:
+        """Run ``verify`` for a cache miss unless the work is already done.
+
+        Concurrent requests carrying the same token wait for the first one's
+        verification instead of each calling the IdP; the shared tier is
+        consulted before verifying and written after. Returns the token and
+        whether it came from elsewhere (another request or the shared tier)
+        rather than from this call's own ``verify``.
+        """
+        while (pending := self._inflight.get(cache_key)) is not None:
+            await pending.done.wait()
+            if pending.finished:
+                return pending.result, True
+            # The verifying request was cancelled or failed; take over.
+
+        verification = self._inflight[cache_key] = _Verification()
+        try:
+            from_elsewhere = False
+            access_token = await self._load_shared(cache_key, token)
+            if access_token is not None:
+                from_elsewhere = True
+            else:
+                access_token = await verify()
+                if access_token is not None:
+                    await self._store_shared(cache_key)
+            verification.result = access_token
+            verification.finished = True
+            return access_token, from_elsewhere
+        finally:
+            del self._inflight[cache_key]
+            verification.done.set()
+
+    async def _get_shared_cache(self) -> "SharedTokenCache | None":
+        if self._shared_cache is None and self._use_shared_store:
+            from nextcloud_mcp_server.auth.verified_token_store import (  # noqa: PLC0415
+                VerifiedTokenStore,
+            )
+
+            self._shared_cache = await VerifiedTokenStore.shared()
+        return self._shared_cache
+
+    async def _load_shared(self, cache_key: str, token: str) -> AccessToken | None:
+        """Warm the local cache from the shared tier (best-effort)."""
+        try:
+            shared = await self._get_shared_cache()
+            entry = await shared.get(cache_key) if shared is not None else None
+        except Exception as e:
+            logger.warning("Shared token cache read failed: %s", e)
+            return None
+        if entry is None or time.time() >= entry[1]:
+            return None
+        logger.debug("Token found in shared cache")
+        self._cache_put(cache_key, *entry)
+        return self._access_token_from_entry(token, *entry)
+
+    async def _store_shared(self, cache_key: str) -> None:
+        """Publish a fresh local verification to the shared tier (best-effort)."""
+        entry = self._token_cache.get(cache_key)
+        if entry is None:
+            return
+        try:
+            shared = await self._get_shared_cache()
+            if shared is not None:
+                await shared.put(cache_key, *entry)
+        except Exception as e:
+            logger.warning("Shared token cache write failed: %s", e)
+
     def clear_cache(self):
-        """Clear the token cache."""
+        """Clear the in-process token cache."""
         self._token_cache.clear()
         logger.debug("Token cache cleared")
 
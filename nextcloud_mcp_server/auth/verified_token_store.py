@@ -0,0 +1,106 @@
+"""Shared tier of the token-verification cache (``verified_tokens``).
+
+:class:`~nextcloud_mcp_server.auth.unified_verifier.UnifiedTokenVerifier`
+caches each verified bearer token in-process. Behind a load balancer every
+replica used to pay the JWKS check, introspection call or userinfo round-trip
+for the same token again. With ``TOKEN_VERIFY_CACHE_SHARED`` the verifier also
+writes each verification to a :class:`SharedTokenCache` and consults it on a
+local miss, so a token verified on one replica is warm on all of them.
+
+:class:`VerifiedTokenStore` is the built-in tier: the ``verified_tokens`` app-DB
+table (migration 012), keyed on the verifier's cache key — a SHA-256 of the
+token, never the token. A row carries the claims and the expiry the verifying
+replica used, so the shared tier never extends how long a verification is
+trusted. Expired rows are ignored on read and swept from ``put`` every few
+minutes.
+
+The table is trusted like the rest of the app DB: its claims carry the
+verifier's ``_auth_via_userinfo`` flag, which only the verifier writes.
+
+Like :class:`~nextcloud_mcp_server.vector.document_path_store.DocumentPathStore`
+the store borrows the process-wide :class:`RefreshTokenStorage` singleton and
+surfaces errors; the verifier treats the tier as best-effort.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import Any, Protocol
+
+import anyio
+
+from nextcloud_mcp_server.auth.storage import RefreshTokenStorage, get_shared_storage
+
+logger = logging.getLogger(__name__)
+
+# Seconds between sweeps of expired rows (per process).
+_SWEEP_INTERVAL_SECONDS = 300
+
+
+class SharedTokenCache(Protocol):
+    """A cache of verified tokens shared between replicas."""
+
+    async def get(self, cache_key: str) -> tuple[dict[str, Any], float] | None:
+        """``(claims, expires_at)`` for a live entry, else None."""
+        ...
+
+    async def put(
+        self, cache_key: str, claims: dict[str, Any], expires_at: float
+    ) -> None: ...
+
+
+class VerifiedTokenStore:
+    """:class:`SharedTokenCache` over the ``verified_tokens`` table."""
+
+    _shared_instance: VerifiedTokenStore | None = None
+    # Lazy-init: anyio primitives must not be created at import time (mirrors
+    # DocumentPathStore). Created on first shared() call.
+    _shared_lock: anyio.Lock | None = None
+
+    def __init__(self, storage: RefreshTokenStorage) -> None:
+        self._storage = storage
+        self._last_sweep = 0.0
+
+    @classmethod
+    async def shared(cls) -> VerifiedTokenStore:
+        """Process-wide store backed by the storage singleton. Tests should
+        construct ``VerifiedTokenStore(storage)`` directly."""
+        if cls._shared_lock is None:
+            cls._shared_lock = anyio.Lock()
+        async with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(await get_shared_storage())
+        return cls._shared_instance
+
+    async def get(self, cache_key: str) -> tuple[dict[str, Any], float] | None:
+        async with self._storage.acquire() as db:
+            async with db.execute(
+                "SELECT claims, expires_at FROM verified_tokens "
+                "WHERE cache_key = ? AND expires_at > ?",
+                (cache_key, int(time.time())),
+            ) as cursor:
+                row = await cursor.fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), float(row[1])
+
+    async def put(
+        self, cache_key: str, claims: dict[str, Any], expires_at: float
+    ) -> None:
+        now = time.time()
+        async with self._storage.acquire() as db:
+            await db.execute(
+                "INSERT INTO verified_tokens (cache_key, claims, expires_at) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT (cache_key) DO UPDATE SET "
+                "claims = excluded.claims, expires_at = excluded.expires_at",
+                (cache_key, json.dumps(claims), int(expires_at)),
+            )
+            if now - self._last_sweep >= _SWEEP_INTERVAL_SECONDS:
+                self._last_sweep = now
+                await db.execute(
+                    "DELETE FROM verified_tokens WHERE expires_at <= ?", (int(now),)
+                )
+            await db.commit()
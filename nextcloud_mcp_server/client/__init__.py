@@ -129,6 +129,7 @@ class NextcloudClient:
         auth_username: str | None = None,
         password: str | None = None,
         token: str | None = None,
+        transport: AsyncBaseTransport | None = None,
     ):
         # ``username`` is the Nextcloud UID and DAV path fallback. Discovery can
         # replace that fallback with the canonical principal id when Nextcloud
@@ -141,10 +142,15 @@ class NextcloudClient:
         # which builds its own auth object from the raw credential.
         self.username = username
         auth_username = auth_username or username
+        # ``transport`` lets the tool-call client pool (``client.pool``) share
+        # one connection pool across users. The cookie wrapper does not close
+        # the transport it wraps, so ``close()`` leaves a shared one open.
         self._client = AsyncClient(
             base_url=base_url,
             auth=auth,
-            transport=AsyncDisableCookieTransport(nextcloud_httpx_transport()),
+            transport=AsyncDisableCookieTransport(
+                transport or nextcloud_httpx_transport()
+            ),
             event_hooks={"request": [log_request], "response": [log_response]},
             timeout=Timeout(timeout=30, connect=5),
         )
@@ -8,6 +8,9 @@ from .webdav import WebDAVClient
 
 logger = logging.getLogger(__name__)
 
+# ``pruneBefore`` value that prunes every note (int32 max, far past any mtime).
+_PRUNE_ALL_BEFORE = 2**31 - 1
+
 
 def _expect_note_object(payload: Any, *, operation: str) -> Dict[str, Any]:
     """Coerce a Notes API single-note response into a dict.
@@ -111,6 +114,31 @@ class NotesClient(BaseNextcloudClient):
                 break
             cursor = response.headers["X-Notes-Chunk-Cursor"]
 
+    async def get_note_ids(self) -> set[int]:
+        """Return the ids of all the user's notes in a single request.
+
+        ``pruneBefore`` is set past any plausible modification time, so the API
+        prunes every note to its ``id`` and, without ``chunkSize``, returns them
+        in one unchunked response. Used by verify-on-read to check many notes
+        at once instead of one ``get_note`` per id.
+        """
+        response = await self._make_request(
+            "GET",
+            "/apps/notes/api/v1/notes",
+            params={"pruneBefore": _PRUNE_ALL_BEFORE},
+        )
+        payload = response.json()
+        if not isinstance(payload, list):
+            raise ValueError(
+                "get_note_ids: Notes API returned "
+                f"{type(payload).__name__} where a list of notes was expected."
+            )
+        return {
+            int(note["id"])
+            for note in payload
+            if isinstance(note, dict) and note.get("id") is not None
+        }
+
     async def get_note(self, note_id: int) -> Dict[str, Any]:
         """Get a specific note by ID."""
         response = await self._make_request(
@@ -0,0 +1,288 @@
+"""Per-user ``NextcloudClient`` pool for tool calls in the multi-user modes.
+
+In OAuth, multi-user BasicAuth and Login Flow mode every tool call used to build
+a fresh ``NextcloudClient``: a new httpx connection pool (TCP + TLS handshake to
+the same Nextcloud host), a new CalDAV client, and another ``current-user-
+principal`` PROPFIND before the first DAV request. :class:`NextcloudClientPool`
+keeps them across calls:
+
+- **One transport.** Every pooled client sends through one shared
+  ``AsyncHTTPTransport``, so keep-alive connections to Nextcloud are reused
+  across users and calls (HTTP/2 with ``NEXTCLOUD_HTTP2``). Each client still
+  has its own ``AsyncClient`` (auth, cookie stripping, event hooks).
+- **Per-credential clients.** Clients are keyed on a fingerprint of the host,
+  user and credential, so a request only ever gets a client built from its own
+  credential; a rotated OAuth token or app password gets a new one.
+- **Discovery per user.** The DAV principal id and CalDAV calendar home found by
+  one client seed the next client built for the same user, so a token refresh
+  does not repeat the discovery round-trips.
+- **Bounded.** At most ``NEXTCLOUD_CLIENT_POOL_SIZE`` clients are kept (least
+  recently used dropped first). A dropped client is closed once it has been
+  unused for ``NEXTCLOUD_CLIENT_POOL_IDLE_SECONDS``: callers never close pooled
+  clients, so a call may still hold one that has just been dropped.
+
+Idle clients are closed on the next :meth:`NextcloudClientPool.acquire`; the
+transport is closed by :func:`close_client_pool` at shutdown. Single-user
+BasicAuth keeps its one lifespan client and background sync builds its own.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import httpx
+
+from nextcloud_mcp_server.client import NextcloudClient
+from nextcloud_mcp_server.client.base import BaseNextcloudClient
+from nextcloud_mcp_server.config import get_nextcloud_http_keepalive, get_settings
+from nextcloud_mcp_server.http import nextcloud_httpx_transport
+
+logger = logging.getLogger(__name__)
+
+# Discovery results kept per pool size unit: users whose clients were all
+# dropped keep their entry for a while after.
+_DISCOVERY_PER_CLIENT = 4
+
+
+@dataclass
+class _Discovery:
+    principal_id: str | None = None
+    calendar_home_url: str | None = None
+
+
+@dataclass
+class _PooledClient:
+    client: NextcloudClient
+    user: tuple[str, str]  # (base_url, username)
+    last_used: float
+
+
+def _read_discovery(client: NextcloudClient) -> _Discovery:
+    discovery = _Discovery()
+    for app_client in vars(client).values():
+        if (
+            isinstance(app_client, BaseNextcloudClient)
+            and app_client._principal_discovered
+        ):
+            discovery.principal_id = app_client._principal_id
+            break
+    if client.calendar._principal_resolved:
+        discovery.calendar_home_url = client.calendar._calendar_home_url
+    return discovery
+
+
+def _seed_discovery(client: NextcloudClient, discovery: _Discovery) -> None:
+    if discovery.principal_id:
+        for app_client in vars(client).values():
+            if isinstance(app_client, BaseNextcloudClient):
+                app_client._principal_id = discovery.principal_id
+                app_client._principal_discovered = True
+    if discovery.calendar_home_url:
+        client.calendar._calendar_home_url = discovery.calendar_home_url
+        client.calendar._principal_resolved = True
+
+
+class NextcloudClientPool:
+    """Reuses per-user ``NextcloudClient``s over one shared transport."""
+
+    def __init__(self, *, max_clients: int, idle_seconds: float, http2: bool = False):
+        self._max_clients = max_clients
+        self._idle_seconds = idle_seconds
+        self._http2 = http2
+        self._transport: httpx.AsyncHTTPTransport | None = None
+        self._clients: OrderedDict[str, _PooledClient] = OrderedDict()
+        # Dropped from _clients but possibly still in use by a call.
+        self._retired: list[_PooledClient] = []
+        self._discovery: OrderedDict[tuple[str, str], _Discovery] = OrderedDict()
+        # Keeps fingerprints from being matched against guessed credentials.
+        self._salt = os.urandom(16)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def _fingerprint(
+        self, base_url: str, username: str, auth_username: str, credential: str
+    ) -> str:
+        digest = hashlib.blake2b(key=self._salt, digest_size=16)
+        for part in (base_url, username, auth_username, credential):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _get_transport(self) -> httpx.AsyncHTTPTransport:
+        if self._transport is None:
+            http2 = self._http2 and get_nextcloud_http_keepalive()
+            if http2 and importlib.util.find_spec("h2") is None:
+                logger.warning(
+                    "NEXTCLOUD_HTTP2 is set but the 'h2' package is not "
+                    "installed; using HTTP/1.1"
+                )
+                http2 = False
+            self._transport = nextcloud_httpx_transport(http2=http2)
+        return self._transport
+
+    async def acquire(
+        self,
+        base_url: str,
+        username: str,
+        *,
+        auth: httpx.Auth,
+        auth_username: str | None = None,
+        password: str | None = None,
+        token: str | None = None,
+    ) -> NextcloudClient:
+        """The pooled client for this user and credential, built on first use.
+
+        Takes the ``NextcloudClient`` constructor arguments; pass exactly one of
+        ``password`` or ``token`` (the credential ``auth`` was built from).
+        """
+        credential = password if password is not None else token
+        if credential is None:
+            raise ValueError("A pooled client needs a password or a token")
+        auth_username = auth_username or username
+        user = (base_url, username)
+        key = self._fingerprint(base_url, username, auth_username, credential)
+        now = time.monotonic()
+
+        entry = self._clients.get(key)
+        if entry is not None:
+            self._clients.move_to_end(key)
+            self._remember(entry)
+            entry.last_used = now
+            client = entry.client
+        else:
+            for other in self._clients.values():
+                if other.user == user:
+                    self._remember(other)
+            client = NextcloudClient(
+                base_url=base_url,
+                username=username,
+                auth=auth,
+                auth_username=auth_username,
+                password=password,
+                token=token,
+                transport=self._get_transport(),
+            )
+            discovery = self._discovery.get(user)
+            if discovery is not None:
+                _seed_discovery(client, discovery)
+            self._clients[key] = _PooledClient(client, user, now)
+            while len(self._clients) > self._max_clients:
+                _, dropped = self._clients.popitem(last=False)
+                self._remember(dropped)
+                self._retired.append(dropped)
+
+        await self._close_idle(now)
+        return client
+
+    def _remember(self, entry: _PooledClient) -> None:
+        discovery = _read_discovery(entry.client)
+        if discovery.principal_id is None and discovery.calendar_home_url is None:
+            return
+        known = self._discovery.get(entry.user)
+        if known is not None:
+            discovery.principal_id = discovery.principal_id or known.principal_id
+            discovery.calendar_home_url = (
+                discovery.calendar_home_url or known.calendar_home_url
+            )
+        self._discovery[entry.user] = discovery
+        self._discovery.move_to_end(entry.user)
+        while len(self._discovery) > self._max_clients * _DISCOVERY_PER_CLIENT:
+            self._discovery.popitem(last=False)
+
+    async def _close_idle(self, now: float) -> None:
+        cutoff = now - self._idle_seconds
+        idle_keys = [k for k, e in self._clients.items() if e.last_used < cutoff]
+        idle = [self._clients.pop(key) for key in idle_keys]
+        for entry in idle:
+            self._remember(entry)
+        to_close = idle + [e for e in self._retired if e.last_used < cutoff]
+        self._retired = [e for e in self._retired if e.last_used >= cutoff]
+        for entry in to_close:
+            await _close_quietly(entry.client)
+
+    async def aclose(self) -> None:
+        """Close every client and the shared transport."""
+        entries = [*self._clients.values(), *self._retired]
+        self._clients.clear()
+        self._retired.clear()
+        for entry in entries:
+            await _close_quietly(entry.client)
+        if self._transport is not None:
+            await self._transport.aclose()
+            self._transport = None
+
+
+async def _close_quietly(client: NextcloudClient) -> None:
+    try:
+        await client.close()
+    except Exception as e:
+        logger.debug("Error closing pooled Nextcloud client: %s", e)
+
+
+_pool: NextcloudClientPool | None = None
+
+
+def get_client_pool() -> NextcloudClientPool | None:
+    """The process-wide pool, or None when ``NEXTCLOUD_CLIENT_POOL_SIZE`` is 0."""
+    global _pool
+    settings = get_settings()
+    if settings.nextcloud_client_pool_size <= 0:
+        return None
+    if _pool is None:
+        _pool = NextcloudClientPool(
+            max_clients=settings.nextcloud_client_pool_size,
+            idle_seconds=settings.nextcloud_client_pool_idle_seconds,
+            http2=settings.nextcloud_http2,
+        )
+    return _pool
+
+
+async def pooled_client(
+    base_url: str,
+    username: str,
+    *,
+    auth: httpx.Auth,
+    auth_username: str | None = None,
+    password: str | None = None,
+    token: str | None = None,
+) -> NextcloudClient:
+    """A pooled client for a tool call, or a fresh one with pooling off."""
+    pool = get_client_pool()
+    if pool is None:
+        return NextcloudClient(
+            base_url=base_url,
+            username=username,
+            auth=auth,
+            auth_username=auth_username,
+            password=password,
+            token=token,
+        )
+    return await pool.acquire(
+        base_url,
+        username,
+        auth=auth,
+        auth_username=auth_username,
+        password=password,
+        token=token,
+    )
+
+
+async def close_client_pool() -> None:
+    """Close the process-wide pool (server shutdown)."""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is not None:
+        await pool.aclose()
+
+
+def clear_client_pool() -> None:
+    """Forget the process-wide pool without closing it (tests)."""
+    global _pool
+    _pool = None
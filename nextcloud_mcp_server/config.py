@@ -45,6 +45,11 @@ _DEFAULTS: dict[str, Any] = {
     "nextcloud_verify_ssl": True,
     "nextcloud_ca_bundle": None,
     "nextcloud_http_keepalive": True,
+    # Per-user NextcloudClient pool for tool calls (client.pool). 0 = a fresh
+    # client per call.
+    "nextcloud_client_pool_size": 256,
+    "nextcloud_client_pool_idle_seconds": 600,
+    "nextcloud_http2": False,
     "nextcloud_mcp_server_url": None,
     "nextcloud_resource_uri": None,
     "nextcloud_public_issuer_url": None,
@@ -113,13 +118,34 @@ _DEFAULTS: dict[str, Any] = {
     # read from it by libpq/psycopg; the server never rewrites it. See ADR-026.
     "database_url": None,
     # Postgres connection pool sizing (ADR-026 → "Concurrency model and
-    # pool sizing"). Per-pod defaults to 2 + 5 overflow = 7 max
-    # connections. psycopg connections are single-flight, so the pool
-    # only needs to cover typical multi-user MCP burst — not every
-    # potential in-flight tool call. Tune up with DATABASE_POOL_SIZE /
-    # DATABASE_MAX_OVERFLOW for high-traffic prod fleets.
+    # pool sizing"), per event loop: 2 + 5 overflow = 7 max connections.
+    # psycopg connections are single-flight, so the pool only needs to cover
+    # typical multi-user MCP burst — not every potential in-flight tool call.
+    # Tune up with DATABASE_POOL_SIZE / DATABASE_MAX_OVERFLOW for
+    # high-traffic prod fleets.
     "database_pool_size": 2,
     "database_max_overflow": 5,
+    # psycopg server-side prepared statements on pooled connections. Off by
+    # default: PgBouncer in transaction mode only routes them with
+    # max_prepared_statements set (1.21+).
+    "database_prepared_statements": False,
+    # Decrypted app passwords / refresh tokens kept in memory by storage
+    # (seconds; 0 disables). Writes invalidate them at once, on every replica
+    # via Postgres NOTIFY; the TTL bounds staleness if a notification is lost.
+    "credential_cache_ttl_seconds": 60,
+    "credential_cache_size": 1024,
+    # Verified bearer tokens kept in-process by the OAuth token verifier
+    # (least recently used dropped first). With TOKEN_VERIFY_CACHE_SHARED each
+    # verification is also written to the app DB, so other replicas skip the
+    # JWKS / introspection / userinfo round-trip for the same token.
+    "token_verify_cache_size": 10000,
+    "token_verify_cache_shared": False,
+    # Token broker: Nextcloud access tokens in use are renewed this many
+    # seconds before expiry by a background task (0 disables, leaving the
+    # refresh to the next request), with at most this many IdP refreshes in
+    # flight at once.
+    "token_broker_refresh_ahead_seconds": 120,
+    "token_broker_refresh_concurrency": 8,
     # Webhook delivery authentication (ADR-010): when set, registrations
     # tell NC to add `Authorization: Bearer <secret>` to webhook deliveries
     # and the receiver rejects unauthenticated requests.
@@ -127,6 +153,13 @@ _DEFAULTS: dict[str, Any] = {
     # Internal URL override for webhook registration; wins over
     # NEXTCLOUD_MCP_SERVER_URL when set (e.g. split internal/external URLs).
     "webhook_internal_url": None,
+    # Webhook debounce buffer (vector/webhook_coalescer.py). Window 0 disables
+    # it (every webhook is enqueued at once); folder batch 0 disables folder
+    # batching.
+    "webhook_coalesce_window_seconds": 2.0,
+    "webhook_coalesce_max_delay_seconds": 30.0,
+    "webhook_coalesce_max_pending": 10000,
+    "webhook_coalesce_folder_batch": 50,
     # Vector sync
     "vector_sync_scan_interval": 300,
     "vector_sync_processor_workers": 3,
@@ -139,6 +172,11 @@ _DEFAULTS: dict[str, Any] = {
     "vector_sync_fast_concurrency": None,
     "vector_sync_structured_concurrency": None,
     "vector_sync_queue_max_size": 10000,
+    # Bulk-load mode (vector.bulk_load): at this many pending documents HNSW
+    # indexing is paused and workers write large unwaited batches, until the
+    # backlog falls to a tenth of it. 0 = off.
+    "vector_sync_bulk_load_threshold": 0,
+    "vector_sync_bulk_upsert_batch_size": 1000,
     "vector_sync_metrics_refresh_interval": 20,
     "vector_density_snapshot_enabled": True,
     "vector_density_snapshot_interval": 300,
@@ -179,8 +217,26 @@ _DEFAULTS: dict[str, Any] = {
     # gone" — preventing a delete/re-index churn loop. A sustained empty (a real
     # mass-untag) still eventually deletes once the streak reaches this value.
     "vector_sync_empty_discovery_delete_threshold": 3,
+    # Scanner deletion tracking reads the per-user document manifest
+    # (vector/document_manifest_store.py) and rebuilds it from a Qdrant scroll
+    # once it is older than this many seconds. 0 scrolls Qdrant on every scan.
+    "vector_sync_manifest_reconcile_interval": 86400,
+    # Multi-user scan scheduler (vector/scan_scheduler.py): global cap on
+    # concurrent user scans, bounds for each user's adaptive scan interval
+    # (which starts at vector_sync_scan_interval), and the +/- jitter applied
+    # to every delay as a fraction of the interval.
+    "vector_sync_max_concurrent_scans": 4,
+    "vector_sync_scan_interval_min": 60,
+    "vector_sync_scan_interval_max": 1800,
+    "vector_sync_scan_jitter": 0.1,
     # Verify-on-read concurrency cap (ADR-019)
     "verification_concurrency": 20,
+    # Verify-on-read verdict cache TTL (search/verification_cache.py); 0 disables.
+    "verification_cache_ttl_seconds": 15,
+    # Repeated-search caches (search/query_cache.py): query vectors per user
+    # (LRU entries) and hybrid-search candidates (TTL); 0 disables either.
+    "query_vector_cache_size": 1024,
+    "search_result_cache_ttl_seconds": 15,
     # Qdrant
     "qdrant_url": None,
     "qdrant_location": None,
@@ -214,6 +270,37 @@ _DEFAULTS: dict[str, Any] = {
     "embedding_dimensions": None,
     # Simple (fallback) embedding dimension
     "simple_embedding_dimension": 384,
+    # Content-addressed embedding reuse on re-index: unchanged chunks take their
+    # vectors from the document's stored points or the in-process cache instead
+    # of the provider. EMBEDDING_CACHE_MAX_MB bounds the in-process tier (0
+    # disables it; stored-point reuse still applies).
+    "embedding_cache_enabled": True,
+    "embedding_cache_max_mb": 128,
+    # Cross-document embedding micro-batching: concurrent processor tasks'
+    # chunk texts are coalesced into one provider request, flushed when a batch
+    # reaches the text/char cap or after max_wait_ms, whichever comes first.
+    "embedding_microbatch_enabled": True,
+    "embedding_microbatch_max_wait_ms": 10,
+    "embedding_microbatch_max_texts": 64,
+    "embedding_microbatch_max_chars": 65536,
+    # BM25 sparse encoding (providers/bm25_encoder.py): distinct raw tokens
+    # remembered with their stem / token id, and an opt-in process pool for
+    # large batches (0 = encode in the calling thread).
+    "bm25_vocab_cache_size": 200000,
+    "bm25_encode_processes": 0,
+    "bm25_parallel_min_texts": 256,
+    # Chunk-level diff writes on re-index (vector/diff_upsert.py): upsert only
+    # added/changed chunks, set_payload for metadata-only changes, delete
+    # vanished chunk positions. False restores the full-upsert behaviour.
+    "vector_sync_diff_upsert": True,
+    # Streamed indexing of long documents: chunks are embedded and written in
+    # windows of this many, so memory stays bounded and a retry resumes after
+    # the last written window. 0 = whole document in one pass.
+    "vector_sync_stream_window_chunks": 256,
+    # Cross-fileid content dedup (vector/sharing_state.py): a file whose bytes
+    # are already indexed under another fileid is indexed by copying those
+    # points instead of parsing and embedding it again.
+    "vector_sync_content_dedup": True,
     # Document chunking
     "document_chunk_size": 2048,
     "document_chunk_overlap": 200,
@@ -225,6 +312,13 @@ _DEFAULTS: dict[str, Any] = {
     # pages into one chunk instead of one-per-page. Off by default until the
     # post-change density re-measure + pricing re-calibration land.
     "document_chunk_page_pack": False,
+    # Unit of DOCUMENT_CHUNK_SIZE/OVERLAP: "chars", or "tokens" of the embedding
+    # model as counted by the Hugging Face tokenizer named in
+    # DOCUMENT_CHUNK_TOKENIZER (a hub repo id or a local tokenizer.json). Token
+    # sizing keeps every chunk inside the model's input window whatever the
+    # script; falls back to characters when the tokenizer can't be loaded.
+    "document_chunk_unit": "chars",
+    "document_chunk_tokenizer": None,
     # Hybrid-search RRF ranking constant. Qdrant's native RRF hardcodes k=2,
     # where adjacent ranks differ by 33% and a single-list outlier outranks a
     # document both retrievers agree on. 60 is the standard value (~2% per rank),
@@ -341,10 +435,14 @@ _DEFAULTS: dict[str, Any] = {
     "document_parse_page_window": 100,
     # Concurrent isolated parse subprocesses (see document_parse_process_slots).
     "document_parse_process_slots": 2,
+    # Concurrent isolated MuPDF/PDFium subprocesses (see document_native_process_slots).
+    "document_native_process_slots": 2,
     # Stream ingest downloads to disk instead of buffering them in memory.
     "document_stream_download_enabled": True,
     # Directory for ingest spool files (default: the system temp dir).
     "document_spool_dir": None,
+    # Disk budget for cached parse results under the spool dir (0 disables).
+    "document_parse_cache_max_mb": 512,
     # Tier-0 classifier (records classification metrics on the tiered path)
     "document_classify_enabled": True,
     # Tiered PDF pipeline: pypdfium2 is the default/only hot-path extractor;
@@ -394,6 +492,12 @@ _DEFAULTS: dict[str, Any] = {
     # Seconds between batch-job polls (the procrastinate re-enqueue delay). Each
     # poll re-runs the tier; keep it well above a few seconds.
     "document_ocr_batch_poll_seconds": 120,
+    # Per-page OCR fan-out: split a PDF into ranges of at most this many pages,
+    # OCR only the pages whose text layer is unusable, and keep the rest. 0
+    # sends the whole document in one request.
+    "document_ocr_pages_per_request": 0,
+    # Page-range OCR requests in flight at once per OCR backend.
+    "document_ocr_concurrency": 4,
     # Observability
     "metrics_enabled": True,
     "metrics_port": 9090,
@@ -534,6 +638,12 @@ _DEFAULTS: dict[str, Any] = {
     # (*/5min), bypassing TieredEscalationStrategy's per-job backoff. A small
     # fixed delay staggers the retry. 0 = immediate (legacy behaviour).
     "ingest_reclaim_retry_delay_seconds": 30,
+    # Ingest lanes (vector.queue.lanes), both backends. Deletes and documents
+    # modified within the window go to the interactive lane, the rest to the
+    # backfill lane; a lane's flows get turns in proportion to its weight.
+    "ingest_interactive_lane_weight": 10,
+    "ingest_backfill_lane_weight": 1,
+    "ingest_interactive_window_seconds": 86400,
     "collection_metadata_source": "qdrant",  # qdrant | api
     # CP base URL for COLLECTION_METADATA_SOURCE=api (e.g. http://control-plane).
     # Required only when the source is api.
@@ -622,9 +732,21 @@ _dynaconf = Dynaconf(
         # Port ranges
         Validator("METRICS_PORT", gte=1, lte=65535),
         # Positive integers
+        Validator("NEXTCLOUD_CLIENT_POOL_SIZE", gte=0),
+        Validator("NEXTCLOUD_CLIENT_POOL_IDLE_SECONDS", gte=1),
+        Validator("CREDENTIAL_CACHE_TTL_SECONDS", gte=0),
+        Validator("CREDENTIAL_CACHE_SIZE", gte=1),
+        Validator("TOKEN_VERIFY_CACHE_SIZE", gte=1),
+        Validator("TOKEN_BROKER_REFRESH_AHEAD_SECONDS", gte=0),
+        Validator("TOKEN_BROKER_REFRESH_CONCURRENCY", gte=1),
         Validator("INGEST_STALLED_JOB_SECONDS", gte=1),
         Validator("INGEST_TRANSIENT_MAX_ATTEMPTS", gte=1),
         Validator("INGEST_RECLAIM_RETRY_DELAY_SECONDS", gte=0),
+        Validator("VECTOR_SYNC_BULK_LOAD_THRESHOLD", gte=0),
+        Validator("VECTOR_SYNC_BULK_UPSERT_BATCH_SIZE", gte=1),
+        Validator("INGEST_INTERACTIVE_LANE_WEIGHT", gte=1),
+        Validator("INGEST_BACKFILL_LANE_WEIGHT", gte=1),
+        Validator("INGEST_INTERACTIVE_WINDOW_SECONDS", gte=1),
         Validator("OIDC_DISCOVERY_MAX_ATTEMPTS", gte=1),
         Validator("OIDC_DISCOVERY_BACKOFF_BASE", gte=0),
         Validator("OIDC_DISCOVERY_BACKOFF_MAX", gte=0),
@@ -638,6 +760,8 @@ _dynaconf = Dynaconf(
         # 1 = park on the first exhausted-retry round. 0/negative would park a
         # document before any attempt was recorded.
         Validator("VECTOR_SYNC_MAX_INDEX_FAILURES", gte=1),
+        # 0 disables windowed indexing; otherwise it must be positive.
+        Validator("VECTOR_SYNC_STREAM_WINDOW_CHUNKS", gte=0),
         # Optional per-tier concurrency overrides (None = fall back to
         # VECTOR_SYNC_PROCESSOR_WORKERS). Like the sibling above they must be
         # >=1 when set — a 0/negative value would otherwise reach
@@ -666,6 +790,19 @@ _dynaconf = Dynaconf(
         Validator("HEALTH_READY_REFRESH_INTERVAL", gte=1),
         Validator("PORT", gte=1, lte=65535),
         Validator("VERIFICATION_CONCURRENCY", gte=1),
+        Validator("VERIFICATION_CACHE_TTL_SECONDS", gte=0),
+        Validator("QUERY_VECTOR_CACHE_SIZE", gte=0),
+        Validator("SEARCH_RESULT_CACHE_TTL_SECONDS", gte=0),
+        Validator("VECTOR_SYNC_MANIFEST_RECONCILE_INTERVAL", gte=0),
+        Validator("WEBHOOK_COALESCE_WINDOW_SECONDS", gte=0),
+        Validator("WEBHOOK_COALESCE_MAX_DELAY_SECONDS", gte=0),
+        Validator("WEBHOOK_COALESCE_MAX_PENDING", gte=1),
+        Validator("WEBHOOK_COALESCE_FOLDER_BATCH", gte=0),
+        Validator("VECTOR_SYNC_MAX_CONCURRENT_SCANS", gte=1),
+        Validator("VECTOR_SYNC_SCAN_INTERVAL_MIN", gte=1),
+        Validator("VECTOR_SYNC_SCAN_INTERVAL_MAX", gte=1),
+        # Jitter above 0.5 could schedule a scan at half the interval or less.
+        Validator("VECTOR_SYNC_SCAN_JITTER", gte=0, lte=0.5),
         Validator("DOCUMENT_CHUNK_SIZE", gte=1),
         Validator("CHUNKING_CONFIG_VERSION", gte=1),
         Validator("DOCUMENT_PARSE_TIMEOUT_SECONDS", gte=1),
@@ -676,6 +813,9 @@ _dynaconf = Dynaconf(
         # "Batch"/"SYNC" normalise instead of erroring.
         # Poll cadence well above a few seconds (each poll re-runs the tier).
         Validator("DOCUMENT_OCR_BATCH_POLL_SECONDS", gte=5),
+        # 0 disables per-page OCR fan-out; otherwise it must be positive.
+        Validator("DOCUMENT_OCR_PAGES_PER_REQUEST", gte=0),
+        Validator("DOCUMENT_OCR_CONCURRENCY", gte=1),
         Validator("DOCUMENT_PARSE_MEM_LIMIT_MB", gte=128),
         # 0 disables the pre-parse PDF size cap; otherwise it must be positive.
         Validator("DOCUMENT_MAX_PDF_SIZE_MB", gte=0),
@@ -687,6 +827,8 @@ _dynaconf = Dynaconf(
         Validator("DOCUMENT_MARKDOWN_MAX_PAGES", gte=0),
         # At least one parse must be able to run.
         Validator("DOCUMENT_PARSE_PROCESS_SLOTS", gte=1),
+        Validator("DOCUMENT_NATIVE_PROCESS_SLOTS", gte=1),
+        Validator("DOCUMENT_PARSE_CACHE_MAX_MB", gte=0),
         # >=1: pymupdf4llm treats graphics_limit=0 as "no cap", which would
         # re-expose the OOM this guards against.
         Validator("DOCUMENT_PDF_GRAPHICS_LIMIT", gte=1),
@@ -697,6 +839,7 @@ _dynaconf = Dynaconf(
         Validator("DOCUMENT_GLYPH_CORRUPTION_RATIO", gte=0, lte=1),
         # Non-negative
         Validator("DOCUMENT_CHUNK_OVERLAP", gte=0),
+        Validator("DOCUMENT_CHUNK_UNIT", is_in=["chars", "tokens"]),
         # RRF ranking constant. Must be >= 1: the fused score is
         # 1/(rank + k) with rank 0-indexed, so k=0 divides by zero on the
         # top-ranked point.
@@ -709,6 +852,14 @@ _dynaconf = Dynaconf(
             condition=lambda v: v is None or v >= 1,
             messages={"condition": "EMBEDDING_DIMENSIONS must be >= 1 when set"},
         ),
+        # 0 disables the in-process embedding cache tier; negative is a typo.
+        Validator("EMBEDDING_CACHE_MAX_MB", gte=0),
+        Validator("EMBEDDING_MICROBATCH_MAX_WAIT_MS", gte=0),
+        Validator("EMBEDDING_MICROBATCH_MAX_TEXTS", gte=1),
+        Validator("EMBEDDING_MICROBATCH_MAX_CHARS", gte=1),
+        Validator("BM25_VOCAB_CACHE_SIZE", gte=1),
+        Validator("BM25_ENCODE_PROCESSES", gte=0),
+        Validator("BM25_PARALLEL_MIN_TEXTS", gte=1),
         Validator("SEARCH_RERANK_POOL_SIZE", gte=1),
         Validator("SEARCH_RERANK_MAX_CONCURRENCY", gte=1),
         Validator("SEARCH_RERANK_TIMEOUT_SECONDS", gt=0),
@@ -1091,16 +1242,35 @@ class Settings:
     # pooled connection on flaky CDN/WAN paths (see #965).
     nextcloud_http_keepalive: bool = True
 
-    # Postgres connection pool sizing — DEPRECATED, retained for
-    # backward compatibility. The psycopg engine switched to NullPool
-    # in #799 (cross-event-loop crashes under anyio TaskGroups made
-    # the original QueuePool + pool_pre_ping setup unsafe). These
-    # fields no longer affect the Postgres engine; the validators
-    # below still reject invalid values so misconfigured deploys
-    # fail loudly rather than silently. See ADR-026 § Connection
-    # pool and docs/configuration.md.
+    # Tool calls in the multi-user modes (OAuth, multi-user BasicAuth, Login
+    # Flow) reuse a per-user NextcloudClient over one shared connection pool
+    # (client.pool). Size caps the cached per-user clients (0 = build a fresh
+    # client per call); clients unused for the idle window are closed.
+    # NEXTCLOUD_HTTP2 negotiates HTTP/2 on the shared pool when the ``h2``
+    # package is installed and keep-alive is on.
+    nextcloud_client_pool_size: int = 256
+    nextcloud_client_pool_idle_seconds: int = 600
+    nextcloud_http2: bool = False
+
+    # Postgres connection pool sizing, per event loop. The engine used
+    # NullPool after #799 (cross-event-loop crashes under anyio TaskGroups);
+    # storage now keeps one pooled engine per loop instead, so these apply
+    # again. See ADR-026 § Concurrency model and pool sizing.
     database_pool_size: int = 2
     database_max_overflow: int = 5
+    database_prepared_statements: bool = False  # psycopg prepare_threshold
+
+    # Decrypted credential cache in token storage (0 TTL disables)
+    credential_cache_ttl_seconds: int = 60
+    credential_cache_size: int = 1024
+
+    # OAuth token-verification cache (in-process LRU, optional shared tier)
+    token_verify_cache_size: int = 10000
+    token_verify_cache_shared: bool = False
+
+    # Token broker refresh-ahead (0 disables) and IdP refresh concurrency
+    token_broker_refresh_ahead_seconds: int = 120
+    token_broker_refresh_concurrency: int = 8
 
     # ADR-005: Token Audience Validation (required for OAuth mode)
     nextcloud_mcp_server_url: str | None = None  # MCP server URL (used as audience)
@@ -1153,6 +1323,19 @@ class Settings:
     # source for the URL we register with NC (above
     # nextcloud_mcp_server_url and the docker-detection fallback).
     webhook_internal_url: str | None = None
+    # Webhook debounce buffer (vector/webhook_coalescer.py). Accepted webhook
+    # tasks wait until their document has been quiet for ``window_seconds``
+    # (at most ``max_delay_seconds`` after its first event), so bursts collapse
+    # to one task per document; a delete beats any index for the same document.
+    # A flush carrying ``folder_batch`` or more file index tasks from one folder
+    # wakes the user's scanner instead (multi-user mode). At ``max_pending``
+    # buffered documents the receiver returns 503 so Nextcloud retries.
+    # ``window_seconds = 0`` disables the buffer; ``folder_batch = 0`` disables
+    # folder batching.
+    webhook_coalesce_window_seconds: float = 2.0
+    webhook_coalesce_max_delay_seconds: float = 30.0
+    webhook_coalesce_max_pending: int = 10000
+    webhook_coalesce_folder_batch: int = 50
 
     # Vector sync settings (ADR-007)
     vector_sync_enabled: bool = False
@@ -1167,10 +1350,13 @@ class Settings:
     vector_sync_max_index_failures: int = 5
     # Optional per-tier concurrency overrides for the ingest worker (None = use
     # vector_sync_processor_workers). Only fast/structured are exposed; the
-    # CPU-heavy PDF paths are serialized (see document_processors/_native_locks).
+    # CPU-heavy PDF paths are bounded by the isolated worker pool (see
+    # document_native_process_slots).
     vector_sync_fast_concurrency: int | None = None
     vector_sync_structured_concurrency: int | None = None
     vector_sync_queue_max_size: int = 10000
+    vector_sync_bulk_load_threshold: int = 0  # pending docs; 0 = bulk-load off
+    vector_sync_bulk_upsert_batch_size: int = 1000  # points per bulk-load upsert
     # Cadence for the periodic gauge publisher (vector/metrics_publisher.py):
     # outstanding-work + indexed documents/chunks. Decoupled from the consumer
     # so the gauges are correct on every deployment mode and queue backend.
@@ -1234,12 +1420,40 @@ class Settings:
     # loop. A sustained empty (a genuine mass-untag) still deletes once the streak
     # reaches this value. See _plan_file_deletions in vector/scanner.py.
     vector_sync_empty_discovery_delete_threshold: int = 3
+    # Deletion tracking diffs Nextcloud against the per-user document manifest
+    # in the app DB instead of scrolling every indexed point out of Qdrant. The
+    # manifest for a (user, doc_type) is rebuilt from one Qdrant scroll when it
+    # is older than this many seconds, which seeds it after an upgrade and
+    # bounds drift from a failed best-effort write. 0 scrolls on every scan.
+    vector_sync_manifest_reconcile_interval: int = 86400
+    # Multi-user scan scheduling (vector/scan_scheduler.py). At most
+    # ``max_concurrent_scans`` user scans run at once per process; webhook-woken
+    # and newly provisioned users are admitted ahead of routine backstop scans.
+    # Each user's interval starts at ``vector_sync_scan_interval``, halves after
+    # a scan that queued work and grows by half after an idle one, within
+    # [``scan_interval_min``, ``scan_interval_max``]. Every delay is jittered by
+    # +/- ``scan_jitter`` of the interval so users do not scan in lockstep.
+    vector_sync_max_concurrent_scans: int = 4
+    vector_sync_scan_interval_min: int = 60  # seconds
+    vector_sync_scan_interval_max: int = 1800  # seconds
+    vector_sync_scan_jitter: float = 0.1
 
     # Verify-on-read concurrency (ADR-019). Cap on parallel Nextcloud
     # round-trips during search-result verification fan-out. Lower this if the
     # Nextcloud backend struggles with the parallel load; raise it on a
     # healthy connection to speed up large result pages.
     verification_concurrency: int = 20
+    # Per-user cache of verify-on-read verdicts, positive and negative
+    # (search/verification_cache.py). Webhook events, processor deletes and
+    # incoming-share changes invalidate entries early; the TTL bounds how long a
+    # revocation Nextcloud didn't tell us about can go unnoticed. 0 disables.
+    verification_cache_ttl_seconds: float = 15
+    # Repeated-search caches (search/query_cache.py). Query vectors are cached
+    # per user, LRU-bounded by entry count; hybrid-search candidates for the
+    # TTL, invalidated early when the processor writes an owner's documents.
+    # Writes by a separate ingest worker only expire with the TTL. 0 disables.
+    query_vector_cache_size: int = 1024
+    search_result_cache_ttl_seconds: float = 15
 
     # Qdrant settings (mutually exclusive modes)
     qdrant_url: str | None = None  # Network mode: http://qdrant:6333
@@ -1287,9 +1501,51 @@ class Settings:
     # Simple (fallback) provider — dimension when no real provider configured
     simple_embedding_dimension: int = 384
 
+    # Embedding reuse on re-index (vector/embedding_cache.py). When enabled, a
+    # chunk whose text hash matches a vector already stored for the document (or
+    # held in the process cache) under the current embedding identity is not
+    # re-embedded. The in-process LRU is bounded by embedding_cache_max_mb of
+    # float32 vector data; 0 disables that tier.
+    embedding_cache_enabled: bool = True
+    embedding_cache_max_mb: float = 128
+
+    # Cross-document embedding micro-batching (vector/embedding_batcher.py).
+    # Chunk texts from concurrent processor tasks are coalesced into one dense
+    # (and one BM25) request, flushed at max_texts / max_chars (~4 chars per
+    # token) or after max_wait_ms. Providers with their own request-size cap
+    # (Ollama's OLLAMA_EMBED_MAX_BATCH_CHARS) lower the char cap to it.
+    embedding_microbatch_enabled: bool = True
+    embedding_microbatch_max_wait_ms: int = 10
+    embedding_microbatch_max_texts: int = 64
+    embedding_microbatch_max_chars: int = 65536
+    # BM25 sparse encoding (providers/bm25_encoder.py). The encoder interns up
+    # to bm25_vocab_cache_size raw tokens with their stem and token id. With
+    # bm25_encode_processes > 0, batches of at least bm25_parallel_min_texts
+    # texts are sharded across that many dedicated worker processes.
+    bm25_vocab_cache_size: int = 200000
+    bm25_encode_processes: int = 0
+    bm25_parallel_min_texts: int = 256
+    # Chunk-level diff writes on re-index (vector/diff_upsert.py): only new or
+    # changed chunks are upserted, payload-only changes go through set_payload,
+    # and chunk positions that vanished are deleted.
+    vector_sync_diff_upsert: bool = True
+    # Chunks embedded and written per window when indexing a long document
+    # (more chunks than this). Each window's vectors and points are released
+    # once it is written, so a 4000-page PDF no longer holds every vector at
+    # once, its first pages are searchable while the rest embeds, and a retry
+    # after a crash re-uses the windows already stored (unchanged chunks are
+    # neither re-embedded nor rewritten). 0 disables windowing.
+    vector_sync_stream_window_chunks: int = 256
+    # Index a file whose exact bytes (SHA-256) are already indexed under another
+    # fileid -- a copy in another folder, a saved mail attachment -- by copying
+    # that document's chunk points and vectors under the new fileid, skipping
+    # parse, OCR and embedding. The copy gets its own path, owner and
+    # acl_principals; it never widens access to the original.
+    vector_sync_content_dedup: bool = True
+
     # Document chunking settings (for vector embeddings)
-    document_chunk_size: int = 2048  # Characters per chunk
-    document_chunk_overlap: int = 200  # Overlapping characters between chunks
+    document_chunk_size: int = 2048  # Chunk size in document_chunk_unit
+    document_chunk_overlap: int = 200  # Overlap between chunks, same unit
     # Page-aware chunking for paginated docs (PDFs). When True (default), PDF
     # text is split on page boundaries first (one chunk per page; oversized
     # pages are character-split within the page), giving exact page numbers,
@@ -1323,6 +1579,11 @@ class Settings:
     # lean-page/born-digital PDFs. Off by default: enabling it re-scales density
     # fleet-wide and requires the storage-rate re-calibration first (#626).
     document_chunk_page_pack: bool = False
+    # Unit of document_chunk_size/overlap: "chars" or "tokens". Token mode counts
+    # with the Hugging Face tokenizer named by document_chunk_tokenizer (hub repo
+    # id or tokenizer.json path), matching the embedding model's own input limit.
+    document_chunk_unit: str = "chars"
+    document_chunk_tokenizer: str | None = None
     # Chunking config generation. Bump on ANY chunker behaviour change (size,
     # overlap, page-aware, page-pack, split strategy) so a change can't silently
     # invalidate the €/GiB density reference. Stamped on the collection sentinel
@@ -1415,6 +1676,15 @@ class Settings:
     # instead. 2 covers the per-tier worker concurrency actually deployed (1-3)
     # while capping the pathological case; raise it only with headroom to spare.
     document_parse_process_slots: int = 2
+    # Concurrent isolated subprocesses for the other native PDF work: the
+    # pypdfium2 fast tier, pymupdf metadata reads, scan detection and chunk
+    # bboxes. These used to run in threads behind one process-wide lock per
+    # library (neither library is thread-safe), so concurrent ingest jobs queued
+    # on it; separate processes need no lock. A separate limiter from
+    # document_parse_process_slots so a slow structured parse can't starve the
+    # fast tier. Same RLIMIT_AS per worker, so budget
+    # (parse + native slots) x document_parse_mem_limit_mb against the pod.
+    document_native_process_slots: int = 2
     # Stream ingest downloads to a spool file rather than buffering the whole
     # response in memory. read_file holds the entire document (a real 1040 MB
     # file cost ~1.1 GB resident before a page was read); streaming keeps that
@@ -1424,6 +1694,12 @@ class Settings:
     # container that is the /tmp emptyDir, which must have room for roughly
     # (worker concurrency x the largest document).
     document_spool_dir: str | None = None
+    # Parse results kept on disk under <document_spool_dir>/nc-parse-cache
+    # (vector/parse_cache.py), keyed on the document version, the tier and the
+    # parse settings, so a retry after an embedding/Qdrant failure doesn't pay
+    # for the parse -- possibly an OCR pass -- again. LRU-evicted past this many
+    # MB; 0 disables. Counts against the spool volume.
+    document_parse_cache_max_mb: float = 512
     # Tier-0 classifier. Records classification metrics (recommended_tier,
     # text-quality) on the tiered path, derived from the tier-1 extraction.
     document_classify_enabled: bool = True
@@ -1454,6 +1730,16 @@ class Settings:
     # polled indefinitely — the gateway owns the OCR lifecycle (Deck #523), so
     # there is no worker-side give-up deadline.
     document_ocr_batch_poll_seconds: int = 120
+    # Sync OCR of a PDF in page ranges (0 = whole document per request). With
+    # N > 0 the PDF's own text layer is read first and scored page by page with
+    # the thresholds below; only pages that fail them are OCR'd, in ranges of at
+    # most N consecutive pages, and the usable pages keep their native text. The
+    # ranges go to the backend concurrently, document_ocr_concurrency at a time
+    # (per worker process, shared by every document on that backend), so a
+    # 200-page scan no longer holds one backend slot for minutes while the
+    # others idle. Batch mode is unaffected.
+    document_ocr_pages_per_request: int = 0
+    document_ocr_concurrency: int = 4
     # OCR escalation triggers (tier-0), per-tenant tunable. A page is OCR-worthy
     # if near-empty (< min_page_chars) OR low text-quality (< min_text_quality)
     # OR (when detect_scanned, image-analysis only runs when OCR is enabled)
@@ -1528,6 +1814,9 @@ class Settings:
     ingest_escalation_enabled: bool = True  # per-tier queue-hop (Deck #323)
     ingest_transient_max_attempts: int = 5  # same-tier transient-retry cap
     ingest_reclaim_retry_delay_seconds: int = 30  # stagger reclaimed-job retries
+    ingest_interactive_lane_weight: int = 10  # turns per backfill turn (lanes)
+    ingest_backfill_lane_weight: int = 1
+    ingest_interactive_window_seconds: int = 86400  # "recent edit" horizon
     collection_metadata_source: str = "qdrant"  # qdrant | api
     collection_metadata_api_url: str | None = None  # CP URL when source=api
     embedding_gateway_url: str | None = None  # required when provider=gateway
@@ -1645,7 +1934,7 @@ class Settings:
                 f"Overlap should be 10-20% of chunk size for optimal results."
             )
 
-        if self.document_chunk_size < 512:
+        if self.document_chunk_unit == "chars" and self.document_chunk_size < 512:
             logger.warning(
                 "DOCUMENT_CHUNK_SIZE is set to %s characters, which is quite small. Smaller chunks may lose context. Consider using at least 1024 characters.",
                 self.document_chunk_size,
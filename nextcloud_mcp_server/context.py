@@ -10,6 +10,7 @@ from nextcloud_mcp_server.auth.context_helper import get_client_from_context
 from nextcloud_mcp_server.auth.scope_authorization import ProvisioningRequiredError
 from nextcloud_mcp_server.auth.storage import get_shared_storage
 from nextcloud_mcp_server.client import NextcloudClient
+from nextcloud_mcp_server.client.pool import pooled_client
 from nextcloud_mcp_server.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -61,7 +62,7 @@ async def get_client(ctx: Context) -> NextcloudClient:
 
     # Multi-user BasicAuth pass-through mode - extract credentials from request
     if settings.enable_multi_user_basic_auth:
-        return _get_client_from_basic_auth(ctx)
+        return await _get_client_from_basic_auth(ctx)
 
     lifespan_ctx = ctx.request_context.lifespan_context
 
@@ -78,7 +79,7 @@ async def get_client(ctx: Context) -> NextcloudClient:
     if hasattr(lifespan_ctx, "nextcloud_host"):
         # Token was validated to have MCP audience in UnifiedTokenVerifier
         # Nextcloud will independently validate its own audience when receiving API calls
-        return get_client_from_context(ctx, lifespan_ctx.nextcloud_host)
+        return await get_client_from_context(ctx, lifespan_ctx.nextcloud_host)
 
     # Unknown context type
     raise AttributeError(
@@ -87,17 +88,17 @@ async def get_client(ctx: Context) -> NextcloudClient:
     )
 
 
-def _get_client_from_basic_auth(ctx: Context) -> NextcloudClient:
+async def _get_client_from_basic_auth(ctx: Context) -> NextcloudClient:
     """
-    Create NextcloudClient from BasicAuth credentials in request headers.
+    Get a NextcloudClient for the BasicAuth credentials in request headers.
 
     For multi-user BasicAuth pass-through mode, this function extracts
     username/password from the Authorization: Basic header (stored by
     BasicAuthMiddleware) and creates a client that passes these credentials
     through to Nextcloud APIs.
 
-    The credentials are NOT stored persistently - they exist only for the
-    duration of this request (stateless).
+    The credentials are NOT stored persistently. The pooled client built from
+    them (``client.pool``) is held in memory until it goes idle.
 
     Args:
         ctx: MCP request context with basic_auth in request state
@@ -139,16 +140,16 @@ def _get_client_from_basic_auth(ctx: Context) -> NextcloudClient:
         raise ValueError("Invalid BasicAuth credentials - missing username or password")
 
     logger.debug(
-        "Creating multi-user BasicAuth client for %s as %s",
+        "Getting multi-user BasicAuth client for %s as %s",
         settings.nextcloud_host,
         username,
     )
 
-    # Create client that passes BasicAuth credentials through to Nextcloud
+    # Client that passes BasicAuth credentials through to Nextcloud
     # settings.nextcloud_host is guaranteed to be str after the check above
-    return NextcloudClient(
-        base_url=settings.nextcloud_host,
-        username=username,
+    return await pooled_client(
+        settings.nextcloud_host,
+        username,
         auth=BasicAuth(username, password),
         password=password,
     )
@@ -157,7 +158,7 @@ def _get_client_from_basic_auth(ctx: Context) -> NextcloudClient:
 async def _get_client_from_login_flow(
     ctx: Context, nextcloud_host: str
 ) -> NextcloudClient:
-    """Create NextcloudClient from stored Login Flow v2 app password.
+    """Get the NextcloudClient for the stored Login Flow v2 app password.
 
     In Login Flow v2 mode, the OAuth token only provides MCP session identity.
     Nextcloud API calls always use the stored app password obtained via Login Flow v2.
@@ -210,15 +211,15 @@ async def _get_client_from_login_flow(
     app_password = app_data["app_password"]
 
     logger.debug(
-        "Creating Login Flow v2 client for %s (id=%s, login=%s)",
+        "Getting Login Flow v2 client for %s (id=%s, login=%s)",
         nextcloud_host,
         user_id,
         login_name,
     )
 
-    return NextcloudClient(
-        base_url=nextcloud_host,
-        username=login_name,
+    return await pooled_client(
+        nextcloud_host,
+        login_name,
         auth_username=login_name,
         auth=BasicAuth(login_name, app_password),
         password=app_password,
@@ -10,12 +10,23 @@ one bad file fails *that document*, not the pod: an rlimit breach raises
 
 The worker function is module-level (picklable) so ``anyio.to_process`` can run it
 in its process pool.
+
+The same pool runs the rest of the ingest path's pymupdf / pypdfium2 work --
+fast-tier extraction, the structured tier's metadata read, scan-detection image
+coverage and chunk bboxes -- through :func:`run_isolated_native`. Both libraries
+keep process-global state that is not thread-safe, so running them on the
+thread pool needed a process-wide lock per library, and every concurrent ingest
+job queued on it. A worker process owns its own library instance, so jobs run
+in parallel up to ``document_native_process_slots``, under the same address-space
+cap and a timeout.
 """
 
 import logging
 import sys
+import time
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TypeVar, cast
 
 import anyio
 import anyio.to_process
@@ -25,6 +36,7 @@ from anyio.lowlevel import RunVar
 from nextcloud_mcp_server.document_processors._pymupdf4llm_classic import (
     load_classic_pymupdf4llm,
 )
+from nextcloud_mcp_server.observability.metrics import record_pdf_native_lock_wait
 
 # ``resource`` is a Unix-only stdlib module -- it does not exist on Windows, and
 # importing it unconditionally crashed Windows startup (#877). The RLIMIT_AS cap
@@ -47,6 +59,11 @@ _MEM_LIMIT_APPLIED = False
 # belongs to the event loop that created it, so hold it in a RunVar (the same
 # mechanism anyio uses for its own default) rather than a module global.
 _PARSE_LIMITER: RunVar[CapacityLimiter] = RunVar("_pdf_parse_process_limiter")
+# Bounds concurrent run_isolated_native calls, separately from parses so a burst
+# of bbox jobs cannot starve the parse slots (or the reverse).
+_NATIVE_LIMITER: RunVar[CapacityLimiter] = RunVar("_pdf_native_process_limiter")
+
+_T = TypeVar("_T")
 
 
 def parse_process_limiter(slots: int) -> CapacityLimiter:
@@ -65,6 +82,20 @@ def parse_process_limiter(slots: int) -> CapacityLimiter:
         return limiter
 
 
+def native_process_limiter(slots: int) -> CapacityLimiter:
+    """The per-event-loop limiter bounding concurrent native-library jobs.
+
+    Same lifecycle as :func:`parse_process_limiter`: created on first use from
+    ``document_native_process_slots`` and fixed until restart.
+    """
+    try:
+        return _NATIVE_LIMITER.get()
+    except LookupError:
+        limiter = CapacityLimiter(max(1, slots))
+        _NATIVE_LIMITER.set(limiter)
+        return limiter
+
+
 # pymupdf4llm reconstructs reading-order markdown, which can DROP most of the text
 # on non-prose layouts (engineering drawings, scattered labels): observed 598 of a
 # 5080-char text layer on an A1 ventilation drawing -- which then mis-escalated to
@@ -175,6 +206,15 @@ class PdfWorkerError(Exception):
     """
 
 
+class PdfUnreadableError(PdfWorkerError):
+    """MuPDF could not open the input as a document at all (``FileDataError``).
+
+    Raised by worker functions in place of ``pymupdf.FileDataError`` so the
+    parent can still tell "not a PDF" apart from other failures once the error
+    has crossed the process boundary as a plain string.
+    """
+
+
 def _picklable_message(exc: BaseException) -> str:
     """``TypeName: message`` for ``exc``, tolerating a broken ``__str__``.
 
@@ -408,3 +448,49 @@ async def run_isolated_pdf_parse(
             raise PdfParseFailed("error", f"{type(e).__name__}: {e}") from e
     # Reached only when move_on_after swallowed the timeout cancellation.
     raise PdfParseFailed("timeout", f"parse exceeded {timeout_seconds}s")
+
+
+def _native_worker(func: Callable[..., _T], mem_limit_mb: int, *args: Any) -> _T:
+    """Run ``func(*args)`` in the worker subprocess, raising only picklable errors.
+
+    The same normalisation as :func:`_parse_pdf_worker`, for the same reason:
+    pymupdf exceptions carry SWIG objects that anyio cannot pickle back.
+    """
+    _apply_mem_limit(mem_limit_mb)
+    try:
+        return func(*args)
+    except MemoryError as exc:
+        raise MemoryError(_picklable_message(exc)) from exc
+    except PdfWorkerError:
+        raise
+    except Exception as exc:
+        raise PdfWorkerError(_picklable_message(exc)) from exc
+
+
+async def run_isolated_native(
+    func: Callable[..., _T],
+    *args: Any,
+    library: str,
+    timeout_seconds: float,
+    mem_limit_mb: int,
+    process_slots: int = 2,
+) -> _T:
+    """Run a pymupdf / pypdfium2 job in the isolated worker pool.
+
+    ``func`` must be a module-level function (it is pickled by reference) that
+    opens the document itself, preferably from a path: its arguments cross a
+    pipe. ``library`` (``pymupdf`` | ``pdfium``) labels the slot-wait metric.
+
+    Raises ``TimeoutError`` after ``timeout_seconds`` (the worker is killed),
+    ``MemoryError`` on an rlimit breach, ``BrokenWorkerProcess`` if the worker
+    died, and :class:`PdfWorkerError` (or a subclass) for anything ``func``
+    raised. Callers treat all of these as a failure of that one document.
+    """
+    limiter = native_process_limiter(process_slots)
+    start = time.perf_counter()
+    async with limiter:
+        record_pdf_native_lock_wait(library, time.perf_counter() - start)
+        with anyio.fail_after(timeout_seconds):
+            return await anyio.to_process.run_sync(
+                _native_worker, func, mem_limit_mb, *args, cancellable=True
+            )
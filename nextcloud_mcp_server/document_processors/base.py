@@ -92,10 +92,10 @@ class DocumentProcessor(ABC):
 
         Concrete on purpose: the default materialises the source and delegates to
         :meth:`process`, so every existing processor keeps working untouched and
-        each can be migrated to a path-based parse independently. Override it
-        where opening by path avoids holding the whole document in memory (the
-        PDF engines); leave it alone where the processor genuinely needs bytes
-        (OCR base64, HTTP upload backends).
+        each can be migrated to a path-based parse independently. Every built-in
+        processor overrides it: the PDF engines open the path, the HTTP backends
+        stream ``source.open()`` as the upload body, and OCR encodes from
+        ``source.buffer()``. A new processor should do the same.
 
         Note the default is where peak memory still scales with document size --
         ``read_bytes`` is deliberately greppable for that reason.
@@ -19,9 +19,11 @@ Two entry points:
   * ``classify_from_text(text, page_boundaries, ...)`` -- the HOT PATH. Routes on
     text-quality + near-empty pages derived from the tier-1 extraction (~no
     cost). When OCR + scan-detection are enabled the registry also passes
-    per-page ``image_coverage`` (from ``image_coverage_per_page``) for the
-    ``image_heavy`` diagnostic flag; that image pass is the only added cost and
-    only OCR-opted-in tenants pay it. Thresholds come from per-tenant settings.
+    per-page ``image_coverage`` for the ``image_heavy`` diagnostic flag; that
+    image pass is the only added cost and only OCR-opted-in tenants pay it. The
+    fast and structured parsers measure it during their own pass
+    (``PAGE_SIGNALS_KEY``); ``image_coverage_per_page`` re-opens the PDF only
+    for a result that carries none. Thresholds come from per-tenant settings.
   * ``classify_pdf(content)`` -- a standalone/diagnostic pass that re-opens the
     PDF and does image-coverage analysis inline. Off the hot path.
 
@@ -64,6 +66,16 @@ MIN_PAGE_CHARS = 16
 # ``_control_char_ratio``.
 GLYPH_CORRUPTION_RATIO = 0.02
 
+# ``ProcessingResult.metadata`` key for the per-page signals a parser recorded
+# during its own pass over the document, so classification never re-opens it:
+#   * ``text_quality`` / ``control_chars`` -- one entry per page boundary, scored
+#     on exactly the page's slice of the result text (``page_text_signals``);
+#   * ``image_coverage`` -- the first ``MAX_SAMPLED_PAGES`` pages, present only
+#     when scan detection is enabled (``scan_detection_enabled``).
+# Either part may be missing: the structured tier's markdown is not the text the
+# worker saw, so it records image coverage only.
+PAGE_SIGNALS_KEY = "page_signals"
+
 _WORD_RE = re.compile(r"\S+")
 
 # Whitespace control characters that legitimately appear in extracted text
@@ -179,6 +191,47 @@ def _page_image_coverage(page: Any) -> float:
     return min(img_area / page_area, 1.0)
 
 
+def pdfium_page_image_coverage(pdfium_c: Any, page: Any) -> float:
+    """:func:`_page_image_coverage` for a pypdfium2 page (``pdfium_c`` is
+    ``pypdfium2.raw``).
+
+    Approximate in the same way, and a little more: an image nested in a Form
+    XObject is measured in the form's own space. A scan places its page image
+    directly on the page, which is the case the coverage signal is for.
+    """
+    width, height = page.get_size()
+    page_area = abs(width * height) or 1.0
+    img_area = 0.0
+    for obj in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_IMAGE]):
+        left, bottom, right, top = obj.get_bounds()
+        img_area += abs((right - left) * (top - bottom))
+    return min(img_area / page_area, 1.0)
+
+
+def scan_detection_enabled(settings: Any) -> bool:
+    """Whether per-page image coverage is collected at all.
+
+    Scan detection feeds the OCR tier, so it is on only when classification,
+    OCR and ``document_ocr_detect_scanned`` are all enabled.
+    """
+    return bool(
+        settings.document_classify_enabled
+        and settings.document_ocr_enabled
+        and settings.document_ocr_detect_scanned
+    )
+
+
+def page_text_signals(text: str) -> tuple[float, int]:
+    """``(text_quality, control-character count)`` of one page's text.
+
+    The parsers record these per page while they extract (``PAGE_SIGNALS_KEY``),
+    so :func:`classify_from_text` doesn't score every page again on the event
+    loop.
+    """
+    bad = sum(1 for c in text if ord(c) < 0x20 and c not in _TEXT_WHITESPACE_CONTROLS)
+    return _text_quality(text), bad
+
+
 def _route_from_signals(
     *,
     total_chars: int,
@@ -243,15 +296,14 @@ def classify_pdf(content: bytes) -> DocClassification:
     May raise (e.g. ``pymupdf`` errors) if the bytes can't be opened as a PDF;
     callers run it in a guarded context (shadow mode swallows failures) so a
     bad file never breaks indexing.
+
+    Drives MuPDF in the calling process, which is not thread-safe: from a
+    server, run it through ``_isolation.run_isolated_native`` like the other
+    pymupdf entry points here.
     """
     import pymupdf  # noqa: PLC0415 -- keep the heavy import lazy / off module load
 
-    from nextcloud_mcp_server.document_processors._native_locks import (  # noqa: PLC0415
-        pymupdf_serialized,
-    )
-
-    # MuPDF is not thread-safe; serialize against concurrent bbox/parse threads.
-    with pymupdf_serialized(), pymupdf.open("pdf", content) as doc:
+    with pymupdf.open("pdf", content) as doc:
         page_count = doc.page_count
         indices = _sample_indices(page_count)
         pages: list[PageSignals] = []
@@ -331,15 +383,11 @@ def image_coverage_per_page_from_path(source_path: str) -> list[float]:
     """
     import pymupdf  # noqa: PLC0415
 
-    from nextcloud_mcp_server.document_processors._native_locks import (  # noqa: PLC0415
-        pymupdf_serialized,
-    )
-
     cov: list[float] = []
     # filetype="pdf": the spool path is ``*.bin``, and PyMuPDF would infer the
     # MuPDF magic from that suffix and fail to find a handler. Matches the
     # bytes-based twin below, which already passes "pdf" explicitly.
-    with pymupdf_serialized(), pymupdf.open(source_path, filetype="pdf") as doc:
+    with pymupdf.open(source_path, filetype="pdf") as doc:
         for n in range(min(doc.page_count, MAX_SAMPLED_PAGES)):
             cov.append(_page_image_coverage(doc.load_page(n)))
     return cov
@@ -355,17 +403,14 @@ def image_coverage_per_page(content: bytes) -> list[float]:
 
     Bounded to the first ``MAX_SAMPLED_PAGES`` pages -- the image pass is the
     costly part, so a 200-page scan isn't fully rasterised on the hot path.
+
+    MuPDF is not thread-safe; the registry runs this (and the path twin above)
+    in the isolated worker pool, never on the event loop or a parent thread.
     """
     import pymupdf  # noqa: PLC0415 -- keep the heavy import lazy
 
-    from nextcloud_mcp_server.document_processors._native_locks import (  # noqa: PLC0415
-        pymupdf_serialized,
-    )
-
     cov: list[float] = []
-    # MuPDF is not thread-safe. This runs on the event loop during escalation, so
-    # the lock also serializes it against concurrent bbox/parse worker threads.
-    with pymupdf_serialized(), pymupdf.open("pdf", content) as doc:
+    with pymupdf.open("pdf", content) as doc:
         for n in range(min(doc.page_count, MAX_SAMPLED_PAGES)):
             cov.append(_page_image_coverage(doc.load_page(n)))
     return cov
@@ -380,6 +425,7 @@ def classify_from_text(
     page_fraction: float = OCR_PAGE_FRACTION,
     glyph_corruption_ratio: float = GLYPH_CORRUPTION_RATIO,
     image_coverage: list[float] | None = None,
+    page_signals: dict[str, Any] | None = None,
 ) -> DocClassification:
     """Classify from text already extracted by tier-1 -- no PDF re-open by default.
 
@@ -397,10 +443,31 @@ def classify_from_text(
     ``page_boundaries`` are ``{page, start_offset, end_offset}`` indexing into
     ``full_text``; ``image_coverage[i]`` (if given) aligns with the i-th boundary.
 
+    ``page_signals`` is the parser's ``PAGE_SIGNALS_KEY`` metadata. Its per-page
+    quality and control-character counts replace re-scoring each page when they
+    cover exactly these boundaries, and its ``image_coverage`` stands in for an
+    omitted ``image_coverage`` argument.
+
     Note: the ``image_heavy`` flag is only set when ``image_coverage`` is
     supplied, so for tenants with scan detection off that flag is always zero.
     Routing is unaffected either way -- it is on the text signals alone.
     """
+    signals = page_signals or {}
+    if image_coverage is None:
+        image_coverage = signals.get("image_coverage")
+    qualities = signals.get("text_quality")
+    controls = signals.get("control_chars")
+    # Recorded on exactly the text being classified, or not used at all: a
+    # result whose text was rewritten after the parse falls back to scoring.
+    precomputed = (
+        qualities is not None
+        and controls is not None
+        and len(qualities) == len(controls) == len(page_boundaries)
+        and bool(page_boundaries)
+        and page_boundaries[0]["start_offset"] == 0
+        and page_boundaries[-1]["end_offset"] == len(full_text)
+    )
+
     # image_coverage is expected to be one entry per page, capped at
     # MAX_SAMPLED_PAGES (see image_coverage_per_page). Any other length means the
     # 1:1 page alignment drifted (e.g. the extractor reordered/skipped pages) --
@@ -420,7 +487,12 @@ def classify_from_text(
     pages: list[PageSignals] = []
     for idx, b in enumerate(page_boundaries):
         seg = full_text[b["start_offset"] : b["end_offset"]]
-        quality = _text_quality(seg)
+        if precomputed:
+            quality = qualities[idx]
+            control_ratio = controls[idx] / len(seg) if seg else 0.0
+        else:
+            quality = _text_quality(seg)
+            control_ratio = _control_char_ratio(seg)
         # image_coverage is one entry per PDF page, aligned 1:1 with the
         # boundaries; the length guard is belt-and-suspenders against a mismatch.
         cov = (
@@ -443,7 +515,7 @@ def classify_from_text(
                 round(cov, 3),
                 quality,
                 needs_ocr,
-                round(_control_char_ratio(seg), 4),
+                round(control_ratio, 4),
             )
         )
 
@@ -462,7 +534,12 @@ def classify_from_text(
     # are therefore not numerically identical for a >24-page doc with corruption
     # concentrated outside the sample. full_text is used here because it is exactly
     # the text that gets chunked + indexed and is robust to boundary edge cases.
-    control_ratio = _control_char_ratio(full_text)
+    # A parser's boundaries partition its text (the page_boundaries contract),
+    # so the per-page counts sum to the same ratio.
+    if precomputed:
+        control_ratio = sum(controls) / len(full_text) if full_text else 0.0
+    else:
+        control_ratio = _control_char_ratio(full_text)
 
     flags, recommended = _route_from_signals(
         total_chars=total_chars,
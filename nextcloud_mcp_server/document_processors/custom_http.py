@@ -2,11 +2,12 @@
 
 import logging
 from collections.abc import Awaitable, Callable
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 import httpx
 
 from .base import DocumentProcessor, ProcessingResult, ProcessorError
+from .source import DocumentSource
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,20 @@ class CustomHTTPProcessor(DocumentProcessor):
     def supported_mime_types(self) -> set[str]:
         return self._supported_types
 
+    async def process_source(
+        self,
+        source: DocumentSource,
+        options: Optional[dict[str, Any]] = None,
+        progress_callback: Optional[
+            Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+        ] = None,
+    ) -> ProcessingResult:
+        """Upload straight from the source's file handle (streamed by httpx)."""
+        with source.open() as upload:
+            return await self._post(
+                upload, source.content_type, source.filename, options
+            )
+
     async def process(
         self,
         content: bytes,
@@ -89,6 +104,15 @@ class CustomHTTPProcessor(DocumentProcessor):
         Raises:
             ProcessorError: If API call fails
         """
+        return await self._post(content, content_type, filename, options)
+
+    async def _post(
+        self,
+        content: bytes | IO[bytes],
+        content_type: str,
+        filename: Optional[str],
+        options: Optional[dict[str, Any]],
+    ) -> ProcessingResult:
         options = options or {}
 
         # Prepare request
@@ -28,12 +28,13 @@ import io
 import logging
 import time
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import IO, Any
 
 import anyio
 import httpx
 
 from .base import DocumentProcessor, ProcessingResult, ProcessorError
+from .source import DocumentSource
 
 logger = logging.getLogger(__name__)
 
@@ -112,7 +113,7 @@ def docling_pages(json_content: Any) -> list[tuple[int, str]]:
 
 async def convert_file(
     api_url: str,
-    content: bytes,
+    content: bytes | memoryview | IO[bytes],
     content_type: str | None,
     *,
     filename: str | None = None,
@@ -131,14 +132,21 @@ async def convert_file(
     requests the classic layout+OCR pipeline with byte-identical form fields to the
     pre-VLM client. The response shape is the same for both pipelines.
 
+    ``content`` may be an open binary file (``DocumentSource.open``): httpx then
+    streams it in chunks as the multipart body, so a spooled document is never
+    read into memory.
+
     Raises :class:`ProcessorError` on HTTP error, a non-usable ``status``
     (anything but success/partial_success), or empty output -- so callers get a
     single failure type to map to their fallback.
     """
+    upload = (
+        io.BytesIO(content) if isinstance(content, (bytes, memoryview)) else content
+    )
     files = {
         "files": (
             filename or "document",
-            io.BytesIO(content),
+            upload,
             content_type or "application/octet-stream",
         )
     }
@@ -275,7 +283,7 @@ class DoclingProcessor(DocumentProcessor):
         return DOCLING_IMAGE_TYPES
 
     async def _convert(
-        self, content: bytes, content_type: str, filename: str | None
+        self, content: bytes | IO[bytes], content_type: str, filename: str | None
     ) -> ProcessingResult:
         document = await convert_file(
             self.api_url,
@@ -302,6 +310,20 @@ class DoclingProcessor(DocumentProcessor):
             processor=self.name,
         )
 
+    async def process_source(
+        self,
+        source: DocumentSource,
+        options: dict[str, Any] | None = None,
+        progress_callback: (
+            Callable[[float, float | None, str | None], Awaitable[None]] | None
+        ) = None,
+    ) -> ProcessingResult:
+        """Upload straight from the source's file handle (streamed by httpx)."""
+        with source.open() as upload:
+            return await self._process_upload(
+                upload, source.content_type, source.filename, progress_callback
+            )
+
     async def process(
         self,
         content: bytes,
@@ -311,6 +333,19 @@ class DoclingProcessor(DocumentProcessor):
         progress_callback: (
             Callable[[float, float | None, str | None], Awaitable[None]] | None
         ) = None,
+    ) -> ProcessingResult:
+        return await self._process_upload(
+            content, content_type, filename, progress_callback
+        )
+
+    async def _process_upload(
+        self,
+        content: bytes | IO[bytes],
+        content_type: str,
+        filename: str | None,
+        progress_callback: (
+            Callable[[float, float | None, str | None], Awaitable[None]] | None
+        ),
     ) -> ProcessingResult:
         if progress_callback is None:
             return await self._convert(content, content_type, filename)
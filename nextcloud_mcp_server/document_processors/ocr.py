@@ -30,7 +30,7 @@ import html as _html
 import logging
 import re
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable, Sequence
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from typing import TYPE_CHECKING, Any
 
 import anyio
@@ -38,7 +38,10 @@ import httpx
 
 from nextcloud_mcp_server.config import Settings, get_settings
 
+from ..observability.metrics import record_document_ocr_pages
 from .base import DocumentProcessor, ProcessingResult, ProcessorError
+from .classifier import PAGE_SIGNALS_KEY, classify_from_text
+from .source import DocumentSource
 
 if TYPE_CHECKING:
     # Annotation-only import (the runtime import is lazy, inside
@@ -254,14 +257,63 @@ def _batch_identity(
     return str(user_id), str(doc_id), str(doc_type), str(options.get("etag") or "")
 
 
+def _pages_needing_ocr(
+    text: str,
+    boundaries: list[dict[str, Any]],
+    settings: Settings,
+    page_signals: dict[str, Any] | None = None,
+) -> set[int]:
+    """0-based indices of the pages whose native text layer is not usable.
+
+    Scored with the same per-page signals and thresholds as the tier-0
+    classifier (near-empty or junk text), plus a glyph-corrupt page (control
+    characters above ``document_glyph_corruption_ratio``): a document can reach
+    the OCR tier after the structured tier failed on exactly those pages.
+    ``page_signals`` is the scoring ``_extract`` already did in the worker.
+    """
+    glyph_ratio = settings.document_glyph_corruption_ratio
+    classification = classify_from_text(
+        text,
+        boundaries,
+        min_text_quality=settings.document_ocr_min_text_quality,
+        min_page_chars=settings.document_ocr_min_page_chars,
+        glyph_corruption_ratio=glyph_ratio,
+        page_signals=page_signals,
+    )
+    return {
+        page.page_no - 1
+        for page in classification.pages
+        if page.needs_ocr or (glyph_ratio and page.control_ratio > glyph_ratio)
+    }
+
+
+def _page_ranges(pages: Iterable[int], max_pages: int) -> list[tuple[int, int]]:
+    """Group page indices into ``[start, end)`` runs of consecutive pages, each
+    at most ``max_pages`` long."""
+    ranges: list[tuple[int, int]] = []
+    for page in sorted(pages):
+        if ranges and ranges[-1][1] == page and page - ranges[-1][0] < max_pages:
+            ranges[-1] = (ranges[-1][0], page + 1)
+        else:
+            ranges.append((page, page + 1))
+    return ranges
+
+
 class _OcrBackend(ABC):
     @abstractmethod
+    async def ocr_pages(
+        self, content: bytes | memoryview, mime_type: str
+    ) -> list[tuple[Any, ...]]:
+        """Return the per-page ``_pages_to_text`` input: ``(index, markdown)`` or
+        ``(index, markdown, blocks)``, ``index`` 0-based within ``content``."""
+        ...
+
     async def ocr(
-        self, content: bytes, mime_type: str
+        self, content: bytes | memoryview, mime_type: str
     ) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]]]:
         """Return ``(text, page_boundaries, block_spans)``. ``block_spans`` is empty
         for backends without layout geometry (Mistral)."""
-        ...
+        return _pages_to_text(await self.ocr_pages(content, mime_type))
 
 
 class _GatewayOcrBackend(_OcrBackend):
@@ -275,9 +327,9 @@ class _GatewayOcrBackend(_OcrBackend):
         self._model = model
         self._token_provider = token_provider
 
-    async def ocr(
-        self, content: bytes, mime_type: str
-    ) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]]]:
+    async def ocr_pages(
+        self, content: bytes | memoryview, mime_type: str
+    ) -> list[tuple[Any, ...]]:
         headers: dict[str, str] = {}
         if self._token_provider is not None:
             headers["Authorization"] = (
@@ -303,11 +355,10 @@ class _GatewayOcrBackend(_OcrBackend):
         # to _pages_to_text, which turns it into per-block char spans. ``index``
         # falls back to position (defensive, matching the batch client) so a missing
         # field degrades to ordered pages rather than a KeyError.
-        pages = [
+        return [
             (p.get("index", i), p.get("markdown", ""), p.get("blocks"))
             for i, p in enumerate(body.get("pages", []))
         ]
-        return _pages_to_text(pages)
 
 
 class _MistralOcrBackend(_OcrBackend):
@@ -321,9 +372,9 @@ class _MistralOcrBackend(_OcrBackend):
         # upstream model the SDK expects.
         self._model = model.split("/", 1)[-1]
 
-    async def ocr(
-        self, content: bytes, mime_type: str
-    ) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]]]:
+    async def ocr_pages(
+        self, content: bytes | memoryview, mime_type: str
+    ) -> list[tuple[Any, ...]]:
         data_url = (
             f"data:{mime_type};base64,{base64.b64encode(content).decode('ascii')}"
         )
@@ -338,8 +389,7 @@ class _MistralOcrBackend(_OcrBackend):
                 model=self._model,
                 document={"type": "document_url", "document_url": data_url},
             )
-        pages = [(p.index, p.markdown or "") for p in (resp.pages or [])]
-        return _pages_to_text(pages)
+        return [(p.index, p.markdown or "") for p in (resp.pages or [])]
 
 
 class _DoclingServeBackend(_OcrBackend):
@@ -359,9 +409,9 @@ class _DoclingServeBackend(_OcrBackend):
         self._pipeline = pipeline
         self._vlm_preset = vlm_preset
 
-    async def ocr(
-        self, content: bytes, mime_type: str
-    ) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]]]:
+    async def ocr_pages(
+        self, content: bytes | memoryview, mime_type: str
+    ) -> list[tuple[Any, ...]]:
         # Lazy import keeps docling_serve off the ocr module-load path.
         from .docling_serve import convert_file, docling_pages  # noqa: PLC0415
 
@@ -382,7 +432,7 @@ class _DoclingServeBackend(_OcrBackend):
             vlm_pipeline_preset=self._vlm_preset,
             timeout=ocr_timeout,
         )
-        pages = docling_pages(document.get("json_content"))
+        pages: list[tuple[Any, ...]] = list(docling_pages(document.get("json_content")))
         if not pages:
             # No per-page provenance in the DoclingDocument: fall back to a single
             # whole-text page. convert_file guarantees non-empty text, so this
@@ -391,7 +441,7 @@ class _DoclingServeBackend(_OcrBackend):
             pages = [(0, whole)]
         # docling has no normalized [0,1] block bbox contract, so block_spans stays
         # empty (like the Mistral backend) and highlighting falls back to pymupdf.
-        return _pages_to_text(pages)
+        return pages
 
 
 def _build_gateway_token_provider(settings: Settings) -> Any:
@@ -633,6 +683,10 @@ class OcrProcessor(DocumentProcessor):
         # doesn't each build a backend (and fetch its own M2M token). Lazy-init:
         # anyio primitives must not be created at import time.
         self._backend_lock: anyio.Lock | None = None
+        # Bounds the page-range requests (DOCUMENT_OCR_PAGES_PER_REQUEST) in
+        # flight on this instance's backend, across every document it serves.
+        # Lazy-init like the lock: sized from settings on first use.
+        self._page_limiter: anyio.CapacityLimiter | None = None
         # Batch-mode (Deck #332): the gateway batch client is cached like the sync
         # backend so its GatewayTokenProvider keeps its M2M-token cache across
         # documents.
@@ -652,6 +706,32 @@ class OcrProcessor(DocumentProcessor):
     def supported_mime_types(self) -> set[str]:
         return {"application/pdf"}
 
+    async def process_source(
+        self,
+        source: DocumentSource,
+        options: dict[str, Any] | None = None,
+        progress_callback: (
+            Callable[[float, float | None, str | None], Awaitable[None]] | None
+        ) = None,
+    ) -> ProcessingResult:
+        """OCR a spooled document from a read-only map of the spool file.
+
+        The request body is base64 of the whole document either way, but the
+        raw copy it is encoded from is paged in from the page cache instead of
+        being read onto the heap. The native text-layer pass of
+        ``_ocr_by_page`` opens the spool path in its worker.
+        """
+        if not source.is_file_backed:
+            return await super().process_source(source, options, progress_callback)
+        with source.buffer() as content:
+            return await self._ocr_document(
+                content,
+                source.content_type,
+                source.filename,
+                options,
+                pdf=str(source.path()),
+            )
+
     async def process(
         self,
         content: bytes,
@@ -662,6 +742,21 @@ class OcrProcessor(DocumentProcessor):
             Callable[[float, float | None, str | None], Awaitable[None]] | None
         ) = None,
     ) -> ProcessingResult:
+        return await self._ocr_document(
+            content, content_type, filename, options, pdf=content
+        )
+
+    async def _ocr_document(
+        self,
+        content: bytes | memoryview,
+        content_type: str,
+        filename: str | None,
+        options: dict[str, Any] | None,
+        *,
+        pdf: bytes | str,
+    ) -> ProcessingResult:
+        """``process`` body. ``pdf`` is what a worker process gets for the same
+        document: the bytes, or the spool path when ``content`` is a map."""
         settings = get_settings()
 
         # Batch mode (Deck #332): submit to the gateway's async Batch OCR job and
@@ -704,10 +799,17 @@ class OcrProcessor(DocumentProcessor):
                 success=False,
                 error="no OCR backend configured",
             )
+        mime = content_type.split(";")[0].strip().lower()
         try:
-            text, boundaries, block_spans = await backend.ocr(
-                content, content_type.split(";")[0].strip().lower()
-            )
+            if (
+                settings.document_ocr_pages_per_request > 0
+                and mime == "application/pdf"
+            ):
+                text, boundaries, block_spans = await self._ocr_by_page(
+                    backend, content, pdf, settings, filename
+                )
+            else:
+                text, boundaries, block_spans = await backend.ocr(content, mime)
         except (TimeoutError, httpx.TimeoutException):
             # Two timeout shapes reach here: the Mistral backend's
             # anyio.fail_after raises the builtin TimeoutError, while the gateway
@@ -750,6 +852,102 @@ class OcrProcessor(DocumentProcessor):
             processor=self.name,
         )
 
+    async def _ocr_by_page(
+        self,
+        backend: _OcrBackend,
+        content: bytes | memoryview,
+        pdf: bytes | str,
+        settings: Settings,
+        filename: str | None,
+    ) -> tuple[str, list[dict[str, Any]], list[dict[str, Any]]]:
+        """OCR only the pages that need it, a page range per request, concurrently.
+
+        Reads the PDF's own text layer (pypdfium2, in the isolated worker pool),
+        keeps the pages that pass ``_pages_needing_ocr``, and cuts the others
+        into sub-PDFs of at most ``document_ocr_pages_per_request`` consecutive
+        pages. The ranges are OCR'd concurrently under ``_page_limiter``; each
+        range's page indices are shifted back to document pages, so
+        ``_pages_to_text`` reassembles text, boundaries and block spans in page
+        order exactly as for a whole-document response. The first failing
+        range cancels the rest and its exception propagates to ``process``.
+
+        When the text layer can't be read at all (the structured tier timed out
+        on it, say), the whole document goes to the backend as before.
+        """
+        # Lazy import: the native stack stays off the OCR module's load path.
+        from ._isolation import run_isolated_native  # noqa: PLC0415
+        from .pypdfium2_fast import _extract, split_pages  # noqa: PLC0415
+
+        async def isolated(func: Callable[..., Any], *args: Any) -> Any:
+            return await run_isolated_native(
+                func,
+                *args,
+                library="pdfium",
+                timeout_seconds=settings.document_parse_timeout_seconds,
+                mem_limit_mb=settings.document_parse_mem_limit_mb,
+                process_slots=settings.document_native_process_slots,
+            )
+
+        try:
+            native_text, metadata = await isolated(
+                _extract, pdf, settings.document_parse_page_window
+            )
+        except Exception as e:
+            logger.info(
+                "No readable text layer in %s (%s); OCR'ing the whole document",
+                filename or "<bytes>",
+                e,
+            )
+            return await backend.ocr(content, "application/pdf")
+        boundaries = metadata["page_boundaries"]
+        needs_ocr = _pages_needing_ocr(
+            native_text, boundaries, settings, metadata.get(PAGE_SIGNALS_KEY)
+        )
+        ranges = _page_ranges(needs_ocr, settings.document_ocr_pages_per_request)
+
+        pages: list[tuple[Any, ...]] = [
+            (b["page"] - 1, native_text[b["start_offset"] : b["end_offset"]])
+            for b in boundaries
+            if b["page"] - 1 not in needs_ocr
+        ]
+        record_document_ocr_pages(ocr=len(needs_ocr), native=len(pages))
+        if ranges:
+            parts = await isolated(split_pages, pdf, ranges)
+            if self._page_limiter is None:
+                self._page_limiter = anyio.CapacityLimiter(
+                    settings.document_ocr_concurrency
+                )
+            limiter = self._page_limiter
+            results: list[list[tuple[Any, ...]]] = [[] for _ in ranges]
+            errors: list[Exception] = []
+
+            async def ocr_range(n: int) -> None:
+                try:
+                    async with limiter:
+                        results[n] = await backend.ocr_pages(
+                            parts[n], "application/pdf"
+                        )
+                except Exception as e:
+                    errors.append(e)
+                    tg.cancel_scope.cancel()
+
+            async with anyio.create_task_group() as tg:
+                for n in range(len(ranges)):
+                    tg.start_soon(ocr_range, n)
+            if errors:
+                raise errors[0]
+            for (start, _), range_pages in zip(ranges, results):
+                pages.extend((start + page[0], *page[1:]) for page in range_pages)
+
+        logger.info(
+            "OCR'd %s/%s pages of %s in %s requests",
+            len(needs_ocr),
+            len(boundaries),
+            filename or "<bytes>",
+            len(ranges),
+        )
+        return _pages_to_text(pages)
+
     async def _get_batch_client(self) -> "GatewayBatchOcrClient | None":
         """Cached gateway batch client (or ``None`` when batch isn't possible — OCR
         disabled, or no gateway configured). Resolved once under its own lock so the
@@ -774,7 +972,7 @@ class OcrProcessor(DocumentProcessor):
 
     async def _process_batch(
         self,
-        content: bytes,
+        content: bytes | memoryview,
         content_type: str,
         filename: str | None,
         options: dict[str, Any] | None,
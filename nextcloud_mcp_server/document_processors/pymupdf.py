@@ -6,11 +6,9 @@ import tempfile
 from collections.abc import Awaitable, Callable
 from typing import Any, Optional
 
-import anyio
-
-# pymupdf is used here only for the cheap metadata open. The heavy
-# pymupdf4llm.to_markdown extraction runs in an isolated worker subprocess
-# (see _isolation.py) so a pathological file can't OOM the pod.
+# pymupdf is used here only for the cheap metadata open. Both it and the heavy
+# pymupdf4llm.to_markdown extraction run in isolated worker subprocesses (see
+# _isolation.py), so a pathological file can't OOM the pod.
 # NOTE: Do NOT call pymupdf.layout.activate()! It changes the behavior of
 # pymupdf4llm.to_markdown() when page_chunks=True (returns str, not list[dict]).
 # See: https://github.com/pymupdf/pymupdf4llm/issues/323
@@ -19,8 +17,20 @@ import pymupdf
 from nextcloud_mcp_server.config import get_settings
 from nextcloud_mcp_server.observability.metrics import record_document_parse_mode
 
-from ._isolation import PdfParseFailed, run_isolated_pdf_parse, uses_markdown
+from ._isolation import (
+    PdfParseFailed,
+    PdfUnreadableError,
+    run_isolated_native,
+    run_isolated_pdf_parse,
+    uses_markdown,
+)
 from .base import DocumentProcessor, ProcessingResult, ProcessorError
+from .classifier import (
+    MAX_SAMPLED_PAGES,
+    PAGE_SIGNALS_KEY,
+    _page_image_coverage,
+    scan_detection_enabled,
+)
 from .source import DocumentSource, MemoryDocumentSource, resolve_path
 
 logger = logging.getLogger(__name__)
@@ -30,6 +40,95 @@ logger = logging.getLogger(__name__)
 _UNNAMED = "<bytes>"
 
 
+def _read_pdf_metadata(
+    source_path: str, filename: Optional[str], size: int, scan_images: bool = False
+) -> tuple[dict[str, Any], int]:
+    """Read metadata + page count in a native worker, then close the document.
+
+    Runs in the isolated pool (``run_isolated_native``): pymupdf is not
+    thread-safe, so the metadata open no longer runs on a parent thread. The
+    heavy page extraction re-opens the same path in its own worker call.
+    try/finally so a failure in _extract_metadata cannot leak the handle.
+
+    With ``scan_images`` the classifier's per-page image coverage is measured
+    on this same open (``PAGE_SIGNALS_KEY``), so the escalation gate doesn't
+    open the document a third time.
+    """
+    # filetype="pdf" rather than letting MuPDF infer it from the path: the
+    # ingest spool is named ``nc-ingest-XXXX.bin`` (source.spool_target), and
+    # PyMuPDF derives the MuPDF magic from the suffix, so the inferred type is
+    # "bin" -- no handler, FileDataError, before any content is read. Handler
+    # selection then falls back to content sniffing, which only inspects a
+    # prefix: a PDF whose header sits behind a long run of junk (recovery-tool
+    # output) is rejected outright, even though the PDF handler's xref repair
+    # can reconstruct it. We only reach this processor because the registry
+    # matched application/pdf, so naming the type states what the caller
+    # already knows.
+    try:
+        doc = pymupdf.open(source_path, filetype="pdf")
+    except pymupdf.FileDataError as exc:
+        # Crosses the process boundary as a string; keep the distinction.
+        raise PdfUnreadableError(str(exc)) from exc
+    try:
+        meta = _extract_metadata(doc, filename)
+        meta["file_size"] = size
+        if scan_images:
+            meta[PAGE_SIGNALS_KEY] = {
+                "image_coverage": [
+                    _page_image_coverage(doc.load_page(n))
+                    for n in range(min(doc.page_count, MAX_SAMPLED_PAGES))
+                ]
+            }
+        return meta, doc.page_count
+    finally:
+        doc.close()
+
+
+def _extract_metadata(doc: pymupdf.Document, filename: Optional[str]) -> dict[str, Any]:
+    """Extract metadata from PDF document.
+
+    Args:
+        doc: Opened PyMuPDF document
+        filename: Optional filename
+
+    Returns:
+        Dictionary with PDF metadata
+    """
+    metadata: dict[str, Any] = {}
+
+    # Basic document info
+    metadata["page_count"] = doc.page_count
+    metadata["format"] = "PDF 1." + str(
+        doc.pdf_version() if hasattr(doc, "pdf_version") else "?"  # type: ignore[call-non-callable]  # ty: ignore[call-non-callable]
+    )
+
+    if filename:
+        metadata["filename"] = filename
+
+    # Extract PDF metadata dictionary
+    pdf_metadata = doc.metadata
+    if pdf_metadata:
+        # Standard PDF metadata fields
+        if pdf_metadata.get("title"):
+            metadata["title"] = pdf_metadata["title"]
+        if pdf_metadata.get("author"):
+            metadata["author"] = pdf_metadata["author"]
+        if pdf_metadata.get("subject"):
+            metadata["subject"] = pdf_metadata["subject"]
+        if pdf_metadata.get("keywords"):
+            metadata["keywords"] = pdf_metadata["keywords"]
+        if pdf_metadata.get("creator"):
+            metadata["creator"] = pdf_metadata["creator"]
+        if pdf_metadata.get("producer"):
+            metadata["producer"] = pdf_metadata["producer"]
+        if pdf_metadata.get("creationDate"):
+            metadata["creation_date"] = pdf_metadata["creationDate"]
+        if pdf_metadata.get("modDate"):
+            metadata["modification_date"] = pdf_metadata["modDate"]
+
+    return metadata
+
+
 def _record_parse_mode(
     metadata: dict[str, Any], page_count: int, settings: Any
 ) -> None:
@@ -142,41 +241,6 @@ class PyMuPDFProcessor(DocumentProcessor):
         finally:
             source.cleanup()
 
-    def _read_metadata_sync(
-        self, source_path: str, filename: Optional[str], size: int
-    ) -> tuple[dict[str, Any], int]:
-        """Read metadata + page count, then close the document immediately.
-
-        Runs entirely inside ONE worker thread, serialized against other MuPDF
-        work: pymupdf is not thread-safe and a doc opened in one thread must not
-        be touched from another. The heavy page extraction re-opens the same path
-        in an isolated subprocess, so it needs no lock and ``doc`` is not needed
-        past this point. try/finally so a failure in _extract_metadata cannot
-        leak the handle.
-        """
-        from nextcloud_mcp_server.document_processors._native_locks import (  # noqa: PLC0415
-            pymupdf_serialized,
-        )
-
-        with pymupdf_serialized():
-            # filetype="pdf" rather than letting MuPDF infer it from the path: the
-            # ingest spool is named ``nc-ingest-XXXX.bin`` (source.spool_target),
-            # and PyMuPDF derives the MuPDF magic from the suffix, so the inferred
-            # type is "bin" -- no handler, FileDataError, before any content is
-            # read. Handler selection then falls back to content sniffing, which
-            # only inspects a prefix: a PDF whose header sits behind a long run of
-            # junk (recovery-tool output) is rejected outright, even though the
-            # PDF handler's xref repair can reconstruct it. We only reach this
-            # processor because the registry matched application/pdf, so naming
-            # the type states what the caller already knows.
-            doc = pymupdf.open(source_path, filetype="pdf")
-            try:
-                meta = self._extract_metadata(doc, filename)
-                meta["file_size"] = size
-                return meta, doc.page_count
-            finally:
-                doc.close()
-
     def _build_text_and_metadata(
         self,
         page_chunks: list[dict[str, Any]],
@@ -252,11 +316,20 @@ class PyMuPDFProcessor(DocumentProcessor):
             if progress_callback:
                 await progress_callback(0, 100, "Opening PDF document")
 
+            settings = get_settings()
             try:
-                metadata, page_count = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
-                    self._read_metadata_sync, source_path, filename, source.size
+                metadata, page_count = await run_isolated_native(
+                    _read_pdf_metadata,
+                    source_path,
+                    filename,
+                    source.size,
+                    scan_detection_enabled(settings),
+                    library="pymupdf",
+                    timeout_seconds=settings.document_parse_timeout_seconds,
+                    mem_limit_mb=settings.document_parse_mem_limit_mb,
+                    process_slots=settings.document_native_process_slots,
                 )
-            except pymupdf.FileDataError as exc:
+            except PdfUnreadableError as exc:
                 # MuPDF could not recognise the bytes as a document it can open
                 # at all -- a file named ``.pdf`` whose content is something else
                 # (or nothing: a zero-filled recovery artifact). Nextcloud derives
@@ -273,9 +346,9 @@ class PyMuPDFProcessor(DocumentProcessor):
                 # once no higher tier remains.
                 #
                 # Narrow on purpose: EmptyFileError subclasses FileDataError, so
-                # both are covered, while pymupdf's own FileNotFoundError (the
-                # spool vanished) stays an exception -- that is an infrastructure
-                # fault and must remain retryable.
+                # both arrive as PdfUnreadableError, while pymupdf's own
+                # FileNotFoundError (the spool vanished) stays an exception --
+                # that is an infrastructure fault and must remain retryable.
                 logger.warning(
                     "PDF %s is not a readable document (%s); failing as unreadable",
                     filename or _UNNAMED,
@@ -314,7 +387,6 @@ class PyMuPDFProcessor(DocumentProcessor):
             # table detection past the pod memory limit) fails THIS document
             # instead of OOM-killing the pod. graphics_limit caps per-page
             # vector-graphics analysis (the known trigger).
-            settings = get_settings()
             try:
                 page_chunks: list[dict[str, Any]] = await run_isolated_pdf_parse(
                     source_path,
@@ -400,52 +472,6 @@ class PyMuPDFProcessor(DocumentProcessor):
             logger.error(error_msg)
             raise ProcessorError(error_msg) from e
 
-    def _extract_metadata(
-        self, doc: pymupdf.Document, filename: Optional[str]
-    ) -> dict[str, Any]:
-        """Extract metadata from PDF document.
-
-        Args:
-            doc: Opened PyMuPDF document
-            filename: Optional filename
-
-        Returns:
-            Dictionary with PDF metadata
-        """
-        metadata: dict[str, Any] = {}
-
-        # Basic document info
-        metadata["page_count"] = doc.page_count
-        metadata["format"] = "PDF 1." + str(
-            doc.pdf_version() if hasattr(doc, "pdf_version") else "?"  # type: ignore[call-non-callable]  # ty: ignore[call-non-callable]
-        )
-
-        if filename:
-            metadata["filename"] = filename
-
-        # Extract PDF metadata dictionary
-        pdf_metadata = doc.metadata
-        if pdf_metadata:
-            # Standard PDF metadata fields
-            if pdf_metadata.get("title"):
-                metadata["title"] = pdf_metadata["title"]
-            if pdf_metadata.get("author"):
-                metadata["author"] = pdf_metadata["author"]
-            if pdf_metadata.get("subject"):
-                metadata["subject"] = pdf_metadata["subject"]
-            if pdf_metadata.get("keywords"):
-                metadata["keywords"] = pdf_metadata["keywords"]
-            if pdf_metadata.get("creator"):
-                metadata["creator"] = pdf_metadata["creator"]
-            if pdf_metadata.get("producer"):
-                metadata["producer"] = pdf_metadata["producer"]
-            if pdf_metadata.get("creationDate"):
-                metadata["creation_date"] = pdf_metadata["creationDate"]
-            if pdf_metadata.get("modDate"):
-                metadata["modification_date"] = pdf_metadata["modDate"]
-
-        return metadata
-
     async def health_check(self) -> bool:
         """Check if PyMuPDF is available and working.
 
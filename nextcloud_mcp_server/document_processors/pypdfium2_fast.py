@@ -15,27 +15,41 @@ escalate to the ``structured`` tier (pymupdf4llm, graphics_limit-guarded) via th
 registry (B2 escalation wiring).
 """
 
+import io
 import logging
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-import anyio
-
 from nextcloud_mcp_server.config import get_settings
 
+from ._isolation import PdfWorkerError, run_isolated_native
 from .base import DocumentProcessor, ProcessingResult
+from .classifier import (
+    MAX_SAMPLED_PAGES,
+    PAGE_SIGNALS_KEY,
+    page_text_signals,
+    pdfium_page_image_coverage,
+    scan_detection_enabled,
+)
 from .source import DocumentSource, resolve_path
 
 logger = logging.getLogger(__name__)
 
 
 def _extract_window(
-    pdfium: Any, content: bytes | str, start: int, end: int, page_texts: list[str]
+    pdfium: Any,
+    content: bytes | str,
+    start: int,
+    end: int,
+    page_texts: list[str],
+    image_coverage: list[float] | None = None,
 ) -> None:
     """Extract pages ``[start, end)`` into ``page_texts`` from a fresh document.
 
     Opening and closing the document per window is what bounds memory -- see
-    ``_extract``. Callers hold the pdfium lock.
+    ``_extract``. When ``image_coverage`` is given, the raster coverage of the
+    first ``MAX_SAMPLED_PAGES`` pages is appended to it from the already-loaded
+    page.
     """
     pdf = pdfium.PdfDocument(content)
     try:
@@ -47,6 +61,8 @@ def _extract_window(
                     page_texts.append(textpage.get_text_bounded() or "")
                 finally:
                     textpage.close()
+                if image_coverage is not None and i < MAX_SAMPLED_PAGES:
+                    image_coverage.append(pdfium_page_image_coverage(pdfium.raw, page))
             finally:
                 # Outer finally so the page handle is freed even if
                 # get_textpage() raises on a corrupt page.
@@ -56,9 +72,9 @@ def _extract_window(
 
 
 def _extract(
-    content: bytes | str, page_window: int = 100
+    content: bytes | str, page_window: int = 100, scan_images: bool = False
 ) -> tuple[str, dict[str, Any]]:
-    """Extract concatenated text + metadata from a PDF (runs in a worker thread).
+    """Extract concatenated text + metadata from a PDF (runs in a worker process).
 
     ``content`` is either the PDF bytes or a path to it. A path is preferable:
     ``PdfDocument(path)`` uses ``FPDF_LoadDocument``, which reads incrementally,
@@ -77,34 +93,32 @@ def _extract(
     caps that at one window's worth; the freed arena is reused by the next
     window, so peak stays flat (100 pages -> 63 MB, unchanged output). Pass 0 to
     disable and extract in a single open.
+
+    The per-page classifier signals are recorded in the same pass under
+    ``PAGE_SIGNALS_KEY`` -- text quality and control characters always, image
+    coverage when ``scan_images`` -- so the escalation gate never re-opens the
+    document with MuPDF.
     """
     import pypdfium2 as pdfium  # noqa: PLC0415 -- keep the native import lazy
 
-    from nextcloud_mcp_server.document_processors._native_locks import (  # noqa: PLC0415
-        pdfium_serialized,
-    )
-
     # PDFium is not thread-safe (shared process-global library + an unlocked
-    # module-global object tracker), so serialize: concurrent ingest jobs must not
-    # drive it from two worker threads at once. The lock is taken per window
-    # rather than for the whole extraction: no pdfium object is held across a
-    # window boundary, so releasing there is safe and stops one large document
-    # blocking every other ingest job for the duration of its parse.
-    with pdfium_serialized():
-        pdf = pdfium.PdfDocument(content)
-        try:
-            page_count = len(pdf)
-            doc_meta = pdf.get_metadata_dict() or {}
-        finally:
-            pdf.close()
+    # module-global object tracker), so this never runs on a parent thread: the
+    # processor dispatches it to the isolated worker pool, where each process
+    # owns its own library instance.
+    pdf = pdfium.PdfDocument(content)
+    try:
+        page_count = len(pdf)
+        doc_meta = pdf.get_metadata_dict() or {}
+    finally:
+        pdf.close()
 
     page_texts: list[str] = []
+    image_coverage: list[float] | None = [] if scan_images else None
     window = page_window if page_window > 0 else page_count
     start = 0
     while start < page_count:
         end = min(start + window, page_count)
-        with pdfium_serialized():
-            _extract_window(pdfium, content, start, end, page_texts)
+        _extract_window(pdfium, content, start, end, page_texts, image_coverage)
         start = end
 
     page_boundaries: list[dict[str, Any]] = []
@@ -115,6 +129,19 @@ def _extract(
         )
         offset += len(text)
 
+    qualities: list[float] = []
+    control_chars: list[int] = []
+    for text in page_texts:
+        quality, controls = page_text_signals(text)
+        qualities.append(quality)
+        control_chars.append(controls)
+    signals: dict[str, Any] = {
+        "text_quality": qualities,
+        "control_chars": control_chars,
+    }
+    if image_coverage is not None:
+        signals["image_coverage"] = image_coverage
+
     full_text = "".join(page_texts)
     metadata: dict[str, Any] = {
         "page_count": len(page_texts),
@@ -123,6 +150,7 @@ def _extract(
         # Stated here so every processor reports its output shape the same way
         # and a caller never has to infer markdown-ness from the processor name.
         "parse_mode": "text_only",
+        PAGE_SIGNALS_KEY: signals,
     }
     title = doc_meta.get("Title")
     if title:
@@ -130,6 +158,32 @@ def _extract(
     return full_text, metadata
 
 
+def split_pages(content: bytes | str, ranges: list[tuple[int, int]]) -> list[bytes]:
+    """Copy each ``[start, end)`` page range of a PDF into a PDF of its own.
+
+    Runs in a worker process, like ``_extract``, and likewise takes the PDF's
+    bytes or its path. Used by the OCR tier to send
+    only the pages that need OCR, a few at a time (``ocr.OcrProcessor``).
+    """
+    import pypdfium2 as pdfium  # noqa: PLC0415 -- keep the native import lazy
+
+    src = pdfium.PdfDocument(content)
+    try:
+        parts: list[bytes] = []
+        for start, end in ranges:
+            dst = pdfium.PdfDocument.new()
+            try:
+                dst.import_pages(src, list(range(start, end)))
+                buf = io.BytesIO()
+                dst.save(buf)
+                parts.append(buf.getvalue())
+            finally:
+                dst.close()
+        return parts
+    finally:
+        src.close()
+
+
 class Pypdfium2FastProcessor(DocumentProcessor):
     """Tier-1 fast PDF text extractor backed by pypdfium2."""
 
@@ -188,13 +242,21 @@ class Pypdfium2FastProcessor(DocumentProcessor):
             await progress_callback(0, 100, "Extracting text (pypdfium2)")
         settings = get_settings()
         try:
-            full_text, metadata = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
-                _extract, content, settings.document_parse_page_window
+            full_text, metadata = await run_isolated_native(
+                _extract,
+                content,
+                settings.document_parse_page_window,
+                scan_detection_enabled(settings),
+                library="pdfium",
+                timeout_seconds=settings.document_parse_timeout_seconds,
+                mem_limit_mb=settings.document_parse_mem_limit_mb,
+                process_slots=settings.document_native_process_slots,
             )
         except Exception as e:
             # Fast path is best-effort: a failure here escalates rather than
-            # crashing the pipeline. pypdfium2 has no O(n^2) bomb, so this is a
-            # genuinely malformed PDF, not a resource blowup.
+            # crashing the pipeline. pypdfium2 has no O(n^2) bomb, so this is
+            # almost always a genuinely malformed PDF; a timeout or rlimit breach
+            # in the worker fails the same way.
             logger.warning(
                 "pypdfium2 fast extract failed for %s: %s", filename or "<bytes>", e
             )
@@ -203,7 +265,12 @@ class Pypdfium2FastProcessor(DocumentProcessor):
                 metadata={"parse_failed_reason": "error"},
                 processor=self.name,
                 success=False,
-                error=f"{type(e).__name__}: {e}",
+                # A worker error's message is already "OriginalType: text".
+                error=(
+                    str(e)
+                    if isinstance(e, PdfWorkerError)
+                    else f"{type(e).__name__}: {e}"
+                ),
             )
         metadata["file_size"] = size
         if progress_callback:
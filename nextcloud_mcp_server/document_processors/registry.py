@@ -14,12 +14,15 @@ from nextcloud_mcp_server.observability.metrics import (
 )
 from nextcloud_mcp_server.observability.tracing import trace_operation
 
+from ._isolation import run_isolated_native
 from .base import DocumentProcessor, ProcessingResult, ProcessorError
 from .classifier import (
+    PAGE_SIGNALS_KEY,
     DocClassification,
     classify_from_text,
     image_coverage_per_page,
     image_coverage_per_page_from_path,
+    scan_detection_enabled,
 )
 from .escalation import TIER_LADDER, EscalationDecision
 from .ocr import OCR_BATCH_PENDING_KEY
@@ -76,16 +79,18 @@ class _LadderState:
     from_tier: str = "fast"
     structured_failed: bool = False
 
-    def advance_to_structured(
+    async def advance_to_structured(
         self,
         result: ProcessingResult,
-        classify: Callable[[ProcessingResult, bool], DocClassification | None],
+        classify: Callable[
+            [ProcessingResult, bool], Awaitable[DocClassification | None]
+        ],
     ) -> None:
         """Adopt a successful structured parse and re-classify from it."""
         self.result = result
         self.from_tier = "structured"
         # record=False: the document was already counted at the fast tier.
-        self.classification = classify(result, False)
+        self.classification = await classify(result, False)
 
 
 class ProcessorRegistry:
@@ -288,13 +293,7 @@ class ProcessorRegistry:
                 escalated=escalated,
             )
 
-        def classify(
-            result: ProcessingResult, record: bool
-        ) -> DocClassification | None:
-            return self._classify_result(
-                result, content, settings, record=record, filename=filename
-            )
-
+        classify = self._ladder_classifier(settings, filename=filename, content=content)
         return await self._run_pdf_ladder(
             content_type, filename, options, settings, run, classify
         )
@@ -330,20 +329,9 @@ class ProcessorRegistry:
                 processor, source, options, progress_callback, escalated=escalated
             )
 
-        def classify(
-            result: ProcessingResult, record: bool
-        ) -> DocClassification | None:
-            # ``content`` is unused when a source is given -- scan detection reads
-            # the path instead of the bytes.
-            return self._classify_result(
-                result,
-                b"",
-                settings,
-                record=record,
-                filename=source.filename,
-                source=source,
-            )
-
+        classify = self._ladder_classifier(
+            settings, filename=source.filename, source=source
+        )
         return await self._run_pdf_ladder(
             source.content_type, source.filename, options, settings, run, classify
         )
@@ -364,7 +352,9 @@ class ProcessorRegistry:
         options: dict[str, Any] | None,
         settings: Any,
         run: Callable[[DocumentProcessor, bool], Awaitable[ProcessingResult]],
-        classify: Callable[[ProcessingResult, bool], DocClassification | None],
+        classify: Callable[
+            [ProcessingResult, bool], Awaitable[DocClassification | None]
+        ],
     ) -> ProcessingResult:
         """Tiered PDF pipeline, independent of how the document is held.
 
@@ -398,7 +388,7 @@ class ProcessorRegistry:
         # when OCR + detect_scanned are enabled, so its cost is paid by
         # OCR-opted-in tenants only. Shared with the external per-tier path via
         # _classify_result.
-        state = _LadderState(result=result, classification=classify(result, True))
+        state = _LadderState(result=result, classification=await classify(result, True))
 
         await self._escalate_structured(state, filename, run, classify)
         await self._promote_markdown(state, options, filename, settings, run, classify)
@@ -430,7 +420,9 @@ class ProcessorRegistry:
         state: "_LadderState",
         filename: str | None,
         run: Callable[[DocumentProcessor, bool], Awaitable[ProcessingResult]],
-        classify: Callable[[ProcessingResult, bool], DocClassification | None],
+        classify: Callable[
+            [ProcessingResult, bool], Awaitable[DocClassification | None]
+        ],
     ) -> None:
         """Recover a poor fast extraction at the structured tier.
 
@@ -484,7 +476,7 @@ class ProcessorRegistry:
         )
         structured_result = await run(structured, True)
         if structured_result.success:
-            state.advance_to_structured(structured_result, classify)
+            await state.advance_to_structured(structured_result, classify)
             return
 
         state.structured_failed = True
@@ -502,7 +494,9 @@ class ProcessorRegistry:
         filename: str | None,
         settings: Any,
         run: Callable[[DocumentProcessor, bool], Awaitable[ProcessingResult]],
-        classify: Callable[[ProcessingResult, bool], DocClassification | None],
+        classify: Callable[
+            [ProcessingResult, bool], Awaitable[DocClassification | None]
+        ],
     ) -> None:
         """Honour ``options["prefer_markdown"]`` (an interactive read, not ingest).
 
@@ -545,7 +539,7 @@ class ProcessorRegistry:
         )
         markdown_result = await run(structured, True)
         if markdown_result.success:
-            state.advance_to_structured(markdown_result, classify)
+            await state.advance_to_structured(markdown_result, classify)
             return
 
         # Keep the fast text rather than failing the read, and say why the
@@ -698,55 +692,123 @@ class ProcessorRegistry:
         """
         return self.oversize_result_for_size(len(content), filename, settings)
 
+    def _ladder_classifier(
+        self,
+        settings: Any,
+        *,
+        filename: str | None,
+        content: bytes = b"",
+        source: DocumentSource | None = None,
+    ) -> Callable[[ProcessingResult, bool], Awaitable[DocClassification | None]]:
+        """``classify(result, record)`` for :meth:`_run_pdf_ladder`.
+
+        Image coverage is a property of the document, not of the tier that
+        parsed it, so it is taken once, from the first successful result, and
+        reused when the structured output is re-classified.
+        """
+        scanned: list[list[float] | None] = []
+
+        async def classify(
+            result: ProcessingResult, record: bool
+        ) -> DocClassification | None:
+            if result.success and not scanned:
+                scanned.append(
+                    await self.scan_image_coverage(
+                        settings,
+                        content=content,
+                        source=source,
+                        filename=filename,
+                        result=result,
+                    )
+                )
+            return self._classify_result(
+                result,
+                settings,
+                record=record,
+                filename=filename,
+                image_coverage=scanned[0] if scanned else None,
+            )
+
+        return classify
+
+    async def scan_image_coverage(
+        self,
+        settings: Any,
+        *,
+        content: bytes = b"",
+        source: DocumentSource | None = None,
+        filename: str | None = None,
+        result: ProcessingResult | None = None,
+    ) -> list[float] | None:
+        """Per-page raster coverage for the ``image_heavy`` flag, or ``None``.
+
+        Scan detection feeds the OCR tier, so it runs only when classification,
+        OCR and ``document_ocr_detect_scanned`` are all enabled. The fast and
+        structured parsers measure coverage during their own pass, so for their
+        ``result`` this is a metadata lookup. Otherwise (an OCR result, or one
+        cached before the parsers recorded it) it re-opens the PDF with MuPDF,
+        in the isolated worker pool -- never on the event loop, where it used
+        to stall every other in-flight document. Best-effort: a failure falls
+        back to text-only signals.
+        """
+        if not scan_detection_enabled(settings):
+            return None
+        if result is not None:
+            recorded = (result.metadata.get(PAGE_SIGNALS_KEY) or {}).get(
+                "image_coverage"
+            )
+            if recorded is not None:
+                return recorded
+        try:
+            # Pick the access that does no I/O for this source type: a spooled
+            # document hands over its path for free, while an in-memory one
+            # hands over its buffer for free. Calling path() on an in-memory
+            # source would write the whole buffer to disk.
+            if source is not None and source.is_file_backed:
+                scan, arg = image_coverage_per_page_from_path, str(source.path())
+            else:
+                scan = image_coverage_per_page
+                arg = source.read_bytes() if source is not None else content
+            return await run_isolated_native(
+                scan,
+                arg,
+                library="pymupdf",
+                timeout_seconds=settings.document_parse_timeout_seconds,
+                mem_limit_mb=settings.document_parse_mem_limit_mb,
+                process_slots=settings.document_native_process_slots,
+            )
+        except Exception:
+            # WARNING (not DEBUG) so a systematic scan-detection failure on an
+            # OCR-enabled tenant is visible at LOG_LEVEL=INFO.
+            logger.warning(
+                "Scan detection failed for %s; using text-only signals",
+                filename or "<bytes>",
+            )
+            return None
+
     def _classify_result(
         self,
         result: ProcessingResult,
-        content: bytes,
         settings: Any,
         *,
         record: bool,
         filename: str | None = None,
-        source: DocumentSource | None = None,
+        image_coverage: list[float] | None = None,
     ) -> DocClassification | None:
         """Tier-0 classification of a parse result (text-only, cheap).
 
-        Shared by the inline memory-backend pipeline (:meth:`_process_pdf`) and
-        the external per-tier path (:meth:`evaluate_escalation`). Returns
-        ``None`` when classification is disabled, the parse failed, or the
-        classifier raised -- best-effort, a classify failure must never break
-        indexing. ``record`` emits the classification metrics; set it only at the
-        FIRST classification of a document (the ``fast`` tier) so the per-doc
+        Shared by the inline PDF ladder (:meth:`_run_pdf_ladder`) and the
+        external per-tier path (:meth:`evaluate_escalation`). Returns ``None``
+        when classification is disabled, the parse failed, or the classifier
+        raised -- best-effort, a classify failure must never break indexing.
+        ``image_coverage`` comes from :meth:`scan_image_coverage`. ``record``
+        emits the classification metrics; set it only at the FIRST
+        classification of a document (the ``fast`` tier) so the per-doc
         counters aren't multiplied across tiers.
         """
         if not (settings.document_classify_enabled and result.success):
             return None
         try:
-            image_coverage = None
-            # Scan detection feeds the OCR tier, so run it whenever OCR is enabled.
-            if settings.document_ocr_enabled and settings.document_ocr_detect_scanned:
-                try:
-                    # Pick the access that does no I/O for this source type:
-                    # a spooled document hands over its path for free, while an
-                    # in-memory one hands over its buffer for free. Calling
-                    # path() on an in-memory source would write the whole buffer
-                    # to disk -- and this runs synchronously on the event loop,
-                    # so that would stall every other in-flight document.
-                    if source is None:
-                        image_coverage = image_coverage_per_page(content)
-                    elif source.is_file_backed:
-                        image_coverage = image_coverage_per_page_from_path(
-                            str(source.path())
-                        )
-                    else:
-                        image_coverage = image_coverage_per_page(source.read_bytes())
-                except Exception:
-                    # Best-effort: fall back to text-only signals. WARNING (not
-                    # DEBUG) so a systematic scan-detection failure on an
-                    # OCR-enabled tenant is visible at LOG_LEVEL=INFO.
-                    logger.warning(
-                        "Scan detection failed for %s; using text-only signals",
-                        filename or "<bytes>",
-                    )
             classification = classify_from_text(
                 result.text,
                 result.metadata.get("page_boundaries") or [],
@@ -755,6 +817,7 @@ class ProcessorRegistry:
                 page_fraction=settings.document_ocr_page_fraction,
                 glyph_corruption_ratio=settings.document_glyph_corruption_ratio,
                 image_coverage=image_coverage,
+                page_signals=result.metadata.get(PAGE_SIGNALS_KEY),
             )
         except Exception:
             logger.warning(
@@ -941,14 +1004,20 @@ class ProcessorRegistry:
         source: DocumentSource,
         current_tier: str,
         settings: Any,
+        *,
+        image_coverage: list[float] | None = None,
     ) -> EscalationDecision | None:
-        """:meth:`evaluate_escalation` against a file-backed source.
+        """:meth:`evaluate_escalation` for a document held as a source.
 
-        Scan detection re-opens the document; giving it the path keeps that off
-        the bytes, so a large scan is not materialised just to be classified.
+        ``image_coverage`` is the caller's :meth:`scan_image_coverage` of the
+        same source; the gate itself never re-opens the document.
         """
         return self._evaluate_escalation(
-            result, b"", current_tier, settings, filename=source.filename, source=source
+            result,
+            current_tier,
+            settings,
+            filename=source.filename,
+            image_coverage=image_coverage,
         )
 
     def evaluate_escalation(
@@ -959,21 +1028,29 @@ class ProcessorRegistry:
         settings: Any,
         *,
         filename: str | None = None,
+        image_coverage: list[float] | None = None,
     ) -> EscalationDecision | None:
-        """Bytes-based adapter; see :meth:`_evaluate_escalation`."""
+        """Bytes-based adapter; see :meth:`_evaluate_escalation`.
+
+        ``content`` is kept for callers of the bytes API; scan detection is the
+        caller's :meth:`scan_image_coverage`, passed in as ``image_coverage``.
+        """
         return self._evaluate_escalation(
-            result, content, current_tier, settings, filename=filename
+            result,
+            current_tier,
+            settings,
+            filename=filename,
+            image_coverage=image_coverage,
         )
 
     def _evaluate_escalation(
         self,
         result: ProcessingResult,
-        content: bytes,
         current_tier: str,
         settings: Any,
         *,
         filename: str | None = None,
-        source: DocumentSource | None = None,
+        image_coverage: list[float] | None = None,
     ) -> EscalationDecision | None:
         """Decide whether ``current_tier``'s result must escalate (external path).
 
@@ -1007,11 +1084,10 @@ class ProcessorRegistry:
         """
         classification = self._classify_result(
             result,
-            content,
             settings,
             record=(current_tier == TIER_LADDER[0]),
             filename=filename,
-            source=source,
+            image_coverage=image_coverage,
         )
         if classification is None or classification.recommended_tier not in (
             "structured",
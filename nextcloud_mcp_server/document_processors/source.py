@@ -21,6 +21,12 @@ Note that opening by path bounds the *input* copy, not the parse working set:
 PDFium still retains parsed page objects, which is what page-windowed extraction
 in ``pypdfium2_fast`` addresses. The two fixes are complementary.
 
+Consumers that cannot take a path get the next best thing. :meth:`buffer` maps
+a spooled document read-only, so a base64 encoder (the OCR request) reads it
+from the page cache rather than from a heap copy. :meth:`open` doubles as a
+streaming upload body: httpx reads a multipart file part in chunks as it sends,
+so the HTTP processors (docling, unstructured, custom) never materialise it.
+
 ``MemoryDocumentSource`` keeps the in-memory case first-class -- notes, deck
 cards and small files never touch the disk, and every existing bytes-based test
 keeps working -- while ``SpooledDocumentSource`` owns a temp file for the
@@ -30,9 +36,10 @@ lifetime of one ingest.
 from __future__ import annotations
 
 import logging
+import mmap
 import os
 import tempfile
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import IO, ClassVar, Iterator, Protocol, runtime_checkable
@@ -73,7 +80,21 @@ class DocumentSource(Protocol):
         ...
 
     def open(self) -> IO[bytes]:
-        """A binary file object positioned at the start."""
+        """A binary file object positioned at the start.
+
+        Also the streaming upload body: pass it as an httpx multipart file part
+        and it is read in chunks while the request is sent.
+        """
+        ...
+
+    def buffer(self) -> AbstractContextManager[memoryview]:
+        """The whole document as a read-only buffer, valid inside the block.
+
+        A spooled document is memory-mapped, so its pages are demand-loaded
+        from the page cache and never copied onto the heap. The view (and any
+        slice of it) must not outlive the block. Not picklable: hand a worker
+        process the :meth:`path` instead.
+        """
         ...
 
     def read_bytes(self) -> bytes:
@@ -115,6 +136,21 @@ class SpooledDocumentSource:
     def open(self) -> IO[bytes]:
         return self.spool_path.open("rb")
 
+    @contextmanager
+    def buffer(self) -> Iterator[memoryview]:
+        with self.spool_path.open("rb") as fh:
+            # mmap rejects a zero-length mapping.
+            if os.fstat(fh.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    # Closing the map fails while a view is still exported.
+                    view.release()
+
     def read_bytes(self) -> bytes:
         return self.spool_path.read_bytes()
 
@@ -167,6 +203,10 @@ class MemoryDocumentSource:
 
         return io.BytesIO(self.content)
 
+    @contextmanager
+    def buffer(self) -> Iterator[memoryview]:
+        yield memoryview(self.content)
+
     def read_bytes(self) -> bytes:
         return self.content
 
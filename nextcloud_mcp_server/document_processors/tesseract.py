@@ -3,9 +3,10 @@
 import logging
 import shutil
 from collections.abc import Awaitable, Callable
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 from .base import DocumentProcessor, ProcessingResult, ProcessorError
+from .source import DocumentSource
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +82,18 @@ class TesseractProcessor(DocumentProcessor):
     def supported_mime_types(self) -> set[str]:
         return self.SUPPORTED_TYPES
 
+    async def process_source(
+        self,
+        source: DocumentSource,
+        options: Optional[dict[str, Any]] = None,
+        progress_callback: Optional[
+            Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+        ] = None,
+    ) -> ProcessingResult:
+        """Decode the image from the source's file handle; PIL reads it lazily."""
+        with source.open() as image_file:
+            return self._ocr(image_file, options)
+
     async def process(
         self,
         content: bytes,
@@ -107,13 +120,18 @@ class TesseractProcessor(DocumentProcessor):
         Raises:
             ProcessorError: If OCR fails
         """
+        return self._ocr(io.BytesIO(content), options)
+
+    def _ocr(
+        self, image_file: IO[bytes], options: Optional[dict[str, Any]]
+    ) -> ProcessingResult:
         options = options or {}
         lang = options.get("lang", self.default_lang)
         config = options.get("config", "")
 
         try:
             # Load image
-            image = Image.open(io.BytesIO(content))
+            image = Image.open(image_file)
 
             # Run OCR
             text = pytesseract.image_to_string(image, lang=lang, config=config)
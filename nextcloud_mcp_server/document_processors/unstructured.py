@@ -4,12 +4,13 @@ import io
 import logging
 import time
 from collections.abc import Awaitable, Callable
-from typing import Any, Optional
+from typing import IO, Any, Optional
 
 import anyio
 import httpx
 
 from .base import DocumentProcessor, ProcessingResult, ProcessorError
+from .source import DocumentSource
 
 logger = logging.getLogger(__name__)
 
@@ -126,7 +127,7 @@ class UnstructuredProcessor(DocumentProcessor):
 
     async def _make_api_request(
         self,
-        content: bytes,
+        content: bytes | IO[bytes],
         content_type: str,
         filename: Optional[str],
         strategy: str,
@@ -136,7 +137,8 @@ class UnstructuredProcessor(DocumentProcessor):
         """Make the actual API request to Unstructured.
 
         Args:
-            content: Document bytes
+            content: Document bytes, or an open binary file that httpx streams
+                as the multipart body
             content_type: MIME type
             filename: Optional filename
             strategy: Processing strategy
@@ -153,7 +155,7 @@ class UnstructuredProcessor(DocumentProcessor):
         files = {
             "files": (
                 filename or "document",
-                io.BytesIO(content),
+                io.BytesIO(content) if isinstance(content, bytes) else content,
                 content_type or "application/octet-stream",
             )
         }
@@ -227,6 +229,20 @@ class UnstructuredProcessor(DocumentProcessor):
             logger.error("Unstructured API processing failed: %s", e)
             raise ProcessorError(f"Processing failed: {str(e)}") from e
 
+    async def process_source(
+        self,
+        source: DocumentSource,
+        options: Optional[dict[str, Any]] = None,
+        progress_callback: Optional[
+            Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+        ] = None,
+    ) -> ProcessingResult:
+        """Upload straight from the source's file handle (streamed by httpx)."""
+        with source.open() as upload:
+            return await self._process_upload(
+                upload, source.content_type, source.filename, options, progress_callback
+            )
+
     async def process(
         self,
         content: bytes,
@@ -255,6 +271,20 @@ class UnstructuredProcessor(DocumentProcessor):
         Raises:
             ProcessorError: If processing fails
         """
+        return await self._process_upload(
+            content, content_type, filename, options, progress_callback
+        )
+
+    async def _process_upload(
+        self,
+        content: bytes | IO[bytes],
+        content_type: str,
+        filename: Optional[str],
+        options: Optional[dict[str, Any]],
+        progress_callback: Optional[
+            Callable[[float, Optional[float], Optional[str]], Awaitable[None]]
+        ],
+    ) -> ProcessingResult:
         options = options or {}
 
         # Extract options with defaults
@@ -327,6 +327,19 @@ ingest_queue_depth = Gauge(
 # aborted) are pruned from the queue table and uninteresting for operating.
 _INGEST_DEPTH_STATUSES = ("todo", "doing", "failed")
 
+# How long the queued ingest jobs have waited so far, per queue and lane
+# (interactive/backfill, see vector.queue.lanes). Cumulative buckets like a
+# histogram's ``_bucket`` series (``le`` in seconds, then ``+Inf``), but a
+# snapshot of the jobs queued now rather than a running count, so a backlog that
+# drains stops showing. ``queue`` is the tier queue, or ``memory`` for the
+# in-process queue.
+ingest_queue_wait_jobs = Gauge(
+    "astrolabe_ingest_queue_wait_jobs",
+    "Queued ingest jobs that have waited at most le seconds, per queue and lane",
+    ["queue", "lane", "le"],
+)
+_published_queue_wait: set[tuple[str, str, str]] = set()
+
 qdrant_operations_total = Counter(
     "mcp_qdrant_operations_total",
     "Total Qdrant vector database operations",
@@ -514,6 +527,62 @@ vector_sync_deletions_suppressed_total = Counter(
     ["index_mode"],  # hybrid | keyword
 )
 
+# Per-point outcome of a chunk-level diff re-index (vector/diff_upsert.py):
+# "upserted" rewrote the point (vectors + payload), "patched" only ran
+# set_payload, "deleted" removed a vanished chunk, "unchanged" wrote nothing.
+# The upserted share is the HNSW write amplification a re-index still costs.
+vector_sync_point_writes_total = Counter(
+    "astrolabe_vector_sync_point_writes_total",
+    "Points touched by document re-indexing, by write action",
+    ["action"],  # upserted | patched | deleted | unchanged
+)
+
+# Where a scan's deletion-tracking set came from: "manifest" read the per-user
+# document manifest (vector/document_manifest_store.py), "qdrant" scrolled the
+# collection and reconciled the manifest from it. Steady state is almost all
+# manifest; a persistent qdrant share means the manifest is unavailable or the
+# reconcile interval is 0.
+vector_sync_deletion_tracking_total = Counter(
+    "astrolabe_vector_sync_deletion_tracking_total",
+    "Scanner deletion-tracking reads, by doc_type and source",
+    ["doc_type", "source"],  # source: manifest | qdrant
+)
+
+# Multi-user scan scheduling (vector/scan_scheduler.py). ``next_timestamp`` is
+# when each user's next scan is due (unix seconds), ``lag`` how long their last
+# scan waited past that point for one of the VECTOR_SYNC_MAX_CONCURRENT_SCANS
+# slots. A lag that keeps growing across users means the scan budget is too
+# small for the user count; ``waiting`` shows which lane the queue is in.
+vector_sync_scan_next_timestamp_seconds = Gauge(
+    "astrolabe_vector_sync_scan_next_timestamp_seconds",
+    "Unix time at which a user's next background scan is due",
+    ["user_id"],
+)
+vector_sync_scan_lag_seconds = Gauge(
+    "astrolabe_vector_sync_scan_lag_seconds",
+    "Seconds a user's last background scan waited past its due time",
+    ["user_id"],
+)
+vector_sync_scans_waiting = Gauge(
+    "astrolabe_vector_sync_scans_waiting",
+    "Due background scans waiting for a scan slot, by lane",
+    ["lane"],  # wake | initial | backstop
+)
+
+# Webhook events folded away by the debounce buffer (vector/webhook_coalescer.py)
+# instead of becoming their own DocumentTask: "superseded" by a later event for
+# the same document, or "folder_batched" (one of a folder's file events
+# replaced by a single scan).
+webhook_events_coalesced_total = Counter(
+    "astrolabe_webhook_events_coalesced_total",
+    "Webhook events collapsed before enqueueing, by doc_type and reason",
+    ["doc_type", "reason"],  # reason: superseded | folder_batched
+)
+webhook_coalescer_pending = Gauge(
+    "astrolabe_webhook_coalescer_pending",
+    "Documents buffered by the webhook coalescer awaiting their debounce window",
+)
+
 # --- Tier-0 classifier (shadow mode) -----------------------------------------
 #
 # The classifier runs a cheap pre-pass per PDF and recommends a starting tier.
@@ -596,6 +665,68 @@ embedding_tokens_total = Counter(
     ["provider", "operation"],  # operation: index | query
 )
 
+# Content-addressed embedding reuse (vector/embedding_cache.py). One increment
+# per chunk, labelled by where its vector came from: ``prior`` (the document's
+# own stored points), ``memory`` (the process LRU) or ``miss`` (sent to the
+# provider / BM25 encoder). hit ratio = (prior + memory) / total.
+embedding_cache_chunks_total = Counter(
+    "astrolabe_embedding_cache_chunks_total",
+    "Chunks resolved by the embedding cache, by vector source",
+    ["kind", "source"],  # kind: dense | sparse; source: prior | memory | miss
+)
+
+# Disk-backed parse-result cache (vector/parse_cache.py). ``hit`` / ``miss`` are
+# lookups before a parse; ``stored`` / ``evicted`` count entries written and
+# removed to stay under DOCUMENT_PARSE_CACHE_MAX_MB. A hit is a parse (possibly
+# an OCR pass) a retry did not pay for again.
+document_parse_cache_total = Counter(
+    "astrolabe_document_parse_cache_total",
+    "Parse-result cache operations on the ingest path",
+    ["result"],  # result: hit | miss | stored | evicted
+)
+
+# Cross-fileid content dedup (vector/sharing_state.find_identical_content): a
+# file indexed by copying another fileid's identical body vs one that had to be
+# parsed and embedded.
+vector_sync_content_dedup_total = Counter(
+    "astrolabe_vector_sync_content_dedup_total",
+    "Content-hash dedup lookups for files on the ingest path",
+    ["result"],  # result: hit | miss
+)
+
+# Per-page OCR fan-out (document_processors/ocr.py, DOCUMENT_OCR_PAGES_PER_REQUEST):
+# pages of an OCR-tier document sent to the backend vs kept from the PDF's own
+# text layer because it was already usable.
+document_ocr_pages_total = Counter(
+    "astrolabe_document_ocr_pages_total",
+    "Pages of OCR-tier documents by how their text was obtained",
+    ["source"],  # source: ocr | native
+)
+
+embedding_cache_bytes = Gauge(
+    "astrolabe_embedding_cache_bytes",
+    "Approximate bytes held by the in-process embedding cache",
+)
+
+# Cross-document embedding micro-batching (vector/embedding_batcher.py): one
+# observation per provider request the batcher sends. "texts" is the coalesced
+# batch size, "callers" how many concurrent documents shared the request. A
+# callers distribution stuck at 1 means the max-wait window is too short (or the
+# processor pool too small) for coalescing to happen.
+embedding_microbatch_texts = Histogram(
+    "astrolabe_embedding_microbatch_texts",
+    "Texts per coalesced embedding request",
+    ["kind"],  # dense | sparse
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+)
+
+embedding_microbatch_callers = Histogram(
+    "astrolabe_embedding_microbatch_callers",
+    "Concurrent embedding requests coalesced into one provider request",
+    ["kind"],  # dense | sparse
+    buckets=(1, 2, 3, 5, 10, 25, 50),
+)
+
 # --- Chunking & indexed-by-type -----------------------------------------------
 
 document_chunks_total = Counter(
@@ -813,6 +944,25 @@ search_verification_dropped_total = Counter(
     ["surface"],
 )
 
+# Verify-on-read verdict cache (search/verification_cache.py). One increment per
+# unique (doc_id, doc_type) a search verifies: ``hit`` skipped the Nextcloud
+# round-trip, ``miss`` paid it. A hit ratio near zero under repeated queries
+# means the TTL is shorter than the query cadence or invalidations are churning.
+search_verification_cache_total = Counter(
+    "astrolabe_search_verification_cache_total",
+    "Verify-on-read verdicts served from / missing in the verification cache",
+    ["doc_type", "result"],  # result: hit | miss
+)
+
+# Repeated-search caches (search/query_cache.py). ``level=vectors`` counts query
+# embedding lookups (a hit skips the provider call and bills no tokens);
+# ``level=candidates`` counts hybrid-search lookups (a hit skips Qdrant).
+search_query_cache_total = Counter(
+    "astrolabe_search_query_cache_total",
+    "Hybrid-search lookups served from / missing in the query caches",
+    ["level", "result"],  # level: vectors | candidates; result: hit | miss
+)
+
 # Documents scored by the cross-encoder. This is the honest cost unit for
 # reranking — there is no natural token unit — and the series to correlate
 # against the gateway's own saturation signals when reranking gets slow. How
@@ -865,12 +1015,14 @@ db_operation_duration_seconds = Histogram(
     ),
 )
 
-# Connection acquisition, split out from the operation it serves. Under NullPool
-# (ADR-026) every operation opens a fresh connection, so this is a real per-op
-# cost, not a startup cost — and `db_operation_duration_seconds` above bundles it
-# with execute, which is exactly why a ~600ms connect hid inside a "slow insert"
-# for a day (Deck #678: one PgBouncer replica was scheduled in another
-# continent; ~50% of connections paid a transatlantic TLS handshake).
+# Connection acquisition, split out from the operation it serves. Under the old
+# Postgres NullPool every operation opened a fresh connection, and
+# `db_operation_duration_seconds` above bundled that with execute, which is
+# exactly why a ~600ms connect hid inside a "slow insert" for a day (Deck #678:
+# one PgBouncer replica was scheduled in another continent; ~50% of connections
+# paid a transatlantic TLS handshake). With the per-loop pool this is a pool
+# checkout, and a physical connect only shows up as a slow sample here plus a
+# `db_connections_opened_total` increment.
 # Labelled by dialect only: an "operation" is meaningless for a connect.
 db_connect_duration_seconds = Histogram(
     "mcp_db_connect_duration_seconds",
@@ -895,19 +1047,37 @@ db_connect_duration_seconds = Histogram(
     ),
 )
 
-# pypdfium2 / pymupdf are not thread-safe; concurrent ingest jobs serialize their
-# native calls on per-library locks (see document_processors/_native_locks.py).
-# This surfaces the resulting contention so per-tier `concurrency` can be tuned.
+# Postgres connection pool (auth/storage.py): one pool per event loop, summed.
+# "in_use" are checked out by an operation, "idle" wait in a pool for reuse.
+db_pool_connections = Gauge(
+    "mcp_db_pool_connections",
+    "Pooled database connections by state, across the per-loop pools",
+    ["db", "state"],
+)
+
+# Physical connections opened by the pools. Its rate falling far below the
+# operation rate is the signal that pooled connections are being reused.
+db_connections_opened_total = Counter(
+    "mcp_db_connections_opened_total",
+    "Physical database connections opened",
+    ["db"],
+)
+
+# pypdfium2 / pymupdf are not thread-safe, so their calls run in isolated worker
+# processes bounded by DOCUMENT_NATIVE_PROCESS_SLOTS (see
+# document_processors/_isolation.py). This surfaces the wait for a free worker
+# slot so the slot count and per-tier `concurrency` can be tuned. The name
+# predates the pool, when the wait was on a per-library lock.
 pdf_native_lock_wait_seconds = Histogram(
     "astrolabe_pdf_native_lock_wait_seconds",
-    "Time spent waiting to acquire a native PDF library lock",
+    "Time spent waiting for an isolated native PDF worker slot",
     ["library"],  # library: pdfium | pymupdf
     buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
 )
 
 
 def record_pdf_native_lock_wait(library: str, seconds: float) -> None:
-    """Record the wait to acquire the PDFium/MuPDF serialization lock."""
+    """Record the wait for a PDFium/MuPDF isolated worker slot."""
     pdf_native_lock_wait_seconds.labels(library=library).observe(seconds)
 
 
@@ -1490,9 +1660,9 @@ def record_db_connect(db: str, duration: float) -> None:
     """
     Record a database connection acquisition.
 
-    Under NullPool this fires once per operation, so a rising ``_count`` rate is
-    normal. If connection pooling is ever reintroduced, that rate collapsing
-    toward zero is the signal the pool is actually being reused.
+    Fires once per operation: a pool checkout on Postgres, a fresh connection
+    on SQLite. Use :func:`record_db_connection_opened` to count the physical
+    connects behind the checkouts.
 
     Args:
         db: Database type ("sqlite" or "postgresql")
@@ -1501,6 +1671,29 @@ def record_db_connect(db: str, duration: float) -> None:
     db_connect_duration_seconds.labels(db=db).observe(duration)
 
 
+def record_db_connection_opened(db: str) -> None:
+    """
+    Record a physical database connection opened by a connection pool.
+
+    Args:
+        db: Database type ("postgresql")
+    """
+    db_connections_opened_total.labels(db=db).inc()
+
+
+def update_db_pool_connections(db: str, *, in_use: int, idle: int) -> None:
+    """
+    Update the pooled-connection gauges.
+
+    Args:
+        db: Database type ("postgresql")
+        in_use: Connections checked out, across all per-loop pools
+        idle: Connections waiting in the pools for reuse
+    """
+    db_pool_connections.labels(db=db, state="in_use").set(in_use)
+    db_pool_connections.labels(db=db, state="idle").set(idle)
+
+
 def set_dependency_health(dependency: str, is_healthy: bool) -> None:
     """
     Update external dependency health status.
@@ -1546,6 +1739,111 @@ def record_vector_sync_deletions_suppressed(index_mode: str, count: int) -> None
     vector_sync_deletions_suppressed_total.labels(index_mode=index_mode).inc(count)
 
 
+def record_vector_sync_point_writes(
+    *, upserted: int, patched: int, deleted: int, unchanged: int
+) -> None:
+    """
+    Record how one document's re-index was written to Qdrant.
+
+    Args:
+        upserted: Points rewritten with vectors and payload
+        patched: Points that only needed a payload update
+        deleted: Vanished chunk points removed
+        unchanged: Points left as stored
+    """
+    for action, count in (
+        ("upserted", upserted),
+        ("patched", patched),
+        ("deleted", deleted),
+        ("unchanged", unchanged),
+    ):
+        if count > 0:
+            vector_sync_point_writes_total.labels(action=action).inc(count)
+
+
+def record_vector_sync_deletion_tracking(doc_type: str, source: str) -> None:
+    """
+    Record where one scan read a user's indexed doc_ids from.
+
+    Args:
+        doc_type: Document type tracked (note, file, deck_card, ...)
+        source: "manifest" (app-DB manifest) or "qdrant" (reconciling scroll)
+    """
+    vector_sync_deletion_tracking_total.labels(doc_type=doc_type, source=source).inc()
+
+
+def set_vector_sync_scan_next(user_id: str, timestamp: float) -> None:
+    """
+    Publish when a user's next background scan is due.
+
+    Args:
+        user_id: User whose scan was scheduled
+        timestamp: Unix time the scan becomes due
+    """
+    vector_sync_scan_next_timestamp_seconds.labels(user_id=user_id).set(timestamp)
+
+
+def record_vector_sync_scan_lag(user_id: str, lag: float) -> None:
+    """
+    Record how long a user's scan waited past its due time for a slot.
+
+    Args:
+        user_id: User whose scan started
+        lag: Seconds between the due time and the scan starting
+    """
+    vector_sync_scan_lag_seconds.labels(user_id=user_id).set(lag)
+
+
+def set_vector_sync_scans_waiting(lane: str, count: int) -> None:
+    """
+    Publish the number of due scans queued for a slot in one lane.
+
+    Args:
+        lane: Scheduler lane (wake | initial | backstop)
+        count: Scans currently waiting in that lane
+    """
+    vector_sync_scans_waiting.labels(lane=lane).set(count)
+
+
+def record_webhook_events_coalesced(doc_type: str, reason: str, count: int = 1) -> None:
+    """
+    Record webhook events collapsed by the coalescer instead of enqueued.
+
+    Args:
+        doc_type: Document type of the collapsed events
+        reason: "superseded" | "folder_batched"
+        count: Number of events collapsed
+    """
+    webhook_events_coalesced_total.labels(doc_type=doc_type, reason=reason).inc(count)
+
+
+def set_webhook_coalescer_pending(count: int) -> None:
+    """
+    Publish how many documents the webhook coalescer is holding.
+
+    Args:
+        count: Buffered documents
+    """
+    webhook_coalescer_pending.set(count)
+
+
+def clear_vector_sync_scan_schedule(user_id: str) -> None:
+    """
+    Drop a user's scheduling series once their scanner stops.
+
+    Args:
+        user_id: User no longer scheduled in this process
+    """
+    for gauge in (
+        vector_sync_scan_next_timestamp_seconds,
+        vector_sync_scan_lag_seconds,
+    ):
+        try:
+            gauge.remove(user_id)
+        except KeyError:
+            pass  # never published (e.g. stopped before its first scan)
+
+
 def record_vector_sync_processing(
     duration: float, status: str = "success", doc_type: str | None = None
 ) -> None:
@@ -1664,6 +1962,30 @@ def update_ingest_queue_depth(by_queue: dict[str, dict[str, int]] | None) -> Non
             )
 
 
+def update_ingest_queue_wait(
+    by_queue: dict[str, dict[str, dict[str, int]]] | None,
+) -> None:
+    """Set the queue-wait gauge from ``{queue: {lane: {le: count}}}``.
+
+    No-op on ``None`` (the producer can't report it). Series published before
+    but missing now (a lane or queue that drained) are reset to 0 rather than
+    left at their last value.
+    """
+    if by_queue is None:
+        return
+    current = {
+        (queue, lane, le): count
+        for queue, per_lane in by_queue.items()
+        for lane, buckets in per_lane.items()
+        for le, count in buckets.items()
+    }
+    for labels in _published_queue_wait - current.keys():
+        ingest_queue_wait_jobs.labels(*labels).set(0)
+    for labels, count in current.items():
+        ingest_queue_wait_jobs.labels(*labels).set(count)
+    _published_queue_wait.update(current)
+
+
 def record_document_parse(
     processor: str,
     tier: str,
@@ -1900,6 +2222,93 @@ def record_embedding_tokens(provider: str, operation: str, tokens: int) -> None:
         )
 
 
+def record_embedding_cache(kind: str, *, prior: int, memory: int, miss: int) -> None:
+    """Record how one batch of chunks was resolved by the embedding cache.
+
+    Args:
+        kind: "dense" or "sparse"
+        prior: Chunks reused from the document's previously stored points
+        memory: Chunks served from the in-process LRU
+        miss: Chunks that still had to be embedded
+    """
+    for source, count in (("prior", prior), ("memory", memory), ("miss", miss)):
+        if count > 0:
+            embedding_cache_chunks_total.labels(kind=kind, source=source).inc(count)
+
+
+def update_embedding_cache_bytes(size: int) -> None:
+    """Update the in-process embedding cache size gauge."""
+    embedding_cache_bytes.set(size)
+
+
+def record_embedding_microbatch(kind: str, *, texts: int, callers: int) -> None:
+    """Record one coalesced embedding request sent by the micro-batcher.
+
+    Args:
+        kind: "dense" or "sparse"
+        texts: Texts in the coalesced request
+        callers: Concurrent embedding requests it served
+    """
+    embedding_microbatch_texts.labels(kind=kind).observe(texts)
+    embedding_microbatch_callers.labels(kind=kind).observe(callers)
+
+
+def record_verification_cache(doc_type: str, *, hits: int, misses: int) -> None:
+    """Record verify-on-read cache lookups for one doc_type in one search.
+
+    Args:
+        doc_type: Document type verified (note, file, deck_card, ...)
+        hits: Documents whose cached verdict was reused
+        misses: Documents that still had to be verified against Nextcloud
+    """
+    for result, count in (("hit", hits), ("miss", misses)):
+        if count > 0:
+            search_verification_cache_total.labels(
+                doc_type=doc_type, result=result
+            ).inc(count)
+
+
+def record_document_parse_cache(result: str) -> None:
+    """Record one parse-result cache operation.
+
+    Args:
+        result: hit, miss, stored or evicted
+    """
+    document_parse_cache_total.labels(result=result).inc()
+
+
+def record_vector_sync_content_dedup(result: str) -> None:
+    """Record one content-hash dedup lookup for a file.
+
+    Args:
+        result: hit (points copied, no parse) or miss (indexed normally)
+    """
+    vector_sync_content_dedup_total.labels(result=result).inc()
+
+
+def record_document_ocr_pages(*, ocr: int, native: int) -> None:
+    """Record how the pages of one OCR-tier document were transcribed.
+
+    Args:
+        ocr: Pages sent to the OCR backend
+        native: Pages kept from the PDF's text layer
+    """
+    if ocr:
+        document_ocr_pages_total.labels(source="ocr").inc(ocr)
+    if native:
+        document_ocr_pages_total.labels(source="native").inc(native)
+
+
+def record_search_query_cache(level: str, result: str) -> None:
+    """Record one lookup in the repeated-search caches.
+
+    Args:
+        level: Cache consulted (vectors, candidates)
+        result: hit or miss
+    """
+    search_query_cache_total.labels(level=level, result=result).inc()
+
+
 def record_search_request(
     *,
     surface: str,
@@ -1,11 +1,15 @@
 """BM25 sparse embedding provider using FastEmbed."""
 
 import logging
+import threading
 from typing import Any
 
 import anyio
 from fastembed import SparseTextEmbedding
 
+from ..config import get_settings
+from .bm25_encoder import BM25Encoder, BM25ProcessPool
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +24,11 @@ class BM25SparseEmbeddingProvider:
     Unlike dense embeddings which have fixed dimensions, sparse embeddings
     have variable-length vectors with (index, value) pairs representing
     term frequencies in the BM25 vocabulary.
+
+    FastEmbed supplies the model (stopwords, stemmer, parameters); encoding
+    runs through the native ``BM25Encoder`` built from it, which yields the
+    same vectors (see providers/bm25_encoder.py). If the loaded model doesn't
+    expose what the encoder needs, encoding falls back to FastEmbed itself.
     """
 
     def __init__(self, model_name: str = "Qdrant/bm25"):
@@ -36,6 +45,23 @@ class BM25SparseEmbeddingProvider:
         self.model = SparseTextEmbedding(model_name=model_name)
         logger.info("BM25 sparse embedding model loaded: %s", model_name)
 
+        settings = get_settings()
+        self._encoder = BM25Encoder.from_fastembed(
+            self.model.model, vocab_size=settings.bm25_vocab_cache_size
+        )
+        if self._encoder is None:
+            logger.warning(
+                "FastEmbed model %s does not expose BM25 internals; "
+                "encoding through FastEmbed",
+                model_name,
+            )
+        self._processes = settings.bm25_encode_processes
+        self._parallel_min_texts = settings.bm25_parallel_min_texts
+        # Started on the first batch large enough to use it, so processes that
+        # never ingest (query-only pods) don't spawn workers.
+        self._pool: BM25ProcessPool | None = None
+        self._pool_lock = threading.Lock()
+
     def encode(self, text: str) -> dict[str, Any]:
         """
         Generate BM25 sparse embedding for a single text (synchronous).
@@ -48,6 +74,9 @@ class BM25SparseEmbeddingProvider:
         Returns:
             Dictionary with 'indices' and 'values' keys for Qdrant sparse vector
         """
+        if self._encoder is not None:
+            return self._encoder.encode(text)
+
         # FastEmbed returns a generator, take first result
         sparse_embedding = next(iter(self.model.embed([text])))
 
@@ -84,17 +113,33 @@ class BM25SparseEmbeddingProvider:
         """
 
         # Run CPU-bound BM25 encoding in thread pool to avoid blocking event loop
-        sparse_embeddings = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
-            lambda: list(self.model.embed(texts))
+        return await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+            lambda: self._encode_texts(texts)
         )
 
-        return [
-            {
-                "indices": emb.indices.tolist(),
-                "values": emb.values.tolist(),
-            }
-            for emb in sparse_embeddings
-        ]
+    def _encode_texts(self, texts: list[str]) -> list[dict[str, Any]]:
+        """Encode a batch synchronously (the body of ``encode_batch``).
+
+        Batches of at least ``BM25_PARALLEL_MIN_TEXTS`` texts are sharded
+        across the ``BM25_ENCODE_PROCESSES`` worker pool when it is enabled.
+        Concurrent calls from several threads share the encoder's vocabulary
+        table; its updates are single dict operations, and racing writers
+        store the same value.
+        """
+        if self._encoder is None:
+            return [
+                {
+                    "indices": emb.indices.tolist(),
+                    "values": emb.values.tolist(),
+                }
+                for emb in self.model.embed(texts)
+            ]
+        if self._processes > 0 and len(texts) >= self._parallel_min_texts:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = BM25ProcessPool(self._encoder, self._processes)
+            return self._pool.encode_batch(texts)
+        return self._encoder.encode_batch(texts)
 
 
 # BM25 sparse embedding singleton
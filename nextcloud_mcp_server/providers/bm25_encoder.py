@@ -0,0 +1,233 @@
+"""Native BM25 term-frequency encoder, bit-compatible with FastEmbed's ``Qdrant/bm25``.
+
+FastEmbed's ``Bm25.raw_embed`` stems and ``mmh3``-hashes every token of every
+chunk, builds a NumPy array per chunk, and the provider then turned each one
+back into Python lists for Qdrant. On the keyword-only ingest path (no dense
+vector) that loop was the CPU hotspot. :class:`BM25Encoder` produces the same
+sparse vectors with less work:
+
+- **Interned vocabulary.** Each distinct raw token is resolved once (punctuation
+  and stopword filter, Snowball stem, ``abs(mmh3.hash(stem))``) and the result
+  is kept in a bounded table. Natural text repeats a small vocabulary, so
+  almost every token after warm-up is a single dict lookup.
+- **Lists, not arrays.** Qdrant's ``SparseVector`` model only accepts Python
+  ``int`` / ``float`` lists, so the encoder builds those directly; no NumPy
+  array is created and converted back per chunk.
+- **Process pool.** ``BM25_ENCODE_PROCESSES`` > 0 shards batches of at least
+  ``BM25_PARALLEL_MIN_TEXTS`` texts across a dedicated pool of worker processes
+  (see :class:`BM25ProcessPool`), since the pure-Python loop holds the GIL.
+
+Compatibility matters more than speed here: points already in Qdrant and every
+search query are encoded by FastEmbed's rules, and a token id that drifted
+would silently stop matching. The encoder therefore takes its stopwords,
+stemmer and ``k`` / ``b`` / ``avg_len`` from the loaded FastEmbed model
+(:meth:`BM25Encoder.from_fastembed`) and mirrors ``Bm25.raw_embed`` step for
+step, including the float operation order of the term-frequency formula.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import re
+from collections import Counter
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, cast
+
+import mmh3
+
+logger = logging.getLogger(__name__)
+
+# ``remove_non_alphanumeric`` followed by ``SimpleTokenizer.tokenize`` in
+# FastEmbed: strip non-word, non-space characters, lowercase, split on every
+# remaining non-word character.
+_NON_WORD_OR_SPACE = re.compile(r"[^\w\s]", flags=re.UNICODE)
+_WORD = re.compile(r"\w+")
+
+# Vocabulary-table miss (a stored ``None`` means "token contributes nothing").
+_MISSING = object()
+
+
+class BM25Encoder:
+    """Encode texts to BM25 sparse vectors as ``{"indices", "values"}`` lists."""
+
+    def __init__(
+        self,
+        *,
+        stopwords: Iterable[str],
+        punctuation: Iterable[str],
+        stemmer: Any | None,
+        language: str = "english",
+        token_max_length: int = 40,
+        k: float = 1.2,
+        b: float = 0.75,
+        avg_len: float = 256.0,
+        vocab_size: int = 200_000,
+    ) -> None:
+        self._stopwords = frozenset(stopwords)
+        self._punctuation = frozenset(punctuation)
+        self._stemmer = stemmer
+        self._language = language
+        self._token_max_length = token_max_length
+        self._k = k
+        self._b = b
+        self._avg_len = avg_len
+        self._vocab_size = vocab_size
+        # raw token -> (stem, token id), or None for a token that contributes
+        # nothing (punctuation, stopword, too long, empty stem).
+        self._vocab: dict[str, tuple[str, int] | None] = {}
+
+    @classmethod
+    def from_fastembed(cls, model: Any, *, vocab_size: int) -> BM25Encoder | None:
+        """Build an encoder from a loaded FastEmbed ``Bm25`` model.
+
+        ``model`` is ``SparseTextEmbedding.model``. Returns ``None`` when it
+        does not expose the ``Bm25`` attributes this encoder mirrors (another
+        sparse model, or a FastEmbed release that renamed them); the caller
+        then keeps encoding through FastEmbed.
+        """
+        try:
+            return cls(
+                stopwords=model.stopwords,
+                punctuation=model.punctuation,
+                stemmer=model.stemmer,
+                language=model.language,
+                token_max_length=model.token_max_length,
+                k=model.k,
+                b=model.b,
+                avg_len=model.avg_len,
+                vocab_size=vocab_size,
+            )
+        except AttributeError:
+            return None
+
+    @property
+    def vocab_len(self) -> int:
+        return len(self._vocab)
+
+    def encode(self, text: str) -> dict[str, list]:
+        """Encode one text; same output as ``Bm25.embed`` plus ``.tolist()``."""
+        vocab = self._vocab
+        resolve = self._resolve
+        stems: list[str] = []
+        ids: dict[str, int] = {}
+        text = _NON_WORD_OR_SPACE.sub(" ", text).lower()
+        for token in _WORD.findall(text):
+            entry = vocab.get(token, _MISSING)
+            if entry is _MISSING:
+                entry = resolve(token)
+            if entry is None:
+                continue
+            # resolve() never returns the sentinel, so entry is a vocab entry.
+            stem, token_id = cast(tuple[str, int], entry)
+            stems.append(stem)
+            ids[stem] = token_id
+
+        k = self._k
+        # Same expression and operation order as Bm25._term_frequency, so the
+        # float64 values are identical. Keyed on token id like FastEmbed's
+        # tf_map, so two stems whose hashes collide still yield one index.
+        norm = k * (1 - self._b + self._b * len(stems) / self._avg_len)
+        tf: dict[int, float] = {}
+        for stem, count in Counter(stems).items():
+            tf[ids[stem]] = count * (k + 1) / (count + norm)
+        return {"indices": list(tf), "values": list(tf.values())}
+
+    def encode_batch(self, texts: list[str]) -> list[dict[str, list]]:
+        encode = self.encode
+        return [encode(text) for text in texts]
+
+    def _resolve(self, token: str) -> tuple[str, int] | None:
+        # Bm25._stem for one already-lowercased token, then compute_token_id.
+        entry = None
+        if (
+            token not in self._punctuation
+            and token not in self._stopwords
+            and len(token) <= self._token_max_length
+        ):
+            stem = self._stemmer.stem_word(token) if self._stemmer else token
+            if stem:
+                entry = (stem, abs(mmh3.hash(stem)))
+        if len(self._vocab) >= self._vocab_size:
+            # Long-tail tokens (ids, numbers, hashes) would grow the table
+            # without bound; start over rather than track recency per lookup.
+            self._vocab.clear()
+        self._vocab[token] = entry
+        return entry
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The Snowball stemmer is a native object that doesn't pickle; worker
+        # processes rebuild it from the language. The vocabulary table is a
+        # per-process cache and is not shipped.
+        state = self.__dict__.copy()
+        state["_stemmer"] = state["_stemmer"] is not None
+        state["_vocab"] = {}
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        if self._stemmer:
+            from py_rust_stemmers import SnowballStemmer  # noqa: PLC0415 — only when a stemmer was shipped  # ty: ignore[unresolved-import]
+
+            self._stemmer = SnowballStemmer(self._language)
+        else:
+            self._stemmer = None
+
+
+# Encoder of the current worker process, installed by the pool initializer.
+_worker_encoder: BM25Encoder | None = None
+
+
+def _init_worker(encoder: BM25Encoder) -> None:
+    global _worker_encoder
+    _worker_encoder = encoder
+
+
+def _encode_shard(texts: list[str]) -> list[dict[str, list]]:
+    assert _worker_encoder is not None
+    return _worker_encoder.encode_batch(texts)
+
+
+class BM25ProcessPool:
+    """Dedicated worker processes for large BM25 batches.
+
+    Separate from ``anyio.to_process``'s shared pool on purpose: that pool runs
+    the PDF parse workers (document_processors/_isolation.py), which set an
+    address-space rlimit on themselves. An encoder shard must neither inherit
+    that cap nor eat into a parse worker's budget. Workers start with
+    ``forkserver`` (``spawn`` where unavailable), never ``fork``, because the
+    parent is a threaded process; each worker receives a pickled copy of the
+    encoder once, in the pool initializer.
+    """
+
+    def __init__(self, encoder: BM25Encoder, processes: int) -> None:
+        self._processes = processes
+        method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context(method),
+            initializer=_init_worker,
+            initargs=(encoder,),
+        )
+        # Stop the workers before interpreter teardown closes the pipes the
+        # executor's management thread still writes to.
+        atexit.register(self._executor.shutdown, wait=False, cancel_futures=True)
+
+    def encode_batch(self, texts: list[str]) -> list[dict[str, list]]:
+        """Encode ``texts`` across the workers, preserving order (blocking)."""
+        shard_size = -(-len(texts) // self._processes)
+        shards = [
+            texts[start : start + shard_size]
+            for start in range(0, len(texts), shard_size)
+        ]
+        return [
+            vector
+            for shard in self._executor.map(_encode_shard, shards)
+            for vector in shard
+        ]
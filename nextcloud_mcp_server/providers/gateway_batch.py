@@ -131,7 +131,9 @@ class GatewayBatchOcrClient:
             return {}
         return {"Authorization": f"Bearer {await self._token_provider.get_token()}"}
 
-    async def submit(self, content: bytes, mime_type: str, custom_id: str) -> str:
+    async def submit(
+        self, content: bytes | memoryview, mime_type: str, custom_id: str
+    ) -> str:
         """Submit ``content`` as a one-document batch job; return the namespaced
         ``job_id`` to persist + poll. Raises on transport / non-2xx."""
         payload = {
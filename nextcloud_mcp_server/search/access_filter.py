@@ -42,6 +42,7 @@ from qdrant_client.models import (
     Range,
 )
 
+from nextcloud_mcp_server.search.verification_cache import invalidate_user
 from nextcloud_mcp_server.vector import payload_keys
 from nextcloud_mcp_server.vector.placeholder import get_placeholder_filter
 
@@ -188,6 +189,13 @@ async def list_accessible_scope(
             share_root_ids.add(str(root).strip())
 
     result = AccessibleScope(sorted(owners), sorted(share_root_ids))
+    # A changed scope means a share was granted or revoked: cached verify-on-read
+    # verdicts for this user may now be wrong in either direction. A missing
+    # previous entry (first lookup, or LRU-evicted) can't be compared, so it
+    # invalidates too. ``cached`` still holds an expired entry when the TTL ran
+    # out — expired entries are only ever overwritten, never removed.
+    if cached is None or cached[1] != result:
+        invalidate_user(user_id)
     _owners_cache[user_id] = (now, result)
     # Promote to the most-recently-used end. This is a no-op for a brand-new
     # key (dict insertion already appends) but is needed when re-inserting an
@@ -1,6 +1,7 @@
 """BM25 hybrid search algorithm using Qdrant native RRF fusion."""
 
 import logging
+import time
 from collections.abc import Iterable
 from typing import Any
 
@@ -20,6 +21,14 @@ from nextcloud_mcp_server.search.algorithms import (
     SearchResult,
     build_search_result_from_point,
 )
+from nextcloud_mcp_server.search.query_cache import (
+    QueryVectors,
+    candidate_key,
+    get_cached_points,
+    get_query_vectors,
+    store_points,
+    store_query_vectors,
+)
 from nextcloud_mcp_server.vector.qdrant_client import get_qdrant_client
 
 logger = logging.getLogger(__name__)
@@ -182,6 +191,44 @@ class BM25HybridSearchAlgorithm(SearchAlgorithm):
         logger.debug("Generated dense embedding (dimension=%s)", len(dense_embedding))
         return dense_embedding
 
+    async def _query_vectors(
+        self, query: str, user_id: str, settings: Any
+    ) -> tuple[list | None, dict[str, Any]]:
+        """Dense and sparse vectors for ``query``, from the query-vector cache
+        when this user searched the same text recently (search/query_cache.py).
+
+        A cache hit embeds nothing, so it bills no tokens: ``query_token_count``
+        is 0 unless an earlier call on this instance already embedded the query.
+        """
+        identity = settings.get_embedding_identity()
+        cached = get_query_vectors(user_id, identity, query)
+        if cached is not None:
+            if self._embedded_query != query:
+                self.query_embedding = cached.dense
+                self.query_token_count = 0
+                self._embedded_query = query
+            return cached.dense, cached.sparse
+
+        # Dense query embedding (fused with the sparse prefetch below).
+        dense_embedding = await self._embed_query_dense(query, settings)
+
+        # Generate sparse embedding for BM25 keyword search
+        with trace_operation("search.get_bm25_service"):
+            bm25_service = await get_bm25_service()
+        with trace_operation("search.sparse_embedding_bm25"):
+            sparse_embedding = await bm25_service.encode_async(query)
+        logger.debug(
+            "Generated sparse embedding (%s non-zero terms)",
+            len(sparse_embedding["indices"]),
+        )
+        store_query_vectors(
+            user_id,
+            identity,
+            query,
+            QueryVectors(dense=dense_embedding, sparse=sparse_embedding),
+        )
+        return dense_embedding, sparse_embedding
+
     def _build_fusion_query(self, settings: Any) -> Any:
         """Build the fusion stage that merges the dense and sparse prefetches.
 
@@ -406,17 +453,8 @@ class BM25HybridSearchAlgorithm(SearchAlgorithm):
             doc_type,
         )
 
-        # Dense query embedding (fused with the sparse prefetch below).
-        dense_embedding = await self._embed_query_dense(query, settings)
-
-        # Generate sparse embedding for BM25 keyword search
-        with trace_operation("search.get_bm25_service"):
-            bm25_service = await get_bm25_service()
-        with trace_operation("search.sparse_embedding_bm25"):
-            sparse_embedding = await bm25_service.encode_async(query)
-        logger.debug(
-            "Generated sparse embedding (%s non-zero terms)",
-            len(sparse_embedding["indices"]),
+        dense_embedding, sparse_embedding = await self._query_vectors(
+            query, user_id, settings
         )
 
         # Build Qdrant filter (placeholder + ACL + doc_type + modified_at range).
@@ -436,48 +474,82 @@ class BM25HybridSearchAlgorithm(SearchAlgorithm):
 
         query_filter = Filter(must=filter_conditions)
 
-        # Execute hybrid search with Qdrant native RRF fusion
-        with trace_operation("search.get_qdrant_client"):
-            qdrant_client = await get_qdrant_client()
-
-        sparse_query = models.SparseVector(
-            indices=sparse_embedding["indices"],
-            values=sparse_embedding["values"],
+        # A repeat of a recent search (same query, filter and page size; a
+        # tighter score_threshold) reuses its candidates instead of re-running
+        # the fusion query (search/query_cache.py). ``fetch_limit`` mirrors the
+        # limit _run_qdrant_query sends to Qdrant, which sets its prefetch depth.
+        grouped = granularity == GRANULARITY_DOCUMENT
+        fetch_limit = limit if grouped else limit * 2
+        cache_key = candidate_key(
+            query=query,
+            identity=settings.get_embedding_identity(),
+            collection=settings.get_collection_name(),
+            query_filter=query_filter,
+            fusion=self.fusion_name,
+            rrf_k=settings.vector_search_rrf_k,
+            granularity=granularity,
+            limit=fetch_limit,
         )
-        try:
-            search_response = await self._run_qdrant_query(
-                qdrant_client,
-                settings,
-                sparse_query=sparse_query,
-                dense_embedding=dense_embedding,
-                query_filter=query_filter,
-                limit=limit,
+        points = get_cached_points(cache_key, score_threshold=score_threshold)
+        if points is None:
+            # Execute hybrid search with Qdrant native RRF fusion
+            with trace_operation("search.get_qdrant_client"):
+                qdrant_client = await get_qdrant_client()
+
+            sparse_query = models.SparseVector(
+                indices=sparse_embedding["indices"],
+                values=sparse_embedding["values"],
+            )
+            # Taken before the query so a write landing mid-flight invalidates
+            # the entry stored below.
+            fetched_at = time.monotonic()
+            try:
+                search_response = await self._run_qdrant_query(
+                    qdrant_client,
+                    settings,
+                    sparse_query=sparse_query,
+                    dense_embedding=dense_embedding,
+                    query_filter=query_filter,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    granularity=granularity,
+                )
+                record_qdrant_operation("search", "success")
+            except Exception:
+                record_qdrant_operation("search", "error")
+                raise
+            points = search_response.points
+            store_points(
+                cache_key,
+                points,
                 score_threshold=score_threshold,
-                granularity=granularity,
+                owners=accessible_owners or [user_id],
+                fetched_at=fetched_at,
+            )
+            logger.info(
+                "Qdrant %s returned %s results (before deduplication)",
+                method_label,
+                len(points),
+            )
+        else:
+            logger.info(
+                "Reused %s cached %s results (before deduplication)",
+                len(points),
+                method_label,
             )
-            record_qdrant_operation("search", "success")
-        except Exception:
-            record_qdrant_operation("search", "error")
-            raise
-
-        logger.info(
-            "Qdrant %s returned %s results (before deduplication)",
-            method_label,
-            len(search_response.points),
-        )
 
-        if search_response.points:
+        if points:
             # Log top 3 scores to help with threshold tuning. Neither algorithm
             # is on a 0-1 relevance scale: RRF peaks near 2/VECTOR_SEARCH_RRF_K
             # (~0.033 at k=60) and DBSF is unbounded above 1.0.
-            top_scores = [p.score for p in search_response.points[:3]]
+            top_scores = [p.score for p in points[:3]]
             logger.debug("Top 3 %s scores: %s", method_label, top_scores)
 
         # Deduplicate by (doc_id, doc_type, chunk_start, chunk_end)
         # This allows multiple chunks from same doc, but removes duplicate chunks
         with trace_operation(
             "search.deduplicate",
-            attributes={"dedupe.num_points": len(search_response.points)},
+            attributes={"dedupe.num_points": len(points)},
         ):
             seen_chunks: set[tuple[str, str, Any, Any]] = set()
             results: list[SearchResult] = []
@@ -485,7 +557,7 @@ class BM25HybridSearchAlgorithm(SearchAlgorithm):
             # never drift (and to avoid the duplicate expression).
             metadata_extras = {"search_method": method_label}
 
-            for point in search_response.points:
+            for point in points:
                 sr = build_search_result_from_point(
                     point, metadata_extras=metadata_extras
                 )
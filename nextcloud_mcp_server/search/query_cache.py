@@ -0,0 +1,237 @@
+"""Two-level cache for repeated hybrid searches.
+
+Agents re-issue the same search constantly: the same question again a few turns
+later, or a retry with a different ``min_relevance`` (applied after retrieval,
+so the retrieval is identical). Each one paid an embedding round-trip and a Qdrant fusion query with
+a prefetch of up to ``MAX_DOCUMENT_PREFETCH`` candidates per branch.
+``BM25HybridSearchAlgorithm.search`` consults two caches before doing that work:
+
+- **Query vectors** (``get_query_vectors``): the dense and sparse vectors of a
+  query, keyed on ``(user_id, embedding identity, normalized query)``. A query's
+  vectors depend only on its text and the model, so entries never go stale; an
+  LRU bound (``QUERY_VECTOR_CACHE_SIZE``) caps them. A hit skips the provider
+  call and bills no tokens. Entries are per user so the cache can't reveal, by
+  timing, what another user searched for.
+- **Candidates** (``get_cached_points``): the raw Qdrant points of one fusion
+  query, keyed on the query, embedding identity, collection, filter (user,
+  accessible owners, doc_type, dates, paths), fusion, granularity and limit.
+  They live for ``SEARCH_RESULT_CACHE_TTL_SECONDS``. The limit is part of the
+  key because it sets the prefetch depth of both branches: fusing deeper
+  prefetches can reorder the head of the result, so an entry fetched for a
+  larger page is not the prefix of a smaller one (and Qdrant reorders the head
+  of a grouped query as the requested group count changes, see
+  ``bm25_hybrid._run_qdrant_query``). A ``score_threshold`` at or above the
+  entry's is applied to the cached points.
+
+Candidate entries are invalidated per owner, timestamp-based like
+``verification_cache``: the processor marks the owning user after every index
+and delete, and an entry is stale once any user whose documents its filter
+admits (the searcher and their accessible owners) was marked after it was
+fetched. Points are re-verified on every search (verify-on-read runs after
+retrieval), so a stale candidate can only hide a just-indexed document, never
+expose a revoked one.
+
+Both caches are per process. Writes made by a separate ingest worker
+(``INGEST_QUEUE=postgres``) don't invalidate them; the TTL bounds how long a
+newly indexed document can be missing from a repeated search there.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from nextcloud_mcp_server.config import get_settings
+from nextcloud_mcp_server.observability.metrics import record_search_query_cache
+
+# Cap on cached candidate lists across all users. An entry holds up to
+# ``limit * 2`` points with payloads (excerpts included), so a few hundred KB at
+# the largest page sizes.
+_RESULT_CACHE_MAXSIZE = 256
+
+
+@dataclass
+class QueryVectors:
+    """The dense and sparse vectors of one query."""
+
+    dense: list[float] | None
+    sparse: dict[str, Any]
+
+
+@dataclass
+class _CandidateEntry:
+    points: list[Any]
+    score_threshold: float
+    fetched_at: float
+    owners: frozenset[str]
+
+
+# (user_id, identity, normalized query) -> (float32 dense, sparse indices, values)
+_vectors: OrderedDict[tuple[str, str, str], tuple[Any, list[int], list[float]]] = (
+    OrderedDict()
+)
+# candidate key -> entry
+_candidates: OrderedDict[str, _CandidateEntry] = OrderedDict()
+# owner user_id -> monotonic time of the last write to their documents
+_owner_written: dict[str, float] = {}
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace so trivially different spellings share an entry."""
+    return " ".join(query.split())
+
+
+def get_query_vectors(user_id: str, identity: str, query: str) -> QueryVectors | None:
+    """Cached vectors for ``query`` under embedding ``identity``, or ``None``."""
+    if get_settings().query_vector_cache_size <= 0:
+        return None
+    key = (user_id, identity, normalize_query(query))
+    entry = _vectors.get(key)
+    if entry is None:
+        record_search_query_cache("vectors", "miss")
+        return None
+    _vectors.move_to_end(key)
+    record_search_query_cache("vectors", "hit")
+    dense, indices, values = entry
+    return QueryVectors(
+        dense=dense.tolist() if dense is not None else None,
+        sparse={"indices": list(indices), "values": list(values)},
+    )
+
+
+def store_query_vectors(
+    user_id: str, identity: str, query: str, vectors: QueryVectors
+) -> None:
+    """Remember ``vectors`` for ``query``; dense vectors are stored as float32."""
+    max_size = get_settings().query_vector_cache_size
+    if max_size <= 0:
+        return
+    key = (user_id, identity, normalize_query(query))
+    dense = (
+        np.asarray(vectors.dense, dtype=np.float32)
+        if vectors.dense is not None
+        else None
+    )
+    _vectors[key] = (
+        dense,
+        list(vectors.sparse["indices"]),
+        list(vectors.sparse["values"]),
+    )
+    _vectors.move_to_end(key)
+    while len(_vectors) > max_size:
+        _vectors.popitem(last=False)
+
+
+def candidate_key(
+    *,
+    query: str,
+    identity: str,
+    collection: str,
+    query_filter: Any,
+    fusion: str,
+    rrf_k: int,
+    granularity: str,
+    limit: int,
+) -> str:
+    """Fingerprint of everything that shapes a fusion query.
+
+    ``limit`` is the number of points the query asks Qdrant for; it also sets
+    the prefetch depth, so queries with different limits never share an entry.
+    """
+    parts = [
+        normalize_query(query),
+        str(identity),
+        str(collection),
+        query_filter.model_dump_json(),
+        fusion,
+        str(rrf_k),
+        granularity,
+        str(limit),
+    ]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def get_cached_points(key: str, *, score_threshold: float) -> list[Any] | None:
+    """Candidate points for a query, or ``None`` if it must go to Qdrant.
+
+    Returns the cached points with ``score_threshold`` applied.
+    """
+    ttl = _ttl()
+    if ttl <= 0:
+        return None
+    entry = _candidates.get(key)
+    if entry is None:
+        record_search_query_cache("candidates", "miss")
+        return None
+    if not _is_fresh(entry, ttl):
+        del _candidates[key]
+        record_search_query_cache("candidates", "miss")
+        return None
+    if entry.score_threshold > score_threshold:
+        record_search_query_cache("candidates", "miss")
+        return None
+    _candidates.move_to_end(key)
+    record_search_query_cache("candidates", "hit")
+    return [p for p in entry.points if p.score >= score_threshold]
+
+
+def store_points(
+    key: str,
+    points: list[Any],
+    *,
+    score_threshold: float,
+    owners: Iterable[str],
+    fetched_at: float,
+) -> None:
+    """Cache the points of a fusion query that was sent at ``fetched_at``.
+
+    ``fetched_at`` is the ``time.monotonic()`` taken *before* the Qdrant call,
+    so a write that lands while the query is in flight invalidates the entry.
+    """
+    if _ttl() <= 0:
+        return
+    _candidates[key] = _CandidateEntry(
+        points=list(points),
+        score_threshold=score_threshold,
+        fetched_at=fetched_at,
+        owners=frozenset(owners),
+    )
+    _candidates.move_to_end(key)
+    while len(_candidates) > _RESULT_CACHE_MAXSIZE:
+        _candidates.popitem(last=False)
+
+
+def invalidate_owner(user_id: str) -> None:
+    """Drop cached candidates whose filter admits ``user_id``'s documents."""
+    now = time.monotonic()
+    _owner_written[user_id] = now
+    if len(_owner_written) > _RESULT_CACHE_MAXSIZE * 16:
+        cutoff = now - _ttl()
+        for stale in [k for k, at in _owner_written.items() if at < cutoff]:
+            del _owner_written[stale]
+
+
+def clear_query_cache() -> None:
+    """Drop both caches and every invalidation mark (used by tests)."""
+    _vectors.clear()
+    _candidates.clear()
+    _owner_written.clear()
+
+
+def _ttl() -> float:
+    return float(get_settings().search_result_cache_ttl_seconds)
+
+
+def _is_fresh(entry: _CandidateEntry, ttl: float) -> bool:
+    if time.monotonic() - entry.fetched_at >= ttl:
+        return False
+    return all(
+        _owner_written.get(owner, -1.0) < entry.fetched_at for owner in entry.owners
+    )
@@ -17,6 +17,12 @@ exception: it gates results on current ``vector-index`` tag membership via a
 single batch tag REPORT (which also confirms access), so it does not read
 per-result metadata.
 
+Round-trips stay O(1) per doc_type where the API allows it: files (one tag
+REPORT), news (one item fetch), mail (one listing per mailbox). Notes and deck
+cards switch from one fetch per result to one ids-only Notes listing, or one
+``get_stacks`` per board, once a search has ``_BATCH_VERIFY_MIN_RESULTS`` of
+them (per board for deck) — a single lookup is cheaper below that.
+
 Concurrency is bounded by a shared semaphore (default 20) so a large search
 result page (or a multi-doc_type query) cannot exhaust the httpx connection
 pool or trigger Nextcloud rate limiting. The 20-slot default matches the
@@ -37,10 +43,18 @@ The ``file`` verifier is the exception to the first rule: it gates on current
 dropped+evicted when it is absent from the tag set — untagged, deleted, or
 under an ``EXCLUDED_TAGS`` folder — not on a per-file 403/404. A failed tag
 fetch still fails open. See ``_verify_files`` for the full contract.
+
+Definitive verdicts — positive and negative — are cached per user for
+``VERIFICATION_CACHE_TTL_SECONDS`` (``search/verification_cache.py``), so a
+repeated search over the same documents skips the round-trips. Fail-open keeps
+are never cached, and webhook events, deletes and incoming-share changes
+invalidate entries before the TTL runs out.
 """
 
 import logging
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from contextvars import ContextVar
 
 import anyio
 from anyio.abc import TaskGroup
@@ -51,6 +65,10 @@ from nextcloud_mcp_server.search.algorithms import (
     NextcloudClientProtocol,
     SearchResult,
 )
+from nextcloud_mcp_server.search.verification_cache import (
+    get_cached_verdicts,
+    store_verdicts,
+)
 from nextcloud_mcp_server.utils.validation import is_valid_nextcloud_doc_id
 from nextcloud_mcp_server.vector.eviction import delete_document_points
 from nextcloud_mcp_server.vector.mail_content import (
@@ -68,6 +86,32 @@ BatchVerifier = Callable[
 """(client, results, semaphore) -> set of doc_ids accessible to the user."""
 
 
+# Doc_ids the running verifier kept *without* a definitive answer (fail-open).
+# Set per doc_type by ``verify_search_results`` so those verdicts are never
+# written to the verification cache; verifiers report them via
+# ``_keep_unverified`` instead of adding to ``accessible`` directly. A context
+# variable rather than a verifier argument so ``BatchVerifier`` keeps its shape.
+_unverified_ids: ContextVar[set[str] | None] = ContextVar(
+    "_unverified_ids", default=None
+)
+
+
+def _keep_unverified(accessible: set[str], doc_id: str) -> None:
+    """Keep ``doc_id`` in results (fail-open) without caching it as verified."""
+    accessible.add(doc_id)
+    unverified = _unverified_ids.get()
+    if unverified is not None:
+        unverified.add(doc_id)
+
+
+def _keep_all_unverified(results: Iterable[SearchResult]) -> set[str]:
+    """Fail-open for a whole batch: every result kept, none cached."""
+    accessible: set[str] = set()
+    for r in results:
+        _keep_unverified(accessible, r.id)
+    return accessible
+
+
 # ---------------------------------------------------------------------------
 # Per-doc-type verifiers
 # ---------------------------------------------------------------------------
@@ -85,11 +129,26 @@ def _is_definitive_404_or_403(exc: BaseException) -> bool:
     return False
 
 
+# Below this many results per search (notes) or per board (deck cards), per-id
+# fetches are cheaper than listing everything: an ids-only Notes listing still
+# walks the whole Notes folder server-side, and a board's stacks carry every
+# card on it. At or above it, one listing replaces N round-trips.
+_BATCH_VERIFY_MIN_RESULTS = 3
+
+
 async def _verify_notes(
     client: NextcloudClientProtocol,
     results: list[SearchResult],
     semaphore: anyio.Semaphore,
 ) -> set[str]:
+    """Verify notes per id for a few results, or with one ids-only listing.
+
+    See ``_verify_notes_batch`` for the batched path's failure policy; the
+    per-id path is the canonical shape the other per-access verifiers mirror.
+    """
+    if len(results) >= _BATCH_VERIFY_MIN_RESULTS:
+        return await _verify_notes_batch(client, results, semaphore)
+
     # safe: cooperative concurrency, no lock needed (see verify_search_results)
     accessible: set[str] = set()
 
@@ -108,7 +167,7 @@ async def _verify_notes(
                 doc_id,
                 e,
             )
-            accessible.add(doc_id)
+            _keep_unverified(accessible, doc_id)
             return
 
         async with semaphore:
@@ -124,14 +183,14 @@ async def _verify_notes(
                     e.response.status_code,
                     e,
                 )
-                accessible.add(doc_id)
+                _keep_unverified(accessible, doc_id)
             except Exception as e:
                 logger.warning(
                     "Unexpected error verifying note %s: %s; keeping result",
                     doc_id,
                     e,
                 )
-                accessible.add(doc_id)
+                _keep_unverified(accessible, doc_id)
 
     async with anyio.create_task_group() as tg:
         for r in results:
@@ -140,6 +199,62 @@ async def _verify_notes(
     return accessible
 
 
+async def _verify_notes_batch(
+    client: NextcloudClientProtocol,
+    results: list[SearchResult],
+    semaphore: anyio.Semaphore,
+) -> set[str]:
+    """Verify many notes with one ids-only Notes listing, then intersect.
+
+    ``notes.get_note_ids`` returns the id of every note the user can read
+    (``pruneBefore`` strips the rest of each note), which is also the set the
+    scanner indexes from. Failure policy mirrors ``_verify_news_items``: a
+    definitive 403/404 on the listing (Notes app disabled or gone for this user)
+    drops every note result; a transient error keeps them all (fail-open), and
+    a non-numeric stored doc_id is kept for that result only.
+    """
+    async with semaphore:
+        try:
+            present_ids = await client.notes.get_note_ids()
+        except HTTPStatusError as e:
+            if _is_definitive_404_or_403(e):
+                logger.debug(
+                    "Notes API returned %s for user %s; treating all %d notes as "
+                    "inaccessible",
+                    e.response.status_code,
+                    client.username,
+                    len(results),
+                )
+                return set()
+            logger.warning(
+                "Transient error listing notes for verification: %s %s; "
+                "keeping all results",
+                e.response.status_code,
+                e,
+            )
+            return _keep_all_unverified(results)
+        except Exception as e:
+            logger.warning(
+                "Unexpected error listing notes for verification: %s; "
+                "keeping all results",
+                e,
+            )
+            return _keep_all_unverified(results)
+
+    accessible: set[str] = set()
+    for r in results:
+        try:
+            note_id_int = int(r.id)
+        except (TypeError, ValueError) as e:
+            logger.warning("Non-numeric note id %r: %s; keeping result", r.id, e)
+            _keep_unverified(accessible, r.id)
+            continue
+        if note_id_int in present_ids:
+            accessible.add(r.id)
+        # else: absent from the listing -> deleted or no longer readable.
+    return accessible
+
+
 async def _verify_files(
     client: NextcloudClientProtocol,
     results: list[SearchResult],
@@ -202,10 +317,10 @@ async def _verify_files(
     # *outside* the slot — it needs no Nextcloud round-trip (mirrors the
     # post-fetch present_ids build in _verify_news_items).
     #
-    # TODO(perf): if folder expansion dominates query latency, cache the
-    # tagged-id set per user with a short TTL (mirroring the
-    # list_accessible_owners cache in search/access_filter.py). Skipped here so
-    # an untag is reflected on the very next search rather than after a TTL.
+    # Repeat searches over the same files skip this call entirely: their
+    # verdicts come from the verification cache, and only uncached file ids
+    # reach this verifier. An untag delivered by webhook invalidates the file's
+    # verdict at once; without webhooks it is reflected within the cache TTL.
     async with semaphore:
         try:
             # Union of BOTH index tags (vector-index → hybrid, keyword-index →
@@ -220,14 +335,14 @@ async def _verify_files(
                 e.response.status_code,
                 e,
             )
-            return {r.id for r in results}
+            return _keep_all_unverified(results)
         except Exception as e:
             logger.warning(
                 "Unexpected error fetching index-tagged files for verification: "
                 "%s; keeping all file results",
                 e,
             )
-            return {r.id for r in results}
+            return _keep_all_unverified(results)
 
         # Exclusion wins: a tagged file under an EXCLUDED_TAGS folder must not
         # surface, matching the scanner's defense-in-depth filter. A failure
@@ -273,7 +388,7 @@ async def _verify_files(
                 "against the numeric tag REPORT)",
                 doc_id,
             )
-            accessible.add(doc_id)
+            _keep_unverified(accessible, doc_id)
         # else: a valid file id absent from the tagged set is untagged/deleted/
         # excluded — drop it and let the caller schedule eviction.
     return accessible
@@ -284,10 +399,21 @@ async def _verify_deck_cards(
     results: list[SearchResult],
     semaphore: anyio.Semaphore,
 ) -> set[str]:
+    """Verify deck cards per id, or per board when a board has several hits.
+
+    Results are grouped by ``board_id``. A board contributing fewer than
+    ``_BATCH_VERIFY_MIN_RESULTS`` cards is checked with one ``get_card`` each;
+    a larger group costs one ``get_stacks(board_id)`` call, and a card is
+    accessible iff it appears, non-archived, in that listing — the same window
+    the scanner indexes. A definitive 403/404 on the board drops all its cards
+    (board deleted or unshared); a transient error keeps them (fail-open).
+    """
     # safe: cooperative concurrency, no lock needed (see verify_search_results)
     accessible: set[str] = set()
+    # board_id -> [(result, stack_id, card_id)]
+    by_board: dict[int, list[tuple[SearchResult, int, int]]] = {}
 
-    async def check(result: SearchResult) -> None:
+    for result in results:
         doc_id = result.id
         # board_id and stack_id are propagated from the Qdrant payload by the
         # algorithm layer. No extra Qdrant round-trip.
@@ -305,8 +431,8 @@ async def _verify_deck_cards(
                 board_id,
                 stack_id,
             )
-            accessible.add(doc_id)
-            return
+            _keep_unverified(accessible, doc_id)
+            continue
 
         # Parse defensively before the network call so a malformed payload
         # produces a specific log line, not a generic "unexpected error"
@@ -325,15 +451,22 @@ async def _verify_deck_cards(
                 stack_id,
                 e,
             )
-            accessible.add(doc_id)
-            return
+            _keep_unverified(accessible, doc_id)
+            continue
+        by_board.setdefault(board_id_int, []).append(
+            (result, stack_id_int, card_id_int)
+        )
 
+    async def check_card(
+        result: SearchResult, board_id: int, stack_id: int, card_id: int
+    ) -> None:
+        doc_id = result.id
         async with semaphore:
             try:
                 await client.deck.get_card(
-                    board_id=board_id_int,
-                    stack_id=stack_id_int,
-                    card_id=card_id_int,
+                    board_id=board_id,
+                    stack_id=stack_id,
+                    card_id=card_id,
                 )
                 accessible.add(doc_id)
             except HTTPStatusError as e:
@@ -345,18 +478,73 @@ async def _verify_deck_cards(
                     e.response.status_code,
                     e,
                 )
-                accessible.add(doc_id)
+                _keep_unverified(accessible, doc_id)
             except Exception as e:
                 logger.warning(
                     "Unexpected error verifying deck card %s: %s; keeping result",
                     doc_id,
                     e,
                 )
-                accessible.add(doc_id)
+                _keep_unverified(accessible, doc_id)
+
+    async def check_board(
+        board_id: int, cards: list[tuple[SearchResult, int, int]]
+    ) -> None:
+        async with semaphore:
+            try:
+                stacks = await client.deck.get_stacks(board_id)
+            except HTTPStatusError as e:
+                if _is_definitive_404_or_403(e):
+                    logger.debug(
+                        "Deck board %s returned %s for user %s; treating its %d "
+                        "card(s) as inaccessible",
+                        board_id,
+                        e.response.status_code,
+                        client.username,
+                        len(cards),
+                    )
+                    return
+                logger.warning(
+                    "Transient error listing deck board %s for verification: "
+                    "%s %s; keeping its %d card(s)",
+                    board_id,
+                    e.response.status_code,
+                    e,
+                    len(cards),
+                )
+                for result, _, _ in cards:
+                    _keep_unverified(accessible, result.id)
+                return
+            except Exception as e:
+                logger.warning(
+                    "Unexpected error listing deck board %s for verification: "
+                    "%s; keeping its %d card(s)",
+                    board_id,
+                    e,
+                    len(cards),
+                )
+                for result, _, _ in cards:
+                    _keep_unverified(accessible, result.id)
+                return
+
+        present_ids = {
+            card.id
+            for stack in stacks
+            for card in stack.cards or []
+            if not card.archived
+        }
+        for result, _, card_id in cards:
+            if card_id in present_ids:
+                accessible.add(result.id)
+            # else: deleted, archived or moved off the board -> drop + evict.
 
     async with anyio.create_task_group() as tg:
-        for r in results:
-            tg.start_soon(check, r)
+        for board_id, cards in by_board.items():
+            if len(cards) >= _BATCH_VERIFY_MIN_RESULTS:
+                tg.start_soon(check_board, board_id, cards)
+                continue
+            for result, stack_id, card_id in cards:
+                tg.start_soon(check_card, result, board_id, stack_id, card_id)
 
     return accessible
 
@@ -432,13 +620,13 @@ async def _verify_news_items(
                 e.response.status_code,
                 e,
             )
-            return set(doc_ids)
+            return _keep_all_unverified(results)
         except Exception as e:
             logger.warning(
                 "Unexpected error fetching news items for verification: %s; keeping all results",
                 e,
             )
-            return set(doc_ids)
+            return _keep_all_unverified(results)
 
     # Build present_ids from the API response. Granularity is intentionally
     # asymmetric with the per-item loop below:
@@ -462,7 +650,7 @@ async def _verify_news_items(
             items[:3] if items else items,
             e,
         )
-        return set(doc_ids)
+        return _keep_all_unverified(results)
 
     # Per-item check: a single non-numeric *stored* doc_id is fail-open
     # for THAT item only — not the whole batch. Mirrors the per-item
@@ -487,14 +675,14 @@ async def _verify_news_items(
                 "of truth — false-positive preferred over false-negative)",
                 d,
             )
-            accessible.add(d)
+            _keep_unverified(accessible, d)
             continue
         try:
             if int(d) in present_ids:
                 accessible.add(d)
         except (TypeError, ValueError):
             logger.debug("Non-numeric news doc_id %r; keeping (cannot verify)", d)
-            accessible.add(d)
+            _keep_unverified(accessible, d)
     return accessible
 
 
@@ -538,7 +726,7 @@ async def _verify_mail_messages(
                 "skipped)",
                 r.id,
             )
-            accessible.add(r.id)
+            _keep_unverified(accessible, r.id)
             continue
         try:
             mailbox_int = int(mailbox_id)
@@ -549,7 +737,7 @@ async def _verify_mail_messages(
                 r.id,
                 mailbox_id,
             )
-            accessible.add(r.id)
+            _keep_unverified(accessible, r.id)
             continue
         by_mailbox.setdefault(mailbox_int, []).append(r)
 
@@ -567,7 +755,7 @@ async def _verify_mail_messages(
             e,
             len(results),
         )
-        return {r.id for r in results}
+        return _keep_all_unverified(results)
 
     async def check_mailbox(mailbox_id: int, mb_results: list[SearchResult]) -> None:
         async with semaphore:
@@ -588,7 +776,7 @@ async def _verify_mail_messages(
                     len(mb_results),
                 )
                 for r in mb_results:
-                    accessible.add(r.id)
+                    _keep_unverified(accessible, r.id)
                 return
             except Exception as e:
                 logger.warning(
@@ -599,7 +787,7 @@ async def _verify_mail_messages(
                     len(mb_results),
                 )
                 for r in mb_results:
-                    accessible.add(r.id)
+                    _keep_unverified(accessible, r.id)
                 return
 
         present_ids = {
@@ -618,7 +806,7 @@ async def _verify_mail_messages(
                     "Malformed mail_message doc_id %r in verifier; keeping",
                     r.id,
                 )
-                accessible.add(r.id)
+                _keep_unverified(accessible, r.id)
             # else: genuinely absent (deleted or aged out) -> drop + evict.
 
     async with anyio.create_task_group() as tg:
@@ -708,9 +896,11 @@ async def verify_search_results(
     """Filter search results to those the user can currently access.
 
     Deduplicates by ``(doc_id, doc_type)`` before verifying, so multiple
-    chunks from the same document cost a single check. Verifiers run
-    concurrently per doc_type and concurrently per id within each verifier,
-    bounded by a shared semaphore (``max_concurrent``).
+    chunks from the same document cost a single check, and documents with a
+    fresh verdict in the per-user verification cache cost none (see
+    ``search/verification_cache.py``; fail-open keeps are never cached).
+    Verifiers run concurrently per doc_type and concurrently per id within each
+    verifier, bounded by a shared semaphore (``max_concurrent``).
 
     When ``evict_on_missing=True``, points for documents that fail verification
     are deleted from Qdrant. If ``eviction_task_group`` is provided (the
@@ -775,28 +965,48 @@ async def verify_search_results(
     accessible_by_type: dict[str, set[str]] = {}
 
     async def run_verifier(doc_type: str, unique_results: list[SearchResult]) -> None:
+        # Cached verdicts (search/verification_cache.py) skip the round-trip;
+        # only the remainder reaches the verifier.
+        cached = get_cached_verdicts(user_id, doc_type, [r.id for r in unique_results])
+        accessible = {doc_id for doc_id, ok in cached.items() if ok}
+        pending = [r for r in unique_results if r.id not in cached]
+        if not pending:
+            accessible_by_type[doc_type] = accessible
+            return
+
         verifier = _VERIFIERS.get(doc_type)
         if verifier is None:
             logger.warning(
                 "No verifier registered for doc_type=%r; keeping %d result(s) unverified",
                 doc_type,
-                len(unique_results),
+                len(pending),
             )
-            accessible_by_type[doc_type] = {r.id for r in unique_results}
+            accessible_by_type[doc_type] = accessible | {r.id for r in pending}
             return
+        # Each run_verifier task runs in its own context copy, so this set is
+        # scoped to one doc_type; nested task groups inside the verifier share it.
+        unverified: set[str] = set()
+        _unverified_ids.set(unverified)
+        checked_at = time.monotonic()
         try:
-            accessible_by_type[doc_type] = await verifier(
-                client, unique_results, semaphore
-            )
+            verified = await verifier(client, pending, semaphore)
         except Exception as e:
-            # Verifier itself blew up (not per-id) — fail open.
+            # Verifier itself blew up (not per-id) — fail open, cache nothing.
             logger.error(
                 "Verifier for doc_type=%s raised: %s; keeping all %d result(s) unverified",
                 doc_type,
                 e,
-                len(unique_results),
+                len(pending),
             )
-            accessible_by_type[doc_type] = {r.id for r in unique_results}
+            accessible_by_type[doc_type] = accessible | {r.id for r in pending}
+            return
+        accessible_by_type[doc_type] = accessible | verified
+        store_verdicts(
+            user_id,
+            doc_type,
+            {r.id: r.id in verified for r in pending if r.id not in unverified},
+            checked_at,
+        )
 
     async with anyio.create_task_group() as tg:
         for doc_type, id_to_result in by_type.items():
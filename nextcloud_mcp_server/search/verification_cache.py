@@ -0,0 +1,150 @@
+"""Short-lived cache of verify-on-read verdicts (ADR-019).
+
+``verify_search_results`` re-proves access for every unique ``(doc_id,
+doc_type)`` on every query — a ``get_note`` per note, a ``get_card`` per deck
+card, the tag REPORT for files. An agent that searches the same corpus several
+times a minute pays those round-trips again for access that has not changed in
+seconds. This module remembers each verdict per user for
+``VERIFICATION_CACHE_TTL_SECONDS``:
+
+- **Positive** entries (``True``): Nextcloud confirmed the user can see it.
+- **Negative** entries (``False``): a definitive miss (403/404, absent from the
+  tag set). The result is dropped again without a round-trip.
+
+Only definitive verdicts are stored. A fail-open keep (transient 5xx, malformed
+id, verifier crash) is never cached, so the next query re-verifies exactly as
+before.
+
+Invalidation is timestamp-based so it is O(1) regardless of cache size: each
+entry records when its verification *started*, and an entry is stale if any
+invalidation covering it happened after that. Using the start time (not the
+store time) closes the race where a change lands while a verification is in
+flight. Three scopes exist:
+
+- one document, for every user (``invalidate_document``) — webhook events and
+  processor deletes (which include the scanner's deletions);
+- one doc_type, for every user (``invalidate_doc_type``) — a Deck board update,
+  which may have changed the board's sharing;
+- one user, every document (``invalidate_user``) — the user's incoming shares
+  changed (see ``access_filter.list_accessible_scope``).
+
+The cache is per process. Deletes processed by a separate ingest worker
+(``INGEST_QUEUE=postgres``) don't reach it; the TTL bounds staleness there.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+from nextcloud_mcp_server.config import get_settings
+from nextcloud_mcp_server.observability.metrics import record_verification_cache
+
+# Cap on cached verdicts across all users. LRU eviction via OrderedDict, same as
+# the accessible-owners cache. An entry is a few hundred bytes, so the cap costs
+# tens of MB at most.
+_VERIFICATION_CACHE_MAXSIZE = 100_000
+
+# (user_id, doc_type, doc_id) -> (checked_at, accessible)
+_verdicts: OrderedDict[tuple[str, str, str], tuple[float, bool]] = OrderedDict()
+
+# Scope -> monotonic time of its last invalidation. Pruned of entries older than
+# the TTL (they can no longer outlive any verdict) once they exceed the cap.
+_doc_invalidated: dict[tuple[str, str], float] = {}
+_type_invalidated: dict[str, float] = {}
+_user_invalidated: dict[str, float] = {}
+
+
+def _ttl() -> float:
+    return float(get_settings().verification_cache_ttl_seconds)
+
+
+def _is_fresh(
+    user_id: str, doc_type: str, doc_id: str, checked_at: float, now: float
+) -> bool:
+    if now - checked_at >= _ttl():
+        return False
+    return (
+        _doc_invalidated.get((doc_type, doc_id), -1.0) < checked_at
+        and _type_invalidated.get(doc_type, -1.0) < checked_at
+        and _user_invalidated.get(user_id, -1.0) < checked_at
+    )
+
+
+def get_cached_verdicts(
+    user_id: str, doc_type: str, doc_ids: list[str]
+) -> dict[str, bool]:
+    """Return the still-valid cached verdicts among ``doc_ids``.
+
+    Ids absent from the returned dict must be verified against Nextcloud.
+    Records one hit or miss per id.
+    """
+    if _ttl() <= 0:
+        return {}
+    now = time.monotonic()
+    found: dict[str, bool] = {}
+    for doc_id in doc_ids:
+        key = (user_id, doc_type, doc_id)
+        entry = _verdicts.get(key)
+        if entry is None:
+            continue
+        checked_at, accessible = entry
+        if not _is_fresh(user_id, doc_type, doc_id, checked_at, now):
+            del _verdicts[key]
+            continue
+        _verdicts.move_to_end(key)
+        found[doc_id] = accessible
+    record_verification_cache(
+        doc_type, hits=len(found), misses=len(doc_ids) - len(found)
+    )
+    return found
+
+
+def store_verdicts(
+    user_id: str, doc_type: str, verdicts: dict[str, bool], checked_at: float
+) -> None:
+    """Cache definitive verdicts from a verification that started at ``checked_at``.
+
+    ``checked_at`` is the ``time.monotonic()`` taken *before* the Nextcloud
+    round-trips, so an invalidation that arrives mid-verification wins.
+    """
+    if _ttl() <= 0:
+        return
+    for doc_id, accessible in verdicts.items():
+        key = (user_id, doc_type, doc_id)
+        _verdicts[key] = (checked_at, accessible)
+        _verdicts.move_to_end(key)
+    while len(_verdicts) > _VERIFICATION_CACHE_MAXSIZE:
+        _verdicts.popitem(last=False)
+
+
+def _mark(scopes: dict, key) -> None:
+    now = time.monotonic()
+    scopes[key] = now
+    if len(scopes) > _VERIFICATION_CACHE_MAXSIZE:
+        cutoff = now - _ttl()
+        for stale in [k for k, at in scopes.items() if at < cutoff]:
+            del scopes[stale]
+
+
+def invalidate_document(doc_type: str, doc_id: str) -> None:
+    """Drop every user's cached verdict for one document."""
+    _mark(_doc_invalidated, (doc_type, str(doc_id)))
+
+
+def invalidate_doc_type(doc_type: str) -> None:
+    """Drop every user's cached verdicts for a whole doc_type."""
+    _mark(_type_invalidated, doc_type)
+
+
+def invalidate_user(user_id: str) -> None:
+    """Drop every cached verdict for one user."""
+    _mark(_user_invalidated, user_id)
+
+
+def clear_verification_cache() -> None:
+    """Drop all cached verdicts and invalidation marks (used by tests)."""
+    _verdicts.clear()
+    _doc_invalidated.clear()
+    _type_invalidated.clear()
+    _user_invalidated.clear()
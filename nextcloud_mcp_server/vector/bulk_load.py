@@ -0,0 +1,238 @@
+"""Bulk-load mode: cheap Qdrant writes while a large ingest backlog drains.
+
+A tenant's first sync pushes millions of points through the per-document write
+path, and with HNSW indexing live Qdrant rebuilds graph segments throughout the
+load -- most of that work is thrown away as the next batches land. While the
+ingest backlog is at least ``VECTOR_SYNC_BULK_LOAD_THRESHOLD`` documents,
+:func:`bulk_load_task` switches the collection to bulk-load mode:
+
+- the collection's ``indexing_threshold`` is set to 0, so Qdrant stops building
+  HNSW segments and only appends;
+- workers upsert in ``VECTOR_SYNC_BULK_UPSERT_BATCH_SIZE`` batches, several at
+  once, with ``wait=False``; only a write's last batch waits to be applied (see
+  ``diff_upsert.apply_point_writes``).
+
+Once the backlog falls to a tenth of the threshold the previous
+``indexing_threshold`` is restored, which starts Qdrant's optimizer: the points
+loaded meanwhile are indexed in one pass.
+
+The mode is recorded in the collection itself, by a marker point carrying the
+threshold to restore (like the doc-id backfill sentinel in ``qdrant_client``), so
+it is shared by the API process and separate ingest workers and survives a
+restart. Payload indexes stay in place: filtered scans run against the
+collection during the load, and Qdrant builds the payload-aware HNSW links from
+them when indexing resumes.
+
+Network Qdrant only; embedded Qdrant never builds HNSW segments.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any
+
+import anyio
+from anyio.abc import TaskStatus
+from qdrant_client import AsyncQdrantClient, models
+
+from nextcloud_mcp_server.config import get_settings
+from nextcloud_mcp_server.vector.ingest_status import get_ingest_pending
+from nextcloud_mcp_server.vector.qdrant_client import get_qdrant_client
+
+logger = logging.getLogger(__name__)
+
+# Marker point of a collection in bulk-load mode. Carries no user_id / doc_id /
+# is_placeholder payload, so no search, scan or count ever matches it.
+BULK_LOAD_MARKER_ID = "00000000-0000-0000-0000-00000b01c10d"
+_MARKER_KEY = "_bulk_load"
+_RESTORE_THRESHOLD_KEY = "indexing_threshold"
+# Qdrant's default indexing_threshold (kB), restored when the collection
+# reported none.
+_DEFAULT_INDEXING_THRESHOLD = 10000
+# How long workers trust their last read of the marker.
+_STATE_TTL_SECONDS = 30.0
+
+_active: dict[str, tuple[float, bool]] = {}
+
+
+async def _read_marker(
+    client: AsyncQdrantClient, collection_name: str
+) -> dict[str, Any] | None:
+    points = await client.retrieve(
+        collection_name=collection_name,
+        ids=[BULK_LOAD_MARKER_ID],
+        with_payload=True,
+        with_vectors=False,
+    )
+    if not points or not (points[0].payload or {}).get(_MARKER_KEY):
+        return None
+    return points[0].payload
+
+
+async def is_bulk_load_active(client: AsyncQdrantClient, collection_name: str) -> bool:
+    """Whether the collection is in bulk-load mode (cached for a few seconds).
+
+    Never raises: an unreadable marker means normal writes.
+    """
+    now = time.monotonic()
+    cached = _active.get(collection_name)
+    if cached is not None and now - cached[0] < _STATE_TTL_SECONDS:
+        return cached[1]
+    try:
+        active = await _read_marker(client, collection_name) is not None
+    except Exception as exc:
+        logger.debug(
+            "Could not read bulk-load marker on '%s': %s", collection_name, exc
+        )
+        active = False
+    _active[collection_name] = (now, active)
+    return active
+
+
+def _marker_vector(params: Any) -> Any:
+    """A vector for the marker point that fits the collection's vector config.
+
+    One entry per named dense and sparse vector the collection was created
+    with, or a plain list for a legacy single-vector collection. Cosine needs a
+    non-zero vector; see the doc-id sentinel.
+    """
+    vectors = params.vectors
+    if vectors is not None and not isinstance(vectors, dict):
+        return [1e-9] + [0.0] * (vectors.size - 1)
+    marker: dict[str, Any] = {
+        name: [1e-9] + [0.0] * (dense.size - 1)
+        for name, dense in (vectors or {}).items()
+    }
+    marker.update(
+        (name, models.SparseVector(indices=[], values=[]))
+        for name in params.sparse_vectors or {}
+    )
+    return marker
+
+
+async def enter_bulk_load(client: AsyncQdrantClient, collection_name: str) -> bool:
+    """Stop HNSW indexing on the collection; False if it is left alone.
+
+    A collection whose ``indexing_threshold`` is already 0 without a marker was
+    configured that way by an operator and is not touched.
+    """
+    if await _read_marker(client, collection_name) is not None:
+        return True
+    info = await client.get_collection(collection_name)
+    threshold = info.config.optimizer_config.indexing_threshold
+    if threshold == 0:
+        logger.info(
+            "Indexing already disabled on '%s'; not entering bulk-load mode",
+            collection_name,
+        )
+        return False
+    # Marker first: a crash before the config update leaves a marker over a
+    # normal collection, which the next exit clears harmlessly.
+    await client.upsert(
+        collection_name=collection_name,
+        points=[
+            models.PointStruct(
+                id=BULK_LOAD_MARKER_ID,
+                vector=_marker_vector(info.config.params),
+                payload={
+                    _MARKER_KEY: True,
+                    _RESTORE_THRESHOLD_KEY: threshold or _DEFAULT_INDEXING_THRESHOLD,
+                },
+            )
+        ],
+        wait=True,
+    )
+    await client.update_collection(
+        collection_name=collection_name,
+        optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0),
+    )
+    _active[collection_name] = (time.monotonic(), True)
+    return True
+
+
+async def exit_bulk_load(client: AsyncQdrantClient, collection_name: str) -> bool:
+    """Restore HNSW indexing; False if the collection was not in bulk-load mode."""
+    marker = await _read_marker(client, collection_name)
+    if marker is None:
+        return False
+    await client.update_collection(
+        collection_name=collection_name,
+        optimizers_config=models.OptimizersConfigDiff(
+            indexing_threshold=marker.get(_RESTORE_THRESHOLD_KEY)
+            or _DEFAULT_INDEXING_THRESHOLD
+        ),
+    )
+    # Marker last, so a crash in between retries the restore next time.
+    await client.delete(
+        collection_name=collection_name,
+        points_selector=models.PointIdsList(points=[BULK_LOAD_MARKER_ID]),
+        wait=True,
+    )
+    _active[collection_name] = (time.monotonic(), False)
+    return True
+
+
+async def reconcile_bulk_load(
+    client: AsyncQdrantClient, collection_name: str, *, pending: int, threshold: int
+) -> None:
+    """Enter bulk-load mode at ``threshold`` pending documents, leave it at a tenth."""
+    if pending >= threshold:
+        if not await is_bulk_load_active(client, collection_name) and (
+            await enter_bulk_load(client, collection_name)
+        ):
+            logger.info(
+                "Bulk-load mode on for '%s': %d documents pending, HNSW indexing "
+                "paused",
+                collection_name,
+                pending,
+            )
+    elif pending <= threshold // 10:
+        if await exit_bulk_load(client, collection_name):
+            logger.info(
+                "Bulk-load mode off for '%s': %d documents pending, HNSW indexing "
+                "restored",
+                collection_name,
+                pending,
+            )
+
+
+async def bulk_load_task(
+    task_producer: Any,
+    document_receive_stream: Any,
+    shutdown_event: anyio.Event,
+    *,
+    task_status: TaskStatus = anyio.TASK_STATUS_IGNORED,
+) -> None:
+    """Switch bulk-load mode from the ingest backlog every metrics interval.
+
+    Spawned next to ``vector_sync_metrics_task`` when
+    ``VECTOR_SYNC_BULK_LOAD_THRESHOLD`` is set. Leaves the mode as it is on
+    shutdown: the next start picks it up from the marker.
+    """
+    settings = get_settings()
+    threshold = settings.vector_sync_bulk_load_threshold
+    interval = settings.vector_sync_metrics_refresh_interval
+    task_status.started()
+    if not settings.qdrant_url:
+        logger.info("Bulk-load mode needs network Qdrant (QDRANT_URL); not started")
+        return
+    logger.info("Bulk-load controller started (threshold=%s documents)", threshold)
+
+    while not shutdown_event.is_set():
+        try:
+            pending = await get_ingest_pending(
+                task_producer=task_producer,
+                document_receive_stream=document_receive_stream,
+                ingest_queue=settings.ingest_queue,
+            )
+            await reconcile_bulk_load(
+                await get_qdrant_client(),
+                settings.get_collection_name(),
+                pending=pending.pending,
+                threshold=threshold,
+            )
+        except Exception as exc:  # noqa: BLE001 — never break ingest over it
+            logger.warning("Bulk-load mode check failed: %s", exc)
+        with anyio.move_on_after(interval):
+            await shutdown_event.wait()
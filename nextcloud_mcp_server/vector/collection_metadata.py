@@ -75,6 +75,8 @@ def env_default_metadata(settings: Settings | None = None) -> dict[str, Any]:
             # (Deck #636). Bump ``version`` on any chunker behaviour change.
             "page_aware": s.document_chunk_page_aware,
             "page_pack": s.document_chunk_page_pack,
+            "unit": s.document_chunk_unit,
+            "tokenizer": s.document_chunk_tokenizer,
             "version": s.chunking_config_version,
         },
     }
@@ -0,0 +1,214 @@
+"""Chunk-level diff writes for re-indexing a document.
+
+A re-index used to upsert every point of the document, in batches of 100 with
+``wait=True``, even when nothing but the title, path or ACL principals had
+changed -- and every upserted point is a delete + re-insert in the HNSW graph.
+Most re-indexes on a large collection are metadata or tail edits, so almost all
+of that write traffic rewrote points with identical vectors.
+
+Point ids are deterministic per chunk position
+(``uuid5("{doc_type}:{doc_id}:chunk:{i}")``), so the new point set can be
+compared id-by-id against the points already stored for the document (the same
+scroll ``load_prior_points`` does for embedding reuse) and split into:
+
+- **upserts** -- new chunk positions, chunks whose text hash changed, and
+  chunks whose vector set changed (keyword -> hybrid, or another embedding
+  identity). Also any point whose new payload drops a key the stored one has:
+  ``set_payload`` merges and cannot remove a key.
+- **payload patches** -- same text, same vectors, different payload. Written
+  with ``set_payload`` (no vector write, no HNSW churn). Patches are grouped by
+  their exact diff, so a title or ACL change across N chunks is one call.
+- **deletes** -- stored points whose id is not in the new set, i.e. the chunk
+  positions that vanished when a document got shorter. The full-upsert path
+  never removed these; they lingered as stale search hits.
+- **unchanged** -- nothing to write.
+
+``indexed_at`` / ``parsed_at`` change on every run, so they alone never make a
+point dirty; they are written along with any real change to a point.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import anyio
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import ExtendedPointId, PointIdsList, PointStruct
+
+from nextcloud_mcp_server.observability.metrics import record_vector_sync_point_writes
+from nextcloud_mcp_server.vector import payload_keys
+
+logger = logging.getLogger(__name__)
+
+# Refreshed on every index run; never a reason to rewrite a point on their own.
+VOLATILE_PAYLOAD_KEYS = frozenset({"indexed_at", payload_keys.PARSED_AT})
+
+# Upsert batches in flight at once for one document in bulk-load mode.
+BULK_UPLOAD_PARALLELISM = 4
+
+
+@dataclass
+class PointWritePlan:
+    """What a re-index has to write, relative to the document's stored points."""
+
+    upserts: list[PointStruct] = field(default_factory=list)
+    # (payload diff, point ids) — one ``set_payload`` call per distinct diff.
+    payload_patches: list[tuple[dict[str, Any], list[ExtendedPointId]]] = field(
+        default_factory=list
+    )
+    deletes: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def patched(self) -> int:
+        return sum(len(ids) for _, ids in self.payload_patches)
+
+
+def _normalize(value: Any) -> Any:
+    """Round-trip through JSON so tuples compare equal to Qdrant's lists."""
+    return json.loads(json.dumps(value, default=str))
+
+
+def _vector_names(vector: Any) -> frozenset[str]:
+    return frozenset(vector) if isinstance(vector, dict) else frozenset()
+
+
+def _payload_diff(new: dict[str, Any], old: dict[str, Any]) -> dict[str, Any] | None:
+    """Keys of ``new`` whose value differs from ``old``; ``None`` if a key was dropped.
+
+    A key stored as ``null`` and a key absent compare equal, so a ``None``
+    field doesn't make every point look dirty on every run.
+    """
+    if any(
+        key not in new and value is not None
+        for key, value in old.items()
+        if key not in VOLATILE_PAYLOAD_KEYS
+    ):
+        return None
+    return {
+        key: value
+        for key, value in new.items()
+        if key not in VOLATILE_PAYLOAD_KEYS and value != old.get(key)
+    }
+
+
+def plan_point_writes(
+    points: list[PointStruct],
+    prior_points: list[Any],
+    *,
+    delete_missing: bool = True,
+) -> PointWritePlan:
+    """Split ``points`` into upserts, payload patches and deletes.
+
+    ``prior_points`` are the document's stored real points (payload + vectors).
+    A stored point without ``chunk_hash`` (indexed before it existed) is always
+    rewritten: there is nothing to prove its vectors match.
+
+    ``delete_missing=False`` plans one window of a streamed index: ``points``
+    is only part of the document, so stored points outside it are left alone
+    (the caller deletes vanished positions once every window is written).
+    """
+    plan = PointWritePlan()
+    prior_by_id = {str(point.id): point for point in prior_points}
+    patches: dict[str, tuple[dict[str, Any], list[ExtendedPointId]]] = {}
+
+    for point in points:
+        point_id = str(point.id)
+        prior = prior_by_id.pop(point_id, None)
+        payload = point.payload or {}
+        if prior is None:
+            plan.upserts.append(point)
+            continue
+        old_payload = prior.payload or {}
+        text_hash = payload.get(payload_keys.CHUNK_HASH)
+        if (
+            not text_hash
+            or text_hash != old_payload.get(payload_keys.CHUNK_HASH)
+            or payload.get(payload_keys.EMBEDDING_IDENTITY)
+            != old_payload.get(payload_keys.EMBEDDING_IDENTITY)
+            or _vector_names(point.vector) != _vector_names(prior.vector)
+        ):
+            plan.upserts.append(point)
+            continue
+        diff = _payload_diff(_normalize(payload), old_payload)
+        if diff is None:
+            plan.upserts.append(point)
+        elif not diff:
+            plan.unchanged += 1
+        else:
+            diff.update(
+                (key, payload[key]) for key in VOLATILE_PAYLOAD_KEYS if key in payload
+            )
+            key = json.dumps(diff, sort_keys=True, default=str)
+            patches.setdefault(key, (diff, []))[1].append(point_id)
+
+    plan.payload_patches = list(patches.values())
+    if delete_missing:
+        plan.deletes = sorted(prior_by_id)
+    return plan
+
+
+async def apply_point_writes(
+    qdrant_client: AsyncQdrantClient,
+    *,
+    collection_name: str,
+    plan: PointWritePlan,
+    batch_size: int,
+    bulk: bool = False,
+) -> None:
+    """Execute a ``PointWritePlan``: upserts first, then patches, then deletes.
+
+    Deletes run last so a failure part-way leaves the document with extra stale
+    chunks (cleaned up by the retry) rather than missing current ones.
+
+    ``bulk`` (the collection is in bulk-load mode, see ``vector.bulk_load``)
+    sends up to ``BULK_UPLOAD_PARALLELISM`` upsert batches at once with
+    ``wait=False``: Qdrant acknowledges each once it is in its write-ahead log.
+    The last batch goes out after them with ``wait=True``. Updates are applied
+    in the order they arrive, so when it returns every batch before it has been
+    applied too, and the caller never reports a write Qdrant has only queued.
+    The ``wait=True`` patches and deletes after it still land last.
+    """
+    batches = [
+        plan.upserts[batch_start : batch_start + batch_size]
+        for batch_start in range(0, len(plan.upserts), batch_size)
+    ]
+    if bulk and len(batches) > 1:
+        limiter = anyio.CapacityLimiter(BULK_UPLOAD_PARALLELISM)
+
+        async def upload(points: list[PointStruct]) -> None:
+            async with limiter:
+                await qdrant_client.upsert(
+                    collection_name=collection_name, points=points, wait=False
+                )
+
+        async with anyio.create_task_group() as tg:
+            for batch in batches[:-1]:
+                tg.start_soon(upload, batch)
+        batches = batches[-1:]
+    for batch in batches:
+        await qdrant_client.upsert(
+            collection_name=collection_name, points=batch, wait=True
+        )
+    for diff, point_ids in plan.payload_patches:
+        await qdrant_client.set_payload(
+            collection_name=collection_name,
+            payload=diff,
+            points=point_ids,
+            wait=True,
+        )
+    if plan.deletes:
+        await qdrant_client.delete(
+            collection_name=collection_name,
+            points_selector=PointIdsList(points=plan.deletes),
+            wait=True,
+        )
+    record_vector_sync_point_writes(
+        upserted=len(plan.upserts),
+        patched=plan.patched,
+        deleted=len(plan.deletes),
+        unchanged=plan.unchanged,
+    )
@@ -1,14 +1,35 @@
-"""Document chunking for large texts using LangChain text splitters."""
+"""Document chunking for large texts.
+
+:class:`TextSplitter` is a span-based recursive splitter: it cuts on paragraph,
+line and word boundaries before resorting to characters, the same strategy and
+the same chunks as LangChain's ``RecursiveCharacterTextSplitter`` with its
+default separators, but every chunk is an exact ``(start, end)`` span of the
+input. Offsets come out of the split itself instead of being recovered with
+``str.find`` afterwards -- which cost a search per chunk and could land on an
+earlier repeat of the same text -- and each character is visited a bounded
+number of times, so splitting is linear in the document length.
+
+Chunk sizes are measured in characters, or in tokens of the embedding model
+when ``DOCUMENT_CHUNK_UNIT=tokens`` (see :func:`get_chunk_token_counter`).
+"""
 
 import logging
+import os
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import anyio
-from langchain_text_splitters import RecursiveCharacterTextSplitter
 
 logger = logging.getLogger(__name__)
 
+# Split priorities: paragraphs, lines, words, then characters (last resort).
+_SEPARATORS = ("\n\n", "\n", " ", "")
+
+# Token counts of a batch of texts. None means "measure in characters".
+TokenCounter = Callable[[list[str]], list[int]]
+
 
 @dataclass
 class ChunkWithPosition:
@@ -23,48 +44,240 @@ class ChunkWithPosition:
     metadata: dict | None = None  # Additional processor-specific metadata (optional)
 
 
+def _strip_span(text: str, start: int, end: int) -> tuple[int, int]:
+    """Shrink ``[start, end)`` to exclude leading and trailing whitespace."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+class TextSplitter:
+    """Recursive separator splitter returning exact spans of the input.
+
+    A span is cut on the first separator of ``_SEPARATORS`` that occurs in it,
+    keeping each separator at the start of the piece that follows it. Pieces
+    under ``chunk_size`` are merged greedily into chunks of at most
+    ``chunk_size``, each new chunk starting with up to ``overlap`` of the
+    previous one's trailing pieces; a piece that is too large is split again
+    on the next separator. Chunks are stripped of surrounding whitespace and
+    blank ones dropped.
+
+    With a ``token_counter`` sizes are token counts. Each piece is measured
+    once, in one batch per span, and a chunk's size is the sum of its pieces'
+    counts -- exact for tokenizers that break on whitespace, and close enough
+    for BPE, whose pieces here always start at a separator.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int,
+        overlap: int,
+        token_counter: TokenCounter | None = None,
+    ):
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.token_counter = token_counter
+
+    def split(
+        self, text: str, start: int = 0, end: int | None = None
+    ) -> list[tuple[int, int]]:
+        """Chunk spans of ``text[start:end]``, as absolute offsets into ``text``."""
+        if end is None:
+            end = len(text)
+        return self._split(text, start, end, 0)
+
+    def measure(self, text: str, spans: list[tuple[int, int]]) -> list[int]:
+        if self.token_counter is None:
+            return [e - s for s, e in spans]
+        return self.token_counter([text[s:e] for s, e in spans])
+
+    def _split(
+        self, text: str, start: int, end: int, level: int
+    ) -> list[tuple[int, int]]:
+        next_level = level
+        for separator in _SEPARATORS[level:]:
+            next_level += 1
+            if not separator or text.find(separator, start, end) != -1:
+                break
+        if not separator:
+            return self._split_characters(text, start, end)
+
+        pieces: list[tuple[int, int]] = []
+        piece_start = start
+        cut = text.find(separator, start, end)
+        while cut != -1:
+            if cut > piece_start:
+                pieces.append((piece_start, cut))
+            piece_start = cut
+            cut = text.find(separator, cut + len(separator), end)
+        if end > piece_start:
+            pieces.append((piece_start, end))
+
+        chunks: list[tuple[int, int]] = []
+        good: list[tuple[int, int]] = []
+        good_sizes: list[int] = []
+        for piece, size in zip(pieces, self.measure(text, pieces), strict=True):
+            if size < self.chunk_size:
+                good.append(piece)
+                good_sizes.append(size)
+                continue
+            if good:
+                chunks.extend(self._merge(text, good, good_sizes))
+                good, good_sizes = [], []
+            chunks.extend(self._split(text, piece[0], piece[1], next_level))
+        if good:
+            chunks.extend(self._merge(text, good, good_sizes))
+        return chunks
+
+    def _merge(
+        self, text: str, pieces: list[tuple[int, int]], sizes: list[int]
+    ) -> list[tuple[int, int]]:
+        """Greedily join contiguous pieces into overlapping chunks."""
+        chunks: list[tuple[int, int]] = []
+        first = 0  # index of the current chunk's first piece
+        total = 0
+        for i, size in enumerate(sizes):
+            if total + size > self.chunk_size and i > first:
+                self._emit(text, pieces[first][0], pieces[i - 1][1], chunks)
+                # Keep the trailing pieces that fit in the overlap.
+                while total > self.overlap or (
+                    total + size > self.chunk_size and total > 0
+                ):
+                    total -= sizes[first]
+                    first += 1
+            total += size
+        if first < len(pieces):
+            self._emit(text, pieces[first][0], pieces[-1][1], chunks)
+        return chunks
+
+    def _split_characters(
+        self, text: str, start: int, end: int
+    ) -> list[tuple[int, int]]:
+        """Fixed windows over a span with no separator left to cut on.
+
+        In token mode the window is the chunk size converted to characters at
+        the span's own characters-per-token ratio.
+        """
+        size, overlap = self.chunk_size, self.overlap
+        if self.token_counter is not None:
+            tokens = max(1, self.token_counter([text[start:end]])[0])
+            ratio = (end - start) / tokens
+            size = max(1, int(size * ratio))
+            overlap = min(size - 1, int(overlap * ratio))
+        overlap = max(0, min(overlap, size - 1))
+        chunks: list[tuple[int, int]] = []
+        window_start = start
+        while True:
+            window_end = min(window_start + size, end)
+            self._emit(text, window_start, window_end, chunks)
+            if window_end >= end:
+                return chunks
+            window_start = window_end - overlap
+
+    @staticmethod
+    def _emit(text: str, start: int, end: int, chunks: list[tuple[int, int]]) -> None:
+        start, end = _strip_span(text, start, end)
+        if end > start:
+            chunks.append((start, end))
+
+
+@lru_cache(maxsize=4)
+def _load_tokenizer(name: str) -> Any:
+    """The named tokenizer, or None (warned once) when it can't be loaded.
+
+    The failure is cached like a success: ``lru_cache`` would not remember an
+    exception, so a bad name would refetch from the Hugging Face hub and warn
+    again for every document.
+    """
+    try:
+        # Lazy: ``tokenizers`` ships with fastembed, but only token mode needs it.
+        from tokenizers import Tokenizer  # noqa: PLC0415
+
+        if os.path.isfile(name):
+            return Tokenizer.from_file(name)
+        return Tokenizer.from_pretrained(name)
+    except Exception as e:
+        logger.warning(
+            "Could not load chunk tokenizer %r (%s); sizing chunks in characters",
+            name,
+            e,
+        )
+        return None
+
+
+def get_chunk_token_counter(settings: Any) -> TokenCounter | None:
+    """Token counter for ``DOCUMENT_CHUNK_UNIT=tokens``; None for characters.
+
+    ``DOCUMENT_CHUNK_TOKENIZER`` names the embedding model's tokenizer: a
+    ``tokenizer.json`` path or a Hugging Face repository id. Falls back to
+    character sizing, with a warning, when none is configured or it can't be
+    loaded -- chunking must never block indexing.
+    """
+    if settings.document_chunk_unit != "tokens":
+        return None
+    name = settings.document_chunk_tokenizer
+    if not name:
+        logger.warning(
+            "DOCUMENT_CHUNK_UNIT=tokens but DOCUMENT_CHUNK_TOKENIZER is unset; "
+            "sizing chunks in characters"
+        )
+        return None
+    tokenizer = _load_tokenizer(name)
+    if tokenizer is None:
+        return None
+
+    def count(texts: list[str]) -> list[int]:
+        encodings = tokenizer.encode_batch(texts, add_special_tokens=False)
+        return [len(encoding.ids) for encoding in encodings]
+
+    return count
+
+
 class DocumentChunker:
-    """Chunk large documents for optimal embedding using LangChain text splitters.
+    """Chunk large documents for optimal embedding.
 
-    Uses RecursiveCharacterTextSplitter which preserves semantic boundaries
-    by splitting on sentence and paragraph boundaries before resorting to
-    character-level splitting.
+    Splits on paragraph, line and word boundaries before resorting to
+    characters (see :class:`TextSplitter`), so sentences stay intact.
     """
 
-    def __init__(self, chunk_size: int = 2048, overlap: int = 200):
+    def __init__(
+        self,
+        chunk_size: int = 2048,
+        overlap: int = 200,
+        token_counter: TokenCounter | None = None,
+    ):
         """
         Initialize document chunker.
 
         Args:
-            chunk_size: Number of characters per chunk (default: 2048)
-            overlap: Number of overlapping characters between chunks (default: 200)
+            chunk_size: Characters (or tokens) per chunk (default: 2048)
+            overlap: Overlapping characters (or tokens) between chunks
+                (default: 200)
+            token_counter: Measure sizes in tokens with this counter (see
+                :func:`get_chunk_token_counter`); None measures characters.
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
+        self.splitter = TextSplitter(chunk_size, overlap, token_counter)
 
-        # Initialize LangChain RecursiveCharacterTextSplitter
-        # Uses hierarchical splitting to preserve semantic boundaries:
-        # - Paragraphs (\n\n)
-        # - Sentences (. ! ?)
-        # - Words (spaces)
-        # - Characters (last resort)
-        # This prevents mid-sentence splitting while maintaining semantic coherence
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=overlap,
-            add_start_index=True,  # Enable position tracking
-            strip_whitespace=True,
-        )
+    def chunk_spans(self, content: str) -> list[ChunkWithPosition]:
+        """Blocking body of :meth:`chunk_text`."""
+        return [
+            ChunkWithPosition(
+                text=content[start:end], start_offset=start, end_offset=end
+            )
+            for start, end in self.splitter.split(content)
+        ]
 
     async def chunk_text(self, content: str) -> list[ChunkWithPosition]:
         """
         Split text into overlapping chunks with position tracking.
 
-        Uses LangChain's RecursiveCharacterTextSplitter to create chunks that
-        preserve semantic boundaries by splitting at paragraphs and sentences
-        before resorting to word or character-level splitting. This ensures
-        sentences are kept intact. Preserves character positions for each chunk
-        to enable precise document retrieval.
+        A document that fits in one chunk -- most notes, cards and news items
+        -- is returned inline; anything longer is split in a worker thread so
+        the event loop isn't blocked.
 
         Args:
             content: Text content to chunk
@@ -77,21 +290,12 @@ class DocumentChunker:
         if not content:
             return [ChunkWithPosition(text="", start_offset=0, end_offset=0)]
 
-        # Run CPU-bound text splitting in thread pool to avoid blocking event loop
-        docs = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
-            self.splitter.create_documents,
-            [content],
-        )
-
-        # Convert LangChain Documents to ChunkWithPosition objects
-        chunks = [
-            ChunkWithPosition(
-                text=doc.page_content,
-                start_offset=doc.metadata.get("start_index", 0),
-                end_offset=doc.metadata.get("start_index", 0) + len(doc.page_content),
+        if self.splitter.token_counter is None and len(content) <= self.chunk_size:
+            chunks = self.chunk_spans(content)
+        else:
+            chunks = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+                self.chunk_spans, content
             )
-            for doc in docs
-        ]
 
         logger.debug(
             "Chunked document into %s chunks (chunk_size=%s, overlap=%s)",
@@ -133,7 +337,11 @@ class PageAwareChunker:
     """
 
     def __init__(
-        self, chunk_size: int = 2048, overlap: int = 200, pack_pages: bool = False
+        self,
+        chunk_size: int = 2048,
+        overlap: int = 200,
+        pack_pages: bool = False,
+        token_counter: TokenCounter | None = None,
     ):
         """
         Initialize page-aware chunker.
@@ -151,6 +359,8 @@ class PageAwareChunker:
                 into one chunk (page-range citation preserved via
                 ``page_number``/``page_end``). Default False keeps the legacy
                 one-chunk-per-page behaviour.
+            token_counter: Measure sizes in tokens with this counter (see
+                :func:`get_chunk_token_counter`); None measures characters.
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
@@ -158,12 +368,7 @@ class PageAwareChunker:
 
         # Only used for pages that exceed chunk_size. Same hierarchical splitter
         # as DocumentChunker so oversized pages keep semantic-boundary splitting.
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=chunk_size,
-            chunk_overlap=overlap,
-            add_start_index=True,
-            strip_whitespace=True,
-        )
+        self.splitter = TextSplitter(chunk_size, overlap, token_counter)
 
     async def chunk_text(
         self, content: str, page_boundaries: list[dict[str, Any]]
@@ -192,18 +397,14 @@ class PageAwareChunker:
         # production this branch is only reached by direct callers/tests, not
         # the indexing path.
         if not page_boundaries:
-            docs = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
-                self.splitter.create_documents,
-                [content],
+            spans = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+                self.splitter.split, content
             )
             return [
                 ChunkWithPosition(
-                    text=doc.page_content,
-                    start_offset=doc.metadata.get("start_index", 0),
-                    end_offset=doc.metadata.get("start_index", 0)
-                    + len(doc.page_content),
+                    text=content[start:end], start_offset=start, end_offset=end
                 )
-                for doc in docs
+                for start, end in spans
             ]
 
         splitter = (
@@ -226,34 +427,40 @@ class PageAwareChunker:
         )
         return chunks
 
+    def _page_sizes(
+        self, content: str, page_boundaries: list[dict[str, Any]]
+    ) -> list[int]:
+        """Size of every page in the chunker's unit, measured in one batch."""
+        return self.splitter.measure(
+            content, [(b["start_offset"], b["end_offset"]) for b in page_boundaries]
+        )
+
     def _split_oversized_page(
-        self, page_text: str, start: int, page: int
+        self, content: str, start: int, end: int, page: int
     ) -> list[ChunkWithPosition]:
-        """Character-split a page that exceeds the budget within its own boundary.
+        """Split a page that exceeds the budget within its own boundary.
 
         Offsets stay absolute (into ``content``) and the page number is fixed —
         an oversized page never spans a page range, so ``page_end == page``.
         """
-        chunks: list[ChunkWithPosition] = []
-        for doc in self.splitter.create_documents([page_text]):
-            sub_start = start + doc.metadata.get("start_index", 0)
-            chunks.append(
-                ChunkWithPosition(
-                    text=doc.page_content,
-                    start_offset=sub_start,
-                    end_offset=sub_start + len(doc.page_content),
-                    page_number=page,
-                    page_end=page,
-                )
+        return [
+            ChunkWithPosition(
+                text=content[sub_start:sub_end],
+                start_offset=sub_start,
+                end_offset=sub_end,
+                page_number=page,
+                page_end=page,
             )
-        return chunks
+            for sub_start, sub_end in self.splitter.split(content, start, end)
+        ]
 
     def _chunk_by_page(
         self, content: str, page_boundaries: list[dict[str, Any]]
     ) -> list[ChunkWithPosition]:
         """CPU-bound per-page splitting (runs in a worker thread)."""
         chunks: list[ChunkWithPosition] = []
-        for boundary in page_boundaries:
+        sizes = self._page_sizes(content, page_boundaries)
+        for boundary, size in zip(page_boundaries, sizes, strict=True):
             page = boundary["page"]
             start = boundary["start_offset"]
             end = boundary["end_offset"]
@@ -264,7 +471,7 @@ class PageAwareChunker:
             if not page_text.strip():
                 continue
 
-            if len(page_text) <= self.chunk_size:
+            if size <= self.chunk_size:
                 stripped = page_text.strip()
                 # Tighten offsets to the stripped text so they stay meaningful
                 # even though the whole page is one chunk.
@@ -282,7 +489,7 @@ class PageAwareChunker:
                 continue
 
             # Oversized page: split within the page only.
-            chunks.extend(self._split_oversized_page(page_text, start, page))
+            chunks.extend(self._split_oversized_page(content, start, end, page))
         return chunks
 
     def _chunk_by_page_packed(
@@ -296,12 +503,17 @@ class PageAwareChunker:
         skipped. Because the extractor joins pages with no separator, a pack is
         exactly the contiguous slice ``content[pack_start:pack_end]`` and the
         pre-strip span is bounded by ``chunk_size`` (no chunk exceeds budget).
+        In token mode a pack's size is the sum of its pages' token counts.
         Runs in a worker thread (CPU-bound).
         """
         chunks: list[ChunkWithPosition] = []
-        # Open pack: character span into ``content`` + covered page range.
+        sizes = self._page_sizes(content, page_boundaries)
+        by_tokens = self.splitter.token_counter is not None
+        # Open pack: character span into ``content`` + covered page range, and
+        # (token mode) the tokens of the pages it has absorbed so far.
         pack_start: int | None = None
         pack_end = 0
+        pack_tokens = 0
         first_page = 0
         last_page = 0
 
@@ -328,7 +540,7 @@ class PageAwareChunker:
                 )
             pack_start = None
 
-        for boundary in page_boundaries:
+        for boundary, size in zip(page_boundaries, sizes, strict=True):
             page = boundary["page"]
             start = boundary["start_offset"]
             end = boundary["end_offset"]
@@ -339,25 +551,26 @@ class PageAwareChunker:
             if not page_text.strip():
                 continue
 
-            if len(page_text) > self.chunk_size:
+            if size > self.chunk_size:
                 # An oversized page cannot join a pack: flush the pending pack,
-                # then character-split the page within its own boundary.
+                # then split the page within its own boundary.
                 flush()
-                chunks.extend(self._split_oversized_page(page_text, start, page))
+                chunks.extend(self._split_oversized_page(content, start, end, page))
                 continue
 
+            packed_size = pack_tokens + size if by_tokens else end - (pack_start or 0)
             if pack_start is None:
                 # Open a new pack on this page.
-                pack_start, pack_end = start, end
+                pack_start, pack_end, pack_tokens = start, end, size
                 first_page = last_page = page
-            elif end - pack_start <= self.chunk_size:
+            elif packed_size <= self.chunk_size:
                 # Extend the pack to include this contiguous page.
-                pack_end = end
+                pack_end, pack_tokens = end, packed_size
                 last_page = page
             else:
                 # Adding this page would overflow the budget: flush and reopen.
                 flush()
-                pack_start, pack_end = start, end
+                pack_start, pack_end, pack_tokens = start, end, size
                 first_page = last_page = page
 
         flush()
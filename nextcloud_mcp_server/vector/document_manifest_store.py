@@ -0,0 +1,236 @@
+"""Per-user document manifest for scanner deletion tracking.
+
+To find documents deleted in Nextcloud, the scanner needs to know what each user
+currently has indexed. It used to get that from a full Qdrant scroll on every
+pass: one point per note/deck card/news item/mail message, and every chunk of
+every readable file. That cost scaled with corpus size, not with change. This
+store keeps one compact row per ``(user_id, doc_type, doc_id)`` in the app DB
+(``document_manifest``, migration 011) instead:
+
+- the processor upserts a row when it indexes a document for a user, and the
+  scanner does the same when its dedup claim grants a user an already-indexed
+  file;
+- ``release_document_for_user`` drops the row once the user's points are
+  released.
+
+Qdrant remains the system of record, and those writes are best-effort, so a
+missed write can leave the manifest out of step with the index.
+``document_manifest_seeds`` records when each ``(user, doc_type)`` manifest was
+last rebuilt from a Qdrant scroll (:meth:`DocumentManifestStore.reconcile`). The
+scanner trusts the manifest only while that reconcile is younger than
+``VECTOR_SYNC_MANIFEST_RECONCILE_INTERVAL`` and otherwise scrolls and reseeds.
+That one rule seeds deployments upgrading with an existing index and bounds how
+long drift can hide a deletion. A stale *extra* row costs at most one no-op
+delete task; a *missing* row delays a deletion until the next reconcile.
+
+Like :class:`~nextcloud_mcp_server.vector.document_path_store.DocumentPathStore`,
+errors surface normally and the best-effort contract is applied at the write
+sites. The store borrows the process-wide :class:`RefreshTokenStorage` singleton
+(``get_shared_storage()``) rather than opening its own engine.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+import anyio
+
+from nextcloud_mcp_server.auth.storage import RefreshTokenStorage, get_shared_storage
+from nextcloud_mcp_server.vector import payload_keys
+
+logger = logging.getLogger(__name__)
+
+# Rows per multi-row INSERT / ids per DELETE ... IN (...) during a reconcile.
+# 8 binds per row keeps a batch well under SQLite's historical 999-variable cap.
+_RECONCILE_BATCH_SIZE = 100
+
+
+class DocumentManifestStore:
+    """CRUD for the ``document_manifest`` table (one row per document + user)."""
+
+    _shared_instance: DocumentManifestStore | None = None
+    # Lazy-init: anyio primitives must not be created at import time (mirrors
+    # DocumentPathStore). Created on first shared() call.
+    _shared_lock: anyio.Lock | None = None
+
+    def __init__(self, storage: RefreshTokenStorage) -> None:
+        self._storage = storage
+
+    @classmethod
+    async def shared(cls) -> DocumentManifestStore:
+        """Process-wide store backed by the storage singleton. Tests should
+        construct ``DocumentManifestStore(storage)`` directly."""
+        if cls._shared_lock is None:
+            cls._shared_lock = anyio.Lock()
+        async with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls(await get_shared_storage())
+        return cls._shared_instance
+
+    async def upsert(
+        self,
+        *,
+        user_id: str,
+        doc_type: str,
+        doc_id: str,
+        etag: str = "",
+        modified_at: int = 0,
+        index_mode: str = payload_keys.INDEX_MODE_HYBRID,
+        chunk_count: int | None = None,
+        updated_at: int | None = None,
+    ) -> None:
+        """Record that ``user_id`` has ``doc_id`` indexed (insert or overwrite).
+
+        A ``chunk_count`` of ``None`` keeps the stored count, so a dedup claim
+        that did not chunk anything doesn't erase the count from the real index.
+        """
+        now = updated_at if updated_at is not None else int(time.time())
+        async with self._storage.acquire() as db:
+            await db.execute(
+                "INSERT INTO document_manifest "
+                "(user_id, doc_type, doc_id, etag, modified_at, index_mode, "
+                "chunk_count, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (user_id, doc_type, doc_id) DO UPDATE SET "
+                "etag = excluded.etag, modified_at = excluded.modified_at, "
+                "index_mode = excluded.index_mode, "
+                "chunk_count = COALESCE(excluded.chunk_count, "
+                "document_manifest.chunk_count), "
+                "updated_at = excluded.updated_at",
+                (
+                    user_id,
+                    doc_type,
+                    doc_id,
+                    etag,
+                    modified_at,
+                    index_mode,
+                    chunk_count,
+                    now,
+                ),
+            )
+            await db.commit()
+
+    async def delete(self, *, user_id: str, doc_type: str, doc_id: str) -> None:
+        """Drop a user's row (the document was released for them)."""
+        async with self._storage.acquire() as db:
+            await db.execute(
+                "DELETE FROM document_manifest "
+                "WHERE user_id = ? AND doc_type = ? AND doc_id = ?",
+                (user_id, doc_type, doc_id),
+            )
+            await db.commit()
+
+    async def get_index_modes(
+        self,
+        user_id: str,
+        doc_type: str,
+        *,
+        max_age: int,
+        now: int | None = None,
+    ) -> dict[str, str] | None:
+        """Return ``{doc_id: index_mode}`` for one user's documents of a type.
+
+        Returns ``None`` when the manifest for ``(user_id, doc_type)`` has never
+        been reconciled against Qdrant, or was last reconciled ``max_age``
+        seconds ago or more. The caller must then scroll Qdrant and
+        :meth:`reconcile`. An empty dict is a trusted "nothing indexed".
+        """
+        now = now if now is not None else int(time.time())
+        async with self._storage.acquire() as db:
+            async with db.execute(
+                "SELECT seeded_at FROM document_manifest_seeds "
+                "WHERE user_id = ? AND doc_type = ?",
+                (user_id, doc_type),
+            ) as cursor:
+                seed = await cursor.fetchone()
+            if seed is None or now - int(seed[0]) >= max_age:
+                return None
+            async with db.execute(
+                "SELECT doc_id, index_mode FROM document_manifest "
+                "WHERE user_id = ? AND doc_type = ?",
+                (user_id, doc_type),
+            ) as cursor:
+                return {row[0]: row[1] for row in await cursor.fetchall()}
+
+    async def reconcile(
+        self,
+        user_id: str,
+        doc_type: str,
+        indexed: dict[str, str],
+        *,
+        started_at: int,
+    ) -> None:
+        """Rebuild one user's manifest for a doc_type from a Qdrant scroll.
+
+        ``indexed`` maps every doc_id the scroll found to its index mode, and
+        ``started_at`` is when the scroll began. Rows the scroll did not see are
+        dropped unless they were written at or after ``started_at``: a document
+        indexed while the scroll was running is kept. Missing rows are inserted
+        and existing ones keep their etag and chunk count. The rows and the seed
+        marker are committed in one transaction.
+        """
+        async with self._storage.acquire() as db:
+            async with db.execute(
+                "SELECT doc_id, updated_at FROM document_manifest "
+                "WHERE user_id = ? AND doc_type = ?",
+                (user_id, doc_type),
+            ) as cursor:
+                existing = {row[0]: int(row[1]) for row in await cursor.fetchall()}
+
+            stale = sorted(
+                doc_id
+                for doc_id, updated_at in existing.items()
+                if doc_id not in indexed and updated_at < started_at
+            )
+            for start in range(0, len(stale), _RECONCILE_BATCH_SIZE):
+                batch = stale[start : start + _RECONCILE_BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                await db.execute(
+                    "DELETE FROM document_manifest WHERE user_id = ? "
+                    f"AND doc_type = ? AND doc_id IN ({placeholders})",
+                    [user_id, doc_type, *batch],
+                )
+
+            missing = sorted(doc_id for doc_id in indexed if doc_id not in existing)
+            for start in range(0, len(missing), _RECONCILE_BATCH_SIZE):
+                batch = missing[start : start + _RECONCILE_BATCH_SIZE]
+                values = ", ".join("(?, ?, ?, ?, ?, ?, ?, ?)" for _ in batch)
+                params: list[str | int | None] = []
+                for doc_id in batch:
+                    params += [
+                        user_id,
+                        doc_type,
+                        doc_id,
+                        "",
+                        0,
+                        indexed[doc_id],
+                        None,
+                        started_at,
+                    ]
+                # DO NOTHING: a row the processor wrote since the SELECT above
+                # is newer than anything the scroll can tell us.
+                await db.execute(
+                    "INSERT INTO document_manifest "
+                    "(user_id, doc_type, doc_id, etag, modified_at, index_mode, "
+                    f"chunk_count, updated_at) VALUES {values} "
+                    "ON CONFLICT (user_id, doc_type, doc_id) DO NOTHING",
+                    params,
+                )
+
+            await db.execute(
+                "INSERT INTO document_manifest_seeds (user_id, doc_type, seeded_at) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT (user_id, doc_type) DO UPDATE SET "
+                "seeded_at = excluded.seeded_at",
+                (user_id, doc_type, started_at),
+            )
+            await db.commit()
+        logger.debug(
+            "Reconciled %s manifest for %s: %d indexed, %d dropped, %d added",
+            doc_type,
+            user_id,
+            len(indexed),
+            len(stale),
+            len(missing),
+        )
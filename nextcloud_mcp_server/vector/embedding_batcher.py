@@ -0,0 +1,254 @@
+"""Cross-document embedding micro-batching for the processor pool.
+
+Every ``process_document`` call used to embed its own chunks in isolation. For
+the small-document mix (notes, deck cards, mail messages: one to five chunks
+each) that turned a burst of work into hundreds of tiny provider requests, and
+on the OpenAI / Ollama / gateway providers throughput is dominated by the
+per-request overhead, not by the texts themselves.
+
+``MicroBatcher`` sits in front of the provider and coalesces texts from
+concurrent callers into one request:
+
+- The first caller to find no open batch becomes its *leader*. It waits up to
+  ``max_wait`` for company, then sends the batch and hands every caller its own
+  slice of the result.
+- A batch is flushed early once it reaches ``max_texts`` or ``max_chars``; a
+  caller whose texts would overflow the open batch closes it and leads the next
+  one. A single request already at a cap skips batching entirely.
+- The provider's token count for a shared request is split across callers in
+  proportion to their characters (largest remainder, so the parts sum to the
+  total), which keeps per-document usage metering intact.
+- If a shared request fails, each caller's texts are retried on their own, so
+  one document's poison input (an over-long chunk, say) fails only that
+  document instead of every neighbour that happened to share its batch.
+
+State is per event loop: a batch's events belong to the loop that created
+them, and workers may run more than one loop (see
+``RefreshTokenStorage._engine_for_running_loop``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import anyio
+
+from nextcloud_mcp_server.config import get_settings
+from nextcloud_mcp_server.observability.metrics import record_embedding_microbatch
+from nextcloud_mcp_server.providers import get_bm25_service, get_provider
+
+logger = logging.getLogger(__name__)
+
+# (texts) -> (one vector per text, token count)
+EmbedFn = Callable[[list[str]], Awaitable[tuple[list[Any], int]]]
+
+
+@dataclass
+class _Request:
+    texts: list[str]
+    chars: int
+    vectors: list[Any] | None = None
+    tokens: int = 0
+    error: Exception | None = None
+
+
+@dataclass
+class _Batch:
+    requests: list[_Request] = field(default_factory=list)
+    texts: int = 0
+    chars: int = 0
+    full: anyio.Event = field(default_factory=anyio.Event)
+    done: anyio.Event = field(default_factory=anyio.Event)
+
+
+def _apportion(total: int, weights: list[int]) -> list[int]:
+    """Split ``total`` in proportion to ``weights``; the parts sum to ``total``."""
+    weight_sum = sum(weights)
+    if weight_sum <= 0:
+        shares = [total // len(weights)] * len(weights)
+        shares[-1] += total - sum(shares)
+        return shares
+    exact = [total * w / weight_sum for w in weights]
+    shares = [int(x) for x in exact]
+    by_remainder = sorted(
+        range(len(weights)), key=lambda i: exact[i] - shares[i], reverse=True
+    )
+    for i in by_remainder[: total - sum(shares)]:
+        shares[i] += 1
+    return shares
+
+
+class MicroBatcher:
+    """Coalesce concurrent embedding calls into shared provider requests."""
+
+    def __init__(
+        self,
+        kind: str,
+        embed: EmbedFn,
+        *,
+        max_texts: int,
+        max_chars: int,
+        max_wait: float,
+    ):
+        self.kind = kind
+        self._embed = embed
+        self.max_texts = max_texts
+        self.max_chars = max_chars
+        self.max_wait = max_wait
+        self._open: _Batch | None = None
+
+    async def embed(self, texts: list[str]) -> tuple[list[Any], int]:
+        """Embed ``texts``, possibly in one request with other callers'."""
+        if not texts:
+            return [], 0
+        request = _Request(texts=texts, chars=sum(len(t) for t in texts))
+        if len(texts) >= self.max_texts or request.chars >= self.max_chars:
+            batch = _Batch(requests=[request], texts=len(texts), chars=request.chars)
+            await self._flush(batch)
+            return self._result(request)
+
+        batch = self._open
+        leader = batch is None or (
+            batch.texts + len(texts) > self.max_texts
+            or batch.chars + request.chars > self.max_chars
+        )
+        if leader:
+            if batch is not None:
+                batch.full.set()  # wake its leader: nothing more fits
+            batch = self._open = _Batch()
+        assert batch is not None
+        batch.requests.append(request)
+        batch.texts += len(texts)
+        batch.chars += request.chars
+        if batch.texts >= self.max_texts or batch.chars >= self.max_chars:
+            batch.full.set()
+            if self._open is batch:
+                self._open = None
+
+        if not leader:
+            await batch.done.wait()
+            return self._result(request)
+
+        try:
+            with anyio.move_on_after(self.max_wait):
+                await batch.full.wait()
+        finally:
+            if self._open is batch:
+                self._open = None
+            # Followers are parked on batch.done: the flush must run even if the
+            # leader itself was cancelled while waiting.
+            with anyio.CancelScope(shield=True):
+                await self._flush(batch)
+        return self._result(request)
+
+    @staticmethod
+    def _result(request: _Request) -> tuple[list[Any], int]:
+        if request.error is not None:
+            raise request.error
+        assert request.vectors is not None
+        return request.vectors, request.tokens
+
+    async def _flush(self, batch: _Batch) -> None:
+        try:
+            record_embedding_microbatch(
+                self.kind, texts=batch.texts, callers=len(batch.requests)
+            )
+            texts = [t for request in batch.requests for t in request.texts]
+            try:
+                vectors, tokens = await self._embed(texts)
+                if len(vectors) != len(texts):
+                    raise ValueError(
+                        f"Expected {len(texts)} {self.kind} vectors, got {len(vectors)}"
+                    )
+            except Exception as exc:
+                if len(batch.requests) == 1:
+                    batch.requests[0].error = exc
+                    return
+                logger.debug(
+                    "Shared %s embedding request for %s callers failed (%s); "
+                    "retrying each caller on its own",
+                    self.kind,
+                    len(batch.requests),
+                    exc,
+                )
+                async with anyio.create_task_group() as tg:
+                    for request in batch.requests:
+                        tg.start_soon(self._embed_alone, request)
+                return
+            shares = _apportion(tokens, [r.chars for r in batch.requests])
+            start = 0
+            for request, share in zip(batch.requests, shares):
+                request.vectors = vectors[start : start + len(request.texts)]
+                request.tokens = share
+                start += len(request.texts)
+        finally:
+            batch.done.set()
+
+    async def _embed_alone(self, request: _Request) -> None:
+        try:
+            request.vectors, request.tokens = await self._embed(request.texts)
+        except Exception as exc:
+            request.error = exc
+
+
+async def _embed_dense(texts: list[str]) -> tuple[list[Any], int]:
+    return await get_provider().embed_batch_with_usage(texts)
+
+
+async def _encode_sparse(texts: list[str]) -> tuple[list[Any], int]:
+    bm25_service = await get_bm25_service()
+    return await bm25_service.encode_batch(texts), 0
+
+
+_batchers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, MicroBatcher]
+] = weakref.WeakKeyDictionary()
+
+
+def _batcher(kind: str) -> MicroBatcher:
+    loop_batchers = _batchers.setdefault(asyncio.get_running_loop(), {})
+    batcher = loop_batchers.get(kind)
+    if batcher is None:
+        settings = get_settings()
+        max_chars = settings.embedding_microbatch_max_chars
+        if kind == "dense":
+            # A provider with its own request-size cap (Ollama) would split a
+            # larger batch into sequential requests anyway; match it instead.
+            provider_cap = getattr(get_provider(), "max_batch_chars", None)
+            if isinstance(provider_cap, int) and provider_cap > 0:
+                max_chars = min(max_chars, provider_cap)
+        batcher = MicroBatcher(
+            kind,
+            _embed_dense if kind == "dense" else _encode_sparse,
+            max_texts=settings.embedding_microbatch_max_texts,
+            max_chars=max_chars,
+            max_wait=settings.embedding_microbatch_max_wait_ms / 1000,
+        )
+        loop_batchers[kind] = batcher
+    return batcher
+
+
+async def embed_dense(texts: list[str]) -> tuple[list[list[float]], int]:
+    """Dense-embed ``texts`` through the shared batcher: ``(vectors, tokens)``."""
+    if not get_settings().embedding_microbatch_enabled:
+        return await _embed_dense(texts)
+    return await _batcher("dense").embed(texts)
+
+
+async def encode_sparse(texts: list[str]) -> list[dict[str, Any]]:
+    """BM25-encode ``texts`` through the shared batcher."""
+    if not get_settings().embedding_microbatch_enabled:
+        vectors, _ = await _encode_sparse(texts)
+        return vectors
+    vectors, _ = await _batcher("sparse").embed(texts)
+    return vectors
+
+
+def reset_embedding_batchers() -> None:
+    """Drop every loop's batchers so settings are re-read (tests, reconfiguration)."""
+    _batchers.clear()
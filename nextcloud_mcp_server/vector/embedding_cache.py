@@ -0,0 +1,412 @@
+"""Content-addressed embedding reuse for the indexing path.
+
+Re-indexing a document after a small edit used to send every chunk back through
+the dense provider and the BM25 encoder, even though a one-character change to a
+300-page PDF or a long note leaves almost every chunk byte-identical. A chunk's
+vector is a pure function of its text and the embedding identity (model +
+Matryoshka width, see ``build_embedding_identity``), so a vector computed once is
+valid wherever the same text appears again under the same identity.
+
+Two tiers resolve a chunk before anything is embedded:
+
+- **Prior points** — the vectors already stored in Qdrant for the previous
+  version of the same document (``load_prior_vectors``). This is the persistent
+  tier: it survives restarts and costs one scroll of the document's own points,
+  which the upsert is about to overwrite anyway.
+- **Process cache** — a byte-bounded LRU (``EmbeddingCache``) shared by every
+  processor task in the process. It catches text repeated across documents and,
+  importantly, a procrastinate retry after a Qdrant blip: the vectors from the
+  failed attempt are still here, so the retry doesn't pay for them twice.
+
+Only what neither tier holds is sent to the provider. Reuse is keyed on the
+SHA-256 of the chunk text, never on chunk position, so an insertion that shifts
+every later chunk's index still hits.
+
+Reusing a vector from another document (or another user's point on a colliding
+per-user ``doc_id``) leaks nothing: the lookup only returns a vector for text the
+caller already holds, and the vector is derived from that text alone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from qdrant_client import AsyncQdrantClient
+from qdrant_client.models import FieldCondition, Filter, MatchValue
+
+from nextcloud_mcp_server.config import get_settings
+from nextcloud_mcp_server.observability.metrics import (
+    record_embedding_cache,
+    update_embedding_cache_bytes,
+)
+from nextcloud_mcp_server.vector import payload_keys
+from nextcloud_mcp_server.vector.placeholder import get_placeholder_filter
+
+logger = logging.getLogger(__name__)
+
+DENSE = "dense"
+SPARSE = "sparse"
+
+# Identity for sparse vectors. BM25 output depends only on the FastEmbed model,
+# which is fixed (``Qdrant/bm25``), not on the dense embedding identity — so a
+# dense model switch still reuses every sparse vector.
+SPARSE_IDENTITY = "Qdrant/bm25"
+
+# Fixed per-entry overhead (OrderedDict slot, key tuple, hash string) added to
+# the vector's own ``nbytes`` so the byte bound holds for tiny sparse vectors
+# too. Measured order of magnitude, not an exact accounting.
+_ENTRY_OVERHEAD_BYTES = 200
+
+# Page size for the prior-points scroll. Vectors are returned, so a page is
+# ~page_size x dimension x 4 bytes; 256 keeps a 3072-dim page near 3 MB.
+_PRIOR_SCROLL_PAGE_SIZE = 256
+
+
+def chunk_hash(text: str) -> str:
+    """Content address of one chunk: the SHA-256 of its UTF-8 text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _pack(kind: str, vector: Any) -> Any:
+    """Store a vector compactly: float32 arrays instead of Python float lists.
+
+    A Python ``list[float]`` costs ~32 bytes per dimension; float32 costs 4, so
+    the same byte budget holds ~8x more dense vectors.
+    """
+    if kind == DENSE:
+        return np.asarray(vector, dtype=np.float32)
+    indices = vector["indices"] if isinstance(vector, dict) else vector.indices
+    values = vector["values"] if isinstance(vector, dict) else vector.values
+    return (np.asarray(indices, dtype=np.int32), np.asarray(values, dtype=np.float32))
+
+
+def _unpack(kind: str, packed: Any) -> Any:
+    """Inverse of ``_pack``: the shape the upsert path builds points from."""
+    if kind == DENSE:
+        return packed.tolist()
+    indices, values = packed
+    return {"indices": indices.tolist(), "values": values.tolist()}
+
+
+def _packed_nbytes(kind: str, packed: Any) -> int:
+    if kind == DENSE:
+        return int(packed.nbytes) + _ENTRY_OVERHEAD_BYTES
+    return int(packed[0].nbytes + packed[1].nbytes) + _ENTRY_OVERHEAD_BYTES
+
+
+@dataclass
+class PriorVectors:
+    """Vectors already stored for a document's previous version, by chunk hash.
+
+    ``dense`` only holds vectors produced under the current embedding identity;
+    ``sparse`` holds every stored sparse vector (see ``SPARSE_IDENTITY``).
+    """
+
+    dense: dict[str, Any] = field(default_factory=dict)
+    sparse: dict[str, Any] = field(default_factory=dict)
+
+    def for_kind(self, kind: str) -> dict[str, Any]:
+        return self.dense if kind == DENSE else self.sparse
+
+    @classmethod
+    def from_points(cls, points: list[Any], embedding_identity: str) -> PriorVectors:
+        """Index stored points' vectors by the hash of the chunk they embed.
+
+        Points written before ``payload_keys.CHUNK_HASH`` existed are keyed on
+        the hash of their ``excerpt`` (the full chunk text), so documents
+        indexed by an older release benefit on their first re-index too. Dense
+        vectors produced under a different embedding identity are skipped --
+        after a model switch they are exactly what must be re-embedded.
+        """
+        prior = cls()
+        for point in points:
+            payload = point.payload or {}
+            text_hash = payload.get(payload_keys.CHUNK_HASH)
+            if not text_hash:
+                excerpt = payload.get("excerpt")
+                if not isinstance(excerpt, str):
+                    continue
+                text_hash = chunk_hash(excerpt)
+            vectors = point.vector if isinstance(point.vector, dict) else {}
+            sparse = vectors.get(SPARSE)
+            if sparse is not None:
+                prior.sparse[text_hash] = {
+                    "indices": list(sparse.indices),
+                    "values": list(sparse.values),
+                }
+            dense = vectors.get(DENSE)
+            if (
+                dense is not None
+                and payload.get(payload_keys.EMBEDDING_IDENTITY) == embedding_identity
+            ):
+                prior.dense[text_hash] = dense
+        return prior
+
+
+@dataclass
+class CacheLookup:
+    """One batch of chunk texts, partly resolved from the cache tiers.
+
+    ``vectors[i]`` is set for every resolved text; ``missing`` lists the indices
+    that still need the provider. Call ``fill`` with the provider's output for
+    exactly ``missing_texts`` (same order) to complete the batch.
+    """
+
+    kind: str
+    identity: str
+    texts: list[str]
+    hashes: list[str]
+    vectors: list[Any]
+    missing: list[int]
+    cache: EmbeddingCache
+
+    @property
+    def missing_texts(self) -> list[str]:
+        return [self.texts[i] for i in self.missing]
+
+    def fill(self, computed: list[Any]) -> list[Any]:
+        """Merge freshly computed vectors in and remember them for next time."""
+        if len(computed) != len(self.missing):
+            raise ValueError(
+                f"Expected {len(self.missing)} {self.kind} vectors, got {len(computed)}"
+            )
+        for index, vector in zip(self.missing, computed):
+            self.vectors[index] = vector
+            self.cache.put(self.kind, self.identity, self.hashes[index], vector)
+        return self.vectors
+
+
+class EmbeddingCache:
+    """Byte-bounded LRU of chunk vectors keyed on (kind, identity, chunk hash).
+
+    Process-local and not thread-safe: every caller runs on the event loop (the
+    processor only leaves it for the provider/BM25 calls, never while touching
+    the cache). ``max_bytes=0`` disables the tier — lookups then resolve from
+    prior points only.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[str, str, str], tuple[Any, int]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: str, identity: str, text_hash: str) -> Any | None:
+        entry = self._entries.get((kind, identity, text_hash))
+        if entry is None:
+            return None
+        self._entries.move_to_end((kind, identity, text_hash))
+        return _unpack(kind, entry[0])
+
+    def put(self, kind: str, identity: str, text_hash: str, vector: Any) -> None:
+        if self.max_bytes <= 0:
+            return
+        key = (kind, identity, text_hash)
+        packed = _pack(kind, vector)
+        nbytes = _packed_nbytes(kind, packed)
+        if nbytes > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (packed, nbytes)
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)  # LRU end
+            self._bytes -= evicted
+        update_embedding_cache_bytes(self._bytes)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        update_embedding_cache_bytes(0)
+
+    def lookup(
+        self,
+        kind: str,
+        identity: str,
+        texts: list[str],
+        prior: PriorVectors | None = None,
+        *,
+        hashes: list[str] | None = None,
+    ) -> CacheLookup:
+        """Resolve ``texts`` from prior points, then the process cache.
+
+        Prior-point hits are promoted into the process cache so a retry of the
+        same document (whose prior points may be gone by then) still hits.
+        ``hashes`` may be passed when the caller already computed them.
+        """
+        prior_for_kind = prior.for_kind(kind) if prior is not None else {}
+        if hashes is None:
+            hashes = [chunk_hash(t) for t in texts]
+        vectors: list[Any] = [None] * len(texts)
+        missing: list[int] = []
+        prior_hits = memory_hits = 0
+        for i, text_hash in enumerate(hashes):
+            if text_hash in prior_for_kind:
+                vectors[i] = prior_for_kind[text_hash]
+                self.put(kind, identity, text_hash, vectors[i])
+                prior_hits += 1
+                continue
+            cached = self.get(kind, identity, text_hash)
+            if cached is not None:
+                vectors[i] = cached
+                memory_hits += 1
+                continue
+            missing.append(i)
+        record_embedding_cache(
+            kind, prior=prior_hits, memory=memory_hits, miss=len(missing)
+        )
+        return CacheLookup(
+            kind=kind,
+            identity=identity,
+            texts=texts,
+            hashes=hashes,
+            vectors=vectors,
+            missing=missing,
+            cache=self,
+        )
+
+
+async def load_prior_points(
+    qdrant_client: AsyncQdrantClient,
+    *,
+    collection_name: str,
+    doc_id: str,
+    doc_type: str,
+) -> list[Any]:
+    """Scroll every real (non-placeholder) point of a document, with vectors.
+
+    One scroll serves both consumers of the previous version: vector reuse
+    (``PriorVectors.from_points``) and the chunk-level diff upsert
+    (``vector/diff_upsert.py``), which needs the full payloads too.
+    """
+    scroll_filter = Filter(
+        must=[
+            FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
+            FieldCondition(key="doc_type", match=MatchValue(value=doc_type)),
+            get_placeholder_filter(),
+        ]
+    )
+    records: list[Any] = []
+    offset = None
+    while True:
+        points, offset = await qdrant_client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            with_payload=True,
+            with_vectors=True,
+            limit=_PRIOR_SCROLL_PAGE_SIZE,
+            offset=offset,
+        )
+        records.extend(points)
+        if offset is None:
+            break
+    return records
+
+
+async def load_prior_points_by_id(
+    qdrant_client: AsyncQdrantClient,
+    *,
+    collection_name: str,
+    point_ids: list[str],
+) -> list[Any]:
+    """Fetch the given chunk points of a document, with payloads and vectors.
+
+    The per-window counterpart of ``load_prior_points`` for a streamed index:
+    only one window's worth of the previous version is held at a time.
+    """
+    if not point_ids:
+        return []
+    return list(
+        await qdrant_client.retrieve(
+            collection_name=collection_name,
+            ids=point_ids,
+            with_payload=True,
+            with_vectors=True,
+        )
+    )
+
+
+async def load_prior_point_ids(
+    qdrant_client: AsyncQdrantClient,
+    *,
+    collection_name: str,
+    doc_id: str,
+    doc_type: str,
+) -> set[str]:
+    """Ids of every real point stored for a document (no payloads or vectors)."""
+    scroll_filter = Filter(
+        must=[
+            FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
+            FieldCondition(key="doc_type", match=MatchValue(value=doc_type)),
+            get_placeholder_filter(),
+        ]
+    )
+    ids: set[str] = set()
+    offset = None
+    while True:
+        points, offset = await qdrant_client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            with_payload=False,
+            with_vectors=False,
+            limit=_PRIOR_SCROLL_PAGE_SIZE,
+            offset=offset,
+        )
+        ids.update(str(point.id) for point in points)
+        if offset is None:
+            break
+    return ids
+
+
+async def load_prior_vectors(
+    qdrant_client: AsyncQdrantClient,
+    *,
+    collection_name: str,
+    doc_id: str,
+    doc_type: str,
+    embedding_identity: str,
+) -> PriorVectors:
+    """Collect the stored vectors of a document's real points, by chunk hash."""
+    points = await load_prior_points(
+        qdrant_client,
+        collection_name=collection_name,
+        doc_id=doc_id,
+        doc_type=doc_type,
+    )
+    return PriorVectors.from_points(points, embedding_identity)
+
+
+_cache: EmbeddingCache | None = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide cache, sized from ``EMBEDDING_CACHE_MAX_MB`` on first use."""
+    global _cache
+    if _cache is None:
+        _cache = EmbeddingCache(
+            max_bytes=int(get_settings().embedding_cache_max_mb * 1024 * 1024)
+        )
+    return _cache
+
+
+def reset_embedding_cache() -> None:
+    """Drop the process-wide cache (tests, reconfiguration)."""
+    global _cache
+    if _cache is not None:
+        _cache.clear()
+    _cache = None
@@ -4,10 +4,12 @@ The status endpoints (``/api/v1/vector-sync/status``, the userinfo route, and
 the ``nc_get_vector_sync_status`` MCP tool) all need the same "how much work is
 outstanding" figure, computed differently per ``INGEST_QUEUE`` backend:
 
-- ``memory`` — the in-process anyio stream's buffer depth (today's behavior).
+- ``memory`` — the tasks held by the in-process lane scheduler.
 - ``postgres`` — procrastinate job counts read from the per-tenant Postgres
   (``todo`` + ``doing``), plus the per-status breakdown for observability.
 
+Both also report how long the queued tasks have waited, per lane.
+
 ``indexed_documents`` (the Qdrant placeholder count) is backend-independent and
 stays at each call site.
 """
@@ -33,6 +35,10 @@ class IngestPending:
     # backend (Deck #323); None on the memory backend. Feeds the per-tier status
     # surface + the astrolabe_ingest_queue_depth gauge.
     job_counts_by_queue: dict[str, dict[str, int]] | None = None
+    # Queue-wait buckets ``{queue: {lane: {le: count}}}`` of the queued tasks
+    # (see ``queue.lanes``); None when the producer can't report them. Feeds the
+    # astrolabe_ingest_queue_wait_jobs gauge.
+    queue_wait_by_lane: dict[str, dict[str, dict[str, int]]] | None = None
 
 
 async def get_ingest_pending(
@@ -42,9 +48,10 @@ async def get_ingest_pending(
 
     ``task_producer`` and ``document_receive_stream`` are intentionally typed
     ``Any``: they're duck-typed across backends. Only ``ProcrastinateTaskProducer``
-    exposes ``job_counts`` (the ``TaskProducer`` protocol doesn't), and the memory
-    backend reads the anyio stream's ``statistics()`` — so no single concrete type
-    or Protocol fits both branches, and we probe with ``hasattr`` instead.
+    exposes ``job_counts`` and only ``MemoryTaskProducer`` ``queue_depth`` (the
+    ``TaskProducer`` protocol has neither), and the stream fallback reads the
+    anyio stream's ``statistics()`` — so no single concrete type or Protocol fits
+    every branch, and we probe with ``hasattr`` instead.
 
     Never raises — a status surface must stay available even if the queue is
     unreachable; failures degrade to ``pending=0``.
@@ -70,11 +77,33 @@ async def get_ingest_pending(
                 logger.warning("Failed to read ingest job counts: %s", e)
         pending = counts.get("todo", 0) + counts.get("doing", 0)
         return IngestPending(
-            pending=pending, job_counts=counts, job_counts_by_queue=by_queue
+            pending=pending,
+            job_counts=counts,
+            job_counts_by_queue=by_queue,
+            queue_wait_by_lane=await _queue_wait_by_lane(task_producer),
         )
 
+    # The memory producer counts the tasks its lane scheduler holds; the bare
+    # stream is the fallback for a producer without one.
+    if task_producer is not None and hasattr(task_producer, "queue_depth"):
+        return IngestPending(
+            pending=task_producer.queue_depth(),
+            queue_wait_by_lane=await _queue_wait_by_lane(task_producer),
+        )
     if document_receive_stream is None:
         return IngestPending(pending=0)
     return IngestPending(
         pending=document_receive_stream.statistics().current_buffer_used
     )
+
+
+async def _queue_wait_by_lane(
+    task_producer: Any,
+) -> dict[str, dict[str, dict[str, int]]] | None:
+    if task_producer is None or not hasattr(task_producer, "queue_wait_by_lane"):
+        return None
+    try:
+        return await task_producer.queue_wait_by_lane()
+    except Exception as e:
+        logger.warning("Failed to read ingest queue wait by lane: %s", e)
+        return None
@@ -35,6 +35,7 @@ from nextcloud_mcp_server.observability.metrics import (
     density_bucket_index,
     estimate_vector_bytes,
     update_ingest_queue_depth,
+    update_ingest_queue_wait,
     update_qdrant_chunk_density_snapshot,
     update_vector_sync_dead_lettered_documents,
     update_vector_sync_estimated_vector_bytes,
@@ -179,6 +180,7 @@ async def publish_vector_sync_metrics(
         update_vector_sync_queue_size(pending.pending)
         # Per-tier-queue depth (Deck #323): None on the memory backend (no-op).
         update_ingest_queue_depth(pending.job_counts_by_queue)
+        update_ingest_queue_wait(pending.queue_wait_by_lane)
     except Exception as exc:  # noqa: BLE001 — metrics must not break ingest
         logger.warning("Failed to publish pending-documents gauge: %s", exc)
 
@@ -2,7 +2,8 @@
 
 Manages background vector sync for multi-user deployments:
 - User Manager: Monitors storage for user changes
-- Per-User Scanners: One scanner task per provisioned user
+- Per-User Scanners: One scanner task per provisioned user, paced and admitted
+  by a shared ScanScheduler (global scan budget, priority lanes)
 - Shared Processor Pool: Processes documents from all users
 
 Background sync authenticates as each provisioned user via locally-stored
@@ -34,6 +35,7 @@ from nextcloud_mcp_server.config import get_settings
 from nextcloud_mcp_server.vector._errors import format_exception_group
 from nextcloud_mcp_server.vector.processor import process_document
 from nextcloud_mcp_server.vector.queue.ports import TaskProducer
+from nextcloud_mcp_server.vector.scan_scheduler import ScanScheduler
 from nextcloud_mcp_server.vector.scanner import DocumentTask, scan_user_documents
 
 logger = logging.getLogger(__name__)
@@ -227,11 +229,15 @@ async def user_scanner_task(
     wake_event: anyio.Event,
     nextcloud_host: str,
     *,
+    scan_scheduler: ScanScheduler | None = None,
     task_status: TaskStatus = anyio.TASK_STATUS_IGNORED,
 ) -> None:
     """Scanner task for a single user.
 
-    Gets fresh credentials at the start of each scan cycle.
+    Gets fresh credentials at the start of each scan cycle. When and how often
+    the user is scanned is up to ``scan_scheduler``, shared by every scanner in
+    the process: each scan waits for the user's next due time and then for one
+    of the global scan slots.
 
     Args:
         user_id: User to scan
@@ -239,14 +245,23 @@ async def user_scanner_task(
         shutdown_event: Event signaling shutdown
         wake_event: Event to trigger immediate scan
         nextcloud_host: Nextcloud base URL
+        scan_scheduler: Shared scheduler (``user_manager_task`` registers the
+            user). Without one the scanner runs on a private scheduler and
+            scans at once.
         task_status: Status object for signaling task readiness
     """
     logger.info("[BasicAuth] Scanner started for user: %s", user_id)
-    settings = get_settings()
     max_consecutive_errors = 5
+    if scan_scheduler is None:
+        scan_scheduler = ScanScheduler.from_settings()
+    scan_scheduler.register(user_id, initial=True)  # no-op if already registered
 
     task_status.started()
 
+    # Users found at startup have a jittered first due time (see
+    # ScanScheduler.register), which also spreads the validation calls below.
+    await scan_scheduler.wait_until_due(user_id, wake_event)
+
     # Pre-validate credentials before entering scan loop
     try:
         nc_client = await get_user_client_basic_auth(user_id, nextcloud_host)
@@ -283,15 +298,19 @@ async def user_scanner_task(
     while not shutdown_event.is_set():
         nc_client = None
         try:
-            # Get fresh credentials for this scan cycle
-            nc_client = await get_user_client_basic_auth(user_id, nextcloud_host)
-
-            # Scan user's documents
-            await scan_user_documents(
-                user_id=user_id,
-                send_stream=send_stream,
-                nc_client=nc_client,
-            )
+            # Hold a global scan slot for credentials + scan; the slot is
+            # released (and the next scan scheduled) before any backoff below.
+            async with scan_scheduler.scan_slot(user_id):
+                # Get fresh credentials for this scan cycle
+                nc_client = await get_user_client_basic_auth(user_id, nextcloud_host)
+
+                # Scan user's documents
+                queued = await scan_user_documents(
+                    user_id=user_id,
+                    send_stream=send_stream,
+                    nc_client=nc_client,
+                )
+                scan_scheduler.record_scan(user_id, queued)
 
             consecutive_errors = 0  # Reset on success
 
@@ -360,12 +379,12 @@ async def user_scanner_task(
             )
             break
 
-        # Sleep until next interval or wake event. Nothing sets wake_event on
-        # shutdown, so task-group cancellation is the expected way out of this
-        # sleep — which is exactly why it must not be caught and turned into a
-        # `break` (python:S7497). It propagates and the task group absorbs it.
-        with anyio.move_on_after(settings.vector_sync_scan_interval):
-            await wake_event.wait()
+        # Sleep until the scheduler's next due time, a webhook wake, or the
+        # wake event. Nothing sets wake_event on shutdown, so task-group
+        # cancellation is the expected way out of this sleep — which is exactly
+        # why it must not be caught and turned into a `break` (python:S7497).
+        # It propagates and the task group absorbs it.
+        await scan_scheduler.wait_until_due(user_id, wake_event)
 
     logger.info("[BasicAuth] Scanner stopped for user: %s", user_id)
 
@@ -518,10 +537,11 @@ async def _run_user_scanner_with_scope(
     wake_event: anyio.Event,
     nextcloud_host: str,
     user_states: dict[str, UserSyncState],
+    scan_scheduler: ScanScheduler,
 ) -> None:
     """Wrapper to run scanner with cancellation scope.
 
-    Cleans up user state on exit.
+    Cleans up user state and the user's scheduler entry on exit.
     """
     cloned_stream = send_stream.clone()
     try:
@@ -532,11 +552,13 @@ async def _run_user_scanner_with_scope(
                 shutdown_event=shutdown_event,
                 wake_event=wake_event,
                 nextcloud_host=nextcloud_host,
+                scan_scheduler=scan_scheduler,
             )
     finally:
         # Clean up on exit
         if user_id in user_states:
             del user_states[user_id]
+        scan_scheduler.unregister(user_id)
         await cloned_stream.aclose()
 
 
@@ -565,6 +587,7 @@ async def user_manager_task(
     user_states: dict[str, UserSyncState],
     tg: TaskGroup,
     provision_signal: "ProvisionSignal",
+    scan_scheduler: ScanScheduler | None = None,
     *,
     task_status: TaskStatus = anyio.TASK_STATUS_IGNORED,
 ) -> None:
@@ -580,6 +603,11 @@ async def user_manager_task(
     once rather than after up to a full poll interval. The poll remains the
     backstop for any missed ring.
 
+    Every scanner shares ``scan_scheduler``. Users found on the first poll are
+    registered as routine scans with a jittered start so a restart does not
+    scan everyone at once; users found later were just provisioned and go in
+    the scheduler's initial-sync lane.
+
     Args:
         send_stream: Stream to send documents to processors
         shutdown_event: Event signaling shutdown
@@ -589,10 +617,15 @@ async def user_manager_task(
         user_states: Shared dict tracking active user scanners
         tg: Task group for spawning scanner tasks
         provision_signal: Doorbell rung on provisioning to force an early re-poll
+        scan_scheduler: Scheduler shared by the scanners (built from settings
+            when not given)
         task_status: Status object for signaling task readiness
     """
     settings = get_settings()
     poll_interval = settings.vector_sync_user_poll_interval
+    if scan_scheduler is None:
+        scan_scheduler = ScanScheduler.from_settings(settings)
+    first_poll = True
 
     logger.info("[BasicAuth] User manager started (poll interval: %ss)", poll_interval)
     task_status.started()
@@ -627,6 +660,7 @@ async def user_manager_task(
                     user_id=user_id,
                     cancel_scope=cancel_scope,
                 )
+                scan_scheduler.register(user_id, initial=not first_poll)
 
                 # Start scanner in task group
                 tg.start_soon(
@@ -638,7 +672,9 @@ async def user_manager_task(
                     wake_event,
                     nextcloud_host,
                     user_states,
+                    scan_scheduler,
                 )
+            first_poll = False
 
             # Cancel scanners for revoked users
             revoked_users = active_users - provisioned_users
@@ -0,0 +1,247 @@
+"""Disk-backed cache of parse results for the ingest path.
+
+A procrastinate retry after a transient embedding or Qdrant failure re-runs the
+whole document: download, parse, chunk, embed. The parse is by far the most
+expensive part when it reached the OCR tier -- a 90-second OCR pass, or a paid
+gateway OCR call -- and its output is a pure function of the document's content
+and the parse configuration. :class:`ParseResultCache` keeps the
+``ProcessingResult`` of a successful parse on disk so the retry picks it up
+instead of parsing again.
+
+Keys (:func:`parse_cache_key`) combine:
+
+- the document version: ``(doc_type, doc_id, etag)``, or the SHA-256 of the
+  content when the scanner recorded no etag (:func:`content_digest`);
+- the tier that produced the result (``"inline"`` for the in-process ladder);
+- the parse configuration: the escalation-tier signature plus the settings that
+  shape a tier's output or its escalation decision, so flipping OCR on or
+  changing a classifier threshold never serves a result computed under the old
+  rules.
+
+Only results that are about to be indexed are stored: a failed parse, a result
+that escalated to another tier and a pending batch-OCR sentinel are not.
+
+Entries live under ``<document_spool_dir>/nc-parse-cache`` (the system temp dir
+when unset) as zlib-compressed JSON, written atomically. The directory is
+bounded by ``DOCUMENT_PARSE_CACHE_MAX_MB``; a hit refreshes the entry's mtime and
+the oldest entries are evicted first, so it behaves as an LRU across processes
+sharing the directory. The startup spool sweep only removes ``nc-ingest-*``
+files, so cached results survive a worker restart.
+
+Imports the document stack, so ``vector.processor`` imports it lazily, like the
+registry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Any
+
+from nextcloud_mcp_server.config import get_settings
+from nextcloud_mcp_server.document_processors.base import ProcessingResult
+from nextcloud_mcp_server.document_processors.escalation import (
+    escalation_tiers_signature,
+)
+from nextcloud_mcp_server.document_processors.ocr import OCR_BATCH_PENDING_KEY
+from nextcloud_mcp_server.document_processors.source import DocumentSource
+from nextcloud_mcp_server.observability.metrics import record_document_parse_cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "nc-parse-cache"
+
+# Bump when the stored shape or the meaning of a key changes, so entries written
+# by an older release are never read back.
+_FORMAT_VERSION = 1
+_SUFFIX = ".json.z"
+# Speed over ratio: extracted text compresses ~4x even at level 1.
+_COMPRESS_LEVEL = 1
+# Streaming read size for content_digest.
+_DIGEST_CHUNK = 1024 * 1024
+
+
+def parse_settings_fingerprint(settings: Any) -> str:
+    """Fingerprint of every setting that changes what a parse returns.
+
+    Starts from ``escalation_tiers_signature`` (which tiers exist) and adds the
+    knobs that change a tier's text or the quality gate that decides whether it
+    is kept.
+    """
+    return ";".join(
+        (
+            escalation_tiers_signature(settings),
+            f"ocrmodel={settings.document_ocr_model}",
+            f"scan={int(bool(settings.document_ocr_detect_scanned))}",
+            f"quality={settings.document_ocr_min_text_quality:g}",
+            f"pagechars={settings.document_ocr_min_page_chars:g}",
+            f"pagefrac={settings.document_ocr_page_fraction:g}",
+            f"glyph={settings.document_glyph_corruption_ratio:g}",
+            f"graphics={settings.document_pdf_graphics_limit:g}",
+            f"images={int(bool(settings.pymupdf_extract_images))}",
+            f"ocrpages={settings.document_ocr_pages_per_request}",
+        )
+    )
+
+
+def parse_cache_key(
+    *,
+    doc_type: str,
+    doc_id: str,
+    version: str,
+    content_type: str,
+    tier: str | None,
+) -> str:
+    """Cache key for one document version parsed at ``tier`` (None = inline)."""
+    parts = [
+        _FORMAT_VERSION,
+        doc_type,
+        str(doc_id),
+        version,
+        content_type,
+        tier or "inline",
+        parse_settings_fingerprint(get_settings()),
+    ]
+    return hashlib.sha256(json.dumps(parts).encode("utf-8")).hexdigest()
+
+
+def content_digest(source: DocumentSource) -> str:
+    """``sha256:<hex>`` of a document's bytes (blocking; run it off the loop).
+
+    The version component of the key when the scanner recorded no etag.
+    """
+    digest = hashlib.sha256()
+    with source.open() as fh:
+        while block := fh.read(_DIGEST_CHUNK):
+            digest.update(block)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def is_cacheable(result: ProcessingResult) -> bool:
+    """Only a successful, final parse is worth keeping."""
+    return result.success and not result.metadata.get(OCR_BATCH_PENDING_KEY)
+
+
+class ParseResultCache:
+    """Byte-bounded LRU of parse results in one directory.
+
+    All methods block on disk I/O; the processor calls them through
+    ``anyio.to_thread``. Safe to share between processes: writes are atomic
+    renames, and a concurrent eviction at worst turns a hit into a miss.
+
+    The directory size is tracked in memory after one initial scan, so a store
+    only lists the directory when the budget is exceeded. Another process's
+    writes aren't seen until then, which makes the bound approximate when
+    several workers share one spool directory.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._bytes: int | None = None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> ProcessingResult | None:
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            record_document_parse_cache("miss")
+            return None
+        try:
+            result = ProcessingResult.model_validate_json(zlib.decompress(raw))
+        except (zlib.error, ValueError):
+            # Truncated by a crash mid-write on a filesystem without atomic
+            # rename, or written by an incompatible release.
+            logger.warning("Discarding unreadable parse cache entry %s", path.name)
+            path.unlink(missing_ok=True)
+            record_document_parse_cache("miss")
+            return None
+        try:
+            os.utime(path)  # LRU: a hit makes the entry the newest
+        except OSError:  # pragma: no cover - evicted between read and touch
+            pass
+        record_document_parse_cache("hit")
+        return result
+
+    def put(self, key: str, result: ProcessingResult) -> None:
+        if not is_cacheable(result):
+            return
+        try:
+            payload = zlib.compress(
+                result.model_dump_json().encode("utf-8"), _COMPRESS_LEVEL
+            )
+        except ValueError:
+            # A processor put something JSON can't represent in its metadata;
+            # the parse is still indexed, just not cached.
+            logger.debug("Parse result for %s is not serialisable", key)
+            return
+        if len(payload) > self.max_bytes:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        record_document_parse_cache("stored")
+        if self._bytes is None:
+            self._bytes = sum(size for _, size, _ in self._entries())
+        else:
+            self._bytes += len(payload)
+        if self._bytes > self.max_bytes:
+            self._evict()
+
+    def _entries(self) -> list[tuple[float, int, Path]]:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries until under the budget."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            record_document_parse_cache("evicted")
+            total -= size
+        self._bytes = total
+
+
+_cache: ParseResultCache | None = None
+
+
+def get_parse_cache() -> ParseResultCache | None:
+    """Process-wide cache from settings, or ``None`` when it is disabled."""
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        max_bytes = int(settings.document_parse_cache_max_mb * 1024 * 1024)
+        if max_bytes <= 0:
+            return None
+        root = Path(settings.document_spool_dir or tempfile.gettempdir())
+        _cache = ParseResultCache(root / CACHE_DIRNAME, max_bytes)
+    return _cache
+
+
+def reset_parse_cache() -> None:
+    """Forget the process-wide cache (tests, reconfiguration); files are kept."""
+    global _cache
+    _cache = None
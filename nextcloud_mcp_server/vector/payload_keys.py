@@ -55,6 +55,21 @@ SOURCE_BYTES = "source_bytes"
 # until an admin payload backfill populates them (no re-embed).
 FOLDER_ANCESTORS = "folder_ancestors"
 
+# SHA-256 of the chunk's text (``vector.embedding_cache.chunk_hash``). The
+# content address the indexing path uses to reuse a stored vector instead of
+# re-embedding an unchanged chunk. Written forward-only; points without it are
+# keyed on the hash of their ``excerpt``, which holds the same full chunk text.
+CHUNK_HASH = "chunk_hash"
+
+# ``sha256:<hex>`` of a file's raw bytes (``vector.parse_cache.content_digest``),
+# the same on every chunk of the document. The tenant-wide content address that
+# lets an identical body at another fileid -- a copy in another user's folder, a
+# saved mail attachment -- be indexed by copying these points instead of
+# re-parsing and re-embedding it (``vector.sharing_state.find_identical_content``).
+# Files only; written forward-only, so documents indexed before it shipped are
+# not dedup sources until they are re-indexed.
+CONTENT_HASH = "content_sha256"
+
 # Fixed platform namespace for deterministic chunk point IDs (design §2.2).
 # Derived once from ``uuid5(NAMESPACE_DNS, "astrolabe.cloud/mcp/point-id/v1")``
 # and pinned here as a literal so neither repo recomputes it. DO NOT CHANGE —
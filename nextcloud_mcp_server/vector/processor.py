@@ -6,6 +6,7 @@ Processes documents from stream: fetches content, generates embeddings, stores i
 import logging
 import time
 import uuid
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, cast
 
 import anyio
@@ -46,26 +47,46 @@ from nextcloud_mcp_server.observability.metrics import (
     record_estimated_vector_bytes,
     record_ingest_dropped,
     record_qdrant_operation,
+    record_vector_sync_content_dedup,
     record_vector_sync_processing,
-    update_vector_sync_queue_size,
 )
 from nextcloud_mcp_server.observability.tracing import trace_operation
-from nextcloud_mcp_server.providers import get_bm25_service, get_provider
+from nextcloud_mcp_server.providers import get_provider
 from nextcloud_mcp_server.search.pdf_highlighter import PDFHighlighter
+from nextcloud_mcp_server.search.query_cache import invalidate_owner
+from nextcloud_mcp_server.search.verification_cache import invalidate_document
 from nextcloud_mcp_server.usage import UsageEvent, UsageEventStore
 from nextcloud_mcp_server.utils.validation import is_valid_nextcloud_doc_id
 from nextcloud_mcp_server.vector import payload_keys
 from nextcloud_mcp_server.vector._errors import format_exception_group
+from nextcloud_mcp_server.vector.bulk_load import is_bulk_load_active
 from nextcloud_mcp_server.vector.collection_metadata import build_embedding_identity
 from nextcloud_mcp_server.vector.dead_letter import (
     clear_dead_letter,
     mark_dead_letter,
     record_index_failure,
 )
+from nextcloud_mcp_server.vector.diff_upsert import (
+    PointWritePlan,
+    apply_point_writes,
+    plan_point_writes,
+)
 from nextcloud_mcp_server.vector.document_chunker import (
     ChunkWithPosition,
     DocumentChunker,
     PageAwareChunker,
+    get_chunk_token_counter,
+)
+from nextcloud_mcp_server.vector.document_manifest_store import DocumentManifestStore
+from nextcloud_mcp_server.vector.embedding_batcher import embed_dense, encode_sparse
+from nextcloud_mcp_server.vector.embedding_cache import (
+    SPARSE_IDENTITY,
+    PriorVectors,
+    chunk_hash,
+    get_embedding_cache,
+    load_prior_point_ids,
+    load_prior_points,
+    load_prior_points_by_id,
 )
 from nextcloud_mcp_server.vector.html_processor import html_to_markdown
 from nextcloud_mcp_server.vector.mail_content import (
@@ -79,9 +100,13 @@ from nextcloud_mcp_server.vector.placeholder import (
 from nextcloud_mcp_server.vector.qdrant_client import get_qdrant_client
 from nextcloud_mcp_server.vector.scanner import DocumentTask, _discover_tagged_files
 from nextcloud_mcp_server.vector.sharing_state import (
+    ACL_PRINCIPALS_KEY,
     claim_existing_index,
+    clone_indexed_content,
     existing_principals,
     file_title_from_path,
+    find_identical_content,
+    principal_user_id,
     release_document_for_user,
 )
 from nextcloud_mcp_server.vector.spool import download_ceiling, spooled_document
@@ -194,7 +219,15 @@ async def _parse_pdf_tier(
     if result.metadata.get(OCR_BATCH_PENDING_KEY):
         raise BatchPending(retry_in=int(result.metadata[OCR_BATCH_RETRY_IN_KEY]))
     if result.success:
-        decision = registry.evaluate_escalation_source(result, source, tier, settings)
+        # The fast and structured tiers record image coverage during their own
+        # pass; only a result without it re-opens the PDF (in the isolated
+        # worker pool). The escalation gate itself is pure and stays in-process.
+        image_coverage = await registry.scan_image_coverage(
+            settings, source=source, filename=filename, result=result
+        )
+        decision = registry.evaluate_escalation_source(
+            result, source, tier, settings, image_coverage=image_coverage
+        )
         if decision is not None:
             if decision.kind == "suppressed":
                 # The ideal next tier (e.g. ocr) is disabled, so we do NOT hop:
@@ -227,6 +260,242 @@ async def _parse_pdf_tier(
     return result
 
 
+async def _parse_cached(
+    doc_task: DocumentTask,
+    source: DocumentSource,
+    tier: str | None,
+    parse: Callable[[], Awaitable["ProcessingResult"]],
+    digest: str | None = None,
+) -> "ProcessingResult":
+    """Serve a document's parse from the parse-result cache, or run ``parse``.
+
+    A retry of the same document version (same etag, or same content when the
+    scanner had none) at the same tier under the same parse settings gets the
+    stored result back instead of re-parsing -- see ``vector/parse_cache.py``.
+    ``digest`` is the content digest when the caller already computed one.
+    ``parse`` raising (``EscalateError``, ``BatchPending``) stores nothing, so
+    only the result that is actually indexed is ever reused. Best-effort: a
+    cache I/O failure falls through to a normal parse.
+    """
+    # Lazy: parse_cache imports the document stack (see the module docstring).
+    from nextcloud_mcp_server.vector.parse_cache import (  # noqa: PLC0415
+        content_digest,
+        get_parse_cache,
+        parse_cache_key,
+    )
+
+    cache = get_parse_cache()
+    if cache is None:
+        return await parse()
+    try:
+        version = (
+            doc_task.etag
+            or digest
+            or await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+                content_digest, source
+            )
+        )
+        key = parse_cache_key(
+            doc_type=doc_task.doc_type,
+            doc_id=doc_task.doc_id,
+            version=version,
+            content_type=source.content_type,
+            tier=tier,
+        )
+        cached = await anyio.to_thread.run_sync(cache.get, key)  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+    except Exception as e:
+        logger.warning("Parse cache lookup failed for %s: %s", doc_task.doc_id, e)
+        return await parse()
+    if cached is not None:
+        logger.info(
+            "Reusing cached %s parse of %s %s",
+            tier or "inline",
+            doc_task.doc_type,
+            doc_task.doc_id,
+        )
+        return cached
+    result = await parse()
+    try:
+        await anyio.to_thread.run_sync(cache.put, key, result)  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+    except Exception as e:
+        logger.warning("Parse cache store failed for %s: %s", doc_task.doc_id, e)
+    return result
+
+
+async def _seed_acl_principals(doc_task: DocumentTask) -> list[str]:
+    """``acl_principals`` for a document about to be (re-)written.
+
+    Seeded with the indexer (and owner, if distinct). For files — the only type
+    with cross-user dedup and globally-unique IDs (Nextcloud fileid) — union in
+    any principals already recorded so re-indexing after a content change
+    preserves visibility for readers who had previously claimed the file. For
+    note/news_item/deck_card, IDs are per-user (not globally unique) and point
+    IDs are user-agnostic, so merging another user's principals on an ID
+    collision would wrongly cross-surface their content; those types are
+    seeded with the indexer only.
+    """
+    prior = (
+        await existing_principals(doc_task.doc_id, doc_task.doc_type)
+        if doc_task.doc_type == "file"
+        else []
+    )
+    return sorted(
+        set(prior)
+        | {
+            f"user:{doc_task.user_id}",
+            f"user:{doc_task.owner_id or doc_task.user_id}",
+        }
+    )
+
+
+async def _file_folder_ancestors(
+    nc_client: NextcloudClient, file_path: str
+) -> list[str]:
+    """Ancestor folder fileids of ``file_path``; best-effort, [] on failure."""
+    from nextcloud_mcp_server.vector.folder_ancestors import (  # noqa: PLC0415
+        resolve_folder_ancestors,
+    )
+
+    try:
+        return await resolve_folder_ancestors(nc_client.webdav, file_path)
+    except Exception as exc:  # noqa: BLE001 — best-effort; fall back to file_path
+        logger.debug(
+            "Folder-ancestor resolution failed for %s (%s); "
+            "search falls back to file_path for folder scope",
+            file_path,
+            exc,
+        )
+        return []
+
+
+async def _content_hash(source: DocumentSource) -> str | None:
+    """``payload_keys.CONTENT_HASH`` of a downloaded file; None if unreadable."""
+    # Lazy: parse_cache imports the document stack (see _parse_cached).
+    from nextcloud_mcp_server.vector.parse_cache import (  # noqa: PLC0415
+        content_digest,
+    )
+
+    try:
+        return await anyio.to_thread.run_sync(content_digest, source)  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+    except Exception as e:
+        logger.warning("Could not hash %s: %s", source.filename, e)
+        return None
+
+
+async def _index_identical_content(
+    doc_task: DocumentTask,
+    *,
+    file_path: str,
+    content_type: str,
+    content_hash: str,
+    nc_client: NextcloudClient,
+    qdrant_client,
+) -> tuple[int, list[str]] | None:
+    """Index a file by copying another fileid's identical, already-indexed body.
+
+    The fileid + etag claim only matches the same Nextcloud file; a copy of the
+    same bytes elsewhere (another user's folder, a saved mail attachment) was
+    parsed, OCR'd and embedded again. When ``content_hash`` is already indexed
+    under another fileid with the current embedding model, its chunks are copied
+    under this document's point ids with this document's identity (path, title,
+    owner, ``acl_principals``, folder ancestors) -- no parse, no provider call.
+    Chunk positions of an older, longer version of this document are removed.
+
+    Returns the chunk count and the ``acl_principals`` written on a hit, None
+    when the document must be processed normally. Fail-safe: any Qdrant error
+    degrades to None.
+    """
+    settings = get_settings()
+    try:
+        match = await find_identical_content(
+            content_hash,
+            doc_task.doc_id,
+            build_embedding_identity(settings),
+            doc_task.index_mode,
+        )
+    except Exception as exc:  # noqa: BLE001 — dedup is an optimisation
+        logger.warning(
+            "Content dedup lookup failed for file %s (%s); processing normally",
+            doc_task.doc_id,
+            exc,
+        )
+        return None
+    if match is None:
+        record_vector_sync_content_dedup("miss")
+        return None
+
+    indexed_at = int(time.time())
+    acl_principals = await _seed_acl_principals(doc_task)
+    overrides = {
+        "user_id": doc_task.user_id,
+        "owner_id": doc_task.owner_id or doc_task.user_id,
+        ACL_PRINCIPALS_KEY: acl_principals,
+        "doc_id": doc_task.doc_id,
+        "title": file_title_from_path(file_path),
+        "indexed_at": indexed_at,
+        "modified_at": doc_task.modified_at,
+        "etag": doc_task.etag or "",
+        "file_path": file_path,
+        "mime_type": content_type,
+        payload_keys.FOLDER_ANCESTORS: await _file_folder_ancestors(
+            nc_client, file_path
+        ),
+        payload_keys.INDEX_MODE: doc_task.index_mode,
+        payload_keys.ACL_HASH: compute_acl_hash([("user", doc_task.user_id)]),
+    }
+    try:
+        copied = await clone_indexed_content(
+            match,
+            point_id=lambda i: chunk_point_id("file", doc_task.doc_id, i),
+            overrides=overrides,
+            keep_dense=doc_task.index_mode != payload_keys.INDEX_MODE_KEYWORD,
+        )
+    except Exception as exc:  # noqa: BLE001 — the normal index overwrites a partial copy
+        logger.warning(
+            "Copying indexed content onto file %s failed (%s); processing normally",
+            doc_task.doc_id,
+            exc,
+        )
+        return None
+    if copied is None:
+        record_vector_sync_content_dedup("miss")
+        return None
+
+    current_ids = {chunk_point_id("file", doc_task.doc_id, i) for i in range(copied)}
+    try:
+        stale_ids = (
+            await load_prior_point_ids(
+                qdrant_client,
+                collection_name=settings.get_collection_name(),
+                doc_id=doc_task.doc_id,
+                doc_type="file",
+            )
+            - current_ids
+        )
+        if stale_ids:
+            await apply_point_writes(
+                qdrant_client,
+                collection_name=settings.get_collection_name(),
+                plan=PointWritePlan(deletes=sorted(stale_ids)),
+                batch_size=len(stale_ids),
+            )
+    except Exception as exc:  # noqa: BLE001 — cleanup is best-effort
+        logger.debug(
+            "Could not drop stale chunks of file %s (%s); the next re-index does",
+            doc_task.doc_id,
+            exc,
+        )
+    record_vector_sync_content_dedup("hit")
+    logger.info(
+        "Content dedup hit for file %s: copied %s chunk(s) of file %s "
+        "without reprocessing (no embedding/usage recorded)",
+        doc_task.doc_id,
+        copied,
+        match.get("doc_id"),
+    )
+    return copied, acl_principals
+
+
 def _ocr_chunk_bboxes(
     chunks: list[ChunkWithPosition], block_spans: list[dict[str, Any]]
 ) -> dict[int, list[tuple[float, float, float, float]]]:
@@ -317,6 +586,27 @@ def resolve_page_end(chunk: ChunkWithPosition) -> int | None:
     return chunk.page_end if chunk.page_end is not None else chunk.page_number
 
 
+def chunk_point_id(doc_type: str, doc_id: str, index: int) -> str:
+    """Deterministic Qdrant point id of a document's ``index``-th chunk."""
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{doc_type}:{doc_id}:chunk:{index}"))
+
+
+def index_windows(chunk_count: int, window: int) -> list[range]:
+    """Chunk-index ranges a document is embedded and written in.
+
+    A single range over every chunk unless ``window``
+    (``vector_sync_stream_window_chunks``) is positive and smaller than the
+    chunk count. A document without chunks still gets its one (empty) window,
+    so the placeholder is cleared and stale points are removed as before.
+    """
+    if window <= 0 or chunk_count <= window:
+        return [range(chunk_count)]
+    return [
+        range(start, min(start + window, chunk_count))
+        for start in range(0, chunk_count, window)
+    ]
+
+
 def should_use_page_aware(
     *, page_aware_enabled: bool, doc_type: str, page_boundaries: Any
 ) -> bool:
@@ -443,6 +733,53 @@ def _record_ingest_vector_cost(
         logger.warning("vector-cost observability hook skipped: %s", exc)
 
 
+async def _record_manifest_entry(
+    doc_task: DocumentTask,
+    *,
+    etag: str,
+    chunk_count: int | None,
+    acl_principals: list[str] | None = None,
+) -> None:
+    """Record ``doc_task``'s document in its readers' manifests; best-effort.
+
+    The scanner diffs Nextcloud against this manifest to find deletions (see
+    ``vector/document_manifest_store.py``). For files, every user in the
+    ``acl_principals`` just written gets a row, not only the indexer: the
+    scanner tracks a file for each reader (``_indexed_files_scroll_filter``),
+    so an owner or earlier claimer without a row would have a lost file go
+    unnoticed until the next reconcile. Other doc types are tracked by
+    ``user_id`` alone. Written only after the Qdrant writes it describes have
+    landed. A failed write is logged, not raised: the index itself is correct,
+    and the next manifest reconcile restores the row.
+    """
+    user_ids = {doc_task.user_id}
+    if doc_task.doc_type == "file":
+        user_ids.update(
+            user_id
+            for principal in acl_principals or []
+            if (user_id := principal_user_id(principal))
+        )
+    try:
+        store = await DocumentManifestStore.shared()
+        for user_id in sorted(user_ids):
+            await store.upsert(
+                user_id=user_id,
+                doc_type=doc_task.doc_type,
+                doc_id=doc_task.doc_id,
+                etag=etag,
+                modified_at=doc_task.modified_at,
+                index_mode=doc_task.index_mode,
+                chunk_count=chunk_count,
+            )
+    except Exception as exc:  # noqa: BLE001 — reconciled from Qdrant later
+        logger.warning(
+            "Manifest upsert failed for %s_%s (%s); the next reconcile restores it",
+            doc_task.doc_type,
+            doc_task.doc_id,
+            exc,
+        )
+
+
 async def record_indexing_usage(
     *,
     enabled: bool,
@@ -645,21 +982,13 @@ async def processor_task(
             with anyio.fail_after(1.0):
                 doc_task = await receive_stream.receive()
 
-            # Update queue size metric after receiving
-            stream_stats = receive_stream.statistics()
-            update_vector_sync_queue_size(stream_stats.current_buffer_used)
-
-            # Process document
+            # Queue depth is published by the vector-sync metrics publisher: the
+            # queued tasks sit in the transport's lane scheduler, not in this
+            # (unbuffered) worker stream.
             await process_document(doc_task, nc_client)
 
-            # Update queue size metric after processing
-            stream_stats = receive_stream.statistics()
-            update_vector_sync_queue_size(stream_stats.current_buffer_used)
-
         except TimeoutError:
-            # No documents available, update metric to show empty queue
-            stream_stats = receive_stream.statistics()
-            update_vector_sync_queue_size(stream_stats.current_buffer_used)
+            # No documents available
             continue
 
         except anyio.EndOfStream:
@@ -868,6 +1197,10 @@ async def process_document(
                 await release_document_for_user(
                     doc_task.doc_id, doc_task.doc_type, doc_task.user_id
                 )
+                # Covers the scanner's deletions too, which only reach this
+                # path; webhook deletes were already invalidated on receipt.
+                invalidate_document(doc_task.doc_type, doc_task.doc_id)
+                invalidate_owner(doc_task.owner_id or doc_task.user_id)
                 # Drop any dead-letter marker for the file too: release only
                 # removes it when the last reader leaves (its filter misses the
                 # user-agnostic, principal-less marker), so without this a
@@ -914,6 +1247,11 @@ async def process_document(
                     # treated as a parse failure.
                     if indexed is False:
                         return
+                    # Repeated searches over this document's owner must see the
+                    # new chunks rather than a cached candidate list. Mark the
+                    # owner_id the points carry: candidate entries are keyed on
+                    # the owners a search admits, not on who triggered the index.
+                    invalidate_owner(doc_task.owner_id or doc_task.user_id)
 
                     # Record successful processing metrics
                     duration = time.time() - start_time
@@ -1308,6 +1646,9 @@ async def _index_document_inner(
                     doc_type="file",
                     user_id=doc_task.user_id,
                 )
+                await _record_manifest_entry(
+                    doc_task, etag=doc_task.etag, chunk_count=None
+                )
                 # No embedding ran, so no usage is recorded here — stated
                 # explicitly so a "fewer tokens_embedded rows than expected"
                 # audit lands on the dedup path rather than reconstructing it
@@ -1394,6 +1735,54 @@ async def _index_document_inner(
         else:
             raise ValueError(f"Unsupported doc_type: {doc_task.doc_type}")
 
+    # Cross-fileid content dedup: the fileid + etag claim above misses a copy of
+    # the same bytes under another fileid. Hash the download and, if that body is
+    # already indexed elsewhere, copy its points instead of parsing and
+    # embedding it again. The hash is also stamped on this document's points so
+    # later copies can find it.
+    content_hash: str | None = None
+    if (
+        doc_task.doc_type == "file"
+        and source is not None
+        and preflight_failure is None
+        and settings.vector_sync_content_dedup
+    ):
+        assert file_path is not None and content_type is not None
+        content_hash = await _content_hash(source)
+        identical = (
+            await _index_identical_content(
+                doc_task,
+                file_path=file_path,
+                content_type=content_type,
+                content_hash=content_hash,
+                nc_client=nc_client,
+                qdrant_client=qdrant_client,
+            )
+            if content_hash
+            else None
+        )
+        if identical is not None:
+            copied, copied_principals = identical
+            try:
+                await delete_placeholder_point(
+                    doc_id=doc_task.doc_id,
+                    doc_type="file",
+                    user_id=doc_task.user_id,
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to delete placeholder for file_%s: %s", doc_task.doc_id, e
+                )
+            if doc_task.etag:
+                await clear_dead_letter(doc_task.doc_id, doc_task.doc_type)
+            await _record_manifest_entry(
+                doc_task,
+                etag=doc_task.etag or "",
+                chunk_count=copied,
+                acl_principals=copied_principals,
+            )
+            return None
+
     # Process file content (text extraction)
     if doc_task.doc_type == "file":
         # Type narrowing: content_type/file_path are set for files. content_bytes
@@ -1458,16 +1847,28 @@ async def _index_document_inner(
                         "doc_type": doc_task.doc_type,
                         "etag": doc_task.etag or "",
                     }
-                    result = await _parse_pdf_tier(
-                        registry,
+                    result = await _parse_cached(
+                        doc_task,
                         source,
                         tier,
-                        settings,
-                        options=doc_identity_options,
+                        lambda: _parse_pdf_tier(
+                            registry,
+                            source,
+                            tier,
+                            settings,
+                            options=doc_identity_options,
+                        ),
+                        digest=content_hash,
                     )
                 else:
                     assert source is not None
-                    result = await registry.process_source(source)
+                    result = await _parse_cached(
+                        doc_task,
+                        source,
+                        None,
+                        lambda: registry.process_source(source),
+                        digest=content_hash,
+                    )
 
                 # A permanent parse failure (e.g. an isolated-worker OOM/timeout
                 # on a pathological PDF) returns success=False rather than
@@ -1606,6 +2007,11 @@ async def _index_document_inner(
                                 "Could not mark placeholder failed for %s",
                                 doc_task.doc_id,
                             )
+                        # The failed placeholder stays indexed for this user, so
+                        # track it: deleting the file must still clean it up.
+                        await _record_manifest_entry(
+                            doc_task, etag=doc_task.etag or "", chunk_count=0
+                        )
                     return False
 
                 content = result.text
@@ -1666,20 +2072,24 @@ async def _index_document_inner(
             "vector_sync.input_chars": len(content),
             "vector_sync.chunk_size": settings.document_chunk_size,
             "vector_sync.overlap": settings.document_chunk_overlap,
+            "vector_sync.chunk_unit": settings.document_chunk_unit,
             "vector_sync.page_aware": use_page_aware,
         },
     ) as chunk_span:
+        token_counter = get_chunk_token_counter(settings)
         if use_page_aware:
             page_boundaries_list = cast(list[dict[str, Any]], page_boundaries)
             chunks = await PageAwareChunker(
                 chunk_size=settings.document_chunk_size,
                 overlap=settings.document_chunk_overlap,
                 pack_pages=settings.document_chunk_page_pack,
+                token_counter=token_counter,
             ).chunk_text(content, page_boundaries_list)
         else:
             chunks = await DocumentChunker(
                 chunk_size=settings.document_chunk_size,
                 overlap=settings.document_chunk_overlap,
+                token_counter=token_counter,
             ).chunk_text(content)
         record_document_chunks(doc_task.doc_type, len(chunks))
         if chunk_span is not None:
@@ -1723,6 +2133,9 @@ async def _index_document_inner(
 
     # Extract chunk texts for embedding
     chunk_texts = [chunk.text for chunk in chunks]
+    # Content address of each chunk (payload_keys.CHUNK_HASH), computed once and
+    # shared by the embedding-cache lookups and the point payloads.
+    chunk_hashes = [chunk_hash(t) for t in chunk_texts]
 
     # Per-document index mode (per-document keyword vs hybrid). Keyword docs
     # (``keyword-index`` tag) skip dense embeddings entirely and upsert
@@ -1730,48 +2143,120 @@ async def _index_document_inner(
     # both dense and sparse. This replaces the removed global ``dense_enabled``.
     dense_for_doc = doc_task.index_mode != payload_keys.INDEX_MODE_KEYWORD
 
-    # Initialize results containers
+    # Initialize results containers (per window; reset before each one)
+    window_chunks: list[ChunkWithPosition] = chunks
+    window_texts: list[str] = chunk_texts
+    window_hashes: list[str] = chunk_hashes
     dense_embeddings: list = []
     sparse_embeddings: list = []
-    # Embedding-token count from the dense pass (0 for keyword docs, which never
-    # embed). Captured as a nonlocal so the post-task-group metering can record
-    # ``tokens_embedded`` for hybrid docs while byte/page metering covers both.
+    # Embedding-token count from the dense pass, summed over windows (0 for
+    # keyword docs, which never embed). Captured as a nonlocal so the
+    # post-window metering can record ``tokens_embedded`` for hybrid docs while
+    # byte/page metering covers both.
     dense_embed_tokens: int = 0
     # chunk_index -> list[(x0, y0, x1, y1)] of normalized rectangles
     # in [0, 1] relative to page width/height. The page is taken from
     # `chunk.page_number` (offset-based) and stored as `page_number`
     # in the Qdrant payload, so we don't carry an `actual_page_num` here.
     chunk_bboxes: dict[int, list[tuple[float, float, float, float]]] = {}
-    # Where the bboxes came from — "ocr" (gateway-provided per-block geometry) or
-    # "pymupdf" (local text-search). Stamped on each chunk payload that has a bbox.
-    bbox_source: str | None = None
+    # chunk_index -> where its bboxes came from: "ocr" (gateway-provided
+    # per-block geometry) or "pymupdf" (local text-search). Per chunk because a
+    # mixed native+OCR PDF gets both. Stamped on each chunk payload with a bbox.
+    bbox_sources: dict[int, str] = {}
 
     # Determine if we need PDF highlighting
     is_pdf = doc_task.doc_type == "file" and content_type == PDF_MIME_TYPE
 
+    # Embedding identity stamped on every chunk point. Via the shared helper so it
+    # is IDENTICAL to what the collection sentinel and the cross-user dedup lookup
+    # produce (Deck #509). It records the dense embedding MODEL (so a model switch
+    # forces a re-embed); it is orthogonal to keyword-vs-hybrid, which is tracked
+    # separately by INDEX_MODE. Keyword points carry the model identity too — they
+    # simply omit the dense vector — so a keyword doc dedups against the same
+    # model-identity space (see claim_existing_index's monotonic rule).
+    _embedding_identity = build_embedding_identity(settings)
+
+    # The document's currently stored points, scrolled once and shared by two
+    # consumers: content-addressed embedding reuse (vector/embedding_cache.py) —
+    # chunks whose text is unchanged since the previous version take the vectors
+    # already stored (or held in the process cache) instead of going back to the
+    # provider / BM25 encoder — and the chunk-level diff write below
+    # (vector/diff_upsert.py). Best-effort: a failed scroll only means every
+    # chunk is embedded and upserted, as before.
+    embedding_cache = (
+        get_embedding_cache() if settings.embedding_cache_enabled else None
+    )
+    # Long documents are embedded and written one window of chunks at a time
+    # (VECTOR_SYNC_STREAM_WINDOW_CHUNKS). A window's vectors and points are
+    # released once it is written, so memory no longer grows with the page
+    # count and the first pages are searchable while the rest embed. A retry
+    # after a crash resumes for free: the windows already written come back as
+    # unchanged prior points, reused instead of re-embedded and skipped by the
+    # diff write. A streamed document fetches its prior points per window too,
+    # by id -- the whole-document scroll would hold every stored vector at once.
+    windows = index_windows(len(chunks), settings.vector_sync_stream_window_chunks)
+    streamed = len(windows) > 1
+    load_prior = embedding_cache is not None or settings.vector_sync_diff_upsert
+    prior_points: list[Any] | None = None
+    if load_prior and not streamed:
+        try:
+            prior_points = await load_prior_points(
+                qdrant_client,
+                collection_name=settings.get_collection_name(),
+                doc_id=doc_task.doc_id,
+                doc_type=doc_task.doc_type,
+            )
+        except Exception as exc:  # noqa: BLE001 — reuse is an optimisation
+            logger.debug(
+                "Could not load prior points for %s_%s (%s); embedding all chunks",
+                doc_task.doc_type,
+                doc_task.doc_id,
+                exc,
+            )
+    prior_vectors: PriorVectors | None = None
+    if embedding_cache is not None and prior_points is not None:
+        prior_vectors = PriorVectors.from_points(prior_points, _embedding_identity)
+
     # Define async tasks for parallel execution
     async def generate_dense_embeddings():
         """Generate dense embeddings (I/O bound - external API call)."""
         nonlocal dense_embeddings, dense_embed_tokens
         provider = settings.get_embedding_provider_family()
-        total_chars = sum(len(t) for t in chunk_texts)
+        lookup = (
+            embedding_cache.lookup(
+                "dense",
+                _embedding_identity,
+                window_texts,
+                prior_vectors,
+                hashes=window_hashes,
+            )
+            if embedding_cache is not None
+            else None
+        )
+        texts_to_embed = lookup.missing_texts if lookup is not None else window_texts
+        total_chars = sum(len(t) for t in texts_to_embed)
         with trace_operation(
             "vector_sync.embed_dense",
             attributes={
-                _ATTR_CHUNK_COUNT: len(chunk_texts),
+                _ATTR_CHUNK_COUNT: len(texts_to_embed),
+                "vector_sync.cached_chunks": len(window_texts) - len(texts_to_embed),
                 "vector_sync.total_chars": total_chars,
                 "embedding.kind": "dense",
                 "embedding.provider": provider,
                 "embedding.model": settings.get_embedding_model_name(),
             },
         ):
-            embedding_provider = get_provider()
+            if not texts_to_embed:
+                # Every chunk resolved from the cache: no provider round-trip,
+                # and nothing billable (embed_tokens stays 0).
+                assert lookup is not None
+                dense_embeddings = lookup.vectors
+                return
             embed_start = time.time()
             try:
-                (
-                    dense_embeddings,
-                    embed_tokens,
-                ) = await embedding_provider.embed_batch_with_usage(chunk_texts)
+                # Through the cross-document micro-batcher: concurrent documents'
+                # chunks share provider requests (vector/embedding_batcher.py).
+                computed, embed_tokens = await embed_dense(texts_to_embed)
             except Exception:
                 record_embedding(
                     "dense", provider, time.time() - embed_start, status="error"
@@ -1781,34 +2266,51 @@ async def _index_document_inner(
                 "dense",
                 provider,
                 time.time() - embed_start,
-                chunks=len(chunk_texts),
+                chunks=len(texts_to_embed),
                 chars=total_chars,
             )
+            dense_embeddings = lookup.fill(computed) if lookup is not None else computed
             # Export token consumption to Prometheus (always-on, independent of
             # the billing flag) so Grafana sees indexing token cost.
             record_embedding_tokens(provider, "index", embed_tokens)
             # Hand the token count to the post-task-group usage metering (byte +
             # page dimensions are recorded there for BOTH modes; embedding tokens
             # are hybrid-only, so keyword docs keep the initialised 0).
-            dense_embed_tokens = embed_tokens
+            dense_embed_tokens += embed_tokens
 
     async def generate_sparse_embeddings():
         """Generate sparse embeddings (BM25 for keyword matching)."""
         nonlocal sparse_embeddings
-        total_chars = sum(len(t) for t in chunk_texts)
+        lookup = (
+            embedding_cache.lookup(
+                "sparse",
+                SPARSE_IDENTITY,
+                window_texts,
+                prior_vectors,
+                hashes=window_hashes,
+            )
+            if embedding_cache is not None
+            else None
+        )
+        texts_to_embed = lookup.missing_texts if lookup is not None else window_texts
+        total_chars = sum(len(t) for t in texts_to_embed)
         with trace_operation(
             "vector_sync.embed_sparse",
             attributes={
-                _ATTR_CHUNK_COUNT: len(chunk_texts),
+                _ATTR_CHUNK_COUNT: len(texts_to_embed),
+                "vector_sync.cached_chunks": len(window_texts) - len(texts_to_embed),
                 "vector_sync.total_chars": total_chars,
                 "embedding.kind": "sparse",
                 "embedding.provider": "bm25",
             },
         ):
-            bm25_service = await get_bm25_service()
+            if not texts_to_embed:
+                assert lookup is not None
+                sparse_embeddings = lookup.vectors
+                return
             embed_start = time.time()
             try:
-                sparse_embeddings = await bm25_service.encode_batch(chunk_texts)
+                computed = await encode_sparse(texts_to_embed)
             except Exception:
                 record_embedding(
                     "sparse", "bm25", time.time() - embed_start, status="error"
@@ -1818,9 +2320,12 @@ async def _index_document_inner(
                 "sparse",
                 "bm25",
                 time.time() - embed_start,
-                chunks=len(chunk_texts),
+                chunks=len(texts_to_embed),
                 chars=total_chars,
             )
+            sparse_embeddings = (
+                lookup.fill(computed) if lookup is not None else computed
+            )
 
     async def generate_highlights():
         """Compute chunk bounding boxes for PDF chunks (CPU-bound, no rendering).
@@ -1828,11 +2333,12 @@ async def _index_document_inner(
         Prefers OCR-provided geometry: when the OCR tier returned per-block bboxes
         (surya via the gateway, normalized [0,1] — ``OCR_BLOCK_SPANS_KEY`` in
         metadata), a chunk's bbox is the set of blocks whose char span it overlaps,
-        and ``bbox_source`` is ``"ocr"``. This is the ONLY viable source for an
-        OCR'd (scanned) doc — its PDF has no text layer for pymupdf to search. When
-        no OCR geometry is present (fast/structured tiers, Mistral OCR), fall back
-        to the pymupdf text-search path (``bbox_source="pymupdf"``)."""
-        nonlocal chunk_bboxes, bbox_source
+        and its source is ``"ocr"``. This is the ONLY viable source for an OCR'd
+        (scanned) page — it has no text layer for pymupdf to search. Chunks on
+        pages with no OCR geometry (every page on the fast/structured tiers and
+        Mistral OCR; the native pages of a per-page OCR'd PDF) use the pymupdf
+        text-search path (source ``"pymupdf"``)."""
+        nonlocal chunk_bboxes, bbox_sources
         if not is_pdf:
             return
 
@@ -1852,7 +2358,7 @@ async def _index_document_inner(
         with trace_operation(
             "vector_sync.generate_highlights",
             attributes={
-                _ATTR_CHUNK_COUNT: len(chunks),
+                _ATTR_CHUNK_COUNT: len(window_chunks),
                 "vector_sync.is_pdf": is_pdf,
                 "vector_sync.pdf_size": source.size,
             },
@@ -1866,31 +2372,33 @@ async def _index_document_inner(
                 """
                 if highlights_span is not None:
                     highlights_span.set_attribute(
-                        "vector_sync.bbox_source", bbox_source or "none"
+                        "vector_sync.bbox_source",
+                        ",".join(sorted(set(bbox_sources.values()))) or "none",
                     )
 
+            # Pages the OCR tier produced geometry for. Their chunks are
+            # attributed from it even when nothing overlaps: an OCR'd page has no
+            # text layer for pymupdf to add.
+            ocr_pages: set[Any] = set()
             ocr_block_spans = file_metadata.get(OCR_BLOCK_SPANS_KEY)
             if ocr_block_spans:
                 spans = cast(list[dict[str, Any]], ocr_block_spans)
                 with trace_operation(
                     "vector_sync.ocr_chunk_bboxes",
                     attributes={
-                        _ATTR_CHUNK_COUNT: len(chunks),
+                        _ATTR_CHUNK_COUNT: len(window_chunks),
                         "vector_sync.ocr_block_count": len(spans),
                     },
                 ):
-                    attributed = _ocr_chunk_bboxes(chunks, spans)
+                    ocr_pages = {s.get("page") for s in spans}
+                    attributed = _ocr_chunk_bboxes(window_chunks, spans)
                     chunk_bboxes.update(attributed)
-                    # Only stamp "ocr" when something was actually attributed — a
-                    # non-empty spans list that overlaps no chunk leaves the source
-                    # unset (nothing is stored either way; the payload gates on
-                    # `i in chunk_bboxes`).
+                    bbox_sources.update(dict.fromkeys(attributed, "ocr"))
                     if attributed:
-                        bbox_source = "ocr"
                         logger.info(
                             "Attributed OCR bboxes for %s/%s chunks (%s blocks)",
                             len(attributed),
-                            len(chunks),
+                            len(window_chunks),
                             len(spans),
                         )
                     else:
@@ -1901,38 +2409,33 @@ async def _index_document_inner(
                             "OCR returned %s blocks but none overlapped any of %s "
                             "chunks; no pre-computed bboxes stored",
                             len(spans),
-                            len(chunks),
+                            len(window_chunks),
                         )
-                # One path for the WHOLE document: when the OCR tier ran, surya OCRs
-                # every rendered page, so its blocks cover the whole doc — pymupdf has
-                # no text layer to add (a scanned doc) and we do NOT fall through to
-                # it, even when attribution found nothing. Caveat: a mixed native+OCR
-                # PDF gets OCR geometry only; native-page chunks won't also get
-                # pymupdf highlights. That's acceptable — escalation to OCR is a
-                # whole-document decision, so a mixed doc is rare, and unmatched
-                # blocks are logged in _pages_to_text for diagnosis.
+
+            # The rest go to pymupdf: the native pages of a mixed PDF, or every
+            # page when the OCR tier did not run.
+            chunk_data: list[tuple[int, int, int, int | None, str]] = [
+                (
+                    i,
+                    chunk.start_offset,
+                    chunk.end_offset,
+                    chunk.page_number,
+                    chunk.text,
+                )
+                for i, chunk in enumerate(window_chunks)
+                if chunk.page_number is not None and chunk.page_number not in ocr_pages
+            ]
+            if not chunk_data:
                 _stamp_bbox_source()
                 return
 
             with trace_operation(
                 "vector_sync.compute_chunk_bboxes",
                 attributes={
-                    _ATTR_CHUNK_COUNT: len(chunks),
+                    _ATTR_CHUNK_COUNT: len(chunk_data),
                     "vector_sync.pdf_size": source.size,
                 },
             ):
-                chunk_data: list[tuple[int, int, int, int | None, str]] = [
-                    (
-                        i,
-                        chunk.start_offset,
-                        chunk.end_offset,
-                        chunk.page_number,
-                        chunk.text,
-                    )
-                    for i, chunk in enumerate(chunks)
-                    if chunk.page_number is not None
-                ]
-
                 page_boundaries = file_metadata.get("page_boundaries")
                 if not page_boundaries:
                     logger.warning(
@@ -1945,122 +2448,59 @@ async def _index_document_inner(
 
                 logger.info("Computing chunk bboxes for %s PDF chunks", len(chunk_data))
 
-                # pymupdf is not thread-safe; run the bbox batch under the shared
-                # MuPDF lock so concurrent ingest jobs serialize their native work.
-                def _compute_bboxes():
-                    from nextcloud_mcp_server.document_processors._native_locks import (  # noqa: PLC0415
-                        pymupdf_serialized,
-                    )
-
-                    with pymupdf_serialized():
-                        return PDFHighlighter.compute_chunk_bboxes_batch(
-                            pdf_bytes=None,
-                            pdf_path=source.path(),
-                            chunks=chunk_data,
-                            page_boundaries=page_boundaries_list,
-                            full_text=content,
-                        )
-
-                batch_results = await anyio.to_thread.run_sync(  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
-                    _compute_bboxes
+                # MuPDF is not thread-safe, so the bbox batch runs in the
+                # isolated worker pool rather than a thread: concurrent ingest
+                # jobs no longer queue behind one process-wide lock, and a
+                # native crash takes down a worker instead of the server.
+                from nextcloud_mcp_server.document_processors._isolation import (  # noqa: PLC0415
+                    run_isolated_native,
                 )
 
+                # path() may spool an in-memory source to disk; keep that off
+                # the event loop.
+                pdf_path = await anyio.to_thread.run_sync(source.path)  # type: ignore[attr-defined]  # ty: ignore[unresolved-attribute]
+                try:
+                    batch_results = await run_isolated_native(
+                        PDFHighlighter.compute_chunk_bboxes_batch,
+                        None,
+                        chunk_data,
+                        page_boundaries_list,
+                        content,
+                        pdf_path,
+                        # Explicit, so the worker never loads settings itself.
+                        settings.document_parse_page_window,
+                        library="pymupdf",
+                        timeout_seconds=settings.document_parse_timeout_seconds,
+                        mem_limit_mb=settings.document_parse_mem_limit_mb,
+                        process_slots=settings.document_native_process_slots,
+                    )
+                except Exception as e:
+                    # Best-effort, like the rest of bbox computation: index the
+                    # chunks without highlight rectangles.
+                    logger.warning(
+                        "Bbox computation failed for %s: %s", doc_task.doc_id, e
+                    )
+                    batch_results = {}
+
                 for chunk_index, (bboxes, _) in batch_results.items():
                     chunk_bboxes[chunk_index] = bboxes
-                if chunk_bboxes:
-                    bbox_source = "pymupdf"
+                    bbox_sources[chunk_index] = "pymupdf"
 
                 logger.info(
-                    "Computed bboxes for %s/%s chunks", len(chunk_bboxes), len(chunks)
+                    "Computed bboxes for %s/%s chunks",
+                    len(batch_results),
+                    len(chunk_data),
                 )
             _stamp_bbox_source()
 
-    # Run all embedding/highlighting operations in parallel
-    # - Dense embeddings: I/O bound (API call)
-    # - Sparse embeddings: CPU bound (local BM25)
-    # - Highlighting: CPU bound (PyMuPDF rendering, runs in thread pool)
-    with trace_operation(
-        "vector_sync.parallel_processing",
-        attributes={
-            "vector_sync.is_pdf": is_pdf,
-            _ATTR_CHUNK_COUNT: len(chunks),
-        },
-    ):
-        async with anyio.create_task_group() as tg:
-            # Keyword-only documents (``keyword-index`` tag → index_mode
-            # "keyword") skip dense embeddings entirely: no embedding endpoint is
-            # contacted and the point is upserted sparse-only. ``dense_embeddings``
-            # stays [] in that case. Hybrid documents (default) always embed — a
-            # failed/unavailable embedding endpoint raises out of
-            # generate_dense_embeddings into process_document's retry/dead-letter
-            # path rather than silently degrading to sparse-only.
-            if dense_for_doc:
-                tg.start_soon(generate_dense_embeddings)
-            tg.start_soon(generate_sparse_embeddings)
-            tg.start_soon(generate_highlights)
-
-    # Usage metering (Deck #67), recorded once per document AFTER the embedding/
-    # sparse task group so it covers BOTH modes (byte + page dimensions for
-    # keyword and hybrid alike; embedding tokens are hybrid-only via
-    # dense_embed_tokens, which stays 0 for keyword docs). Best-effort and
-    # flag-gated; placed after processing succeeds so it can never affect the
-    # indexing path. ``page_count`` is set by the document processors for PDFs
-    # and absent for text types. Narrow defensively: file_metadata values are
-    # loosely typed, so a malformed page_count meters as "no pages"; bool is an
-    # int subclass, so exclude it explicitly.
-    _meter_total_chars = sum(len(t) for t in chunk_texts)
-    _meter_raw_page_count = file_metadata.get("page_count")
-    _meter_pipeline_tier = file_metadata.get("pipeline_tier")
-    await record_indexing_usage(
-        enabled=settings.usage_metering_enabled,
-        provider=settings.get_embedding_provider_family(),
-        model=settings.get_embedding_model_name(),
-        doc_type=doc_task.doc_type,
-        user_id=doc_task.user_id,
-        index_mode=doc_task.index_mode,
-        chunk_count=len(chunk_texts),
-        token_count=dense_embed_tokens,
-        total_chars=_meter_total_chars,
-        page_count=(
-            _meter_raw_page_count
-            if isinstance(_meter_raw_page_count, int)
-            and not isinstance(_meter_raw_page_count, bool)
-            else None
-        ),
-        # bytes_ingested: raw source size at ingestion (raw WebDAV binary for
-        # files, UTF-8 text size for text doc types — note, deck_card,
-        # news_item, mail_message). See helper.
-        bytes_ingested=ingested_byte_size(source.size if source else None, content),
-        # bytes_stored: UTF-8 size of the chunk texts persisted as Qdrant payload
-        # excerpts (includes chunk-overlap duplication).
-        bytes_stored=sum(len(t.encode("utf-8")) for t in chunk_texts),
-        # Tier that produced the parsed pages (registry stamps it on the result
-        # metadata); text doc types stay "fast". Narrow defensively to str|None.
-        pipeline_tier=(
-            _meter_pipeline_tier if isinstance(_meter_pipeline_tier, str) else None
-        ),
-    )
-
     # Raw source size at ingestion (raw WebDAV binary for files, UTF-8 text size
     # for text doc types). Computed once here and reused for both the ingest-time
     # density metric and the per-point payload (payload_keys.SOURCE_BYTES) so the
     # current-corpus density snapshot can recompute chunks-per-MB from Qdrant.
     source_bytes = ingested_byte_size(source.size if source else None, content)
 
-    # Observability-only cost signals (card #624), independent of USAGE_METERING.
-    # Best-effort and self-contained in the helper so a metrics failure can never
-    # disturb indexing.
-    _record_ingest_vector_cost(
-        doc_type=doc_task.doc_type,
-        chunk_count=len(chunk_texts),
-        source_bytes=source_bytes,
-        dense_for_doc=dense_for_doc,
-        overhead=settings.vector_ram_hnsw_overhead_factor,
-    )
-
-    # Prepare Qdrant points
+    # Per-document payload fields, shared by every window's points
     indexed_at = int(time.time())
-    points = []
 
     # Decomposition payload keys (design §10.2) — written even in local mode so
     # a future migration to the external processor is friction-free. Computed
@@ -2068,44 +2508,19 @@ async def _index_document_inner(
     # PIPELINE_TIER is "fast"; ACL hash records at least the owner principal
     # (full share enumeration is a follow-up — a missing/partial acl_hash is
     # safe because the query-side pre-filter only applies when present + enabled).
-    # Embedding identity stamped on every chunk point. Via the shared helper so it
-    # is IDENTICAL to what the collection sentinel and the cross-user dedup lookup
-    # produce (Deck #509). It records the dense embedding MODEL (so a model switch
-    # forces a re-embed); it is orthogonal to keyword-vs-hybrid, which is tracked
-    # separately by INDEX_MODE. Keyword points carry the model identity too — they
-    # simply omit the dense vector — so a keyword doc dedups against the same
-    # model-identity space (see claim_existing_index's monotonic rule).
-    _embedding_identity = build_embedding_identity(settings)
+    # The embedding identity (_embedding_identity) was resolved before the
+    # embedding step, which keys its cache lookups on it.
     _acl_hash = compute_acl_hash([("user", doc_task.user_id)])
 
     # Observed-access ACL principals (computed once per document, not per chunk).
-    # Seed with the indexer (and owner, if distinct). For files — the only type
-    # with cross-user dedup and globally-unique IDs (Nextcloud fileid) — union in
-    # any principals already recorded so re-indexing after a content change
-    # preserves visibility for readers who had previously claimed the file. For
-    # note/news_item/deck_card, IDs are per-user (not globally unique) and point
-    # IDs are user-agnostic, so merging another user's principals on an ID
-    # collision would wrongly cross-surface their content; those types are
-    # seeded with the indexer only.
-    _prior_principals = (
-        await existing_principals(doc_task.doc_id, doc_task.doc_type)
-        if doc_task.doc_type == "file"
-        else []
-    )
-    _acl_principals = sorted(
-        set(_prior_principals)
-        | {
-            f"user:{doc_task.user_id}",
-            f"user:{doc_task.owner_id or doc_task.user_id}",
-        }
-    )
+    _acl_principals = await _seed_acl_principals(doc_task)
 
     # ADR-033 Phase 3: resolve the file's ancestor folder fileids once per
     # document (identical for every chunk). Stamped on each file point as
     # folder_ancestors so search can scope by a folder's canonical fileid — a
-    # user-agnostic, truly left-anchored containment. Best-effort: an empty list
-    # (resolution failure, or a non-file doc type) leaves search on the file_path
-    # MatchText fallback for this doc.
+    # user-agnostic, truly left-anchored containment. An empty list (resolution
+    # failure, or a non-file doc type) leaves search on the file_path MatchText
+    # fallback for this doc.
     #
     # No cross-document ancestor cache here: this runs in the queue worker, one
     # DocumentTask at a time, decoupled from the scanner's scan pass — so unlike
@@ -2127,21 +2542,7 @@ async def _index_document_inner(
     # principal can resolve them at query time).
     _folder_ancestors: list[str] = []
     if doc_task.doc_type == "file" and file_path:
-        from nextcloud_mcp_server.vector.folder_ancestors import (  # noqa: PLC0415
-            resolve_folder_ancestors,
-        )
-
-        try:
-            _folder_ancestors = await resolve_folder_ancestors(
-                nc_client.webdav, file_path
-            )
-        except Exception as exc:  # noqa: BLE001 — best-effort; fall back to file_path
-            logger.debug(
-                "Folder-ancestor resolution failed for %s (%s); "
-                "search falls back to file_path for folder scope",
-                file_path,
-                exc,
-            )
+        _folder_ancestors = await _file_folder_ancestors(nc_client, file_path)
 
     # Surface deck card data quality issues at indexing time rather than
     # only at verification time (where _verify_deck_cards falls through to
@@ -2160,206 +2561,400 @@ async def _index_document_inner(
                 missing_deck_fields,
             )
 
-    for i, (chunk, sparse_emb) in enumerate(zip(chunks, sparse_embeddings)):
-        # Generate deterministic UUID for point ID
-        # Using uuid5 with DNS namespace and combining doc info
-        point_name = f"{doc_task.doc_type}:{doc_task.doc_id}:chunk:{i}"
-        point_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, point_name))
-
-        # Keyword docs upsert sparse-only points; the loop is driven off
-        # ``sparse_embeddings`` so the chunk count stays correct when
-        # ``dense_embeddings`` is empty. See build_point_vector for the rationale.
-        point_vector = build_point_vector(
-            sparse_emb, dense_embeddings, i, dense_enabled=dense_for_doc
-        )
+    # Upsert to Qdrant in batches. Now that we no longer embed PNG payloads,
+    # per-point payloads are small (chunk text + small metadata), so we can
+    # safely use a larger batch size. Bulk-load mode (a large backlog, see
+    # vector/bulk_load.py) writes bigger batches without waiting on each.
+    bulk_load = await is_bulk_load_active(qdrant_client, settings.get_collection_name())
+    BATCH_SIZE = settings.vector_sync_bulk_upsert_batch_size if bulk_load else 100
+
+    # Embed, highlight and write each window in turn. Windows run one after
+    # another: the next window is not embedded until the previous one is
+    # written, which bounds memory to one window however large the document.
+    for window_number, window in enumerate(windows):
+        window_chunks = chunks[window.start : window.stop]
+        window_texts = chunk_texts[window.start : window.stop]
+        window_hashes = chunk_hashes[window.start : window.stop]
+        window_ids = [
+            chunk_point_id(doc_task.doc_type, doc_task.doc_id, i) for i in window
+        ]
+        dense_embeddings = []
+        sparse_embeddings = []
+        chunk_bboxes = {}
+        bbox_sources = {}
+        if streamed and load_prior:
+            try:
+                prior_points = await load_prior_points_by_id(
+                    qdrant_client,
+                    collection_name=settings.get_collection_name(),
+                    point_ids=window_ids,
+                )
+            except Exception as exc:  # noqa: BLE001 — reuse is an optimisation
+                logger.debug(
+                    "Could not load prior points for window %s of %s_%s (%s)",
+                    window_number,
+                    doc_task.doc_type,
+                    doc_task.doc_id,
+                    exc,
+                )
+                prior_points = None
+            prior_vectors = (
+                PriorVectors.from_points(prior_points, _embedding_identity)
+                if embedding_cache is not None and prior_points is not None
+                else None
+            )
 
-        # Last page of a packed multi-page chunk (Deck #636); falls back to
-        # page_number for single-page and char-path chunks so the citation
-        # range is always set.
-        page_end = resolve_page_end(chunk)
-
-        points.append(
-            PointStruct(
-                id=point_id,
-                vector=point_vector,
-                payload={
-                    "user_id": doc_task.user_id,
-                    # owner_id is the UID of the file's owner — what
-                    # search-time ACL expansion filters on. Today the scanner
-                    # always runs as the file's owner (per-user crawl, only
-                    # surfaces files the user owns or that fall under their
-                    # WebDAV root), so owner_id == user_id is correct for
-                    # every doc type indexed here. The fields are kept
-                    # separate so a future indexer change that lets a user
-                    # crawl shared-with-them content can set owner_id to the
-                    # true owner without losing the "who indexed this" trail.
-                    "owner_id": doc_task.owner_id or doc_task.user_id,
-                    # Observed-access ACL set: every user whose scanner has seen
-                    # (hence can read) this document. Seeded with the indexer (and
-                    # owner, if distinct); grown lazily as other readers' scanners
-                    # hit the tenant-wide dedup path. Search ORs a
-                    # MatchAny(acl_principals, ["user:<me>"]) branch so a
-                    # deduplicated shared file stays findable by every reader.
-                    "acl_principals": _acl_principals,
-                    "doc_id": doc_task.doc_id,
-                    "doc_type": doc_task.doc_type,
-                    "is_placeholder": False,  # Real indexed document (not placeholder)
-                    "title": title,
-                    "excerpt": chunk.text,  # Full chunk text (up to chunk_size, default 2048 chars)
-                    "indexed_at": indexed_at,
-                    "modified_at": doc_task.modified_at,
-                    "etag": etag,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    "chunk_start_offset": chunk.start_offset,
-                    "chunk_end_offset": chunk.end_offset,
-                    "metadata_version": 2,  # v2 includes position metadata
-                    # Raw source size (bytes) at ingestion — the denominator the
-                    # current-corpus density snapshot needs, previously discarded
-                    # after embedding. Same on every chunk of the document.
-                    payload_keys.SOURCE_BYTES: source_bytes,
-                    # Decomposition payload keys (design §10.2), additive.
-                    payload_keys.PROCESSOR_VERSION: "monolith-v1",
-                    payload_keys.PARSED_AT: indexed_at,
-                    # Actual tier that produced this doc (registry stamps it on
-                    # the result metadata); non-PDF doc types stay "fast".
-                    payload_keys.PIPELINE_TIER: file_metadata.get(
-                        "pipeline_tier", "fast"
-                    ),
-                    payload_keys.EMBEDDING_IDENTITY: _embedding_identity,
-                    # Per-document index mode: "hybrid" (this point carries a
-                    # dense vector) or "keyword" (sparse-only). Drives verify-on-
-                    # read tag selection, the dedup monotonic rule, and billing.
-                    payload_keys.INDEX_MODE: doc_task.index_mode,
-                    payload_keys.ACL_HASH: _acl_hash,
-                    # File-specific metadata (PDF, etc.)
-                    **(
-                        {
-                            "file_path": file_path,  # Store file path for retrieval
-                            # ADR-033 Phase 3: ancestor folder fileids for the
-                            # folder-scope search filter (same value on every
-                            # chunk). Omitted implicitly when resolution yielded
-                            # nothing — search then uses the file_path fallback.
-                            payload_keys.FOLDER_ANCESTORS: _folder_ancestors,
-                            "mime_type": content_type,  # From WebDAV response
-                            "file_size": file_metadata.get("file_size"),
-                            "page_number": chunk.page_number,
-                            "page_end": page_end,
-                            "page_count": file_metadata.get("page_count"),
-                            "author": file_metadata.get("author"),
-                            "creation_date": file_metadata.get("creation_date"),
-                            "has_images": file_metadata.get("has_images", False),
-                            "image_count": file_metadata.get("image_count", 0),
-                        }
-                        if doc_task.doc_type == "file"
-                        else {}
-                    ),
-                    # News item-specific metadata
-                    **(
-                        {
-                            "feed_id": file_metadata.get("feed_id"),
-                            "feed_title": file_metadata.get("feed_title"),
-                            "author": file_metadata.get("author"),
-                            "pub_date": file_metadata.get("pub_date"),
-                            "starred": file_metadata.get("starred"),
-                            "unread": file_metadata.get("unread"),
-                            "url": file_metadata.get("url"),
-                            "guid_hash": file_metadata.get("guid_hash"),
-                            "enclosure_link": file_metadata.get("enclosure_link"),
-                            "enclosure_mime": file_metadata.get("enclosure_mime"),
-                        }
-                        if doc_task.doc_type == "news_item"
-                        else {}
-                    ),
-                    # Deck card-specific metadata
-                    **(
-                        {
-                            "board_id": file_metadata.get("board_id"),
-                            "board_title": file_metadata.get("board_title"),
-                            "stack_id": file_metadata.get("stack_id"),
-                            "stack_title": file_metadata.get("stack_title"),
-                            "card_type": file_metadata.get("card_type"),
-                            "duedate": file_metadata.get("duedate"),
-                            "owner": file_metadata.get("owner"),
-                        }
-                        if doc_task.doc_type == "deck_card"
-                        else {}
-                    ),
-                    # Mail message-specific metadata
-                    **(
-                        {
-                            "subject": file_metadata.get("subject"),
-                            "from": file_metadata.get("from"),
-                            "to": file_metadata.get("to"),
-                            "cc": file_metadata.get("cc"),
-                            "bcc": file_metadata.get("bcc"),
-                            "date_int": file_metadata.get("date_int"),
-                            "has_attachments": file_metadata.get("has_attachments"),
-                            "account_id": file_metadata.get("account_id"),
-                            "mailbox_id": file_metadata.get("mailbox_id"),
-                        }
-                        if doc_task.doc_type == "mail_message"
-                        else {}
-                    ),
-                    # Chunk bbox (PDF only) — normalized rectangles in [0,1]
-                    # relative to page width/height. Replaces the legacy
-                    # `highlighted_page_image` (Deck #76). The page number
-                    # comes from `page_number` (set above for PDF chunks).
-                    # ``bbox_source`` records provenance ("ocr" = gateway-provided
-                    # surya geometry, "pymupdf" = local text-search).
-                    **(
-                        {"chunk_bbox": chunk_bboxes[i], "bbox_source": bbox_source}
-                        if i in chunk_bboxes
-                        else {}
-                    ),
-                },
+        # Run all embedding/highlighting operations in parallel
+        # - Dense embeddings: I/O bound (API call)
+        # - Sparse embeddings: CPU bound (local BM25)
+        # - Highlighting: CPU bound (PyMuPDF rendering, runs in thread pool)
+        with trace_operation(
+            "vector_sync.parallel_processing",
+            attributes={
+                "vector_sync.is_pdf": is_pdf,
+                _ATTR_CHUNK_COUNT: len(window_chunks),
+            },
+        ):
+            async with anyio.create_task_group() as tg:
+                # Keyword-only documents (``keyword-index`` tag → index_mode
+                # "keyword") skip dense embeddings entirely: no embedding
+                # endpoint is contacted and the point is upserted sparse-only.
+                # ``dense_embeddings`` stays [] in that case. Hybrid documents
+                # (default) always embed — a failed/unavailable embedding
+                # endpoint raises out of generate_dense_embeddings into
+                # process_document's retry/dead-letter path rather than silently
+                # degrading to sparse-only.
+                if dense_for_doc:
+                    tg.start_soon(generate_dense_embeddings)
+                tg.start_soon(generate_sparse_embeddings)
+                tg.start_soon(generate_highlights)
+
+        points = []
+        for i, (chunk, sparse_emb) in enumerate(
+            zip(window_chunks, sparse_embeddings), start=window.start
+        ):
+            # ``i`` is the chunk's position in the document (its deterministic
+            # point ID); ``j`` indexes the window's own embeddings and bboxes.
+            j = i - window.start
+            point_id = window_ids[j]
+
+            # Keyword docs upsert sparse-only points; the loop is driven off
+            # ``sparse_embeddings`` so the chunk count stays correct when
+            # ``dense_embeddings`` is empty. See build_point_vector for the rationale.
+            point_vector = build_point_vector(
+                sparse_emb, dense_embeddings, j, dense_enabled=dense_for_doc
             )
-        )
 
-    # Delete placeholder before writing real vectors
-    # This prevents duplicates and cleans up the placeholder state
-    try:
-        await delete_placeholder_point(
-            doc_id=doc_task.doc_id,
-            doc_type=doc_task.doc_type,
-            user_id=doc_task.user_id,
-        )
-    except Exception as e:
-        # Log but don't fail indexing if placeholder deletion fails
-        logger.warning(
-            "Failed to delete placeholder for %s_%s: %s",
-            doc_task.doc_type,
-            doc_task.doc_id,
-            e,
-        )
+            # Last page of a packed multi-page chunk (Deck #636); falls back to
+            # page_number for single-page and char-path chunks so the citation
+            # range is always set.
+            page_end = resolve_page_end(chunk)
 
-    # Upsert to Qdrant in batches. Now that we no longer embed PNG payloads,
-    # per-point payloads are small (chunk text + small metadata), so we can
-    # safely use a larger batch size.
-    BATCH_SIZE = 100
-    with trace_operation(
-        "vector_sync.qdrant_upsert",
-        attributes={
-            "vector_sync.point_count": len(points),
-            "vector_sync.collection": settings.get_collection_name(),
-            "vector_sync.bboxes_count": len(chunk_bboxes),
-            "vector_sync.batch_size": BATCH_SIZE,
-        },
-    ):
-        for batch_start in range(0, len(points), BATCH_SIZE):
-            batch_end = min(batch_start + BATCH_SIZE, len(points))
-            batch = points[batch_start:batch_end]
-            await qdrant_client.upsert(
+            points.append(
+                PointStruct(
+                    id=point_id,
+                    vector=point_vector,
+                    payload={
+                        "user_id": doc_task.user_id,
+                        # owner_id is the UID of the file's owner — what
+                        # search-time ACL expansion filters on. Today the scanner
+                        # always runs as the file's owner (per-user crawl, only
+                        # surfaces files the user owns or that fall under their
+                        # WebDAV root), so owner_id == user_id is correct for
+                        # every doc type indexed here. The fields are kept
+                        # separate so a future indexer change that lets a user
+                        # crawl shared-with-them content can set owner_id to the
+                        # true owner without losing the "who indexed this" trail.
+                        "owner_id": doc_task.owner_id or doc_task.user_id,
+                        # Observed-access ACL set: every user whose scanner has seen
+                        # (hence can read) this document. Seeded with the indexer (and
+                        # owner, if distinct); grown lazily as other readers' scanners
+                        # hit the tenant-wide dedup path. Search ORs a
+                        # MatchAny(acl_principals, ["user:<me>"]) branch so a
+                        # deduplicated shared file stays findable by every reader.
+                        "acl_principals": _acl_principals,
+                        "doc_id": doc_task.doc_id,
+                        "doc_type": doc_task.doc_type,
+                        "is_placeholder": False,  # Real indexed document (not placeholder)
+                        "title": title,
+                        "excerpt": chunk.text,  # Full chunk text (up to chunk_size, default 2048 chars)
+                        "indexed_at": indexed_at,
+                        "modified_at": doc_task.modified_at,
+                        "etag": etag,
+                        "chunk_index": i,
+                        payload_keys.CHUNK_HASH: chunk_hashes[i],
+                        "total_chunks": len(chunks),
+                        "chunk_start_offset": chunk.start_offset,
+                        "chunk_end_offset": chunk.end_offset,
+                        "metadata_version": 2,  # v2 includes position metadata
+                        # Raw source size (bytes) at ingestion — the denominator the
+                        # current-corpus density snapshot needs, previously discarded
+                        # after embedding. Same on every chunk of the document.
+                        payload_keys.SOURCE_BYTES: source_bytes,
+                        # Decomposition payload keys (design §10.2), additive.
+                        payload_keys.PROCESSOR_VERSION: "monolith-v1",
+                        payload_keys.PARSED_AT: indexed_at,
+                        # Actual tier that produced this doc (registry stamps it on
+                        # the result metadata); non-PDF doc types stay "fast".
+                        payload_keys.PIPELINE_TIER: file_metadata.get(
+                            "pipeline_tier", "fast"
+                        ),
+                        payload_keys.EMBEDDING_IDENTITY: _embedding_identity,
+                        # Per-document index mode: "hybrid" (this point carries a
+                        # dense vector) or "keyword" (sparse-only). Drives verify-on-
+                        # read tag selection, the dedup monotonic rule, and billing.
+                        payload_keys.INDEX_MODE: doc_task.index_mode,
+                        payload_keys.ACL_HASH: _acl_hash,
+                        # File-specific metadata (PDF, etc.)
+                        **(
+                            {
+                                "file_path": file_path,  # Store file path for retrieval
+                                # ADR-033 Phase 3: ancestor folder fileids for the
+                                # folder-scope search filter (same value on every
+                                # chunk). Omitted implicitly when resolution yielded
+                                # nothing — search then uses the file_path fallback.
+                                payload_keys.FOLDER_ANCESTORS: _folder_ancestors,
+                                # Cross-fileid content address; absent when the
+                                # dedup is disabled or the hash failed.
+                                **(
+                                    {payload_keys.CONTENT_HASH: content_hash}
+                                    if content_hash
+                                    else {}
+                                ),
+                                "mime_type": content_type,  # From WebDAV response
+                                "file_size": file_metadata.get("file_size"),
+                                "page_number": chunk.page_number,
+                                "page_end": page_end,
+                                "page_count": file_metadata.get("page_count"),
+                                "author": file_metadata.get("author"),
+                                "creation_date": file_metadata.get("creation_date"),
+                                "has_images": file_metadata.get("has_images", False),
+                                "image_count": file_metadata.get("image_count", 0),
+                            }
+                            if doc_task.doc_type == "file"
+                            else {}
+                        ),
+                        # News item-specific metadata
+                        **(
+                            {
+                                "feed_id": file_metadata.get("feed_id"),
+                                "feed_title": file_metadata.get("feed_title"),
+                                "author": file_metadata.get("author"),
+                                "pub_date": file_metadata.get("pub_date"),
+                                "starred": file_metadata.get("starred"),
+                                "unread": file_metadata.get("unread"),
+                                "url": file_metadata.get("url"),
+                                "guid_hash": file_metadata.get("guid_hash"),
+                                "enclosure_link": file_metadata.get("enclosure_link"),
+                                "enclosure_mime": file_metadata.get("enclosure_mime"),
+                            }
+                            if doc_task.doc_type == "news_item"
+                            else {}
+                        ),
+                        # Deck card-specific metadata
+                        **(
+                            {
+                                "board_id": file_metadata.get("board_id"),
+                                "board_title": file_metadata.get("board_title"),
+                                "stack_id": file_metadata.get("stack_id"),
+                                "stack_title": file_metadata.get("stack_title"),
+                                "card_type": file_metadata.get("card_type"),
+                                "duedate": file_metadata.get("duedate"),
+                                "owner": file_metadata.get("owner"),
+                            }
+                            if doc_task.doc_type == "deck_card"
+                            else {}
+                        ),
+                        # Mail message-specific metadata
+                        **(
+                            {
+                                "subject": file_metadata.get("subject"),
+                                "from": file_metadata.get("from"),
+                                "to": file_metadata.get("to"),
+                                "cc": file_metadata.get("cc"),
+                                "bcc": file_metadata.get("bcc"),
+                                "date_int": file_metadata.get("date_int"),
+                                "has_attachments": file_metadata.get("has_attachments"),
+                                "account_id": file_metadata.get("account_id"),
+                                "mailbox_id": file_metadata.get("mailbox_id"),
+                            }
+                            if doc_task.doc_type == "mail_message"
+                            else {}
+                        ),
+                        # Chunk bbox (PDF only) — normalized rectangles in [0,1]
+                        # relative to page width/height. Replaces the legacy
+                        # `highlighted_page_image` (Deck #76). The page number
+                        # comes from `page_number` (set above for PDF chunks).
+                        # ``bbox_source`` records provenance ("ocr" = gateway-provided
+                        # surya geometry, "pymupdf" = local text-search).
+                        **(
+                            {
+                                "chunk_bbox": chunk_bboxes[j],
+                                "bbox_source": bbox_sources[j],
+                            }
+                            if j in chunk_bboxes
+                            else {}
+                        ),
+                    },
+                )
+            )
+
+        # Delete placeholder before writing real vectors
+        # This prevents duplicates and cleans up the placeholder state
+        if window_number == 0:
+            try:
+                await delete_placeholder_point(
+                    doc_id=doc_task.doc_id,
+                    doc_type=doc_task.doc_type,
+                    user_id=doc_task.user_id,
+                )
+            except Exception as e:
+                # Log but don't fail indexing if placeholder deletion fails
+                logger.warning(
+                    "Failed to delete placeholder for %s_%s: %s",
+                    doc_task.doc_type,
+                    doc_task.doc_id,
+                    e,
+                )
+
+        # Diff mode: against the stored points, write only what changed (see
+        # vector/diff_upsert.py). Without a prior scroll (disabled, or it failed)
+        # every point is upserted, which is always correct but leaves any vanished
+        # chunk positions behind. A window of a streamed document only sees its
+        # own positions; vanished ones are deleted after the last window.
+        diff_write = settings.vector_sync_diff_upsert and prior_points is not None
+        write_plan = (
+            plan_point_writes(points, prior_points or [], delete_missing=not streamed)
+            if diff_write
+            else PointWritePlan(upserts=points)
+        )
+        with trace_operation(
+            "vector_sync.qdrant_upsert",
+            attributes={
+                "vector_sync.point_count": len(points),
+                "vector_sync.upserted_count": len(write_plan.upserts),
+                "vector_sync.patched_count": write_plan.patched,
+                "vector_sync.deleted_count": len(write_plan.deletes),
+                "vector_sync.collection": settings.get_collection_name(),
+                "vector_sync.bboxes_count": len(chunk_bboxes),
+                "vector_sync.batch_size": BATCH_SIZE,
+                "vector_sync.bulk_load": bulk_load,
+            },
+        ):
+            await apply_point_writes(
+                qdrant_client,
                 collection_name=settings.get_collection_name(),
-                points=batch,
-                wait=True,
+                plan=write_plan,
+                batch_size=BATCH_SIZE,
+                bulk=bulk_load,
             )
-            if batch_end < len(points):
-                logger.debug(
-                    "Upserted batch %s/%s",
-                    batch_start // BATCH_SIZE + 1,
-                    (len(points) + BATCH_SIZE - 1) // BATCH_SIZE,
+        if diff_write:
+            logger.debug(
+                "Diff write for %s_%s: %s upserted, %s patched, %s deleted, %s unchanged",
+                doc_task.doc_type,
+                doc_task.doc_id,
+                len(write_plan.upserts),
+                write_plan.patched,
+                len(write_plan.deletes),
+                write_plan.unchanged,
+            )
+        if streamed:
+            logger.debug(
+                "Wrote window %s/%s (chunks %s-%s) of %s_%s",
+                window_number + 1,
+                len(windows),
+                window.start,
+                window.stop - 1,
+                doc_task.doc_type,
+                doc_task.doc_id,
+            )
+
+    # A streamed document's vanished chunk positions (it got shorter): every
+    # stored point whose id is not one of the new positions. Best-effort, like
+    # the prior scroll; a failure leaves them for the next re-index.
+    if streamed and settings.vector_sync_diff_upsert:
+        current_ids = {
+            chunk_point_id(doc_task.doc_type, doc_task.doc_id, i)
+            for i in range(len(chunks))
+        }
+        try:
+            stale_ids = (
+                await load_prior_point_ids(
+                    qdrant_client,
+                    collection_name=settings.get_collection_name(),
+                    doc_id=doc_task.doc_id,
+                    doc_type=doc_task.doc_type,
                 )
+                - current_ids
+            )
+        except Exception as exc:  # noqa: BLE001 — cleanup is best-effort
+            logger.debug(
+                "Could not list stored points of %s_%s (%s); stale chunks kept",
+                doc_task.doc_type,
+                doc_task.doc_id,
+                exc,
+            )
+            stale_ids = set()
+        if stale_ids:
+            await apply_point_writes(
+                qdrant_client,
+                collection_name=settings.get_collection_name(),
+                plan=PointWritePlan(deletes=sorted(stale_ids)),
+                batch_size=BATCH_SIZE,
+            )
+
+    # Usage metering (Deck #67), recorded once per document AFTER every window's
+    # embedding/sparse task group so it covers BOTH modes (byte + page dimensions for
+    # keyword and hybrid alike; embedding tokens are hybrid-only via
+    # dense_embed_tokens, which stays 0 for keyword docs). Best-effort and
+    # flag-gated; placed after processing succeeds so it can never affect the
+    # indexing path. ``page_count`` is set by the document processors for PDFs
+    # and absent for text types. Narrow defensively: file_metadata values are
+    # loosely typed, so a malformed page_count meters as "no pages"; bool is an
+    # int subclass, so exclude it explicitly.
+    _meter_total_chars = sum(len(t) for t in chunk_texts)
+    _meter_raw_page_count = file_metadata.get("page_count")
+    _meter_pipeline_tier = file_metadata.get("pipeline_tier")
+    await record_indexing_usage(
+        enabled=settings.usage_metering_enabled,
+        provider=settings.get_embedding_provider_family(),
+        model=settings.get_embedding_model_name(),
+        doc_type=doc_task.doc_type,
+        user_id=doc_task.user_id,
+        index_mode=doc_task.index_mode,
+        chunk_count=len(chunk_texts),
+        token_count=dense_embed_tokens,
+        total_chars=_meter_total_chars,
+        page_count=(
+            _meter_raw_page_count
+            if isinstance(_meter_raw_page_count, int)
+            and not isinstance(_meter_raw_page_count, bool)
+            else None
+        ),
+        # bytes_ingested: raw source size at ingestion (raw WebDAV binary for
+        # files, UTF-8 text size for text doc types — note, deck_card,
+        # news_item, mail_message). See helper.
+        bytes_ingested=ingested_byte_size(source.size if source else None, content),
+        # bytes_stored: UTF-8 size of the chunk texts persisted as Qdrant payload
+        # excerpts (includes chunk-overlap duplication).
+        bytes_stored=sum(len(t.encode("utf-8")) for t in chunk_texts),
+        # Tier that produced the parsed pages (registry stamps it on the result
+        # metadata); text doc types stay "fast". Narrow defensively to str|None.
+        pipeline_tier=(
+            _meter_pipeline_tier if isinstance(_meter_pipeline_tier, str) else None
+        ),
+    )
+
+    # Observability-only cost signals (card #624), independent of USAGE_METERING.
+    # Best-effort and self-contained in the helper so a metrics failure can never
+    # disturb indexing.
+    _record_ingest_vector_cost(
+        doc_type=doc_task.doc_type,
+        chunk_count=len(chunk_texts),
+        source_bytes=source_bytes,
+        dense_for_doc=dense_for_doc,
+        overhead=settings.vector_ram_hnsw_overhead_factor,
+    )
 
     # A successful (re-)index supersedes any prior failure record: clear the
     # marker (e.g. the file was fixed/replaced, or a new escalation tier finally
@@ -2382,6 +2977,10 @@ async def _index_document_inner(
     if doc_task.doc_type == "file" and doc_task.etag:
         await clear_dead_letter(doc_task.doc_id, doc_task.doc_type)
 
+    await _record_manifest_entry(
+        doc_task, etag=etag, chunk_count=len(chunks), acl_principals=_acl_principals
+    )
+
     logger.info(
         "Indexed %s_%s for %s (%s chunks)",
         doc_task.doc_type,
@@ -124,6 +124,13 @@ _PAYLOAD_INDEX_FIELDS: dict[str, PayloadSchemaType] = {
     # exact string match; idempotent startup migration like the fields above, so
     # existing collections gain it with no content re-index and no operator action.
     "index_mode": PayloadSchemaType.KEYWORD,
+    # content_sha256 is the cross-fileid content address (payload_keys.
+    # CONTENT_HASH): before parsing a file the processor scrolls for another
+    # document's real points carrying the same hash, and copies them instead of
+    # re-parsing and re-embedding identical bytes (see
+    # vector/sharing_state.find_identical_content). KEYWORD for exact match;
+    # idempotent startup migration like the fields above.
+    "content_sha256": PayloadSchemaType.KEYWORD,
 }
 
 # Sentinel point that records "this collection has been backfilled to str
@@ -1,6 +1,7 @@
 """Ingest-path ports & adapters (design §10, hexagonal; Deck #183)."""
 
 from .factory import build_producer
+from .lanes import LaneScheduler
 from .memory import MemoryTaskProducer
 from .ports import TaskProducer
 from .transport import (
@@ -14,6 +15,7 @@ from .transport import (
 __all__ = [
     "DistributedTransport",
     "IngestTransport",
+    "LaneScheduler",
     "LocalTransport",
     "MemoryTaskProducer",
     "SpawnWorker",
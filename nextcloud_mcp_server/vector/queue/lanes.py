@@ -0,0 +1,191 @@
+"""Ingest lanes: recent edits ahead of bulk backfill, fair across users.
+
+Every queued ``DocumentTask`` belongs to one of two lanes (:func:`lane_for_task`):
+
+- ``interactive`` — deletes, and documents modified within
+  ``INGEST_INTERACTIVE_WINDOW_SECONDS``: webhook events and the edits a periodic
+  scan picks up.
+- ``backfill`` — anything older: a new user's first scans, a freshly tagged
+  folder, a re-index.
+
+Both backends order work by start-time fair queueing (:class:`FairShareClock`).
+Each ``(lane, user)`` pair is a flow; a task is stamped ``max(virtual time, the
+flow's last stamp) + tick(lane)`` and the lowest stamp runs first, so
+
+- the flows of a lane are served round-robin: a user with 50,000 backlogged
+  files holds one turn per round, not the head of the queue;
+- a lane's weight (``INGEST_INTERACTIVE_LANE_WEIGHT`` /
+  ``INGEST_BACKFILL_LANE_WEIGHT``) divides its tick, so an interactive flow gets
+  that many turns per backfill turn and a just-edited note lands next to the
+  head of the queue instead of behind the backlog, without starving backfill.
+
+The memory backend keeps the stamped tasks in a heap (:class:`LaneScheduler`).
+The postgres backend writes ``-stamp`` as the procrastinate job ``priority``
+(fetched ``priority DESC, id ASC``) and reads its virtual time off the head of
+the queue (see ``ProcrastinateTaskProducer``).
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ..scanner import DocumentTask
+
+INGEST_LANE_INTERACTIVE = "interactive"
+INGEST_LANE_BACKFILL = "backfill"
+INGEST_LANES: tuple[str, ...] = (INGEST_LANE_INTERACTIVE, INGEST_LANE_BACKFILL)
+
+# Defaults of INGEST_INTERACTIVE_LANE_WEIGHT / INGEST_BACKFILL_LANE_WEIGHT and
+# INGEST_INTERACTIVE_WINDOW_SECONDS, for a scheduler built without settings.
+DEFAULT_LANE_WEIGHTS: dict[str, int] = {
+    INGEST_LANE_INTERACTIVE: 10,
+    INGEST_LANE_BACKFILL: 1,
+}
+DEFAULT_INTERACTIVE_WINDOW_SECONDS = 86400
+
+# Upper bounds (seconds) of the queue-wait buckets. Buckets are cumulative, like
+# a Prometheus histogram: "+Inf" counts every queued job.
+QUEUE_WAIT_BUCKETS: tuple[int, ...] = (10, 60, 300, 1800, 7200, 43200)
+
+
+def lane_for_task(
+    task: DocumentTask, *, interactive_window: int, now: float | None = None
+) -> str:
+    """Lane of ``task``: deletes and recently modified documents are interactive.
+
+    ``modified_at`` is the document's own modification time (epoch seconds), so
+    a webhook event or a scan that found a fresh edit is interactive, while the
+    years-old files of an initial sync are backfill however they were found.
+    """
+    if task.operation == "delete":
+        return INGEST_LANE_INTERACTIVE
+    now = time.time() if now is None else now
+    if task.modified_at >= now - interactive_window:
+        return INGEST_LANE_INTERACTIVE
+    return INGEST_LANE_BACKFILL
+
+
+def lane_ticks(weights: dict[str, int]) -> dict[str, int]:
+    """Stamp increment per lane: the heaviest lane advances by 1 per task."""
+    heaviest = max(weights.values())
+    return {lane: max(1, round(heaviest / weight)) for lane, weight in weights.items()}
+
+
+def lane_weights(settings: Any) -> dict[str, int]:
+    """Lane weights from the ``INGEST_*_LANE_WEIGHT`` settings."""
+    return {
+        INGEST_LANE_INTERACTIVE: settings.ingest_interactive_lane_weight,
+        INGEST_LANE_BACKFILL: settings.ingest_backfill_lane_weight,
+    }
+
+
+def wait_histogram(waits: Iterable[float]) -> dict[str, int]:
+    """Cumulative ``{le: count}`` of queued jobs by seconds waited so far."""
+    counts = dict.fromkeys([*map(str, QUEUE_WAIT_BUCKETS), "+Inf"], 0)
+    for waited in waits:
+        for bound in QUEUE_WAIT_BUCKETS:
+            if waited <= bound:
+                counts[str(bound)] += 1
+        counts["+Inf"] += 1
+    return counts
+
+
+class FairShareClock:
+    """Start-time fair queueing stamps for ``(lane, user)`` flows.
+
+    ``virtual_time`` is the stamp of the task being served; a flow that has
+    nothing queued beyond it starts again from there, so an idle user's next
+    task is served within one round whatever other flows have queued.
+    """
+
+    def __init__(self, ticks: dict[str, int]):
+        self._ticks = ticks
+        self._last: dict[tuple[str, str], int] = {}
+        self.virtual_time = 0
+
+    def peek(self, lane: str, user_id: str) -> int:
+        """The stamp the flow's next task gets, without recording it."""
+        last = self._last.get((lane, user_id), 0)
+        return max(self.virtual_time, last) + self._ticks[lane]
+
+    def commit(self, lane: str, user_id: str, stamp: int) -> None:
+        """Record that the flow queued a task at ``stamp``."""
+        self._last[(lane, user_id)] = stamp
+
+    def stamp(self, lane: str, user_id: str) -> int:
+        stamp = self.peek(lane, user_id)
+        self.commit(lane, user_id, stamp)
+        return stamp
+
+    def advance(self, virtual_time: int) -> None:
+        """Move to the stamp now being served and forget flows it has passed."""
+        if virtual_time <= self.virtual_time:
+            return
+        self.virtual_time = virtual_time
+        self._last = {
+            flow: last for flow, last in self._last.items() if last > virtual_time
+        }
+
+    def reset(self) -> None:
+        """The queue drained: every flow starts from zero again."""
+        self.virtual_time = 0
+        self._last.clear()
+
+
+class LaneScheduler:
+    """Fair queue of ``DocumentTask``s for the in-process (memory) backend.
+
+    Not thread-safe and not bounded on its own: ``LocalTransport`` calls it from
+    one dispatcher and enforces the capacity.
+    """
+
+    def __init__(
+        self,
+        weights: dict[str, int] | None = None,
+        interactive_window: int = DEFAULT_INTERACTIVE_WINDOW_SECONDS,
+    ):
+        self._clock = FairShareClock(lane_ticks(weights or DEFAULT_LANE_WEIGHTS))
+        self._window = interactive_window
+        # (stamp, arrival order, lane, monotonic enqueue time, task)
+        self._heap: list[tuple[int, int, str, float, DocumentTask]] = []
+        self._order = itertools.count()
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> LaneScheduler:
+        return cls(
+            lane_weights(settings),
+            settings.ingest_interactive_window_seconds,
+        )
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, task: DocumentTask) -> None:
+        lane = lane_for_task(task, interactive_window=self._window)
+        stamp = self._clock.stamp(lane, task.user_id)
+        heapq.heappush(
+            self._heap, (stamp, next(self._order), lane, time.monotonic(), task)
+        )
+
+    def pop(self) -> DocumentTask:
+        stamp, _, _, _, task = heapq.heappop(self._heap)
+        if self._heap:
+            self._clock.advance(stamp)
+        else:
+            self._clock.reset()
+        return task
+
+    def wait_by_lane(self) -> dict[str, dict[str, int]]:
+        """Queue-wait histogram of the held tasks, per lane."""
+        now = time.monotonic()
+        return {
+            lane: wait_histogram(
+                now - queued for _, _, held, queued, _ in self._heap if held == lane
+            )
+            for lane in INGEST_LANES
+        }
@@ -6,6 +6,10 @@ third-party class). Semantics are identical to using the stream directly:
 ``send`` enqueues, ``clone`` yields an independent per-user handle, ``async
 with`` / ``aclose`` close the (cloned) send end so the processor pool's
 receivers observe end-of-stream.
+
+Under :class:`LocalTransport` the stream feeds a :class:`LaneScheduler`, which
+holds the queued tasks; the producer then reports the queue depth and per-lane
+wait from it, like the procrastinate producer does from Postgres.
 """
 
 from __future__ import annotations
@@ -17,17 +21,39 @@ from anyio.streams.memory import MemoryObjectSendStream
 
 if TYPE_CHECKING:
     from ..scanner import DocumentTask
+    from .lanes import LaneScheduler
+
+# Queue label of the in-process queue in the per-queue wait breakdown.
+MEMORY_QUEUE_NAME = "memory"
 
 
 class MemoryTaskProducer:
-    def __init__(self, stream: MemoryObjectSendStream[DocumentTask]):
+    def __init__(
+        self,
+        stream: MemoryObjectSendStream[DocumentTask],
+        scheduler: LaneScheduler | None = None,
+    ):
         self._stream = stream
+        self._scheduler = scheduler
 
     async def send(self, task: DocumentTask, /) -> None:
         await self._stream.send(task)
 
     def clone(self) -> MemoryTaskProducer:
-        return MemoryTaskProducer(self._stream.clone())
+        return MemoryTaskProducer(self._stream.clone(), self._scheduler)
+
+    def queue_depth(self) -> int:
+        """Tasks sent but not yet handed to a worker."""
+        depth = self._stream.statistics().current_buffer_used
+        if self._scheduler is not None:
+            depth += len(self._scheduler)
+        return depth
+
+    async def queue_wait_by_lane(self) -> dict[str, dict[str, dict[str, int]]]:
+        """``{queue: {lane: {le: count}}}`` for the in-process queue."""
+        if self._scheduler is None:
+            return {}
+        return {MEMORY_QUEUE_NAME: self._scheduler.wait_by_lane()}
 
     async def __aenter__(self) -> MemoryTaskProducer:
         await self._stream.__aenter__()
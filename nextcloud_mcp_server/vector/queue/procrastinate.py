@@ -30,16 +30,21 @@ Design notes:
 - Tasks are defined on a :class:`procrastinate.Blueprint` so the connector is
   decoupled from the task registry: production binds a real
   :class:`PsycopgConnector`; unit tests bind ``testing.InMemoryConnector``.
+- **Lanes.** The producer stamps each job's ``priority`` from the fair-share
+  clock in ``lanes.py``, so recent edits run ahead of bulk backfill and users
+  are served round-robin; procrastinate fetches ``priority DESC, id ASC`` and
+  keeps the priority across retries and tier hops.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 import warnings
 from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final, LiteralString, cast
 
 from procrastinate import (
     App,
@@ -57,6 +62,15 @@ from procrastinate.manager import QUEUEING_LOCK_CONSTRAINT
 from ...config import get_procrastinate_conninfo, get_settings
 from .. import payload_keys
 from ..scanner import DocumentTask
+from .lanes import (
+    INGEST_LANE_BACKFILL,
+    INGEST_LANE_INTERACTIVE,
+    QUEUE_WAIT_BUCKETS,
+    FairShareClock,
+    lane_for_task,
+    lane_ticks,
+    lane_weights,
+)
 
 if TYPE_CHECKING:
     from ...client import NextcloudClient
@@ -178,7 +192,9 @@ async def process_document_task(
     ``await_func(**job.task_kwargs)``, so every :class:`DocumentTask` field must
     be accepted here with a default (an older producer's payload omits new
     fields) and ``**_forward_compat`` absorbs fields a newer producer adds, so a
-    version skew degrades to ignoring them rather than failing the job.
+    version skew degrades to ignoring them rather than failing the job. It also
+    absorbs the ``lane`` / ``enqueued_at`` queue metadata the producer adds for
+    :func:`get_ingest_queue_wait_by_lane`.
 
     Queue-aware (Deck #323): the tier this worker runs is the tier of the job's
     current queue. A low-quality parse raises ``EscalateError``, which the
@@ -706,6 +722,76 @@ async def get_ingest_job_counts(app: App | None = None) -> dict[str, int]:
     return counts
 
 
+_QUEUE_WAIT_BUCKET_COLUMNS = ", ".join(
+    f"count(*) FILTER (WHERE waited <= {bound}) AS le_{bound}"
+    for bound in QUEUE_WAIT_BUCKETS
+)
+# Jobs deferred before lanes shipped carry neither key: they count as backfill,
+# in the +Inf bucket only. Interpolated from module constants only (no input),
+# so it is a literal query as far as the driver is concerned.
+_QUEUE_WAIT_QUERY: Final = cast(
+    LiteralString,
+    f"""
+SELECT queue_name, lane, {_QUEUE_WAIT_BUCKET_COLUMNS}, count(*) AS le_inf
+FROM (
+    SELECT queue_name,
+           coalesce(args->>'lane', '{INGEST_LANE_BACKFILL}') AS lane,
+           extract(epoch FROM now()) - (args->>'enqueued_at')::float8 AS waited
+    FROM procrastinate_jobs
+    WHERE status = 'todo' AND queue_name = ANY(%(queues)s)
+) AS queued
+GROUP BY queue_name, lane
+""",
+)
+
+
+async def get_ingest_queue_wait_by_lane(
+    app: App | None = None,
+) -> dict[str, dict[str, dict[str, int]]]:
+    """How long queued (``todo``) ingest jobs have waited, per queue and lane.
+
+    Returns ``{queue_name: {lane: {le: count}}}`` with cumulative buckets
+    (``lanes.QUEUE_WAIT_BUCKETS`` seconds, then ``"+Inf"``), measured from the
+    ``enqueued_at`` the producer writes into the job args. Hand-written SQL: the
+    manager API has no per-job age aggregate. Assumes the app's connector is
+    already open. Feeds the ``astrolabe_ingest_queue_wait_jobs`` gauge.
+    """
+    app = app or get_procrastinate_app()
+    rows = await app.connector.execute_query_all_async(
+        _QUEUE_WAIT_QUERY, queues=list(_MANAGED_QUEUES)
+    )
+    by_queue: dict[str, dict[str, dict[str, int]]] = {}
+    for row in rows:
+        buckets = {str(bound): int(row[f"le_{bound}"]) for bound in QUEUE_WAIT_BUCKETS}
+        buckets["+Inf"] = int(row["le_inf"])
+        by_queue.setdefault(row["queue_name"], {})[row["lane"]] = buckets
+    return by_queue
+
+
+# Highest priority among the runnable jobs of a queue: minus the fair-share stamp
+# being served, i.e. the producer's virtual time.
+_QUEUE_HEAD_QUERY = """
+SELECT max(priority) AS head
+FROM procrastinate_jobs
+WHERE status = 'todo' AND queue_name = %(queue)s
+  AND (scheduled_at IS NULL OR scheduled_at <= now())
+"""
+
+# A webhook edit for a document whose backfill job is still queued: lift that job
+# into the interactive lane instead of leaving it behind the backlog.
+_PROMOTE_QUERY = """
+UPDATE procrastinate_jobs
+SET priority = greatest(priority, %(priority)s),
+    args = args || jsonb_build_object('lane', %(lane)s::text)
+WHERE queueing_lock = %(queueing_lock)s AND status = 'todo'
+"""
+
+# procrastinate's priority column is an int4.
+_MIN_PRIORITY = -(2**31 - 1)
+# How often (seconds) send() re-reads the queue head for the fair-share clock.
+_CLOCK_REFRESH_SECONDS = 5.0
+
+
 def _doc_queueing_lock(task: DocumentTask) -> str:
     """Per-document enqueue-dedup key (partial-unique on ``status='todo'``).
 
@@ -730,10 +816,18 @@ class ProcrastinateTaskProducer:
     The App's connector pool is owned by the server lifespan (opened once,
     closed on shutdown), so ``clone``/``aenter``/``aexit``/``aclose`` are no-ops
     — there is no per-handle resource like the memory stream's clones.
+
+    Each job's ``priority`` comes from a per-process :class:`FairShareClock`
+    whose virtual time follows the head of the queue (re-read at most every
+    ``_CLOCK_REFRESH_SECONDS``). Several API pods each keep their own clock, so
+    fairness across pods is approximate; the lane split is not.
     """
 
     def __init__(self, app: App):
         self._app = app
+        self._clock: FairShareClock | None = None
+        self._interactive_window = 0
+        self._clock_read_at = float("-inf")
 
     @classmethod
     async def connect(cls) -> ProcrastinateTaskProducer:
@@ -749,20 +843,71 @@ class ProcrastinateTaskProducer:
 
     async def send(self, task: DocumentTask, /) -> None:
         key = _doc_queueing_lock(task)
+        clock = await self._lane_clock()
+        lane = lane_for_task(task, interactive_window=self._interactive_window)
+        stamp = clock.peek(lane, task.user_id)
+        priority = max(-stamp, _MIN_PRIORITY)
         # Always defer onto the cheapest tier's queue; the escalation strategy
         # hops the job up the ladder on a poor parse. queueing_lock is a global
         # partial-unique on status='todo', so a doc mid-escalation on a higher
         # tier still dedupes a fresh enqueue here -- no double-processing.
         deferrer = self._app.configure_task(
-            INGEST_TASK_NAME, queue=DEFAULT_INGEST_QUEUE, queueing_lock=key
+            INGEST_TASK_NAME,
+            queue=DEFAULT_INGEST_QUEUE,
+            queueing_lock=key,
+            priority=priority,
         )
         try:
-            await deferrer.defer_async(**asdict(task))
+            await deferrer.defer_async(
+                **asdict(task), lane=lane, enqueued_at=time.time()
+            )
         except AlreadyEnqueued:
             # A todo job already exists for this doc; the next periodic scan
             # re-evaluates freshness (placeholder/Qdrant modified_at only
             # advances after a successful index), so this is not a lost update.
             logger.debug("ingest.already_enqueued key=%s", key)
+            if lane == INGEST_LANE_INTERACTIVE:
+                await self._promote(key, priority)
+            return
+        # Only a job actually queued takes the flow's turn: a scan re-sending
+        # documents that are still queued must not push the user's next ones
+        # further back.
+        clock.commit(lane, task.user_id, stamp)
+
+    async def _lane_clock(self) -> FairShareClock:
+        """The fair-share clock, its virtual time refreshed from the queue head."""
+        if self._clock is None:
+            settings = get_settings()
+            self._clock = FairShareClock(lane_ticks(lane_weights(settings)))
+            self._interactive_window = settings.ingest_interactive_window_seconds
+        now = time.monotonic()
+        if now - self._clock_read_at >= _CLOCK_REFRESH_SECONDS:
+            self._clock_read_at = now
+            try:
+                row = await self._app.connector.execute_query_one_async(
+                    _QUEUE_HEAD_QUERY, queue=DEFAULT_INGEST_QUEUE
+                )
+            except Exception as e:
+                # Ordering degrades to the last known virtual time; never fail
+                # an enqueue over it.
+                logger.debug("ingest.queue_head_unavailable: %s", e)
+            else:
+                if row["head"] is None:
+                    self._clock.reset()
+                else:
+                    self._clock.advance(-row["head"])
+        return self._clock
+
+    async def _promote(self, queueing_lock: str, priority: int) -> None:
+        try:
+            await self._app.connector.execute_query_async(
+                _PROMOTE_QUERY,
+                queueing_lock=queueing_lock,
+                priority=priority,
+                lane=INGEST_LANE_INTERACTIVE,
+            )
+        except Exception as e:
+            logger.debug("ingest.promote_failed key=%s: %s", queueing_lock, e)
 
     async def ensure_schema(self) -> None:
         """Apply the ingest-queue schema on the producer's already-open pool.
@@ -781,6 +926,10 @@ class ProcrastinateTaskProducer:
         """Per-tier-queue ingest job counts by status (Deck #323)."""
         return await get_ingest_job_counts_by_queue(self._app)
 
+    async def queue_wait_by_lane(self) -> dict[str, dict[str, dict[str, int]]]:
+        """Queue-wait buckets of the queued jobs, per tier queue and lane."""
+        return await get_ingest_queue_wait_by_lane(self._app)
+
     def clone(self) -> ProcrastinateTaskProducer:
         return self
 
@@ -10,8 +10,8 @@ is the composition object that owns *both* sides of one backend:
 Two adapters, selected by ``INGEST_QUEUE`` via :func:`build_transport`:
 
 - :class:`LocalTransport` (``memory`` — the SQLite/dev default): an in-process
-  anyio ``MemoryObjectStream`` drained by a pool of in-process workers that
-  :meth:`run_consumers` starts.
+  anyio ``MemoryObjectStream`` feeding a lane scheduler (``lanes.py``), drained
+  by a pool of in-process workers that :meth:`run_consumers` starts.
 - :class:`DistributedTransport` (``postgres``): wraps the
   :class:`ProcrastinateTaskProducer`; :meth:`run_consumers` is a no-op because
   the consumer is a *separate* process — the ``nextcloud-mcp-server worker``
@@ -31,7 +31,7 @@ structurally; the transport has exactly two in-house adapters that share the
 defaults, so a concrete ABC is simpler and checks more cleanly under ``ty``.
 
 The single-tenant parallelism invariant lives here: :class:`LocalTransport`
-hands every worker a ``clone()`` of *one* shared receive stream, so a tenant's
+hands every worker a ``clone()`` of *one* shared worker stream, so a tenant's
 users are processed by an N-worker pool off a single multiplexed queue
 (per-document, not per-user, dispatch) — never one user fully then the next.
 """
@@ -44,13 +44,14 @@ from collections.abc import Callable, Coroutine
 from typing import TYPE_CHECKING, Any
 
 import anyio
-from anyio.abc import TaskGroup
+from anyio.abc import TaskGroup, TaskStatus
 from anyio.streams.memory import (
     MemoryObjectReceiveStream,
     MemoryObjectSendStream,
 )
 
 from .factory import build_producer
+from .lanes import LaneScheduler
 from .memory import MemoryTaskProducer
 
 if TYPE_CHECKING:
@@ -149,21 +150,34 @@ class IngestTransport(abc.ABC):
 class LocalTransport(IngestTransport):
     """In-process anyio memory stream + processor pool (``INGEST_QUEUE=memory``).
 
-    Builds the paired send/receive streams up front and owns the receive end;
-    :meth:`run_consumers` hands each worker an independent ``clone()`` so every
-    receiver observes end-of-stream when the scanner's send handles all close.
+    Producers send on an unbuffered intake stream; a dispatcher task moves each
+    task into a :class:`LaneScheduler` (at most ``max_buffer_size`` held, so a
+    full queue still blocks the scanner) and hands them, in lane/fair order, to
+    the workers over a second unbuffered stream. :meth:`run_consumers` starts the
+    dispatcher and gives each worker an independent ``clone()`` of that worker
+    stream; when the scanner's send handles all close, the dispatcher drains the
+    scheduler and closes the worker stream, so every receiver observes
+    end-of-stream as before.
     """
 
-    def __init__(self, max_buffer_size: float):
+    def __init__(self, max_buffer_size: float, scheduler: LaneScheduler | None = None):
         # "DocumentTask" as a string (not the symbol): the class is
         # TYPE_CHECKING-only here, and anyio ignores the runtime value of the
         # type argument — so the string is intentional, not a typo.
-        send_stream, receive_stream = anyio.create_memory_object_stream["DocumentTask"](
-            max_buffer_size=max_buffer_size
-        )
+        send_stream, intake_stream = anyio.create_memory_object_stream["DocumentTask"]()
+        worker_send, receive_stream = anyio.create_memory_object_stream[
+            "DocumentTask"
+        ]()
         self._send_stream = send_stream
+        self._intake_stream = intake_stream
+        self._worker_send = worker_send
         self._receive_stream = receive_stream
-        self._producer = MemoryTaskProducer(send_stream)
+        self._scheduler = scheduler if scheduler is not None else LaneScheduler()
+        self._capacity = max(1, max_buffer_size)
+        self._intake_open = True
+        self._changed: anyio.Event | None = None
+        self._dispatch_scope: anyio.CancelScope | None = None
+        self._producer = MemoryTaskProducer(send_stream, self._scheduler)
         self._active_consumer_count = 0
 
     @property
@@ -189,7 +203,10 @@ class LocalTransport(IngestTransport):
     async def run_consumers(
         self, task_group: TaskGroup, spawn_worker: SpawnWorker, count: int
     ) -> None:
-        # One shared receive stream, N workers each draining a clone → a single
+        # The dispatcher first, so the scanner's sends are accepted as soon as
+        # the workers are up.
+        await task_group.start(self._run_dispatcher)
+        # One shared worker stream, N workers each draining a clone → a single
         # multiplexed queue processed with N-way parallelism across all users in
         # the tenant (per-document dispatch). ``start`` (not ``start_soon``)
         # waits for each worker's ``task_status.started()`` readiness, matching
@@ -201,15 +218,72 @@ class LocalTransport(IngestTransport):
             # how many workers were actually live.
             self._active_consumer_count += 1
 
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+        self._changed = anyio.Event()
+
+    async def _wait_for_change(self) -> None:
+        if self._changed is None:
+            self._changed = anyio.Event()
+        await self._changed.wait()
+
+    async def _run_dispatcher(
+        self, *, task_status: TaskStatus = anyio.TASK_STATUS_IGNORED
+    ) -> None:
+        with anyio.CancelScope() as scope:
+            self._dispatch_scope = scope
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(self._run_intake)
+                task_status.started()
+                await self._dispatch()
+
+    async def _run_intake(self) -> None:
+        async with self._intake_stream:
+            while True:
+                while len(self._scheduler) >= self._capacity:
+                    await self._wait_for_change()
+                try:
+                    task = await self._intake_stream.receive()
+                except anyio.EndOfStream:
+                    break
+                self._scheduler.push(task)
+                self._notify()
+        self._intake_open = False
+        self._notify()
+
+    async def _dispatch(self) -> None:
+        async with self._worker_send:
+            while True:
+                while not self._scheduler and self._intake_open:
+                    await self._wait_for_change()
+                if not self._scheduler:
+                    return  # every producer closed and the queue is drained
+                # Popped before a worker is free, so a task that arrives while
+                # all workers are busy can be overtaken by at most this one.
+                task = self._scheduler.pop()
+                self._notify()
+                try:
+                    await self._worker_send.send(task)
+                except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                    return
+
     async def aclose(self) -> None:
-        # Belt-and-suspenders cleanup of the two stream ends this transport owns,
-        # so they don't linger until GC (which can emit unclosed-resource
-        # warnings under the test runner / alternative runtimes). anyio's aclose
-        # is idempotent, so the scanner's own ``async with`` on the send side
-        # (single-user) closing it first is harmless; worker receive *clones* are
-        # independent handles, closed by task-group cancellation. By shutdown the
-        # ``shutdown_event`` is already set, so the scanner is winding down rather
-        # than issuing fresh sends.
+        # Stop the dispatcher (its ``async with`` blocks close the intake and the
+        # worker send end, so idle workers see end-of-stream and sends after
+        # shutdown fail fast instead of blocking), then close the stream ends
+        # this transport owns so they don't linger until GC (which can emit
+        # unclosed-resource warnings under the test runner / alternative
+        # runtimes). anyio's aclose is idempotent, so the scanner's own ``async
+        # with`` on the send side (single-user) closing it first is harmless;
+        # worker receive *clones* are independent handles. By shutdown the
+        # ``shutdown_event`` is already set, so the scanner is winding down
+        # rather than issuing fresh sends.
+        if self._dispatch_scope is not None:
+            self._dispatch_scope.cancel()
+        else:
+            await self._intake_stream.aclose()
+            await self._worker_send.aclose()
         await self._send_stream.aclose()
         await self._receive_stream.aclose()
 
@@ -263,4 +337,7 @@ async def build_transport(settings: Settings) -> IngestTransport:
         return DistributedTransport(producer)
 
     logger.info("Ingest queue: memory (in-process anyio stream + processor pool)")
-    return LocalTransport(max_buffer_size=settings.vector_sync_queue_max_size)
+    return LocalTransport(
+        max_buffer_size=settings.vector_sync_queue_max_size,
+        scheduler=LaneScheduler.from_settings(settings),
+    )
@@ -0,0 +1,298 @@
+"""Process-wide scheduler for the multi-user background scanners.
+
+``user_manager_task`` runs one ``user_scanner_task`` per provisioned user. Each
+used to sleep a fixed ``VECTOR_SYNC_SCAN_INTERVAL`` between scans and scan as
+soon as it woke. Scanners started together (every user at pod start) therefore
+stayed in lockstep and hit Nextcloud and Qdrant as one burst per interval, a
+burst that grew with the user count. The scanner tasks now share one
+:class:`ScanScheduler`, which decides when each of them may scan:
+
+- At most ``VECTOR_SYNC_MAX_CONCURRENT_SCANS`` scans run at once per process. A
+  scanner that is due waits in :meth:`ScanScheduler.scan_slot` for a free slot.
+- Free slots go out by :class:`ScanLane`, first come first served within a
+  lane: users woken by a webhook (:meth:`ScanScheduler.wake`), then the first
+  scan of a user provisioned while the process runs, then routine backstop
+  scans. A burst of idle users cannot hold up a user with fresh changes.
+- Each user's interval follows their change rate. A scan that queued work halves
+  it (down to ``VECTOR_SYNC_SCAN_INTERVAL_MIN``), and one that found nothing
+  grows it by half (up to ``VECTOR_SYNC_SCAN_INTERVAL_MAX``). New users start
+  at ``VECTOR_SYNC_SCAN_INTERVAL``.
+- Every delay is jittered by ``±VECTOR_SYNC_SCAN_JITTER`` (a fraction of the
+  interval), and users found at startup start at a random point within the
+  first jitter window, so scanners drift apart instead of staying in lockstep.
+
+The scheduler is plain in-process state. Like the scanners it serves, it is
+per pod, and a restart starts every user over at the base interval.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+import anyio
+
+from nextcloud_mcp_server.config import Settings, get_settings
+from nextcloud_mcp_server.observability.metrics import (
+    clear_vector_sync_scan_schedule,
+    record_vector_sync_scan_lag,
+    set_vector_sync_scan_next,
+    set_vector_sync_scans_waiting,
+)
+
+logger = logging.getLogger(__name__)
+
+# Interval multipliers applied after each scan: a scan that queued work brings
+# the user's next scan closer, an idle scan pushes it out.
+_ACTIVE_FACTOR = 0.5
+_IDLE_FACTOR = 1.5
+
+
+class ScanLane(IntEnum):
+    """Admission priority for a waiting scan (lower is admitted first)."""
+
+    WAKE = 0
+    INITIAL = 1
+    BACKSTOP = 2
+
+
+@dataclass
+class _UserSchedule:
+    """Scheduling state for one registered user."""
+
+    interval: float
+    due_at: float
+    lane: ScanLane
+    last_started_at: float | None = None
+    running: bool = False
+    # Earliest start for a wake that arrived mid-scan, applied when it ends.
+    woken_due_at: float | None = None
+    # This user's entry in the slot queue while it waits for admission.
+    waiter: tuple[int, int, anyio.Event] | None = None
+    # Rung by wake() so a sleeping scanner re-reads due_at.
+    doorbell: anyio.Event = field(default_factory=anyio.Event)
+
+
+class ScanScheduler:
+    """Global scan budget, priority lanes and adaptive per-user cadence."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int,
+        base_interval: float,
+        min_interval: float,
+        max_interval: float,
+        jitter: float,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._available = max_concurrent
+        self._base_interval = base_interval
+        # Widen the bounds rather than reject them, so the base interval is
+        # always inside [min, max] whatever the operator configured.
+        self._min_interval = min(min_interval, base_interval)
+        self._max_interval = max(max_interval, base_interval)
+        self._jitter = jitter
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._users: dict[str, _UserSchedule] = {}
+        # Heap of (lane, arrival seq, event): lane first, FIFO within a lane.
+        self._waiters: list[tuple[int, int, anyio.Event]] = []
+        self._seq = itertools.count()
+
+    @classmethod
+    def from_settings(cls, settings: Settings | None = None) -> ScanScheduler:
+        """Build a scheduler from the ``VECTOR_SYNC_*`` scan settings."""
+        settings = settings or get_settings()
+        return cls(
+            max_concurrent=settings.vector_sync_max_concurrent_scans,
+            base_interval=settings.vector_sync_scan_interval,
+            min_interval=settings.vector_sync_scan_interval_min,
+            max_interval=settings.vector_sync_scan_interval_max,
+            jitter=settings.vector_sync_scan_jitter,
+        )
+
+    def is_registered(self, user_id: str) -> bool:
+        return user_id in self._users
+
+    def register(self, user_id: str, *, initial: bool = False) -> None:
+        """Start scheduling ``user_id``; a no-op if already registered.
+
+        ``initial`` marks a user provisioned while the process is running: the
+        first scan is due at once, in the :attr:`ScanLane.INITIAL` lane.
+        Otherwise (users found at startup) the first scan is a backstop scan
+        due at a random point within the first jitter window.
+        """
+        if user_id in self._users:
+            return
+        now = self._clock()
+        if initial:
+            due_at, lane = now, ScanLane.INITIAL
+        else:
+            spread = self._base_interval * self._jitter
+            due_at, lane = now + self._rng.uniform(0, spread), ScanLane.BACKSTOP
+        self._users[user_id] = _UserSchedule(
+            interval=self._base_interval, due_at=due_at, lane=lane
+        )
+        self._publish_next(user_id)
+
+    def unregister(self, user_id: str) -> None:
+        """Stop scheduling ``user_id`` and drop its per-user gauges."""
+        if self._users.pop(user_id, None) is not None:
+            clear_vector_sync_scan_schedule(user_id)
+
+    def wake(self, user_id: str) -> bool:
+        """Move ``user_id``'s next scan forward into the :attr:`ScanLane.WAKE` lane.
+
+        The scan becomes due now, but never sooner than
+        ``VECTOR_SYNC_SCAN_INTERVAL_MIN`` after the user's previous scan
+        started, which caps how often a stream of webhooks can rescan one user.
+        A wake that lands during a scan is kept for the next one. The user's
+        interval is also reset to at most the base interval, since a webhook
+        means they are active. Returns ``False`` when the user has no scanner
+        in this process.
+        """
+        state = self._users.get(user_id)
+        if state is None:
+            return False
+        now = self._clock()
+        earliest = now
+        if state.last_started_at is not None:
+            earliest = max(now, state.last_started_at + self._min_interval)
+        state.interval = min(state.interval, self._base_interval)
+        if state.running:
+            state.woken_due_at = earliest
+            return True
+        state.due_at = min(state.due_at, earliest)
+        state.lane = ScanLane.WAKE
+        if state.waiter is not None and state.waiter[0] > ScanLane.WAKE:
+            # Already queued for a slot in a slower lane: move up.
+            self._waiters.remove(state.waiter)
+            state.waiter = (int(ScanLane.WAKE), state.waiter[1], state.waiter[2])
+            self._waiters.append(state.waiter)
+            heapq.heapify(self._waiters)
+            self._publish_waiting()
+        state.doorbell.set()
+        self._publish_next(user_id)
+        return True
+
+    async def wait_until_due(
+        self, user_id: str, wake_event: anyio.Event | None = None
+    ) -> None:
+        """Sleep until ``user_id``'s next scan is due.
+
+        Returns early when ``wake_event`` is set. A :meth:`wake` rings the
+        user's doorbell, which re-reads the (earlier) due time.
+        """
+        state = self._users[user_id]
+        while (delay := state.due_at - self._clock()) > 0:
+            with anyio.move_on_after(delay):
+                async with anyio.create_task_group() as tg:
+                    if wake_event is not None:
+                        tg.start_soon(_wake_on, wake_event.wait, tg.cancel_scope)
+                    await _wake_on(state.doorbell.wait, tg.cancel_scope)
+            if state.doorbell.is_set():
+                state.doorbell = anyio.Event()
+            if wake_event is not None and wake_event.is_set():
+                return
+
+    @asynccontextmanager
+    async def scan_slot(self, user_id: str) -> AsyncIterator[None]:
+        """Hold one of the global scan slots for the duration of a scan.
+
+        Waits in the user's current lane for a slot. On exit the slot goes to
+        the next waiter and the user's next scan is scheduled one jittered
+        interval out (or earlier, if a wake arrived during the scan).
+        """
+        state = self._users[user_id]
+        await self._acquire(state)
+        try:
+            now = self._clock()
+            record_vector_sync_scan_lag(user_id, max(0.0, now - state.due_at))
+            state.last_started_at = now
+            state.lane = ScanLane.BACKSTOP
+            state.running = True
+            yield
+        finally:
+            state.running = False
+            self._release()
+            self._schedule_next(user_id, state)
+
+    def record_scan(self, user_id: str, queued: int) -> None:
+        """Adapt ``user_id``'s interval to a completed scan's result."""
+        state = self._users.get(user_id)
+        if state is None:
+            return
+        if queued > 0:
+            state.interval = max(self._min_interval, state.interval * _ACTIVE_FACTOR)
+        else:
+            state.interval = min(self._max_interval, state.interval * _IDLE_FACTOR)
+
+    def _schedule_next(self, user_id: str, state: _UserSchedule) -> None:
+        spread = state.interval * self._jitter
+        due_at = self._clock() + state.interval + self._rng.uniform(-spread, spread)
+        if state.woken_due_at is not None:
+            due_at = min(due_at, state.woken_due_at)
+            state.lane = ScanLane.WAKE
+            state.woken_due_at = None
+        state.due_at = due_at
+        if user_id in self._users:
+            self._publish_next(user_id)
+
+    def _publish_next(self, user_id: str) -> None:
+        state = self._users[user_id]
+        set_vector_sync_scan_next(user_id, time.time() + state.due_at - self._clock())
+
+    async def _acquire(self, state: _UserSchedule) -> None:
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+        granted = anyio.Event()
+        state.waiter = (int(state.lane), next(self._seq), granted)
+        heapq.heappush(self._waiters, state.waiter)
+        self._publish_waiting()
+        try:
+            await granted.wait()
+        except BaseException:
+            if granted.is_set():
+                # The slot was handed over as we were cancelled: pass it on.
+                self._release()
+            else:
+                self._waiters.remove(state.waiter)
+                heapq.heapify(self._waiters)
+                self._publish_waiting()
+            raise
+        finally:
+            state.waiter = None
+
+    def _release(self) -> None:
+        if self._waiters:
+            # Hand the slot straight to the next waiter so a newcomer on the
+            # fast path cannot take it ahead of the queue.
+            _, _, event = heapq.heappop(self._waiters)
+            self._publish_waiting()
+            event.set()
+        else:
+            self._available += 1
+
+    def _publish_waiting(self) -> None:
+        counts = dict.fromkeys(ScanLane, 0)
+        for lane, _, _ in self._waiters:
+            counts[ScanLane(lane)] += 1
+        for lane, count in counts.items():
+            set_vector_sync_scans_waiting(lane.name.lower(), count)
+
+
+async def _wake_on(
+    wait_fn: Callable[[], Awaitable[object]], scope: anyio.CancelScope
+) -> None:
+    await wait_fn()
+    scope.cancel()
@@ -31,6 +31,7 @@ from nextcloud_mcp_server.client.news import NewsItemType
 from nextcloud_mcp_server.config import Settings, get_settings
 from nextcloud_mcp_server.models.deck import DeckCard
 from nextcloud_mcp_server.observability.metrics import (
+    record_vector_sync_deletion_tracking,
     record_vector_sync_deletions_suppressed,
     record_vector_sync_scan,
 )
@@ -56,6 +57,7 @@ from nextcloud_mcp_server.vector.queue.ports import TaskProducer
 if TYPE_CHECKING:
     from nextcloud_mcp_server.search.algorithms import NextcloudClientProtocol
 
+from nextcloud_mcp_server.vector.document_manifest_store import DocumentManifestStore
 from nextcloud_mcp_server.vector.document_path_store import DocumentPathStore
 from nextcloud_mcp_server.vector.sharing_state import (
     ACL_PRINCIPALS_KEY,
@@ -144,8 +146,10 @@ async def _scroll_doc_ids(
 ) -> set[str]:
     """Collect the ``doc_id`` payload of every matching point into a set.
 
-    The shape five of the deletion-tracking call sites want. Points without a
-    ``doc_id`` payload are skipped (defensive: pre-``doc_id`` writes).
+    The shape the deletion-tracking scrolls want (directly for the consent
+    backstop, via ``_indexed_doc_ids`` when the manifest needs reconciling).
+    Points without a ``doc_id`` payload are skipped (defensive: pre-``doc_id``
+    writes).
     """
     doc_ids: set[str] = set()
     async for point in _iter_all_points(
@@ -159,6 +163,161 @@ async def _scroll_doc_ids(
     return doc_ids
 
 
+async def _read_manifest(
+    user_id: str, doc_type: str
+) -> tuple[DocumentManifestStore | None, dict[str, str] | None]:
+    """Return the manifest store and its trusted ``{doc_id: index_mode}``.
+
+    The mapping is ``None`` when the manifest must not be trusted this scan:
+    never reconciled or overdue for a reconcile (see
+    ``DocumentManifestStore.get_index_modes``), disabled by a zero
+    ``VECTOR_SYNC_MANIFEST_RECONCILE_INTERVAL``, or unreadable. The store is
+    ``None`` when there is nothing to reconcile into. A DB failure only costs
+    the Qdrant scroll the manifest exists to avoid, so it is logged and
+    swallowed.
+    """
+    try:
+        max_age = get_settings().vector_sync_manifest_reconcile_interval
+        if max_age <= 0:
+            return None, None
+        store = await DocumentManifestStore.shared()
+        return store, await store.get_index_modes(user_id, doc_type, max_age=max_age)
+    except Exception as exc:  # noqa: BLE001 — fall back to the Qdrant scroll
+        logger.warning(
+            "Document manifest read failed for %s/%s (%s); scrolling Qdrant",
+            user_id,
+            doc_type,
+            exc,
+        )
+        return None, None
+
+
+async def _reconcile_manifest(
+    store: DocumentManifestStore | None,
+    user_id: str,
+    doc_type: str,
+    indexed: dict[str, str],
+    started_at: int,
+) -> None:
+    """Rebuild the manifest from a completed scroll; best-effort."""
+    if store is None:
+        return
+    try:
+        await store.reconcile(user_id, doc_type, indexed, started_at=started_at)
+    except Exception as exc:  # noqa: BLE001 — next scan scrolls and retries
+        logger.warning(
+            "Document manifest reconcile failed for %s/%s (%s); next scan retries",
+            user_id,
+            doc_type,
+            exc,
+        )
+
+
+async def _indexed_doc_ids(
+    qdrant_client: AsyncQdrantClient, user_id: str, doc_type: str
+) -> set[str]:
+    """The doc_ids of one text doc_type that ``user_id`` has indexed.
+
+    Read from the per-user document manifest when it is trusted, so a scan
+    costs one keyed SQL read instead of a scroll over every indexed point.
+    Otherwise this scrolls Qdrant (the system of record) as before and
+    reconciles the manifest from the result. Scroll errors propagate, as they
+    always have, to the caller's skip-deletion-tracking handling.
+    """
+    store, modes = await _read_manifest(user_id, doc_type)
+    if modes is not None:
+        record_vector_sync_deletion_tracking(doc_type, "manifest")
+        return set(modes)
+    started_at = int(time.time())
+    doc_ids = await _scroll_doc_ids(
+        qdrant_client,
+        collection_name=get_settings().get_collection_name(),
+        scroll_filter=Filter(
+            must=[
+                FieldCondition(key="user_id", match=MatchValue(value=user_id)),
+                FieldCondition(key="doc_type", match=MatchValue(value=doc_type)),
+            ]
+        ),
+    )
+    record_vector_sync_deletion_tracking(doc_type, "qdrant")
+    await _reconcile_manifest(
+        store,
+        user_id,
+        doc_type,
+        dict.fromkeys(doc_ids, payload_keys.INDEX_MODE_HYBRID),
+        started_at,
+    )
+    return doc_ids
+
+
+async def _indexed_files_by_mode(
+    qdrant_client: AsyncQdrantClient, user_id: str
+) -> dict[str, set[str]]:
+    """The file doc_ids ``user_id`` can read from the index, bucketed by mode.
+
+    The manifest replaces the widest scroll in the scanner: every indexed
+    *chunk* of every readable file, not one point per document. The fallback
+    scroll keys on ``acl_principals`` (see ``_indexed_files_scroll_filter``)
+    and is bucketed as the pages stream in, never materialised. A document
+    whose points disagree on the mode (a keyword→hybrid upgrade in flight) is
+    recorded under the last mode seen; the per-mode deletion gate only needs
+    it in one bucket.
+    """
+    store, modes = await _read_manifest(user_id, "file")
+    source = "manifest"
+    if modes is None:
+        source = "qdrant"
+        started_at = int(time.time())
+        modes = {}
+        # Points written before INDEX_MODE existed carry no key and were
+        # dense+sparse, so they default to hybrid — matching how the
+        # modified-at gate reads INDEX_MODE.
+        async for point in _iter_all_points(
+            qdrant_client,
+            collection_name=get_settings().get_collection_name(),
+            scroll_filter=_indexed_files_scroll_filter(user_id),
+            payload_fields=["doc_id", payload_keys.INDEX_MODE],
+        ):
+            if point.payload is not None and "doc_id" in point.payload:
+                modes[str(point.payload["doc_id"])] = point.payload.get(
+                    payload_keys.INDEX_MODE, payload_keys.INDEX_MODE_HYBRID
+                )
+        await _reconcile_manifest(store, user_id, "file", modes, started_at)
+    record_vector_sync_deletion_tracking("file", source)
+    indexed_by_mode: dict[str, set[str]] = {}
+    for doc_id, mode in modes.items():
+        indexed_by_mode.setdefault(mode, set()).add(doc_id)
+    return indexed_by_mode
+
+
+async def _record_manifest_claim(
+    user_id: str, file_id: str, etag: str, modified_at: int, index_mode: str
+) -> None:
+    """Add a dedup-claimed file to ``user_id``'s manifest; best-effort.
+
+    A claim grants the user an already-indexed file without the processor ever
+    seeing it, so this is the only write that puts the file into the user's
+    deletion tracking. A failed write delays its deletion at most until the
+    next manifest reconcile.
+    """
+    try:
+        await (await DocumentManifestStore.shared()).upsert(
+            user_id=user_id,
+            doc_type="file",
+            doc_id=file_id,
+            etag=etag,
+            modified_at=modified_at,
+            index_mode=index_mode,
+        )
+    except Exception as exc:  # noqa: BLE001 — reconciled from Qdrant later
+        logger.debug(
+            "Manifest upsert failed for claimed file %s (%s); "
+            "the next reconcile restores it",
+            file_id,
+            exc,
+        )
+
+
 @dataclass
 class DocumentTask:
     """Document task for processing queue."""
@@ -840,7 +999,7 @@ async def scan_user_documents(
     send_stream: TaskProducer,
     nc_client: NextcloudClient,
     initial_sync: bool = False,
-):
+) -> int:
     """
     Scan a single user's documents and send changes to processor stream.
 
@@ -849,6 +1008,10 @@ async def scan_user_documents(
         send_stream: Stream to send changed documents to processors
         nc_client: Authenticated Nextcloud client
         initial_sync: If True, send all documents (first-time sync)
+
+    Returns:
+        Number of tasks queued (index and delete), the change signal the
+        multi-user scan scheduler adapts each user's interval to
     """
 
     scan_id = random.randint(1000, 9999)
@@ -880,7 +1043,9 @@ async def scan_user_documents(
                 prune_before,
             )
 
-        # For deletion tracking, get all doc_ids in Qdrant (for incremental sync)
+        # For deletion tracking, get the user's indexed note ids (for
+        # incremental sync) from the document manifest, or Qdrant when the
+        # manifest needs reconciling — see _indexed_doc_ids.
         # Note: We no longer bulk-query indexed_at, instead check per-document.
         # Hoisted to function scope so the file-scroll block below doesn't
         # depend on a name bound inside the notes-scroll block; future
@@ -896,18 +1061,9 @@ async def scan_user_documents(
             # checker can't infer from the surrounding ``if not
             # initial_sync`` (the ternary above ties the two together).
             qdrant_client = cast(AsyncQdrantClient, qdrant_client)
-            indexed_doc_ids = await _scroll_doc_ids(
-                qdrant_client,
-                collection_name=get_settings().get_collection_name(),
-                scroll_filter=Filter(
-                    must=[
-                        FieldCondition(key="user_id", match=MatchValue(value=user_id)),
-                        FieldCondition(key="doc_type", match=MatchValue(value="note")),
-                    ]
-                ),
-            )
+            indexed_doc_ids = await _indexed_doc_ids(qdrant_client, user_id, "note")
 
-            logger.debug("Found %s indexed documents in Qdrant", len(indexed_doc_ids))
+            logger.debug("Found %s indexed notes", len(indexed_doc_ids))
 
         # Determine which apps are enabled for this user so we skip polling
         # apps they lack — those polls 404 and flood tenant logs. ``None`` means
@@ -972,42 +1128,26 @@ async def scan_user_documents(
 
         if initial_sync:
             logger.info("Sent %s documents for initial sync: %s", queued, user_id)
-            return
+            return queued
 
         # Scan tagged PDF files (after notes)
-        # Get this user's readable indexed file points from Qdrant (for deletion
-        # tracking), keyed on acl_principals (the observed-access set) rather than
-        # the immutable user_id indexer stamp — see _indexed_files_scroll_filter
-        # for why (blackbox-demo team-folder-removal release loop). Keying on the
-        # principal makes a release converge and also tracks pure claimers, so a
-        # reader who lost access releases its own principal on the next scan.
+        # Get the files this user can read from the index (for deletion
+        # tracking). The manifest holds one row per file the user indexed or
+        # claimed; its reconciling scroll keys on acl_principals (the
+        # observed-access set) rather than the immutable user_id indexer stamp
+        # — see _indexed_files_scroll_filter for why (blackbox-demo
+        # team-folder-removal release loop). Keying on the principal makes a
+        # release converge and also tracks pure claimers, so a reader who lost
+        # access releases its own principal on the next scan.
         indexed_by_mode: dict[str, set[str]] = {}
         if not initial_sync:
             assert qdrant_client is not None  # narrow for the type checker
-            # Bucket indexed file points by index mode so the deletion fail-safe
-            # can reason per mode (a flaky read can zero one tag but not the
-            # other). Points written before INDEX_MODE existed carry no key and
-            # were dense+sparse, so they default to hybrid — matching how the
-            # modified-at gate below reads INDEX_MODE.
-            #
-            # Bucketed as the pages stream in: this is the widest scroll in the
-            # scanner (every indexed chunk of every readable file, not one point
-            # per document), so it is the one that must never be materialised.
-            async for point in _iter_all_points(
-                qdrant_client,
-                collection_name=settings.get_collection_name(),
-                scroll_filter=_indexed_files_scroll_filter(user_id),
-                payload_fields=["doc_id", payload_keys.INDEX_MODE],
-            ):
-                if point.payload is not None and "doc_id" in point.payload:
-                    did = str(point.payload["doc_id"])
-                    mode = point.payload.get(
-                        payload_keys.INDEX_MODE, payload_keys.INDEX_MODE_HYBRID
-                    )
-                    indexed_by_mode.setdefault(mode, set()).add(did)
+            # Bucketed by index mode so the deletion fail-safe can reason per
+            # mode (a flaky read can zero one tag but not the other).
+            indexed_by_mode = await _indexed_files_by_mode(qdrant_client, user_id)
 
             logger.debug(
-                "Found %s indexed files in Qdrant",
+                "Found %s indexed files",
                 sum(len(ids) for ids in indexed_by_mode.values()),
             )
 
@@ -1165,6 +1305,11 @@ async def scan_user_documents(
                     folder_ancestor_cache=folder_ancestor_cache,
                 ):
                     _potentially_deleted.pop((user_id, file_id, "file"), None)
+                    # Steady state: the claim is already tracked, no write.
+                    if file_id not in indexed_by_mode.get(index_mode, ()):
+                        await _record_manifest_claim(
+                            user_id, file_id, etag, modified_at, index_mode
+                        )
                     logger.debug(
                         "Dedup: file %s (ID: %s) already indexed in tenant; "
                         "granted access to %s without reprocessing",
@@ -1509,6 +1654,8 @@ async def scan_user_documents(
         else:
             logger.debug("No changes detected for %s", user_id)
 
+        return queued
+
 
 async def scan_notes(
     user_id: str,
@@ -1712,21 +1859,12 @@ async def scan_news_items(
     settings = get_settings()
     queued = 0
 
-    # Get indexed news item IDs from Qdrant (for deletion tracking)
+    # Get indexed news item IDs (for deletion tracking)
     indexed_item_ids: set[str] = set()
     if not initial_sync:
         qdrant_client = await get_qdrant_client()
-        indexed_item_ids = await _scroll_doc_ids(
-            qdrant_client,
-            collection_name=settings.get_collection_name(),
-            scroll_filter=Filter(
-                must=[
-                    FieldCondition(key="user_id", match=MatchValue(value=user_id)),
-                    FieldCondition(key="doc_type", match=MatchValue(value="news_item")),
-                ]
-            ),
-        )
-        logger.debug("Found %s indexed news items in Qdrant", len(indexed_item_ids))
+        indexed_item_ids = await _indexed_doc_ids(qdrant_client, user_id, "news_item")
+        logger.debug("Found %s indexed news items", len(indexed_item_ids))
 
     # Fetch all items (News app caps at ~200 per feed via auto-purge)
     all_items = await nc_client.news.get_items(
@@ -1937,25 +2075,14 @@ async def scan_mail_messages(
     settings = get_settings()
     queued = 0
 
-    # Get indexed mail message IDs from Qdrant (for deletion tracking)
+    # Get indexed mail message IDs (for deletion tracking)
     indexed_message_ids: set[str] = set()
     if not initial_sync:
         qdrant_client = await get_qdrant_client()
-        indexed_message_ids = await _scroll_doc_ids(
-            qdrant_client,
-            collection_name=settings.get_collection_name(),
-            scroll_filter=Filter(
-                must=[
-                    FieldCondition(key="user_id", match=MatchValue(value=user_id)),
-                    FieldCondition(
-                        key="doc_type", match=MatchValue(value="mail_message")
-                    ),
-                ]
-            ),
-        )
-        logger.debug(
-            "Found %s indexed mail messages in Qdrant", len(indexed_message_ids)
+        indexed_message_ids = await _indexed_doc_ids(
+            qdrant_client, user_id, "mail_message"
         )
+        logger.debug("Found %s indexed mail messages", len(indexed_message_ids))
 
     # Resolve the include-tag filter once per scan (None = index everything).
     # Deliberately *not* wrapped: a failure here must abort the whole mail scan
@@ -2232,21 +2359,12 @@ async def scan_deck_cards(
     settings = get_settings()
     queued = 0
 
-    # Get indexed deck card IDs from Qdrant (for deletion tracking)
+    # Get indexed deck card IDs (for deletion tracking)
     indexed_card_ids: set[str] = set()
     if not initial_sync:
         qdrant_client = await get_qdrant_client()
-        indexed_card_ids = await _scroll_doc_ids(
-            qdrant_client,
-            collection_name=settings.get_collection_name(),
-            scroll_filter=Filter(
-                must=[
-                    FieldCondition(key="user_id", match=MatchValue(value=user_id)),
-                    FieldCondition(key="doc_type", match=MatchValue(value="deck_card")),
-                ]
-            ),
-        )
-        logger.debug("Found %s indexed deck cards in Qdrant", len(indexed_card_ids))
+        indexed_card_ids = await _indexed_doc_ids(qdrant_client, user_id, "deck_card")
+        logger.debug("Found %s indexed deck cards", len(indexed_card_ids))
 
     # Fetch all boards
     boards = await nc_client.deck.get_boards()
@@ -20,6 +20,15 @@ scanner has observed (hence can access) the file. The search filter ORs a
 verify-on-read gate) re-checks each result against the user's tagged REPORT, so
 an over-broad principal match can never leak content.
 
+The same bytes at a *different* fileid (a copy in another user's folder, a saved
+mail attachment) share neither doc_id nor etag, so the claim above misses them.
+File points therefore also carry ``content_sha256`` (``payload_keys.CONTENT_HASH``);
+``find_identical_content`` + ``clone_indexed_content`` let the processor index a
+new copy by copying the stored chunks under the new doc_id instead of parsing,
+OCR'ing and embedding the body again. The copy is an independent point set with
+its own ``acl_principals``, so releasing or deleting one copy never touches the
+other.
+
 All point IDs are user-agnostic, so deletion must *release one user* (drop their
 principal) and only remove the points when the principal set empties — otherwise
 one user untagging a shared file would evict it for everyone still reading it.
@@ -28,9 +37,10 @@ one user untagging a shared file would evict it for everyone still reading it.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from qdrant_client.models import FieldCondition, Filter, MatchValue
+from qdrant_client.models import FieldCondition, Filter, MatchValue, PointStruct
 
 if TYPE_CHECKING:
     from nextcloud_mcp_server.vector.folder_ancestors import FileIdResolver
@@ -45,12 +55,21 @@ logger = logging.getLogger(__name__)
 
 ACL_PRINCIPALS_KEY = "acl_principals"
 
+# Points per scroll page when copying an identical document's chunks.
+_CLONE_PAGE_SIZE = 256
+
 
 def user_principal(user_id: str) -> str:
     """The ``acl_principals`` entry representing a single user's read access."""
     return f"user:{user_id}"
 
 
+def principal_user_id(principal: str) -> str | None:
+    """The user id of a :func:`user_principal` entry, else None."""
+    prefix, sep, user_id = principal.partition(":")
+    return user_id if sep and prefix == "user" else None
+
+
 def file_title_from_path(file_path: str) -> str:
     """Human-facing title for an indexed file: its Nextcloud filename.
 
@@ -119,10 +138,17 @@ async def find_indexed_content(
     if not points:
         return None
     payload = dict(points[0].payload or {})
+    if not _is_reusable(payload, embedding_identity, index_mode):
+        return None
+    return payload
+
+
+def _is_reusable(payload: dict, embedding_identity: str, index_mode: str) -> bool:
+    """Whether a real point's vectors can serve a claim in ``index_mode``."""
     if payload.get(payload_keys.EMBEDDING_IDENTITY) != embedding_identity:
         # Existing vectors were produced by a different embedding model — a
         # re-embed is required, so this content is not reusable as-is.
-        return None
+        return False
     # Monotonic keyword→hybrid upgrade: a hybrid claim cannot reuse sparse-only
     # keyword points (they lack the dense vector), so force a reprocess. Every
     # other combination reuses the existing points (same mode, or a keyword claim
@@ -130,14 +156,143 @@ async def find_indexed_content(
     # before INDEX_MODE existed have no key; treat them as hybrid (the prior
     # dense+sparse default) so a hybrid claim still dedups against them.
     existing_mode = payload.get(payload_keys.INDEX_MODE, payload_keys.INDEX_MODE_HYBRID)
-    if (
+    return not (
         index_mode == payload_keys.INDEX_MODE_HYBRID
         and existing_mode == payload_keys.INDEX_MODE_KEYWORD
-    ):
+    )
+
+
+async def find_identical_content(
+    content_hash: str,
+    doc_id: str,
+    embedding_identity: str,
+    index_mode: str = payload_keys.INDEX_MODE_HYBRID,
+) -> dict | None:
+    """Return a real point's payload from *another* file with the same bytes.
+
+    The fileid-keyed lookup above only matches the same Nextcloud file. The same
+    body frequently lives at many fileids -- a handbook copied into every team
+    folder, a mail attachment saved to Files -- and each copy used to be parsed,
+    OCR'd and embedded on its own. This looks tenant-wide for a non-placeholder
+    file point whose ``content_sha256`` matches, excluding ``doc_id`` itself, and
+    applies the same embedding-model and keyword→hybrid rules as
+    ``find_indexed_content``.
+
+    Returns the payload on a hit, else None.
+    """
+    if not content_hash:
+        return None
+    qdrant_client = await get_qdrant_client()
+    settings = get_settings()
+    points, _ = await qdrant_client.scroll(
+        collection_name=settings.get_collection_name(),
+        scroll_filter=Filter(
+            must=[
+                FieldCondition(
+                    key=payload_keys.CONTENT_HASH, match=MatchValue(value=content_hash)
+                ),
+                FieldCondition(key="doc_type", match=MatchValue(value="file")),
+                get_placeholder_filter(),
+            ],
+            must_not=[FieldCondition(key="doc_id", match=MatchValue(value=doc_id))],
+        ),
+        limit=1,
+        with_payload=True,
+        with_vectors=False,
+    )
+    if not points:
+        return None
+    payload = dict(points[0].payload or {})
+    if not _is_reusable(payload, embedding_identity, index_mode):
         return None
     return payload
 
 
+async def clone_indexed_content(
+    source: dict,
+    *,
+    point_id: Callable[[int], str],
+    overrides: dict,
+    keep_dense: bool = True,
+) -> int | None:
+    """Copy another file's indexed points onto a new document; no re-embed.
+
+    ``source`` is the payload ``find_identical_content`` returned. Every chunk of
+    that document version is copied, vectors included, under ``point_id(i)`` with
+    ``overrides`` (the new document's identity: doc_id, path, title, owner,
+    ``acl_principals``, ...) laid over its payload. ``keep_dense=False`` drops
+    the dense vector, for a keyword claim served from hybrid points.
+
+    The source is copied page by page, so memory stays at one scroll page however
+    long the document is. Returns the number of chunks copied, or None when the
+    source is not complete -- it is still being written window by window, or was
+    re-indexed or deleted mid-copy -- in which case the caller indexes normally
+    and its write overwrites whatever was copied.
+    """
+    total = source.get("total_chunks")
+    if not isinstance(total, int) or total <= 0:
+        return None
+    doc_id = source.get("doc_id")
+    content_hash = source.get(payload_keys.CONTENT_HASH)
+    if not isinstance(doc_id, (str, int)) or not isinstance(content_hash, (str, int)):
+        return None
+    qdrant_client = await get_qdrant_client()
+    collection = get_settings().get_collection_name()
+    source_filter = Filter(
+        must=[
+            FieldCondition(key="doc_id", match=MatchValue(value=doc_id)),
+            FieldCondition(key="doc_type", match=MatchValue(value="file")),
+            FieldCondition(
+                key=payload_keys.CONTENT_HASH,
+                match=MatchValue(value=content_hash),
+            ),
+            get_placeholder_filter(),
+        ]
+    )
+    counted = await qdrant_client.count(
+        collection_name=collection, count_filter=source_filter, exact=True
+    )
+    if counted.count != total:
+        return None
+
+    copied: set[int] = set()
+    offset = None
+    while True:
+        records, offset = await qdrant_client.scroll(
+            collection_name=collection,
+            scroll_filter=source_filter,
+            with_payload=True,
+            with_vectors=True,
+            limit=_CLONE_PAGE_SIZE,
+            offset=offset,
+        )
+        points = []
+        for record in records:
+            payload = {**(record.payload or {}), **overrides}
+            index = payload.get("chunk_index")
+            if not isinstance(index, int):
+                return None
+            # Points carry named vectors; anything else can't be copied as is.
+            if not isinstance(record.vector, dict):
+                return None
+            vector = dict(record.vector)
+            if not keep_dense:
+                vector.pop("dense", None)
+            points.append(
+                PointStruct(id=point_id(index), vector=vector, payload=payload)
+            )
+            copied.add(index)
+        if points:
+            await qdrant_client.upsert(
+                collection_name=collection, points=points, wait=True
+            )
+        if offset is None:
+            break
+    if copied != set(range(total)):
+        return None
+    return total
+
+
 async def existing_principals(doc_id: str, doc_type: str) -> list[str]:
     """Return the ``acl_principals`` already recorded for a document (or []).
 
@@ -430,6 +585,33 @@ async def claim_existing_index(
     return True
 
 
+async def _drop_manifest_row(doc_id: str, doc_type: str, user_id: str) -> None:
+    """Remove the released document from the user's manifest; best-effort.
+
+    Called only once the Qdrant release succeeded: if the release raises, the
+    row stays, so the scanner keeps seeing the document and re-enqueues the
+    delete next scan. A failed drop leaves a stale row, which costs one no-op
+    delete per scan until the next manifest reconcile. Lazily imported for the
+    same reason as the path-row cleanup.
+    """
+    try:
+        from nextcloud_mcp_server.vector.document_manifest_store import (  # noqa: PLC0415
+            DocumentManifestStore,
+        )
+
+        await (await DocumentManifestStore.shared()).delete(
+            user_id=user_id, doc_type=doc_type, doc_id=doc_id
+        )
+    except Exception as exc:  # noqa: BLE001 — reconciled from Qdrant later
+        logger.debug(
+            "Manifest row cleanup failed for %s_%s user:%s (%s)",
+            doc_type,
+            doc_id,
+            user_id,
+            exc,
+        )
+
+
 async def release_document_for_user(
     doc_id: str,
     doc_type: str,
@@ -445,6 +627,9 @@ async def release_document_for_user(
     Legacy points written before ``acl_principals`` existed have no principal
     set; for those we preserve the original behaviour (delete by
     ``user_id``/``doc_id``/``doc_type``) so a single-owner delete still works.
+
+    Either way, the user's document-manifest row is dropped once the release
+    has landed, taking the document out of the scanner's deletion tracking.
     """
     qdrant_client = await get_qdrant_client()
     settings = get_settings()
@@ -495,6 +680,7 @@ async def release_document_for_user(
                 ]
             ),
         )
+        await _drop_manifest_row(doc_id, doc_type, user_id)
         return
 
     remaining = sorted(p for p in principals if p != user_principal(user_id))
@@ -523,3 +709,4 @@ async def release_document_for_user(
             doc_id,
             len(remaining),
         )
+    await _drop_manifest_row(doc_id, doc_type, user_id)
@@ -0,0 +1,258 @@
+"""Debounce buffer between the webhook receiver and the ingest producer.
+
+Nextcloud sends one webhook per change. A note autosaved every few seconds, or
+a desktop client syncing a folder of 2,000 PDFs, used to become one
+``DocumentTask`` per event, and most of those tasks re-did the work of the one
+before. Each file task also runs a full tagged-file discovery in the processor
+(``processor._reconcile_tag_event``). :class:`WebhookCoalescer` holds accepted
+tasks briefly, keyed on ``(user_id, doc_type, doc_id)``, and forwards one task
+per key:
+
+- **Last writer wins.** A newer event replaces the buffered task, whatever
+  either operation is, so the processor sees the latest state: the latest
+  payload (mtime, Deck stack) of an edit, a delete that follows an edit, and
+  the re-index of a file restored from the trash (or a Deck card brought back
+  by undo) under its old id right after its delete.
+- **Debounce.** A key is sent once it has been quiet for
+  ``WEBHOOK_COALESCE_WINDOW_SECONDS``, and no later than
+  ``WEBHOOK_COALESCE_MAX_DELAY_SECONDS`` after its first event, so a document
+  saved continuously is still indexed.
+- **Folder batching.** File events from the same folder debounce together: a
+  new event anywhere in the folder holds the folder's keys back. When a flush
+  would send ``WEBHOOK_COALESCE_FOLDER_BATCH`` or more file index tasks from one
+  folder and the user has a scanner, the tasks are replaced by a single wake
+  of that scanner. One scan discovers the whole folder in one pass, instead of
+  one discovery per file. Deletes are always sent.
+
+The buffer sits in front of the ``TaskProducer``, so it works the same for the
+in-memory stream and the procrastinate queue. It is in-process: events buffered
+when a pod dies are lost, and the polling scanner picks those changes up, as it
+does for any missed webhook. When the buffer holds ``WEBHOOK_COALESCE_MAX_PENDING``
+keys, :meth:`WebhookCoalescer.submit` refuses new ones, and the receiver answers
+503 so Nextcloud retries, as it does today when the queue is full.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import anyio
+from anyio.abc import TaskStatus
+
+from nextcloud_mcp_server.config import Settings, get_settings
+from nextcloud_mcp_server.observability.metrics import (
+    record_webhook_events_coalesced,
+    set_webhook_coalescer_pending,
+)
+from nextcloud_mcp_server.vector._errors import format_exception_group
+from nextcloud_mcp_server.vector.queue.ports import TaskProducer
+from nextcloud_mcp_server.vector.scanner import DocumentTask
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long close() spends sending the buffer at shutdown.
+_CLOSE_FLUSH_TIMEOUT = 10.0
+
+_Key = tuple[str, str, str]
+
+
+@dataclass
+class _Pending:
+    """One buffered task and the timing of the events folded into it."""
+
+    task: DocumentTask
+    first_seen: float
+    last_seen: float
+    # Parent folder of a file event, for folder batching (None otherwise).
+    folder: str | None = None
+
+
+class WebhookCoalescer:
+    """Per-document debounce buffer in front of a ``TaskProducer``."""
+
+    def __init__(
+        self,
+        producer: TaskProducer,
+        *,
+        window: float,
+        max_delay: float,
+        max_pending: int,
+        folder_batch: int,
+        scan_waker: Callable[[str], bool] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._producer = producer
+        self._window = window
+        self._max_delay = max(max_delay, window)
+        self._max_pending = max_pending
+        self._folder_batch = folder_batch
+        self._scan_waker = scan_waker
+        self._clock = clock
+        self._pending: dict[_Key, _Pending] = {}
+        self._folder_last_seen: dict[tuple[str, str], float] = {}
+        self._closed = False
+
+    @classmethod
+    def from_settings(
+        cls,
+        producer: TaskProducer,
+        settings: Settings | None = None,
+        *,
+        scan_waker: Callable[[str], bool] | None = None,
+    ) -> WebhookCoalescer:
+        """Build a coalescer from the ``WEBHOOK_COALESCE_*`` settings."""
+        settings = settings or get_settings()
+        return cls(
+            producer,
+            window=settings.webhook_coalesce_window_seconds,
+            max_delay=settings.webhook_coalesce_max_delay_seconds,
+            max_pending=settings.webhook_coalesce_max_pending,
+            folder_batch=settings.webhook_coalesce_folder_batch,
+            scan_waker=scan_waker,
+        )
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, task: DocumentTask, *, folder: str | None = None) -> bool:
+        """Buffer ``task``, folding it into any pending task for the same document.
+
+        ``folder`` is the parent folder of a file event. Returns ``False`` when
+        the task was not accepted: the buffer is full or closed.
+        """
+        if self._closed:
+            return False
+        now = self._clock()
+        key = (task.user_id, task.doc_type, task.doc_id)
+        if folder is not None:
+            self._folder_last_seen[(task.user_id, folder)] = now
+
+        existing = self._pending.get(key)
+        if existing is None:
+            if len(self._pending) >= self._max_pending:
+                return False
+            self._pending[key] = _Pending(
+                task=task, first_seen=now, last_seen=now, folder=folder
+            )
+            set_webhook_coalescer_pending(len(self._pending))
+            return True
+
+        existing.last_seen = now
+        existing.task = task
+        existing.folder = folder if folder is not None else existing.folder
+        record_webhook_events_coalesced(task.doc_type, "superseded")
+        return True
+
+    async def run(
+        self,
+        shutdown_event: anyio.Event,
+        *,
+        task_status: TaskStatus = anyio.TASK_STATUS_IGNORED,
+    ) -> None:
+        """Flush due tasks on a short tick until ``shutdown_event`` is set.
+
+        The lifespan calls :meth:`close` before setting ``shutdown_event``, so
+        the buffer is sent while the transport is still open.
+        """
+        tick = min(max(self._window / 4, 0.05), 1.0)
+        logger.info(
+            "Webhook coalescer started (window=%ss, max_delay=%ss)",
+            self._window,
+            self._max_delay,
+        )
+        task_status.started()
+        while not shutdown_event.is_set() and not self._closed:
+            with anyio.move_on_after(tick):
+                await shutdown_event.wait()
+            await self.flush()
+        logger.info("Webhook coalescer stopped")
+
+    async def flush(self, *, force: bool = False) -> int:
+        """Send every due task (every task, with ``force``); return how many."""
+        now = self._clock()
+        due = [
+            (key, entry)
+            for key, entry in self._pending.items()
+            if force or self._is_due(entry, now)
+        ]
+        if not due:
+            return 0
+        for key, _entry in due:
+            del self._pending[key]
+        self._forget_quiet_folders(now)
+        set_webhook_coalescer_pending(len(self._pending))
+
+        sent = 0
+        for entry in self._batch_folders([entry for _key, entry in due]):
+            try:
+                await self._producer.send(entry.task)
+                sent += 1
+            except Exception as e:
+                # Already acknowledged to Nextcloud, so it can't be redelivered;
+                # the polling scanner picks the change up on its next pass.
+                logger.error(
+                    "Failed to queue coalesced webhook task %s_%s for %s: %s",
+                    entry.task.doc_type,
+                    entry.task.doc_id,
+                    entry.task.user_id,
+                    format_exception_group(e),
+                )
+        return sent
+
+    async def close(self) -> None:
+        """Stop accepting tasks and send whatever is still buffered."""
+        self._closed = True
+        with anyio.move_on_after(_CLOSE_FLUSH_TIMEOUT) as scope:
+            await self.flush(force=True)
+        if scope.cancelled_caught:
+            logger.warning(
+                "Webhook coalescer gave up flushing at shutdown; the scanner "
+                "will pick up the remaining changes"
+            )
+
+    def _is_due(self, entry: _Pending, now: float) -> bool:
+        if now - entry.first_seen >= self._max_delay:
+            return True
+        last_seen = entry.last_seen
+        if entry.folder is not None:
+            last_seen = max(
+                last_seen,
+                self._folder_last_seen.get(
+                    (entry.task.user_id, entry.folder), last_seen
+                ),
+            )
+        return now - last_seen >= self._window
+
+    def _forget_quiet_folders(self, now: float) -> None:
+        # A folder's timestamp only matters while it can still hold keys back.
+        for folder_key, last_seen in list(self._folder_last_seen.items()):
+            if now - last_seen >= self._max_delay:
+                del self._folder_last_seen[folder_key]
+
+    def _batch_folders(self, due: list[_Pending]) -> list[_Pending]:
+        """Replace large per-folder runs of file index tasks with a scan wake."""
+        if self._folder_batch <= 0 or self._scan_waker is None:
+            return due
+        by_folder: dict[tuple[str, str], list[_Pending]] = defaultdict(list)
+        for entry in due:
+            if entry.folder is not None and entry.task.operation == "index":
+                by_folder[(entry.task.user_id, entry.folder)].append(entry)
+
+        batched: set[int] = set()
+        for (user_id, folder), entries in by_folder.items():
+            if len(entries) < self._folder_batch or not self._scan_waker(user_id):
+                continue
+            batched.update(id(entry) for entry in entries)
+            record_webhook_events_coalesced("file", "folder_batched", len(entries))
+            logger.info(
+                "Coalesced %d file events under %s into a scan for %s",
+                len(entries),
+                folder,
+                user_id,
+            )
+        return [entry for entry in due if id(entry) not in batched]
@@ -87,6 +87,38 @@ def extract_document_task(payload: dict) -> DocumentTask | None:
     return None
 
 
+def is_deck_board_event(payload: dict) -> bool:
+    """True for a Deck ``BoardUpdatedEvent``.
+
+    The event yields no DocumentTask (it names no card), but a board update can
+    change the board's sharing — and with it who may read every card on it.
+    """
+    try:
+        return payload["event"]["class"] == _DECK_EVENT_BOARD_UPDATED
+    except (KeyError, TypeError):
+        return False
+
+
+def file_event_folder(payload: dict) -> str | None:
+    """Parent folder of a file node event's path, or None for other events.
+
+    Lets the webhook coalescer batch the events of a folder-wide sync.
+    """
+    try:
+        event = payload["event"]
+        if event["class"] not in (
+            _FILE_EVENT_CREATED,
+            _FILE_EVENT_WRITTEN,
+            _FILE_EVENT_BEFORE_DELETED,
+        ):
+            return None
+        path = (event.get("node") or {}).get("path") or ""
+    except (KeyError, TypeError, AttributeError):
+        return None
+    folder, sep, _name = path.rpartition("/")
+    return folder if sep else None
+
+
 def _parse_file_event(
     event_class: str, event: dict, user_id: str, time: int
 ) -> DocumentTask | None:
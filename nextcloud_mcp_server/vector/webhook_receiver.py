@@ -13,7 +13,15 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from nextcloud_mcp_server.config import get_settings
-from nextcloud_mcp_server.vector.webhook_parser import extract_document_task
+from nextcloud_mcp_server.search.verification_cache import (
+    invalidate_doc_type,
+    invalidate_document,
+)
+from nextcloud_mcp_server.vector.webhook_parser import (
+    extract_document_task,
+    file_event_folder,
+    is_deck_board_event,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,19 @@ def _warn_missing_secret_once() -> None:
     )
 
 
+def _wake_scan(request: Request, user_id: str) -> None:
+    """Promote the user's next scan into the scheduler's wake lane.
+
+    The webhook covers one document; the scan picks up anything it did not
+    (e.g. the PDFs under a newly tagged folder). Called only once the task was
+    accepted: a refused delivery is retried by Nextcloud and must not promote
+    the scan each time. No scheduler in single-user mode.
+    """
+    scan_scheduler = getattr(request.app.state, "scan_scheduler", None)
+    if scan_scheduler is not None:
+        scan_scheduler.wake(user_id)
+
+
 async def handle_nextcloud_webhook(request: Request) -> JSONResponse:
     """Receive a Nextcloud webhook and queue a DocumentTask for vector sync.
 
@@ -46,7 +67,9 @@ async def handle_nextcloud_webhook(request: Request) -> JSONResponse:
     read from ``request.app.state.task_producer`` (the in-memory send stream when
     ``INGEST_QUEUE=memory``, or the procrastinate producer when
     ``INGEST_QUEUE=postgres``); when vector sync isn't running we return 503 so
-    NC retries delivery.
+    NC retries delivery. When ``request.app.state.webhook_coalescer`` is set,
+    the task is buffered there instead and sent to the producer once its
+    debounce window closes.
 
     ``WEBHOOK_SECRET`` is **required** (GHSA-8vh3-g2qg-2h2c). The endpoint is
     only mounted by ``app.py`` when the secret is configured, and every request
@@ -103,6 +126,16 @@ async def handle_nextcloud_webhook(request: Request) -> JSONResponse:
         )
 
     task = extract_document_task(payload)
+
+    # Any delivered change may alter who can see the document (a delete, an
+    # untag, a board's sharing), so drop cached verify-on-read verdicts now
+    # rather than after their TTL — before the queue, which may be full or on
+    # another process.
+    if task is not None:
+        invalidate_document(task.doc_type, task.doc_id)
+    elif is_deck_board_event(payload):
+        invalidate_doc_type("deck_card")
+
     if task is None:
         event_class = (payload.get("event") or {}).get("class", "<missing>")
         logger.debug("Webhook ignored (unsupported event): %s", event_class)
@@ -121,6 +154,39 @@ async def handle_nextcloud_webhook(request: Request) -> JSONResponse:
             status_code=503,
         )
 
+    # Debounce buffer (WEBHOOK_COALESCE_*): bursts for one document collapse to
+    # one task, sent once the document has been quiet for the window.
+    coalescer = getattr(request.app.state, "webhook_coalescer", None)
+    if coalescer is not None:
+        folder = file_event_folder(payload) if task.doc_type == "file" else None
+        if not coalescer.submit(task, folder=folder):
+            logger.warning(
+                "Webhook task drop: coalescer full for %s_%s",
+                task.doc_type,
+                task.doc_id,
+            )
+            return JSONResponse(
+                {"status": "unavailable", "reason": "queue full"},
+                status_code=503,
+            )
+        _wake_scan(request, task.user_id)
+        logger.debug(
+            "Webhook buffered %s_%s (%s) for user %s",
+            task.doc_type,
+            task.doc_id,
+            task.operation,
+            task.user_id,
+        )
+        return JSONResponse(
+            {
+                "status": "buffered",
+                "doc_type": task.doc_type,
+                "doc_id": task.doc_id,
+                "operation": task.operation,
+            },
+            status_code=200,
+        )
+
     try:
         with anyio.fail_after(1.0):
             await producer.send(task)
@@ -148,6 +214,7 @@ async def handle_nextcloud_webhook(request: Request) -> JSONResponse:
             {"status": "error", "message": "queue unavailable"},
             status_code=500,
         )
+    _wake_scan(request, task.user_id)
 
     logger.info(
         "Webhook queued %s_%s (%s) for user %s",
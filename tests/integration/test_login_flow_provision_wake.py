@@ -62,6 +62,11 @@ async def test_login_flow_provision_wakes_user_manager(temp_storage, mocker):
     # ── user_manager: long poll interval + stubbed per-user scanner ──────────
     manager_settings = MagicMock()
     manager_settings.vector_sync_user_poll_interval = 1000  # never fires here
+    manager_settings.vector_sync_max_concurrent_scans = 4
+    manager_settings.vector_sync_scan_interval = 300
+    manager_settings.vector_sync_scan_interval_min = 60
+    manager_settings.vector_sync_scan_interval_max = 1800
+    manager_settings.vector_sync_scan_jitter = 0.1
     mocker.patch(
         "nextcloud_mcp_server.vector.oauth_sync.get_settings",
         return_value=manager_settings,
@@ -78,6 +83,7 @@ async def test_login_flow_provision_wakes_user_manager(temp_storage, mocker):
         wake_event,
         nextcloud_host,
         user_states,
+        scan_scheduler,
     ):
         spawned.add(user_id)
         if user_id == "alice":
@@ -0,0 +1,122 @@
+"""Unit tests for the per-user tool-call client pool (client/pool.py).
+
+Tool calls in the multi-user modes reuse one ``NextcloudClient`` per user and
+credential over a shared transport; a new credential for the same user gets a
+new client seeded with the user's DAV discovery, and clients dropped from the
+pool are closed once idle.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import BasicAuth
+
+from nextcloud_mcp_server.client import pool as pool_module
+from nextcloud_mcp_server.client.pool import NextcloudClientPool
+
+pytestmark = pytest.mark.unit
+
+HOST = "https://cloud.example.org"
+
+
+@pytest.fixture(autouse=True)
+def _mock_dav_client(mocker):
+    mocker.patch(
+        "nextcloud_mcp_server.client.calendar.AsyncDAVClient",
+        return_value=mocker.AsyncMock(),
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(pool_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+async def _acquire(pool: NextcloudClientPool, username: str, password: str):
+    return await pool.acquire(
+        HOST, username, auth=BasicAuth(username, password), password=password
+    )
+
+
+async def test_same_credential_reuses_client_over_one_transport():
+    pool = NextcloudClientPool(max_clients=8, idle_seconds=600)
+
+    first = await _acquire(pool, "alice", "pw-1")
+    again = await _acquire(pool, "alice", "pw-1")
+    rotated = await _acquire(pool, "alice", "pw-2")
+    bob = await _acquire(pool, "bob", "pw-1")
+
+    assert again is first
+    assert rotated is not first and bob is not first
+    assert len(pool) == 3
+    transports = {c._client._transport.transport for c in (first, rotated, bob)}
+    assert len(transports) == 1
+
+    await pool.aclose()
+    assert len(pool) == 0
+
+
+async def test_new_credential_inherits_user_discovery():
+    pool = NextcloudClientPool(max_clients=8, idle_seconds=600)
+    first = await _acquire(pool, "alice", "pw-1")
+    first.webdav._principal_id = "alice-principal"
+    first.webdav._principal_discovered = True
+    first.calendar._calendar_home_url = f"{HOST}/remote.php/dav/calendars/alice-x/"
+    first.calendar._principal_resolved = True
+
+    rotated = await _acquire(pool, "alice", "pw-2")
+    bob = await _acquire(pool, "bob", "pw-1")
+
+    assert rotated.notes._principal_id == "alice-principal"
+    assert rotated.contacts._principal_discovered
+    assert rotated.calendar._calendar_home_url.endswith("/alice-x/")
+    assert rotated.calendar._principal_resolved
+    assert not bob.webdav._principal_discovered
+    assert not bob.calendar._principal_resolved
+
+
+async def test_dropped_client_is_closed_only_once_idle(clock):
+    pool = NextcloudClientPool(max_clients=1, idle_seconds=60)
+    alice = await _acquire(pool, "alice", "pw")
+    alice.close = AsyncMock()
+
+    bob = await _acquire(pool, "bob", "pw")  # evicts alice, maybe still in use
+    alice.close.assert_not_awaited()
+    assert len(pool) == 1
+
+    clock[0] += 61
+    assert await _acquire(pool, "bob", "pw") is bob
+    alice.close.assert_awaited_once()
+
+
+async def test_idle_client_is_closed_and_rebuilt(clock):
+    pool = NextcloudClientPool(max_clients=8, idle_seconds=60)
+    alice = await _acquire(pool, "alice", "pw")
+    alice.close = AsyncMock()
+
+    clock[0] += 61
+    await _acquire(pool, "bob", "pw")
+
+    alice.close.assert_awaited_once()
+    assert await _acquire(pool, "alice", "pw") is not alice
+
+
+async def test_pooling_off_builds_a_fresh_client(monkeypatch):
+    monkeypatch.setattr(
+        pool_module,
+        "get_settings",
+        lambda: SimpleNamespace(nextcloud_client_pool_size=0),
+    )
+
+    first = await pool_module.pooled_client(
+        HOST, "alice", auth=BasicAuth("alice", "pw"), password="pw"
+    )
+    second = await pool_module.pooled_client(
+        HOST, "alice", auth=BasicAuth("alice", "pw"), password="pw"
+    )
+
+    assert first is not second
+    assert pool_module.get_client_pool() is None
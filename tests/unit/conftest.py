@@ -66,3 +66,93 @@ def _reload_dynaconf_after_test():
     # clear the settings caches too or a cached value leaks into later tests.
     _config._clear_settings_caches()
     _config._bg_ops_advisories_logged = False
+
+
+@pytest.fixture(autouse=True)
+def _clear_embedding_cache():
+    """Chunk vectors are cached process-wide, keyed on chunk text and model.
+
+    Processor tests embed the same chunk texts with different mocked
+    embedders, so a vector cached by one test would skip the next test's
+    embedder entirely.
+    """
+    from nextcloud_mcp_server.vector.embedding_cache import reset_embedding_cache
+
+    reset_embedding_cache()
+    yield
+    reset_embedding_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_verification_cache():
+    """Verify-on-read verdicts are cached process-wide, keyed by user and doc id.
+
+    Unit tests reuse the same "alice" / doc id pairs with different verifier
+    outcomes, so a verdict cached by one test would answer the next one's
+    verification without calling its (mocked) verifier.
+    """
+    from nextcloud_mcp_server.search.verification_cache import (
+        clear_verification_cache,
+    )
+
+    clear_verification_cache()
+    yield
+    clear_verification_cache()
+
+
+@pytest.fixture(autouse=True)
+def _clear_client_pool():
+    """Tool-call NextcloudClients are pooled process-wide per credential.
+
+    Unit tests build clients for the same user and password against different
+    mocks, so a client pooled by one test would be handed to the next.
+    """
+    from nextcloud_mcp_server.client.pool import clear_client_pool
+
+    clear_client_pool()
+    yield
+    clear_client_pool()
+
+
+@pytest.fixture(autouse=True)
+def _clear_credential_caches():
+    """Decrypted credentials are cached process-wide per database and key."""
+    from nextcloud_mcp_server.auth.credential_cache import clear_credential_caches
+
+    clear_credential_caches()
+    yield
+    clear_credential_caches()
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_cache():
+    """Query vectors and hybrid-search candidates are cached process-wide.
+
+    Unit tests repeat the same "alice" / query pairs against different mocked
+    embedders and Qdrant responses, so a cached entry would answer the next
+    test's search without reaching its mocks.
+    """
+    from nextcloud_mcp_server.search.query_cache import clear_query_cache
+
+    clear_query_cache()
+    yield
+    clear_query_cache()
+
+
+@pytest.fixture(autouse=True)
+def _isolate_parse_cache(tmp_path, monkeypatch):
+    """Parse results are cached on disk under the spool dir, keyed on etag.
+
+    Processor tests reuse the same doc id / etag pairs with different mocked
+    parses, and the default spool dir is the shared system temp dir, so give
+    every test its own empty cache directory.
+    """
+    from nextcloud_mcp_server.vector import parse_cache
+
+    monkeypatch.setattr(
+        parse_cache,
+        "_cache",
+        parse_cache.ParseResultCache(
+            tmp_path / parse_cache.CACHE_DIRNAME, max_bytes=64 * 1024 * 1024
+        ),
+    )
@@ -0,0 +1,83 @@
+"""Unit tests for the native BM25 encoder (providers/bm25_encoder.py).
+
+The encoder must produce exactly what FastEmbed's ``Bm25`` produces, or stored
+sparse vectors and search queries stop matching. The reference model is a real
+``fastembed.sparse.bm25.Bm25`` loaded from a local stopwords file, so no model
+download is needed.
+"""
+
+from __future__ import annotations
+
+import pickle
+from types import SimpleNamespace
+
+import pytest
+from fastembed.sparse.bm25 import Bm25
+
+from nextcloud_mcp_server.providers.bm25_encoder import BM25Encoder
+
+pytestmark = pytest.mark.unit
+
+_TEXTS = [
+    "The quick brown fox's jumped over the lazy dogs!! Running runners ran.",
+    "",
+    "___ a_b İstanbul naïve café — ½ ² Ⅻ 3.14 e-mail foo@bar.com",
+    "Ärger über Straße " * 40,
+    "日本語のテキスト 中文 文本",
+    "x" * 50 + " kept " + "y" * 40,
+    "Meeting notes: the budget is approved, and the budget review is next week.",
+]
+
+
+@pytest.fixture(scope="module")
+def bm25(tmp_path_factory) -> Bm25:
+    model_dir = tmp_path_factory.mktemp("bm25")
+    (model_dir / "english.txt").write_text("the\na\nover\nof\nand\nis\n")
+    (model_dir / "mock.file").write_text("")
+    return Bm25("Qdrant/bm25", specific_model_path=str(model_dir))
+
+
+def _reference(bm25: Bm25, texts: list[str]) -> list[dict[str, list]]:
+    return [
+        {"indices": emb.indices.tolist(), "values": emb.values.tolist()}
+        for emb in bm25.embed(texts)
+    ]
+
+
+def test_matches_fastembed(bm25):
+    encoder = BM25Encoder.from_fastembed(bm25, vocab_size=1000)
+    assert encoder is not None
+    expected = _reference(bm25, _TEXTS)
+
+    assert encoder.encode_batch(_TEXTS) == expected
+    # Second pass is served from the vocabulary table.
+    assert encoder.encode_batch(_TEXTS) == expected
+    assert encoder.encode(_TEXTS[0]) == expected[0]
+
+
+def test_vocabulary_table_is_bounded(bm25):
+    encoder = BM25Encoder.from_fastembed(bm25, vocab_size=8)
+    assert encoder is not None
+
+    assert encoder.encode_batch(_TEXTS) == _reference(bm25, _TEXTS)
+    assert encoder.vocab_len <= 8
+
+
+def test_pickled_encoder_rebuilds_its_stemmer(bm25):
+    encoder = BM25Encoder.from_fastembed(bm25, vocab_size=1000)
+    encoder.encode_batch(_TEXTS)
+
+    copy = pickle.loads(pickle.dumps(encoder))
+    assert copy.vocab_len == 0
+    assert copy.encode_batch(_TEXTS) == _reference(bm25, _TEXTS)
+
+
+def test_values_are_plain_python_numbers(bm25):
+    vector = BM25Encoder.from_fastembed(bm25, vocab_size=1000).encode(_TEXTS[0])
+
+    assert all(type(i) is int for i in vector["indices"])
+    assert all(type(v) is float for v in vector["values"])
+
+
+def test_non_bm25_model_is_not_mirrored():
+    assert BM25Encoder.from_fastembed(SimpleNamespace(), vocab_size=10) is None
@@ -0,0 +1,168 @@
+"""Unit tests for the repeated-search caches (search/query_cache.py).
+
+Driven through ``BM25HybridSearchAlgorithm.search`` with a mocked embedder,
+BM25 service and Qdrant client: a repeat search must reuse the query vectors
+and candidates it may reuse, and go back to the provider / Qdrant whenever the
+user, the page shape or an owner's documents changed.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nextcloud_mcp_server.config import Settings
+from nextcloud_mcp_server.search import query_cache
+from nextcloud_mcp_server.search.bm25_hybrid import BM25HybridSearchAlgorithm
+from nextcloud_mcp_server.search.query_cache import invalidate_owner
+
+pytestmark = pytest.mark.unit
+
+_MODULE = "nextcloud_mcp_server.search.bm25_hybrid"
+
+
+def _point(doc_id: int, score: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=doc_id,
+        score=score,
+        payload={
+            "doc_id": doc_id,
+            "doc_type": "note",
+            "title": f"note {doc_id}",
+            "excerpt": "...",
+            "chunk_start_offset": 0,
+            "chunk_end_offset": 10,
+        },
+    )
+
+
+@pytest.fixture
+def deps(monkeypatch):
+    """Stub search() deps; Qdrant returns 20 points with descending scores."""
+    embed = AsyncMock(return_value=([0.1, 0.2, 0.3], 7))
+    monkeypatch.setattr(
+        f"{_MODULE}.get_provider", lambda: SimpleNamespace(embed_with_usage=embed)
+    )
+    bm25 = MagicMock()
+    bm25.encode_async = AsyncMock(return_value={"indices": [1], "values": [0.5]})
+    monkeypatch.setattr(f"{_MODULE}.get_bm25_service", AsyncMock(return_value=bm25))
+
+    response = SimpleNamespace(points=[_point(i, 1.0 - i / 100) for i in range(20)])
+    qdrant = MagicMock()
+    qdrant.query_points = AsyncMock(return_value=response)
+    grouped = SimpleNamespace(groups=[SimpleNamespace(hits=[_point(1, 0.9)])])
+    qdrant.query_points_groups = AsyncMock(return_value=grouped)
+    monkeypatch.setattr(f"{_MODULE}.get_qdrant_client", AsyncMock(return_value=qdrant))
+
+    settings = MagicMock()
+    settings.get_collection_name.return_value = "test_collection"
+    settings.get_embedding_identity.return_value = "test-model"
+    settings.get_embedding_provider_family.return_value = "mistral"
+    settings.vector_search_rrf_k = 60
+    monkeypatch.setattr(f"{_MODULE}.get_settings", lambda: settings)
+    return SimpleNamespace(embed=embed, bm25=bm25, qdrant=qdrant)
+
+
+async def _search(**kwargs):
+    kwargs.setdefault("query", "budget review")
+    kwargs.setdefault("user_id", "alice")
+    return await BM25HybridSearchAlgorithm().search(**kwargs)
+
+
+async def test_repeat_query_reuses_vectors_without_billing(deps):
+    await _search()
+    algo = BM25HybridSearchAlgorithm()
+    await algo.search(query="  budget   review ", user_id="alice", doc_type="file")
+
+    assert deps.embed.await_count == 1
+    assert deps.bm25.encode_async.await_count == 1
+    assert algo.query_token_count == 0
+    assert algo.query_embedding == pytest.approx([0.1, 0.2, 0.3])
+
+
+async def test_query_vectors_are_per_user(deps):
+    await _search(user_id="alice")
+    await _search(user_id="bob")
+
+    assert deps.embed.await_count == 2
+
+
+async def test_repeat_search_skips_qdrant(deps):
+    first = await _search(limit=5)
+    second = await _search(limit=5)
+
+    assert deps.qdrant.query_points.await_count == 1
+    assert [r.id for r in second] == [r.id for r in first]
+
+
+async def test_smaller_page_goes_to_qdrant(deps):
+    # The limit sets the prefetch depth, so a larger page's head is not the
+    # smaller page's result.
+    await _search(limit=10)
+    await _search(limit=3)
+
+    assert deps.qdrant.query_points.await_count == 2
+
+
+async def test_larger_page_goes_to_qdrant(deps):
+    await _search(limit=3)
+    await _search(limit=10)
+
+    assert deps.qdrant.query_points.await_count == 2
+
+
+async def test_each_page_size_keeps_its_own_entry(deps):
+    await _search(limit=10)
+    await _search(limit=3)
+    await _search(limit=10)
+    await _search(limit=3)
+
+    assert deps.qdrant.query_points.await_count == 2
+
+
+async def test_grouped_search_needs_the_same_limit(deps):
+    await _search(limit=10, granularity="document")
+    await _search(limit=10, granularity="document")
+    await _search(limit=5, granularity="document")
+
+    assert deps.qdrant.query_points_groups.await_count == 2
+
+
+async def test_higher_score_threshold_filters_cached_points(deps):
+    await _search(limit=10)
+    results = await _search(limit=10, score_threshold=0.975)
+
+    assert deps.qdrant.query_points.await_count == 1
+    assert [r.id for r in results] == ["0", "1", "2"]
+
+
+async def test_different_filter_goes_to_qdrant(deps):
+    await _search(limit=5)
+    await _search(limit=5, accessible_owners=["alice", "bob"])
+    await _search(limit=5, doc_type="file")
+
+    assert deps.qdrant.query_points.await_count == 3
+
+
+async def test_write_to_an_accessible_owner_invalidates(deps):
+    await _search(limit=5, accessible_owners=["alice", "bob"])
+    invalidate_owner("carol")
+    await _search(limit=5, accessible_owners=["alice", "bob"])
+    assert deps.qdrant.query_points.await_count == 1
+
+    invalidate_owner("bob")
+    await _search(limit=5, accessible_owners=["alice", "bob"])
+    assert deps.qdrant.query_points.await_count == 2
+
+
+async def test_zero_settings_disable_both_caches(deps, monkeypatch):
+    monkeypatch.setattr(
+        query_cache,
+        "get_settings",
+        lambda: Settings(query_vector_cache_size=0, search_result_cache_ttl_seconds=0),
+    )
+    await _search()
+    await _search()
+
+    assert deps.embed.await_count == 2
+    assert deps.qdrant.query_points.await_count == 2
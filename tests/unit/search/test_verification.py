@@ -86,12 +86,10 @@ async def test_verify_notes_200_keeps_all(mocker):
     )
     client = SimpleNamespace(notes=notes_client, username="alice")
 
-    result = await _verify_notes(
-        client, [_make_result(1), _make_result(2), _make_result(3)], _sem()
-    )
+    result = await _verify_notes(client, [_make_result(1), _make_result(2)], _sem())
 
-    assert result == {"1", "2", "3"}
-    assert notes_client.get_note.await_count == 3
+    assert result == {"1", "2"}
+    assert notes_client.get_note.await_count == 2
 
 
 @pytest.mark.unit
@@ -192,6 +190,8 @@ async def test_verify_notes_mixed_outcomes(mocker):
             raise _http_error(500)  # transient → keep
         raise AssertionError(f"unexpected id {note_id}")
 
+    # Per-id path: three notes would otherwise take the batched listing.
+    mocker.patch.object(verification, "_BATCH_VERIFY_MIN_RESULTS", 10)
     notes_client = SimpleNamespace(get_note=mocker.AsyncMock(side_effect=side_effect))
     client = SimpleNamespace(notes=notes_client, username="alice")
 
@@ -225,6 +225,42 @@ async def test_verify_notes_string_doc_id_matches_production(mocker):
     notes_client.get_note.assert_awaited_once_with(42)
 
 
+@pytest.mark.unit
+async def test_verify_notes_batch_uses_one_listing(mocker):
+    """Enough notes in one search → one ids-only listing instead of N get_note."""
+    notes_client = SimpleNamespace(
+        get_note=mocker.AsyncMock(side_effect=AssertionError("must not be called")),
+        get_note_ids=mocker.AsyncMock(return_value={1, 3}),
+    )
+    client = SimpleNamespace(notes=notes_client, username="alice")
+
+    result = await _verify_notes(
+        client,
+        [_make_result(1), _make_result(2), _make_result(3), _make_result("bad")],
+        _sem(),
+    )
+
+    # "2" is absent from the listing (deleted); the malformed id fails open.
+    assert result == {"1", "3", "bad"}
+    notes_client.get_note_ids.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("status", "expected"), [(404, set()), (503, {"1", "2", "3"})])
+async def test_verify_notes_batch_listing_errors(mocker, status, expected):
+    """Listing 404 → Notes gone, drop all; transient → keep all (fail-open)."""
+    notes_client = SimpleNamespace(
+        get_note_ids=mocker.AsyncMock(side_effect=_http_error(status))
+    )
+    client = SimpleNamespace(notes=notes_client, username="alice")
+
+    result = await _verify_notes(
+        client, [_make_result(1), _make_result(2), _make_result(3)], _sem()
+    )
+
+    assert result == expected
+
+
 # ---------------------------------------------------------------------------
 # Mail verifier (per-id, mirrors the note verifier)
 # ---------------------------------------------------------------------------
@@ -952,6 +988,61 @@ async def test_verify_deck_cards_non_numeric_metadata_keeps(mocker):
     deck_client.get_card.assert_not_awaited()
 
 
+def _deck_stacks(*cards: tuple[int, bool]) -> list:
+    return [
+        SimpleNamespace(cards=[SimpleNamespace(id=card_id, archived=archived)])
+        for card_id, archived in cards
+    ]
+
+
+@pytest.mark.unit
+async def test_verify_deck_cards_batches_per_board(mocker):
+    """Three cards on one board → one get_stacks; a lone card → one get_card."""
+    deck_client = SimpleNamespace(
+        get_stacks=mocker.AsyncMock(return_value=_deck_stacks((41, False), (42, True))),
+        get_card=mocker.AsyncMock(return_value=object()),
+    )
+    client = SimpleNamespace(deck=deck_client, username="alice")
+    on_board_1 = {"board_id": 1, "stack_id": 2}
+
+    result = await _verify_deck_cards(
+        client,
+        [
+            _make_result(41, doc_type="deck_card", metadata=on_board_1),
+            _make_result(42, doc_type="deck_card", metadata=on_board_1),
+            _make_result(43, doc_type="deck_card", metadata=on_board_1),
+            _make_result(
+                50, doc_type="deck_card", metadata={"board_id": 9, "stack_id": 3}
+            ),
+        ],
+        _sem(),
+    )
+
+    # 42 is archived and 43 is gone: both dropped, like the scanner's window.
+    assert result == {"41", "50"}
+    deck_client.get_stacks.assert_awaited_once_with(1)
+    deck_client.get_card.assert_awaited_once_with(board_id=9, stack_id=3, card_id=50)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("status", "expected"), [(403, set()), (502, {"1", "2", "3"})])
+async def test_verify_deck_cards_board_listing_errors(mocker, status, expected):
+    """Board 403 → unshared, drop its cards; transient → keep them (fail-open)."""
+    deck_client = SimpleNamespace(
+        get_stacks=mocker.AsyncMock(side_effect=_http_error(status))
+    )
+    client = SimpleNamespace(deck=deck_client, username="alice")
+    meta = {"board_id": 1, "stack_id": 2}
+
+    result = await _verify_deck_cards(
+        client,
+        [_make_result(i, doc_type="deck_card", metadata=meta) for i in (1, 2, 3)],
+        _sem(),
+    )
+
+    assert result == expected
+
+
 @pytest.mark.unit
 async def test_verify_deck_cards_missing_metadata_keeps_unverified(mocker):
     """Legacy data without board_id/stack_id → keep, do NOT iterate or call API."""
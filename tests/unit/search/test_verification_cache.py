@@ -0,0 +1,181 @@
+"""Unit tests for the verify-on-read verdict cache (search/verification_cache.py).
+
+Repeat searches reuse definitive verdicts (positive and negative), fail-open
+keeps are never cached, and every invalidation scope — document, doc_type,
+user, and a change of incoming shares — forces the next search to re-verify.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from httpx import HTTPStatusError
+
+from nextcloud_mcp_server.config import Settings
+from nextcloud_mcp_server.search import access_filter, verification, verification_cache
+from nextcloud_mcp_server.search.access_filter import (
+    clear_accessible_owners_cache,
+    list_accessible_scope,
+)
+from nextcloud_mcp_server.search.algorithms import SearchResult
+from nextcloud_mcp_server.search.verification import verify_search_results
+from nextcloud_mcp_server.search.verification_cache import (
+    invalidate_doc_type,
+    invalidate_document,
+    invalidate_user,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _result(doc_id: str, doc_type: str = "note") -> SearchResult:
+    return SearchResult(
+        id=doc_id,
+        doc_type=doc_type,
+        title=f"{doc_type}_{doc_id}",
+        excerpt="...",
+        score=0.9,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_eviction(mocker):
+    mocker.patch.object(verification, "delete_document_points", AsyncMock())
+
+
+@pytest.fixture
+def note_verifier(mocker):
+    """Note verifier reporting "1" accessible and "2" gone."""
+    verifier = AsyncMock(return_value={"1"})
+    mocker.patch.dict(verification._VERIFIERS, {"note": verifier}, clear=False)
+    return verifier
+
+
+async def _search(user: str = "alice") -> list[str]:
+    client = SimpleNamespace(username=user)
+    kept, _dropped = await verify_search_results(client, [_result("1"), _result("2")])
+    return [r.id for r in kept]
+
+
+async def test_repeat_search_reuses_positive_and_negative_verdicts(
+    note_verifier, metric_sample
+):
+    hits_before = metric_sample(
+        "astrolabe_search_verification_cache_total",
+        {"doc_type": "note", "result": "hit"},
+    )
+
+    assert await _search() == ["1"]
+    assert await _search() == ["1"]
+
+    note_verifier.assert_awaited_once()
+    hits_after = metric_sample(
+        "astrolabe_search_verification_cache_total",
+        {"doc_type": "note", "result": "hit"},
+    )
+    assert hits_after - hits_before == 2
+
+
+async def test_verdicts_are_per_user(note_verifier):
+    await _search("alice")
+    await _search("bob")
+
+    assert note_verifier.await_count == 2
+
+
+async def test_fail_open_keep_is_not_cached():
+    request = httpx.Request("GET", "http://test.local/x")
+    error = HTTPStatusError(
+        "503", request=request, response=httpx.Response(503, request=request)
+    )
+    notes = SimpleNamespace(get_note=AsyncMock(side_effect=error))
+    client = SimpleNamespace(username="alice", notes=notes)
+
+    for _ in range(2):
+        kept, dropped = await verify_search_results(client, [_result("7")])
+        assert [r.id for r in kept] == ["7"]
+        assert dropped == 0
+
+    assert notes.get_note.await_count == 2
+
+
+async def test_verifier_crash_is_not_cached(mocker):
+    verifier = AsyncMock(side_effect=RuntimeError("boom"))
+    mocker.patch.dict(verification._VERIFIERS, {"note": verifier}, clear=False)
+
+    assert await _search() == ["1", "2"]
+    assert await _search() == ["1", "2"]
+    assert verifier.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "invalidate",
+    [
+        lambda: invalidate_document("note", "2"),
+        lambda: invalidate_doc_type("note"),
+        lambda: invalidate_user("alice"),
+    ],
+    ids=["document", "doc_type", "user"],
+)
+async def test_invalidation_forces_reverification(note_verifier, invalidate):
+    await _search()
+    invalidate()
+    note_verifier.return_value = {"1", "2"}  # e.g. the note was re-shared
+
+    assert await _search() == ["1", "2"]
+    assert note_verifier.await_count == 2
+    # Only the invalidated scope was re-verified.
+    pending_ids = {r.id for r in note_verifier.call_args.args[1]}
+    assert "2" in pending_ids
+
+
+async def test_invalidation_during_verification_wins(mocker):
+    async def verify(client, results, semaphore):
+        # The note is deleted while its verification is in flight: the
+        # verdict computed from the pre-delete state must not be cached.
+        invalidate_document("note", "1")
+        return {"1"}
+
+    verifier = AsyncMock(side_effect=verify)
+    mocker.patch.dict(verification._VERIFIERS, {"note": verifier}, clear=False)
+
+    await _search()
+    await _search()
+
+    assert verifier.await_count == 2
+
+
+async def test_zero_ttl_disables_cache(note_verifier, monkeypatch):
+    monkeypatch.setattr(
+        verification_cache,
+        "get_settings",
+        lambda: Settings(verification_cache_ttl_seconds=0),
+    )
+
+    await _search()
+    await _search()
+
+    assert note_verifier.await_count == 2
+
+
+async def test_changed_incoming_shares_invalidate_user(note_verifier, monkeypatch):
+    # Every scope lookup goes to OCS, as after the owners-cache TTL.
+    monkeypatch.setattr(access_filter, "_OWNERS_CACHE_TTL_SECONDS", 0.0)
+    clear_accessible_owners_cache()
+    sharing = AsyncMock()
+    sharing.list_shares.return_value = [{"uid_owner": "bob", "file_source": 5}]
+
+    await list_accessible_scope(sharing, "alice")
+    await _search()
+    # Unchanged scope on refresh: cached verdicts survive.
+    await list_accessible_scope(sharing, "alice")
+    await _search()
+    assert note_verifier.await_count == 1
+
+    # Bob revoked his share, so the refreshed scope differs.
+    sharing.list_shares.return_value = []
+    await list_accessible_scope(sharing, "alice")
+    await _search()
+    assert note_verifier.await_count == 2
+    clear_accessible_owners_cache()
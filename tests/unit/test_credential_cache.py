@@ -0,0 +1,204 @@
+"""Unit tests for the decrypted credential cache (auth/credential_cache.py).
+
+Storage keeps decrypted app passwords and refresh tokens in memory; every
+write through storage drops the cached copy, and on Postgres tells the other
+replicas to do the same.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from cryptography.fernet import Fernet
+
+from nextcloud_mcp_server.auth import credential_cache as cache_module
+from nextcloud_mcp_server.auth.credential_cache import CredentialCache
+from nextcloud_mcp_server.auth.storage import RefreshTokenStorage
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def encryption_key():
+    return Fernet.generate_key().decode()
+
+
+@pytest.fixture
+async def storage(encryption_key):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = RefreshTokenStorage(
+            db_path=str(Path(tmpdir) / "credentials.db"),
+            encryption_key=encryption_key,
+        )
+        await storage.initialize()
+        yield storage
+        await storage.close()
+
+
+@pytest.fixture
+def count_reads(mocker):
+    def _count(storage: RefreshTokenStorage):
+        return mocker.spy(storage, "_db")
+
+    return _count
+
+
+async def test_app_password_reads_are_served_from_cache(storage, count_reads):
+    await storage.store_app_password_with_scopes(
+        "alice", "pw-1", scopes=["notes.read"], username="alice@example.org"
+    )
+    reads = count_reads(storage)
+
+    first = await storage.get_app_password_with_scopes("alice")
+    first["scopes"].append("notes.write")  # callers get their own copy
+    again = await storage.get_app_password_with_scopes("alice")
+
+    assert await storage.get_app_password("alice") == "pw-1"
+    assert again["scopes"] == ["notes.read"]
+    assert reads.call_count == 1
+
+
+@pytest.mark.parametrize(
+    ("write", "expected"),
+    [
+        (lambda s: s.store_app_password("alice", "pw-2"), ("pw-2", ["notes.read"])),
+        (
+            lambda s: s.update_app_password_scopes("alice", ["files.read"]),
+            ("pw-1", ["files.read"]),
+        ),
+        (lambda s: s.delete_app_password("alice"), None),
+    ],
+    ids=["store", "update_scopes", "delete"],
+)
+async def test_app_password_writes_invalidate(storage, write, expected):
+    await storage.store_app_password_with_scopes("alice", "pw-1", scopes=["notes.read"])
+    assert await storage.get_app_password("alice") == "pw-1"
+
+    await write(storage)
+
+    app_data = await storage.get_app_password_with_scopes("alice")
+    if expected is None:
+        assert app_data is None
+    else:
+        assert (app_data["app_password"], app_data["scopes"]) == expected
+
+
+async def test_write_through_another_instance_invalidates(storage, encryption_key):
+    other = RefreshTokenStorage(
+        database_url=storage.database_url, encryption_key=encryption_key
+    )
+    await storage.store_app_password("alice", "pw-1")
+    assert await storage.get_app_password("alice") == "pw-1"
+
+    await other.store_app_password("alice", "pw-2")
+
+    assert await storage.get_app_password("alice") == "pw-2"
+    await other.close()
+
+
+async def test_instances_with_another_key_do_not_share_plaintext(storage):
+    other = RefreshTokenStorage(
+        database_url=storage.database_url, encryption_key=Fernet.generate_key()
+    )
+    await storage.store_app_password("alice", "pw-1")
+    assert await storage.get_app_password("alice") == "pw-1"
+
+    assert await other.get_app_password("alice") is None
+    await other.close()
+
+
+async def test_refresh_token_cache_respects_expiry(storage, count_reads, mocker):
+    now = int(time.time())
+    await storage.store_refresh_token("alice", "rt-1", expires_at=now + 60)
+    reads = count_reads(storage)
+
+    assert (await storage.get_refresh_token("alice"))["refresh_token"] == "rt-1"
+    assert (await storage.get_refresh_token("alice"))["refresh_token"] == "rt-1"
+    assert reads.call_count == 1
+
+    # Past expires_at the cached copy is ignored and the row deleted.
+    mocker.patch("nextcloud_mcp_server.auth.storage.time.time", return_value=now + 120)
+    assert await storage.get_refresh_token("alice") is None
+    assert "alice" not in await storage.get_all_user_ids()
+
+
+async def test_refresh_token_store_and_delete_invalidate(storage):
+    await storage.store_refresh_token("alice", "rt-1")
+    assert (await storage.get_refresh_token("alice"))["refresh_token"] == "rt-1"
+
+    await storage.store_refresh_token("alice", "rt-2")
+    assert (await storage.get_refresh_token("alice"))["refresh_token"] == "rt-2"
+
+    await storage.delete_refresh_token("alice")
+    assert await storage.get_refresh_token("alice") is None
+
+
+async def test_rotation_keeps_provisioning_metadata(storage):
+    await storage.store_refresh_token(
+        "alice",
+        "rt-1",
+        flow_type="flow2",
+        provisioning_client_id="state-1",
+        scopes=["notes.read"],
+    )
+    before = await storage.get_refresh_token("alice")
+
+    expires_at = int(time.time()) + 3600
+    await storage.rotate_refresh_token("alice", "rt-2", expires_at=expires_at)
+    after = await storage.get_refresh_token("alice")
+
+    assert after["refresh_token"] == "rt-2"
+    assert after["expires_at"] == expires_at
+    assert after["flow_type"] == "flow2"
+    assert after["provisioning_client_id"] == "state-1"
+    assert after["scopes"] == ["notes.read"]
+    assert after["provisioned_at"] is not None
+    assert after["provisioned_at"] == before["provisioned_at"]
+
+
+def test_cache_is_off_with_zero_ttl(monkeypatch):
+    monkeypatch.setattr(
+        cache_module,
+        "get_settings",
+        lambda: SimpleNamespace(credential_cache_ttl_seconds=0),
+    )
+
+    assert cache_module.get_credential_cache("sqlite://", b"key") is None
+
+
+def test_entries_expire_and_stay_bounded(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    cache = CredentialCache(ttl_seconds=60, max_entries=2)
+
+    for user in ("alice", "bob", "carol"):
+        cache.put("app_passwords", user, {"app_password": user}, cache.epoch)
+    assert cache.get("app_passwords", "alice") is None  # least recently used
+    assert len(cache) == 2
+
+    now[0] += 60
+    assert cache.get("app_passwords", "bob") is None
+
+
+def test_read_racing_an_invalidation_is_not_cached():
+    cache = CredentialCache(ttl_seconds=60, max_entries=8)
+    epoch = cache.epoch  # a read starts...
+    cache.invalidate("app_passwords", "alice")  # ...a write lands meanwhile
+
+    cache.put("app_passwords", "alice", {"app_password": "old"}, epoch)
+
+    assert cache.get("app_passwords", "alice") is None
+
+
+def test_notification_from_another_replica_invalidates():
+    cache = CredentialCache(ttl_seconds=60, max_entries=8)
+    cache.put("refresh_tokens", "a:b", {"refresh_token": "rt"}, cache.epoch)
+    cache.put("app_passwords", "a:b", {"app_password": "pw"}, cache.epoch)
+
+    cache.apply_notification("refresh_tokens:a:b")
+    cache.apply_notification("bogus")
+
+    assert cache.get("refresh_tokens", "a:b") is None
+    assert cache.get("app_passwords", "a:b") is not None
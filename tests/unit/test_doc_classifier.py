@@ -356,6 +356,38 @@ def test_scan_coverage_shorter_than_pages_aligns_without_crash():
     assert c.recommended_tier == "fast"
 
 
+def test_parser_signals_give_the_same_classification():
+    # The fast tier scores each page in its worker (PAGE_SIGNALS_KEY); reusing
+    # those scores must not change a single signal.
+    full, bounds = _two_page(_CLEAN, _JUNK)
+    scored = [
+        clf.page_text_signals(full[b["start_offset"] : b["end_offset"]]) for b in bounds
+    ]
+    signals = {
+        "text_quality": [q for q, _ in scored],
+        "control_chars": [c for _, c in scored],
+        "image_coverage": [1.0, 0.0],
+    }
+
+    reused = clf.classify_from_text(full, bounds, page_signals=signals)
+    recomputed = clf.classify_from_text(full, bounds, image_coverage=[1.0, 0.0])
+
+    assert reused == recomputed
+    assert "image_heavy" in reused.flags
+
+
+def test_parser_signals_for_other_text_are_ignored():
+    # Signals recorded for a different page split (the text was rewritten after
+    # the parse) fall back to scoring the text itself.
+    full, bounds = _two_page(_CLEAN, _CLEAN)
+    stale = {"text_quality": [0.0], "control_chars": [0]}
+
+    c = clf.classify_from_text(full, bounds, page_signals=stale)
+
+    assert c == clf.classify_from_text(full, bounds)
+    assert c.recommended_tier == "fast"
+
+
 # --- glyph-corruption signal (broken /ToUnicode -> structured escalation) -----
 
 # A uniform glyph/Caesar offset turns clean prose into alphabetic-but-wrong tokens
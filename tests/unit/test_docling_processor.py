@@ -258,6 +258,29 @@ async def test_process_image_returns_markdown(mocker, monkeypatch):
     assert "pipeline" not in data
 
 
+async def test_process_source_streams_the_spool_file(mocker, monkeypatch, tmp_path):
+    """A spooled image is uploaded from its open file, never read into memory."""
+    from nextcloud_mcp_server.document_processors.source import SpooledDocumentSource
+
+    client = _mock_client(
+        mocker, json={"status": "success", "document": {"md_content": "scan text"}}
+    )
+    monkeypatch.setattr(docling_serve.httpx, "AsyncClient", lambda *a, **k: client)
+    spool = tmp_path / "nc-ingest-1.bin"
+    spool.write_bytes(b"\x89PNG body")
+    source = SpooledDocumentSource(spool, "image/png", "note.png")
+    monkeypatch.setattr(
+        source, "read_bytes", mocker.Mock(side_effect=AssertionError("read"))
+    )
+
+    result = await DoclingProcessor("https://docling:5001").process_source(source)
+
+    assert result.text == "scan text"
+    name, upload, mime = client.post.call_args.kwargs["files"]["files"]
+    assert (name, mime) == ("note.png", "image/png")
+    assert upload.name == str(spool)
+
+
 async def test_process_image_vlm_pipeline(mocker, monkeypatch):
     """A DoclingProcessor built with pipeline='vlm' forwards the VLM fields to
     docling-serve and records the pipeline in parsing_metadata."""
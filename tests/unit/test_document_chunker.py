@@ -1,11 +1,16 @@
-"""Unit tests for DocumentChunker with LangChain text splitters."""
+"""Unit tests for DocumentChunker and the native recursive text splitter."""
+
+import logging
 
 import pytest
 
+from nextcloud_mcp_server.config import Settings
+from nextcloud_mcp_server.vector import document_chunker
 from nextcloud_mcp_server.vector.document_chunker import (
     ChunkWithPosition,
     DocumentChunker,
     PageAwareChunker,
+    get_chunk_token_counter,
 )
 
 pytestmark = pytest.mark.unit
@@ -95,7 +100,7 @@ class TestDocumentChunkerPositions:
         for chunk in chunks:
             extracted = content[chunk.start_offset : chunk.end_offset]
             assert extracted == chunk.text
-            # LangChain strips whitespace by default
+            # The splitter strips whitespace from every chunk
             assert len(chunk.text.strip()) > 0
 
     async def test_empty_content(self):
@@ -192,7 +197,7 @@ which builds trust in the RAG system."""
             assert chunk.start_offset < chunk.end_offset
 
     async def test_semantic_boundary_preservation(self):
-        """Test that LangChain creates semantically coherent chunks."""
+        """Test that the splitter creates semantically coherent chunks."""
         chunker = DocumentChunker(chunk_size=100, overlap=20)
         content = (
             "First sentence is here. "
@@ -217,7 +222,7 @@ which builds trust in the RAG system."""
             assert chunk.start_offset < chunk.end_offset
 
     async def test_paragraph_boundary_preservation(self):
-        """Test that LangChain preserves paragraph boundaries."""
+        """Test that the splitter preserves paragraph boundaries."""
         chunker = DocumentChunker(chunk_size=80, overlap=15)
         content = """First paragraph here.
 
@@ -229,7 +234,7 @@ Fourth paragraph here."""
 
         chunks = await chunker.chunk_text(content)
 
-        # LangChain should prefer splitting at paragraph boundaries (\n\n)
+        # The splitter should prefer paragraph boundaries (\n\n)
         # Verify we got multiple chunks
         assert len(chunks) >= 1
 
@@ -377,8 +382,8 @@ class TestPageAwareChunker:
     async def test_oversized_page_with_leading_whitespace_offsets(self):
         """Offset invariant holds for oversized-page sub-chunks with leading ws.
 
-        Guards the ``start + start_index`` path: LangChain's start_index points
-        at the first non-whitespace char, so offsets must still extract exactly.
+        Guards the span path: a sub-chunk's offsets point at its first
+        non-whitespace char, so they must still extract exactly.
         """
         pages = ["  \n  " + "word " * 200, "Tail page."]
         content, boundaries = _make_doc(pages)
@@ -580,3 +585,73 @@ class TestPageAwarePacking:
 
         assert len(unpacked) == 10  # one vector per lean page (the inflator)
         assert len(packed) < len(unpacked)  # merged into far fewer vectors
+
+
+def _count_words(texts: list[str]) -> list[int]:
+    """Token counter stand-in: one token per whitespace-separated word."""
+    return [len(text.split()) for text in texts]
+
+
+class TestTokenSizing:
+    """Chunk sizes measured by a token counter instead of characters."""
+
+    async def test_chunks_fit_the_token_budget(self):
+        content = " ".join(f"w{n}" for n in range(100))
+
+        chunks = await DocumentChunker(
+            chunk_size=10, overlap=2, token_counter=_count_words
+        ).chunk_text(content)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert len(chunk.text.split()) <= 10
+            assert content[chunk.start_offset : chunk.end_offset] == chunk.text
+        assert chunks[1].text.split()[:2] == chunks[0].text.split()[-2:]
+
+    async def test_long_word_pages_split_by_tokens_not_characters(self):
+        # Five 100-character words: over a 200-char budget, inside 10 tokens.
+        page = " ".join("x" * 100 for _ in range(5))
+        content, boundaries = _make_doc([page, "Tail page."])
+
+        chunks = await PageAwareChunker(
+            chunk_size=10, overlap=2, token_counter=_count_words
+        ).chunk_text(content, boundaries)
+
+        assert [c.page_number for c in chunks] == [1, 2]
+
+    async def test_repeated_text_gets_exact_offsets(self):
+        content = "same line\n" * 40
+
+        chunks = await DocumentChunker(chunk_size=30, overlap=10).chunk_text(content)
+
+        for chunk in chunks:
+            assert content[chunk.start_offset : chunk.end_offset] == chunk.text
+        starts = [c.start_offset for c in chunks]
+        assert starts == sorted(set(starts))
+
+    def test_counter_only_in_token_mode(self):
+        assert get_chunk_token_counter(Settings()) is None
+        # Token mode without a tokenizer falls back to characters.
+        assert get_chunk_token_counter(Settings(document_chunk_unit="tokens")) is None
+
+    def test_unloadable_tokenizer_is_tried_once(self, tmp_path, caplog):
+        """A failed load is cached, so it is neither retried nor re-warned."""
+        broken = tmp_path / "tokenizer.json"
+        broken.write_text("not a tokenizer")
+        # pytest's log_level is ERROR; the failed load is reported as a warning.
+        caplog.set_level(
+            logging.WARNING, logger="nextcloud_mcp_server.vector.document_chunker"
+        )
+        settings = Settings(
+            document_chunk_unit="tokens", document_chunk_tokenizer=str(broken)
+        )
+        document_chunker._load_tokenizer.cache_clear()
+        try:
+            assert get_chunk_token_counter(settings) is None
+            assert get_chunk_token_counter(settings) is None
+            assert document_chunker._load_tokenizer.cache_info().misses == 1
+        finally:
+            document_chunker._load_tokenizer.cache_clear()
+
+        warnings = [r for r in caplog.records if "chunk tokenizer" in r.message]
+        assert len(warnings) == 1
@@ -118,7 +118,7 @@ def test_is_file_backed_distinguishes_the_two_sources(tmp_path):
 
     A spooled source hands over its path for free; an in-memory one hands over
     its buffer for free. Choosing wrong means a blocking whole-buffer disk write
-    on the shared event loop (registry._classify_result is a plain def).
+    on the shared event loop.
     """
     spooled = _spooled(tmp_path)
     memory = MemoryDocumentSource(b"hello", "text/plain")
@@ -162,3 +162,27 @@ def test_memory_source_defaults_to_the_system_temp_dir():
         assert source.path().parent == Path(_tempfile.gettempdir())
     finally:
         source.cleanup()
+
+
+def test_spooled_buffer_maps_the_file(tmp_path):
+    body = b"%PDF-1.7" + bytes(range(256)) * 64
+    source = _spooled(tmp_path, body)
+
+    with source.buffer() as view:
+        assert view.readonly
+        assert len(view) == len(body)
+        assert view[:8] == b"%PDF-1.7"
+        assert bytes(view) == body
+
+
+def test_spooled_buffer_of_an_empty_file(tmp_path):
+    # mmap refuses a zero-length mapping; an empty download must still work.
+    with _spooled(tmp_path, b"").buffer() as view:
+        assert len(view) == 0
+
+
+def test_memory_buffer_shares_the_content():
+    source = MemoryDocumentSource(b"%PDF-1.7 body", "application/pdf")
+
+    with source.buffer() as view:
+        assert view.obj is source.content
@@ -0,0 +1,31 @@
+"""Unit test for the per-lane ingest queue-wait gauge."""
+
+import pytest
+from pytest import approx
+
+from nextcloud_mcp_server.observability.metrics import update_ingest_queue_wait
+
+pytestmark = pytest.mark.unit
+
+_METRIC = "astrolabe_ingest_queue_wait_jobs"
+
+
+def test_drained_lane_zeroes_not_stale(metric_sample):
+    update_ingest_queue_wait(
+        {"ingest-fast": {"backfill": {"60": 2, "+Inf": 5}, "interactive": {"60": 1}}}
+    )
+    labels = {"queue": "ingest-fast", "lane": "backfill", "le": "+Inf"}
+    assert metric_sample(_METRIC, labels) == approx(5)
+
+    # The backfill lane drained, so it is no longer reported.
+    update_ingest_queue_wait({"ingest-fast": {"interactive": {"60": 3}}})
+    assert metric_sample(_METRIC, labels) == approx(0)
+    assert metric_sample(
+        _METRIC, {"queue": "ingest-fast", "lane": "interactive", "le": "60"}
+    ) == approx(3)
+
+    # None (producer can't report) keeps the last values.
+    update_ingest_queue_wait(None)
+    assert metric_sample(
+        _METRIC, {"queue": "ingest-fast", "lane": "interactive", "le": "60"}
+    ) == approx(3)
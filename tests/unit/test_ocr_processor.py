@@ -33,6 +33,15 @@ def _settings(**kw) -> Any:  # a Settings stand-in (only the read fields matter)
         docling_ocr_lang="en,de",
         docling_pipeline="standard",
         docling_vlm_preset=None,
+        document_ocr_pages_per_request=0,
+        document_ocr_concurrency=4,
+        document_ocr_min_text_quality=0.5,
+        document_ocr_min_page_chars=16,
+        document_glyph_corruption_ratio=0.02,
+        document_parse_page_window=100,
+        document_parse_timeout_seconds=120,
+        document_parse_mem_limit_mb=1536,
+        document_native_process_slots=2,
     )
     base.update(kw)
     return SimpleNamespace(**base)
@@ -1096,3 +1105,134 @@ async def test_poll_pending_job_gone_falls_through(monkeypatch):
         settings=_settings(document_ocr_mode="batch"),
     )
     assert got is None
+
+
+# --- per-page OCR fan-out ------------------------------------------------------
+
+_PROSE = "The committee reviewed the quarterly budget and approved it. "
+
+
+def test_page_ranges_split_runs_and_cap_length():
+    assert ocr._page_ranges([7, 0, 1, 2, 5, 6], 2) == [(0, 2), (2, 3), (5, 7), (7, 8)]
+    assert ocr._page_ranges([], 4) == []
+
+
+def test_pages_needing_ocr_keeps_usable_text_layers():
+    pages = [_PROSE, "", _PROSE, "x"]
+    text = "".join(pages)
+    boundaries, offset = [], 0
+    for n, page in enumerate(pages, start=1):
+        boundaries.append(
+            {"page": n, "start_offset": offset, "end_offset": offset + len(page)}
+        )
+        offset += len(page)
+
+    assert ocr._pages_needing_ocr(text, boundaries, _settings()) == {1, 3}
+
+
+async def test_processor_ocrs_only_scanned_pages_concurrently(monkeypatch):
+    """Pages 2-3 and 5 have no text layer: they go out as two concurrent range
+    requests, page 1 and 4 keep their native text, and the result is in page
+    order with the block spans pointing into the reassembled text."""
+    from nextcloud_mcp_server.document_processors import _isolation, pypdfium2_fast
+
+    pages = [_PROSE, "", "", _PROSE, ""]
+    boundaries, offset = [], 0
+    for n, page in enumerate(pages, start=1):
+        boundaries.append(
+            {"page": n, "start_offset": offset, "end_offset": offset + len(page)}
+        )
+        offset += len(page)
+    split_calls = []
+
+    async def _fake_isolated(func, *args, **kw):
+        if func is pypdfium2_fast._extract:
+            return "".join(pages), {"page_boundaries": boundaries}
+        assert func is pypdfium2_fast.split_pages
+        split_calls.append(args[1])
+        return [f"range{n}".encode() for n in range(len(args[1]))]
+
+    in_flight = 0
+    peak = 0
+
+    class _FakeBackend:
+        async def ocr_pages(self, content, mime_type):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await anyio.sleep(0.01)
+            in_flight -= 1
+            if content == b"range0":
+                block = {"html": "<p>scan two</p>", "bbox": [0.1, 0.1, 0.5, 0.2]}
+                return [(0, "scan two", [block]), (1, "scan three", None)]
+            return [(0, "scan five")]
+
+    monkeypatch.setattr(_isolation, "run_isolated_native", _fake_isolated)
+    monkeypatch.setattr(
+        ocr, "get_settings", lambda: _settings(document_ocr_pages_per_request=2)
+    )
+    monkeypatch.setattr(ocr, "build_ocr_backend", lambda s, **kw: _FakeBackend())
+
+    r = await ocr.OcrProcessor().process(b"%PDF-1.7", "application/pdf")
+
+    assert r.success is True
+    assert split_calls == [[(1, 3), (4, 5)]]
+    assert peak == 2
+    assert r.text == "\n\n".join(
+        [_PROSE, "scan two", "scan three", _PROSE, "scan five"]
+    )
+    assert [b["page"] for b in r.metadata["page_boundaries"]] == [1, 2, 3, 4, 5]
+    (span,) = r.metadata[ocr.OCR_BLOCK_SPANS_KEY]
+    assert span["page"] == 2
+    assert r.text[span["start_offset"] : span["end_offset"]] == "scan two"
+
+
+async def test_processor_fan_out_failure_fails_the_document(monkeypatch):
+    from nextcloud_mcp_server.document_processors import _isolation, pypdfium2_fast
+
+    async def _fake_isolated(func, *args, **kw):
+        if func is pypdfium2_fast._extract:
+            return "", {
+                "page_boundaries": [
+                    {"page": 1, "start_offset": 0, "end_offset": 0},
+                    {"page": 2, "start_offset": 0, "end_offset": 0},
+                ]
+            }
+        return [b"range0"]
+
+    class _TimeoutBackend:
+        async def ocr_pages(self, content, mime_type):
+            raise TimeoutError
+
+    monkeypatch.setattr(_isolation, "run_isolated_native", _fake_isolated)
+    monkeypatch.setattr(
+        ocr, "get_settings", lambda: _settings(document_ocr_pages_per_request=4)
+    )
+    monkeypatch.setattr(ocr, "build_ocr_backend", lambda s, **kw: _TimeoutBackend())
+
+    r = await ocr.OcrProcessor().process(b"%PDF-1.7", "application/pdf")
+
+    assert r.success is False
+    assert r.metadata["parse_failed_reason"] == "timeout"
+
+
+async def test_processor_unreadable_text_layer_ocrs_whole_document(monkeypatch):
+    from nextcloud_mcp_server.document_processors import _isolation
+
+    async def _broken(func, *args, **kw):
+        raise _isolation.PdfWorkerError("PdfiumError: Failed to load document")
+
+    class _FakeBackend:
+        async def ocr(self, content, mime_type):
+            return "whole", [{"page": 1, "start_offset": 0, "end_offset": 5}], []
+
+    monkeypatch.setattr(_isolation, "run_isolated_native", _broken)
+    monkeypatch.setattr(
+        ocr, "get_settings", lambda: _settings(document_ocr_pages_per_request=4)
+    )
+    monkeypatch.setattr(ocr, "build_ocr_backend", lambda s, **kw: _FakeBackend())
+
+    r = await ocr.OcrProcessor().process(b"%PDF-1.7", "application/pdf")
+
+    assert r.success is True
+    assert r.text == "whole"
@@ -21,6 +21,7 @@ def mock_storage():
     storage = AsyncMock()
     storage.get_refresh_token = AsyncMock(return_value=None)
     storage.store_refresh_token = AsyncMock()
+    storage.rotate_refresh_token = AsyncMock()
     storage.delete_refresh_token = AsyncMock()
     return storage
 
@@ -178,8 +179,8 @@ class TestRefreshScopeConditional:
                 )
 
                 # Verify the rotated refresh token was stored
-                mock_storage.store_refresh_token.assert_called_once()
-                call_kwargs = mock_storage.store_refresh_token.call_args[1]
+                mock_storage.rotate_refresh_token.assert_called_once()
+                call_kwargs = mock_storage.rotate_refresh_token.call_args[1]
                 assert call_kwargs["user_id"] == "user1"
                 assert call_kwargs["refresh_token"] == "rotated_refresh_token"
         await broker.close()
@@ -74,6 +74,7 @@ def settings(mocker):
             "document_parse_mem_limit_mb": 1536,
             "document_parse_page_window": 100,
             "document_parse_process_slots": 2,
+            "document_native_process_slots": 2,
         }
         values.update(overrides)
         stub = SimpleNamespace(**values)
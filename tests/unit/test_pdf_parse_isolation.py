@@ -324,7 +324,11 @@ async def test_processor_reports_text_only_mode_above_ceiling(monkeypatch):
             document_parse_timeout_seconds=120.0,
             document_parse_mem_limit_mb=1536,
             document_parse_process_slots=2,
+            document_native_process_slots=2,
             document_markdown_max_pages=4,  # 5 pages > 4 -> text_only
+            document_classify_enabled=True,
+            document_ocr_enabled=False,
+            document_ocr_detect_scanned=False,
         )
 
     monkeypatch.setattr(
@@ -769,6 +773,67 @@ async def test_worker_error_classified_as_error_without_double_prefix(monkeypatc
     assert str(exc.value) == "FzErrorBase: cannot open document"
 
 
+# --- native-library jobs in the isolated pool ---------------------------------
+
+
+def _unreadable(path):
+    raise _isolation.PdfUnreadableError(f"cannot open {path}")
+
+
+async def test_native_job_runs_in_the_pool_and_records_the_slot_wait(mocker):
+    run_sync = mocker.patch.object(
+        anyio.to_process, "run_sync", new=mocker.AsyncMock(return_value=[0.5])
+    )
+    wait = mocker.patch.object(_isolation, "record_pdf_native_lock_wait")
+
+    out = await _isolation.run_isolated_native(
+        _tiny_pdf,
+        "doc.pdf",
+        library="pymupdf",
+        timeout_seconds=5.0,
+        mem_limit_mb=512,
+    )
+
+    assert out == [0.5]
+    assert run_sync.await_args.args == (
+        _isolation._native_worker,
+        _tiny_pdf,
+        512,
+        "doc.pdf",
+    )
+    assert wait.call_args.args[0] == "pymupdf"
+    assert wait.call_args.args[1] >= 0
+
+
+async def test_native_process_limiter_is_separate_from_the_parse_limiter():
+    """A burst of bbox jobs must not take the structured tier's parse slots."""
+    await anyio.lowlevel.checkpoint()  # RunVar needs a running loop
+
+    native = _isolation.native_process_limiter(2)
+
+    assert native is not _isolation.parse_process_limiter(2)
+    assert native is _isolation.native_process_limiter(99)
+
+
+def test_native_worker_keeps_unreadable_error_type():
+    """ "Not a PDF" must stay distinguishable once it crosses the boundary."""
+    with pytest.raises(_isolation.PdfUnreadableError) as exc:
+        _isolation._native_worker(_unreadable, 0, "junk.bin")
+
+    assert pickle.loads(pickle.dumps(exc.value)).args == ("cannot open junk.bin",)
+
+
+def test_native_worker_normalises_other_exceptions():
+    def raiser():
+        raise ValueError(lambda: None)
+
+    with pytest.raises(_isolation.PdfWorkerError) as exc:
+        _isolation._native_worker(raiser, 0)
+
+    assert type(exc.value) is _isolation.PdfWorkerError
+    assert "ValueError" in str(pickle.loads(pickle.dumps(exc.value)))
+
+
 def test_ingest_import_graph_does_not_load_pymupdf4llm():
     """Nothing on the ingest path may import pymupdf4llm at module scope.
 
@@ -0,0 +1,332 @@
+"""Unit tests for windowed indexing of long documents.
+
+``_index_document`` embeds and writes a document in the chunk-index ranges of
+:func:`processor.index_windows`: one range for a short document, consecutive
+``vector_sync_stream_window_chunks``-sized ranges for a long one. Point ids come
+from :func:`processor.chunk_point_id`, so a window's stored points can be
+fetched by id on a retry and compared against what it is about to write.
+
+The loop itself is driven end to end against an in-memory Qdrant collection:
+bboxes are looked up by a chunk's index within its window, unchanged chunks
+reuse their prior points window by window, and vanished positions are deleted
+once the last window is written (diff mode only).
+"""
+
+import json
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_client.models import SparseVector
+
+from nextcloud_mcp_server.document_processors.base import ProcessingResult
+from nextcloud_mcp_server.vector import processor
+from nextcloud_mcp_server.vector.document_chunker import ChunkWithPosition
+from nextcloud_mcp_server.vector.embedding_cache import EmbeddingCache
+from nextcloud_mcp_server.vector.processor import chunk_point_id, index_windows
+from nextcloud_mcp_server.vector.scanner import DocumentTask
+
+
+@pytest.mark.unit
+def test_short_document_is_one_window():
+    assert index_windows(10, 256) == [range(10)]
+    assert index_windows(256, 256) == [range(256)]
+
+
+@pytest.mark.unit
+def test_zero_window_disables_streaming():
+    assert index_windows(5000, 0) == [range(5000)]
+
+
+@pytest.mark.unit
+def test_long_document_windows_cover_every_chunk_once():
+    windows = index_windows(600, 256)
+
+    assert windows == [range(0, 256), range(256, 512), range(512, 600)]
+    assert [i for window in windows for i in window] == list(range(600))
+
+
+@pytest.mark.unit
+def test_empty_document_still_gets_a_window():
+    """The one empty window clears the placeholder and stale chunks."""
+    assert index_windows(0, 256) == [range(0)]
+
+
+@pytest.mark.unit
+def test_point_id_is_the_chunk_position_uuid():
+    """Unchanged from the pre-windowing scheme, so stored points still match."""
+    expected = str(uuid.uuid5(uuid.NAMESPACE_DNS, "file:42:chunk:7"))
+
+    assert chunk_point_id("file", "42", 7) == expected
+
+
+# ---------------------------------------------------------------------------
+# The windowed _index_document loop, against an in-memory Qdrant collection
+# ---------------------------------------------------------------------------
+
+
+class _FakeQdrant:
+    """The point store behind the prior-point reads and the diff writes.
+
+    Holds one document's points by id, with payloads round-tripped through JSON
+    the way Qdrant returns them, and records every write call.
+    """
+
+    def __init__(self):
+        self.points: dict[str, SimpleNamespace] = {}
+        self.upserted: list[str] = []
+        self.deleted: list[str] = []
+
+    async def scroll(self, *, with_payload, with_vectors, offset, **_):
+        return list(self.points.values()), None
+
+    async def retrieve(self, *, ids, **_):
+        return [self.points[str(i)] for i in ids if str(i) in self.points]
+
+    async def upsert(self, *, points, **_):
+        for point in points:
+            self.points[str(point.id)] = SimpleNamespace(
+                id=str(point.id),
+                payload=json.loads(json.dumps(point.payload)),
+                vector=point.vector,
+            )
+            self.upserted.append(str(point.id))
+
+    async def set_payload(self, *, payload, points, **_):
+        for point_id in points:
+            self.points[str(point_id)].payload.update(json.loads(json.dumps(payload)))
+
+    async def delete(self, *, points_selector, **_):
+        for point_id in points_selector.points:
+            self.points.pop(str(point_id), None)
+            self.deleted.append(str(point_id))
+
+
+class _PageChunker:
+    """One chunk per line of the parsed text (one line per page here)."""
+
+    def __init__(self, **_):
+        pass
+
+    async def chunk_text(self, content):
+        chunks, start = [], 0
+        for line in content.split("\n"):
+            chunks.append(
+                ChunkWithPosition(
+                    text=line, start_offset=start, end_offset=start + len(line)
+                )
+            )
+            start += len(line) + 1
+        return chunks
+
+
+def _pdf_parse(pages: list[str], **metadata) -> ProcessingResult:
+    boundaries, start = [], 0
+    for number, text in enumerate(pages, start=1):
+        boundaries.append(
+            {"page": number, "start_offset": start, "end_offset": start + len(text)}
+        )
+        start += len(text) + 1
+    return ProcessingResult(
+        text="\n".join(pages),
+        metadata={
+            "page_boundaries": boundaries,
+            "page_count": len(pages),
+            **metadata,
+        },
+        processor="pymupdf",
+    )
+
+
+def _bbox_batch(fn, pdf_bytes, chunk_data, *args, **kwargs):
+    """Stand-in for the isolated pymupdf batch: one box per chunk, x0 = page / 10.
+
+    Keyed by the index it was handed, like the real batch, so a point that got
+    another chunk's box would carry another page's x0.
+    """
+    return {
+        index: ([(page / 10, 0.0, 1.0, 1.0)], 0) for index, _, _, page, _ in chunk_data
+    }
+
+
+@pytest.fixture
+def index_pdf(mocker, tmp_path):
+    """Index a PDF of the given pages through the real windowed loop.
+
+    Windows are two chunks wide. Parsing, chunking, embedding and the pymupdf
+    batch are faked; the prior-point reads, the diff planning and the writes run
+    for real against the returned ``_FakeQdrant``. Each run gets a fresh
+    embedding cache, so any vector it does not embed came from a prior point.
+    """
+    qdrant = _FakeQdrant()
+    embedded: list[str] = []
+
+    async def embed(texts):
+        embedded.extend(texts)
+        return [[float(len(t)), 1.0] for t in texts], len(texts)
+
+    async def encode(texts):
+        return [SparseVector(indices=[len(t)], values=[1.0]) for t in texts]
+
+    batch = mocker.patch(
+        "nextcloud_mcp_server.document_processors._isolation.run_isolated_native",
+        AsyncMock(side_effect=_bbox_batch),
+    )
+    mocker.patch.object(
+        processor, "claim_existing_index", AsyncMock(return_value=False)
+    )
+    mocker.patch.object(processor, "existing_principals", AsyncMock(return_value=[]))
+    mocker.patch.object(processor, "_file_folder_ancestors", AsyncMock(return_value=[]))
+    mocker.patch.object(processor, "is_bulk_load_active", AsyncMock(return_value=False))
+    mocker.patch.object(processor, "delete_placeholder_point", AsyncMock())
+    mocker.patch.object(processor, "clear_dead_letter", AsyncMock())
+    mocker.patch.object(processor, "_record_manifest_entry", AsyncMock())
+    mocker.patch.object(processor, "_record_ingest_vector_cost")
+    mocker.patch.object(processor, "DocumentChunker", _PageChunker)
+    mocker.patch.object(processor, "embed_dense", embed)
+    mocker.patch.object(processor, "encode_sparse", encode)
+    mocker.patch.object(
+        processor,
+        "get_embedding_cache",
+        lambda: EmbeddingCache(max_bytes=16 * 1024 * 1024),
+    )
+
+    async def run(pages: list[str], *, diff_upsert: bool, **metadata):
+        mocker.patch.object(
+            processor,
+            "get_settings",
+            lambda: SimpleNamespace(
+                document_ocr_mode="sync",
+                document_stream_download_enabled=False,
+                document_spool_dir=str(tmp_path),
+                vector_sync_content_dedup=False,
+                document_chunk_page_aware=False,
+                document_chunk_page_pack=False,
+                document_chunk_size=2048,
+                document_chunk_overlap=0,
+                document_chunk_unit="characters",
+                document_parse_page_window=50,
+                document_parse_timeout_seconds=60,
+                document_parse_mem_limit_mb=512,
+                document_native_process_slots=1,
+                embedding_cache_enabled=True,
+                vector_sync_diff_upsert=diff_upsert,
+                vector_sync_stream_window_chunks=2,
+                vector_sync_bulk_upsert_batch_size=500,
+                usage_metering_enabled=False,
+                vector_ram_hnsw_overhead_factor=1.5,
+                get_collection_name=lambda: "c",
+                get_embedding_model_name=lambda: "m",
+                get_embedding_provider_family=lambda: "openai",
+                get_embedding_identity=lambda: "m",
+            ),
+        )
+        mocker.patch.object(
+            processor,
+            "_parse_cached",
+            AsyncMock(return_value=_pdf_parse(pages, **metadata)),
+        )
+        nc = MagicMock()
+        nc.webdav.read_file = AsyncMock(
+            return_value=(b"%PDF-1.4", "application/pdf", None)
+        )
+        task = DocumentTask(
+            user_id="alice",
+            doc_id="42",
+            doc_type="file",
+            operation="index",
+            modified_at=0,
+            file_path="/Docs/long.pdf",
+            etag="etag-1",
+        )
+        qdrant.upserted.clear()
+        qdrant.deleted.clear()
+        embedded.clear()
+        batch.reset_mock()
+        await processor._index_document(task, nc, qdrant)
+
+    return SimpleNamespace(run=run, qdrant=qdrant, embedded=embedded, batch=batch)
+
+
+def _stored_chunks(qdrant: _FakeQdrant) -> dict[int, dict]:
+    return {p.payload["chunk_index"]: p.payload for p in qdrant.points.values()}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("diff_upsert", [True, False])
+async def test_window_bboxes_are_indexed_within_the_window(index_pdf, diff_upsert):
+    """Every window hands the bbox batch its own 0-based chunk indices."""
+    await index_pdf.run(["one", "two", "three"], diff_upsert=diff_upsert)
+
+    calls = index_pdf.batch.await_args_list
+    assert [[c[0] for c in call.args[2]] for call in calls] == [[0, 1], [0]]
+    stored = _stored_chunks(index_pdf.qdrant)
+    assert sorted(stored) == [0, 1, 2]
+    for index, payload in stored.items():
+        assert payload["page_number"] == index + 1
+        assert payload["chunk_bbox"] == [[(index + 1) / 10, 0.0, 1.0, 1.0]]
+        assert payload["bbox_source"] == "pymupdf"
+
+
+@pytest.mark.unit
+async def test_native_pages_of_an_ocr_pdf_fall_back_to_pymupdf(index_pdf):
+    """Per-page OCR leaves the native pages' chunks to the pymupdf batch."""
+    ocr_span = {"bbox": [0.5, 0.5, 0.6, 0.6], "start_offset": 4, "end_offset": 7}
+    await index_pdf.run(
+        ["one", "two", "three"],
+        diff_upsert=True,
+        ocr_block_spans=[{**ocr_span, "page": 2}],
+    )
+
+    calls = index_pdf.batch.await_args_list
+    assert [[c[0] for c in call.args[2]] for call in calls] == [[0], [0]]
+    stored = _stored_chunks(index_pdf.qdrant)
+    assert stored[1]["chunk_bbox"] == [[0.5, 0.5, 0.6, 0.6]]
+    assert [stored[i]["bbox_source"] for i in range(3)] == ["pymupdf", "ocr", "pymupdf"]
+    assert stored[2]["chunk_bbox"] == [[0.3, 0.0, 1.0, 1.0]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("diff_upsert", [True, False])
+async def test_unchanged_windows_reuse_their_prior_points(index_pdf, diff_upsert):
+    """A re-index embeds only the changed chunk, in whichever window it falls.
+
+    Diff mode also leaves the unchanged points unwritten; without it every point
+    is upserted again, carrying the reused vectors.
+    """
+    await index_pdf.run(["one", "two", "three"], diff_upsert=diff_upsert)
+    await index_pdf.run(["one", "two", "THREE!"], diff_upsert=diff_upsert)
+
+    assert index_pdf.embedded == ["THREE!"]
+    changed = chunk_point_id("file", "42", 2)
+    if diff_upsert:
+        assert index_pdf.qdrant.upserted == [changed]
+    else:
+        assert sorted(index_pdf.qdrant.upserted) == sorted(
+            chunk_point_id("file", "42", i) for i in range(3)
+        )
+    assert index_pdf.qdrant.points[changed].payload["excerpt"] == "THREE!"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("diff_upsert", [True, False])
+async def test_vanished_chunks_after_the_last_window(index_pdf, diff_upsert):
+    """A document that got shorter loses its tail only in diff mode.
+
+    Full-upsert mode never reads which points are stored, so the vanished
+    positions stay until the document is deleted.
+    """
+    await index_pdf.run(["a", "b", "c", "d", "e"], diff_upsert=diff_upsert)
+    await index_pdf.run(["a", "b", "c"], diff_upsert=diff_upsert)
+
+    stored = _stored_chunks(index_pdf.qdrant)
+    if diff_upsert:
+        assert sorted(index_pdf.qdrant.deleted) == sorted(
+            chunk_point_id("file", "42", i) for i in (3, 4)
+        )
+        assert sorted(stored) == [0, 1, 2]
+    else:
+        assert index_pdf.qdrant.deleted == []
+        assert sorted(stored) == [0, 1, 2, 3, 4]
+    assert all(stored[i]["total_chunks"] == 3 for i in (0, 1, 2))
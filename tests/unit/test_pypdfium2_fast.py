@@ -3,6 +3,7 @@
 import pymupdf
 import pytest
 
+from nextcloud_mcp_server.document_processors import classifier as clf
 from nextcloud_mcp_server.document_processors.pypdfium2_fast import (
     Pypdfium2FastProcessor,
     _extract,
@@ -129,3 +130,30 @@ async def test_process_source_parses_from_a_path_not_bytes(tmp_path):
         from_path.metadata["page_boundaries"] == from_bytes.metadata["page_boundaries"]
     )
     assert from_path.metadata["file_size"] == len(content)
+
+
+def test_extract_records_classifier_signals_in_the_same_pass():
+    """Scan detection reads the coverage the extract measured, not a MuPDF
+    re-open; it must agree with the MuPDF scan it replaces."""
+    doc = pymupdf.open()
+    pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 600, 850))
+    pix.clear_with(255)
+    page = doc.new_page(width=595, height=842)
+    page.insert_image(page.rect, stream=pix.tobytes("png"))
+    page = doc.new_page(width=595, height=842)
+    page.insert_text((50, 60), "Hello world this is clean text. " * 8)
+    content: bytes = doc.tobytes()
+    doc.close()
+
+    text, meta = _extract(content, 1, scan_images=True)
+
+    signals = meta[clf.PAGE_SIGNALS_KEY]
+    assert signals["image_coverage"] == pytest.approx(
+        clf.image_coverage_per_page(content), abs=0.01
+    )
+    first, second = meta["page_boundaries"]
+    assert signals["text_quality"] == [
+        clf._text_quality(text[: first["end_offset"]]),
+        clf._text_quality(text[second["start_offset"] :]),
+    ]
+    assert "image_coverage" not in _extract(content, 1)[1][clf.PAGE_SIGNALS_KEY]
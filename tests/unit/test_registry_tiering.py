@@ -803,3 +803,25 @@ def test_evaluate_escalation_ignore_ocr_enabled_computes_ideal_target():
     assert r.next_available_tier("structured", s) is None
     # ...but the *ideal* target ignoring the enable gate is the OCR tier.
     assert r.next_available_tier("structured", s, ignore_ocr_enabled=True) == "ocr"
+
+
+async def test_scan_detection_reuses_the_parsers_image_coverage(monkeypatch):
+    """The fast and structured tiers measure image coverage during their own
+    pass; scan detection must not re-open the PDF for their results."""
+
+    async def _reopen(*args, **kwargs):
+        raise AssertionError("scan detection re-opened the PDF")
+
+    monkeypatch.setattr(reg_mod, "run_isolated_native", _reopen)
+    r = _registry((_Fake("fast", "fast"), 20))
+    res = ProcessingResult(
+        text="",
+        metadata={"page_signals": {"image_coverage": [1.0, 0.25]}},
+        processor="fast",
+    )
+    settings = _Settings(ocr=True, detect_scanned=True)
+
+    coverage = await r.scan_image_coverage(settings, content=b"%PDF", result=res)
+
+    assert coverage == [1.0, 0.25]
+    assert await r.scan_image_coverage(_Settings(ocr=True), result=res) is None
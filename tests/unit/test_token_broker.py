@@ -9,6 +9,7 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import anyio
 import httpx
 import pytest
 from cryptography.fernet import Fernet
@@ -30,6 +31,7 @@ def mock_storage():
     storage = AsyncMock()
     storage.get_refresh_token = AsyncMock(return_value=None)
     storage.store_refresh_token = AsyncMock()
+    storage.rotate_refresh_token = AsyncMock()
     storage.delete_refresh_token = AsyncMock()
     return storage
 
@@ -214,8 +216,8 @@ class TestTokenBrokerService:
 
                 assert success is True
                 # Verify new token was stored (storage handles encryption)
-                mock_storage.store_refresh_token.assert_called_once()
-                call_args = mock_storage.store_refresh_token.call_args[1]
+                mock_storage.rotate_refresh_token.assert_called_once()
+                call_args = mock_storage.rotate_refresh_token.call_args[1]
                 assert call_args["user_id"] == "user1"
                 assert call_args["refresh_token"] == "new_refresh_token"
 
@@ -248,7 +250,7 @@ class TestTokenBrokerService:
 
                 assert success is True
                 # Should not store if token didn't change
-                mock_storage.store_refresh_token.assert_not_called()
+                mock_storage.rotate_refresh_token.assert_not_called()
 
     async def test_revoke_nextcloud_access(
         self, token_broker, mock_storage, mock_oidc_config
@@ -369,8 +371,8 @@ class TestRefreshTokenRotation:
         assert expires_in == 900
 
         # CRITICAL: Verify the new refresh token was stored
-        mock_storage.store_refresh_token.assert_called_once()
-        call_args = mock_storage.store_refresh_token.call_args
+        mock_storage.rotate_refresh_token.assert_called_once()
+        call_args = mock_storage.rotate_refresh_token.call_args
         assert call_args.kwargs["user_id"] == "admin"
         assert call_args.kwargs["refresh_token"] == "new_refresh_token_456"
 
@@ -411,7 +413,7 @@ class TestRefreshTokenRotation:
                 )
 
         # Should NOT store since token didn't change
-        mock_storage.store_refresh_token.assert_not_called()
+        mock_storage.rotate_refresh_token.assert_not_called()
 
         await broker.close()
 
@@ -447,6 +449,107 @@ class TestRefreshTokenRotation:
                 )
 
         # Should NOT store since no user_id
-        mock_storage.store_refresh_token.assert_not_called()
+        mock_storage.rotate_refresh_token.assert_not_called()
 
         await broker.close()
+
+
+class TestRefreshAhead:
+    """Single-flight refreshes and refresh-ahead of tokens in use."""
+
+    @pytest.fixture
+    def token_endpoint(self, token_broker, mock_storage, mock_oidc_config):
+        """Patch the IdP; returns stats on the refresh POSTs it received."""
+        mock_storage.get_refresh_token.return_value = {
+            "refresh_token": "stored_refresh_token",
+            "expires_at": datetime.now(timezone.utc) + timedelta(days=30),
+        }
+        stats = {"calls": 0, "in_flight": 0, "max_in_flight": 0}
+
+        async def post(*args, **kwargs):
+            stats["calls"] += 1
+            stats["in_flight"] += 1
+            stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            await asyncio.sleep(0.01)
+            stats["in_flight"] -= 1
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                "access_token": f"access_{stats['calls']}",
+                "expires_in": 3600,
+            }
+            return response
+
+        mock_http_client = AsyncMock()
+        mock_http_client.post.side_effect = post
+        with (
+            patch.object(
+                token_broker, "_get_oidc_config", return_value=mock_oidc_config
+            ),
+            patch.object(
+                token_broker, "_get_http_client", return_value=mock_http_client
+            ),
+        ):
+            yield stats
+
+    async def test_concurrent_requests_share_one_refresh(
+        self, token_broker, token_endpoint
+    ):
+        tokens = await asyncio.gather(
+            *(
+                token_broker.get_background_token("user1", ["notes.read"])
+                for _ in range(5)
+            )
+        )
+
+        assert tokens == ["access_1"] * 5
+        assert token_endpoint["calls"] == 1
+
+    async def test_refreshes_are_bounded_across_users(
+        self, token_broker, token_endpoint
+    ):
+        token_broker._refresh_concurrency = 2
+
+        await asyncio.gather(
+            *(token_broker.get_nextcloud_token(f"user{i}") for i in range(6))
+        )
+
+        assert token_endpoint["calls"] == 6
+        assert token_endpoint["max_in_flight"] == 2
+
+    async def test_tokens_in_use_are_renewed_before_expiry(
+        self, token_broker, token_endpoint
+    ):
+        assert await token_broker.get_background_token("user1", ["notes.read"])
+        assert await token_broker.get_background_token("user2", ["notes.read"])
+        # user1's token is served again (in use); user2's is not.
+        assert await token_broker.get_background_token("user1", ["notes.read"])
+
+        with patch(
+            "nextcloud_mcp_server.auth.token_broker.datetime", wraps=datetime
+        ) as mock_datetime:
+            mock_datetime.now.return_value = datetime.now(timezone.utc) + timedelta(
+                seconds=3600 - 60
+            )
+            assert await token_broker.refresh_due_tokens() == 1
+
+        assert token_endpoint["calls"] == 3
+        assert (
+            await token_broker.get_background_token("user1", ["notes.read"])
+            == "access_3"
+        )
+
+    async def test_revoke_drops_background_tokens(self, token_broker, token_endpoint):
+        await token_broker.get_background_token("user1", ["notes.read"])
+
+        assert await token_broker.revoke_nextcloud_access("user1") is True
+
+        assert token_broker._refreshable == {}
+        assert await token_broker.cache.get("user1:background:notes.read") is None
+
+    async def test_refresh_ahead_task_stops_on_shutdown(self, token_broker):
+        shutdown_event = anyio.Event()
+
+        async with anyio.create_task_group() as tg:
+            await tg.start(token_broker.refresh_ahead_task, shutdown_event)
+            shutdown_event.set()
@@ -224,6 +224,144 @@ class TestTokenCaching:
         cached = verifier._get_cached_token(test_token)
         assert cached is None
 
+    def test_cache_is_bounded_lru(self, base_settings):
+        """The least recently used token is dropped once the cache is full."""
+        base_settings.token_verify_cache_size = 2
+        verifier = UnifiedTokenVerifier(base_settings)
+        exp = int(time.time() + 3600)
+
+        for name in ("a", "b"):
+            verifier._create_access_token(f"token-{name}", {"sub": name, "exp": exp})
+        assert verifier._get_cached_token("token-a") is not None  # a is recent now
+        verifier._create_access_token("token-c", {"sub": "c", "exp": exp})
+
+        assert len(verifier._token_cache) == 2
+        assert verifier._get_cached_token("token-b") is None
+        assert verifier._get_cached_token("token-a") is not None
+
+    def test_expired_entries_are_swept_on_insert(self, base_settings, monkeypatch):
+        from nextcloud_mcp_server.auth import unified_verifier
+
+        verifier = UnifiedTokenVerifier(base_settings)
+        verifier._create_access_token(
+            "stale", {"sub": "a", "exp": int(time.time() - 1)}
+        )
+        monkeypatch.setattr(unified_verifier, "_CACHE_SWEEP_INTERVAL_SECONDS", 0)
+
+        verifier._create_access_token(
+            "fresh", {"sub": "b", "exp": int(time.time() + 3600)}
+        )
+
+        assert len(verifier._token_cache) == 1
+
+    async def test_concurrent_misses_share_one_verification(self, base_settings):
+        import anyio
+
+        verifier = UnifiedTokenVerifier(base_settings)
+        release = anyio.Event()
+        payload = {"aud": ["test-client-id"], "sub": "alice", "exp": 4102444800}
+
+        async def _slow_introspect(token, chain=None):
+            await release.wait()
+            return payload
+
+        results = []
+
+        async def _verify():
+            results.append(await verifier.verify_token("opaque-token"))
+
+        with patch.object(
+            verifier, "_introspect_token", AsyncMock(side_effect=_slow_introspect)
+        ) as introspect:
+            async with anyio.create_task_group() as tg:
+                for _ in range(5):
+                    tg.start_soon(_verify)
+                await anyio.sleep(0.01)
+                release.set()
+
+        assert introspect.await_count == 1
+        assert [r.resource for r in results] == ["alice"] * 5
+        assert not verifier._inflight
+
+    async def test_waiters_take_over_a_cancelled_verification(self, base_settings):
+        import anyio
+
+        verifier = UnifiedTokenVerifier(base_settings)
+        payload = {"aud": ["test-client-id"], "sub": "alice", "exp": 4102444800}
+        calls = []
+
+        async def _introspect(token, chain=None):
+            calls.append(token)
+            if len(calls) == 1:
+                await anyio.sleep_forever()
+            return payload
+
+        first = anyio.CancelScope()
+        results = []
+
+        async def _first():
+            with first:
+                await verifier.verify_token("opaque-token")
+
+        async def _waiter():
+            results.append(await verifier.verify_token("opaque-token"))
+
+        with patch.object(
+            verifier, "_introspect_token", AsyncMock(side_effect=_introspect)
+        ):
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(_first)
+                await anyio.sleep(0.01)
+                tg.start_soon(_waiter)
+                await anyio.sleep(0.01)
+                first.cancel()
+
+        assert len(calls) == 2
+        assert results[0].resource == "alice"
+
+    async def test_shared_tier_warms_other_replicas(self, base_settings):
+        class _MemoryTier:
+            def __init__(self):
+                self.entries = {}
+
+            async def get(self, cache_key):
+                return self.entries.get(cache_key)
+
+            async def put(self, cache_key, claims, expires_at):
+                self.entries[cache_key] = (claims, expires_at)
+
+        tier = _MemoryTier()
+        replica_a = UnifiedTokenVerifier(base_settings, shared_cache=tier)
+        replica_b = UnifiedTokenVerifier(base_settings, shared_cache=tier)
+        payload = {"aud": ["test-client-id"], "sub": "alice", "exp": 4102444800}
+
+        with patch.object(
+            replica_a, "_introspect_token", AsyncMock(return_value=payload)
+        ):
+            assert (await replica_a.verify_token("opaque-token")).resource == "alice"
+        introspect_b = AsyncMock(return_value=None)
+        with patch.object(replica_b, "_introspect_token", introspect_b):
+            result = await replica_b.verify_token("opaque-token")
+
+        assert result is not None and result.resource == "alice"
+        introspect_b.assert_not_awaited()
+        # Warm locally from then on.
+        assert replica_b._get_cached_token("opaque-token") is not None
+
+    async def test_shared_tier_failure_falls_back_to_verifying(self, base_settings):
+        tier = MagicMock()
+        tier.get = AsyncMock(side_effect=RuntimeError("db down"))
+        tier.put = AsyncMock(side_effect=RuntimeError("db down"))
+        verifier = UnifiedTokenVerifier(base_settings, shared_cache=tier)
+        payload = {"aud": ["test-client-id"], "sub": "alice", "exp": 4102444800}
+
+        with patch.object(
+            verifier, "_introspect_token", AsyncMock(return_value=payload)
+        ):
+            result = await verifier.verify_token("opaque-token")
+
+        assert result is not None and result.resource == "alice"
+
 
 class TestMultiAudienceVerification:
     """Test multi-audience token verification."""
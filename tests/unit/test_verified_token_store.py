@@ -0,0 +1,45 @@
+"""Unit tests for the shared token-verification tier (auth/verified_token_store.py)."""
+
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from nextcloud_mcp_server.auth import verified_token_store
+from nextcloud_mcp_server.auth.storage import RefreshTokenStorage
+from nextcloud_mcp_server.auth.verified_token_store import VerifiedTokenStore
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def store():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = RefreshTokenStorage(db_path=str(Path(tmpdir) / "verified.db"))
+        await storage.initialize()
+        yield VerifiedTokenStore(storage)
+        await storage.close()
+
+
+async def test_round_trips_claims_until_expiry(store):
+    claims = {"sub": "alice", "scope": "openid", "_auth_via_userinfo": True}
+    expires_at = time.time() + 300
+
+    await store.put("mgmt:abc", claims, expires_at)
+
+    assert await store.get("mgmt:abc") == (claims, float(int(expires_at)))
+    assert await store.get("abc") is None
+
+
+async def test_expired_rows_are_ignored_and_swept(store, monkeypatch):
+    await store.put("old", {"sub": "alice"}, time.time() - 1)
+    assert await store.get("old") is None
+
+    monkeypatch.setattr(verified_token_store, "_SWEEP_INTERVAL_SECONDS", 0)
+    await store.put("new", {"sub": "bob"}, time.time() + 300)
+
+    async with store._storage.acquire() as db:
+        async with db.execute("SELECT cache_key FROM verified_tokens") as cursor:
+            rows = await cursor.fetchall()
+    assert [row[0] for row in rows] == ["new"]
@@ -4,6 +4,8 @@ Builds a minimal Starlette app around ``handle_nextcloud_webhook`` so we can
 drive it with ``TestClient`` without standing up the full FastMCP server.
 """
 
+from types import SimpleNamespace
+
 import anyio
 import pytest
 from starlette.applications import Starlette
@@ -198,6 +200,63 @@ def test_index_event_queues_task_and_returns_200():
     assert task.doc_type == "note"
 
 
+def test_queued_event_wakes_the_users_scan():
+    send_stream, _receive_stream = anyio.create_memory_object_stream(max_buffer_size=4)
+    app = _make_app(send_stream=send_stream)
+    woken: list[str] = []
+    app.state.scan_scheduler = SimpleNamespace(wake=woken.append)
+
+    with _client(app) as client:
+        response = client.post("/webhooks/nextcloud", json=_NOTE_DELETED)
+
+    assert response.status_code == 200
+    assert woken == ["alice"]
+
+
+class _RecordingCoalescer:
+    def __init__(self, accept: bool = True) -> None:
+        self.accept = accept
+        self.submitted: list[tuple] = []
+
+    def submit(self, task, *, folder=None) -> bool:
+        self.submitted.append((task, folder))
+        return self.accept
+
+
+def test_event_is_buffered_when_coalescer_is_wired():
+    send_stream, receive_stream = anyio.create_memory_object_stream(max_buffer_size=4)
+    app = _make_app(send_stream=send_stream)
+    app.state.webhook_coalescer = coalescer = _RecordingCoalescer()
+
+    with _client(app) as client:
+        response = client.post("/webhooks/nextcloud", json=_PDF_WRITTEN)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "buffered"
+    [(task, folder)] = coalescer.submitted
+    assert task.doc_id == "8123"
+    assert folder == "/alice/files/Documents"
+    # Sent by the coalescer's flush, not by the handler.
+    with pytest.raises(anyio.WouldBlock):
+        receive_stream.receive_nowait()
+
+
+def test_returns_503_when_coalescer_is_full():
+    send_stream, _receive_stream = anyio.create_memory_object_stream(max_buffer_size=4)
+    app = _make_app(send_stream=send_stream)
+    app.state.webhook_coalescer = _RecordingCoalescer(accept=False)
+    woken: list[str] = []
+    app.state.scan_scheduler = SimpleNamespace(wake=woken.append)
+
+    with _client(app) as client:
+        response = client.post("/webhooks/nextcloud", json=_NOTE_CREATED)
+
+    assert response.status_code == 503
+    assert response.json()["reason"] == "queue full"
+    # Nextcloud retries a refused delivery; it must not promote the scan.
+    assert woken == []
+
+
 def test_delete_event_queues_delete_task():
     send_stream, receive_stream = anyio.create_memory_object_stream(max_buffer_size=4)
     app = _make_app(send_stream=send_stream)
@@ -325,6 +384,30 @@ def test_deck_board_updated_is_ignored():
         receive_stream.receive_nowait()
 
 
+def test_events_invalidate_cached_verification_verdicts(monkeypatch):
+    """A delivered event drops the document's cached verify-on-read verdicts;
+    a board update drops every deck card's, since it may change sharing."""
+    calls: list[tuple] = []
+    monkeypatch.setattr(
+        webhook_receiver,
+        "invalidate_document",
+        lambda doc_type, doc_id: calls.append(("document", doc_type, doc_id)),
+    )
+    monkeypatch.setattr(
+        webhook_receiver,
+        "invalidate_doc_type",
+        lambda doc_type: calls.append(("doc_type", doc_type)),
+    )
+    send_stream, _receive_stream = anyio.create_memory_object_stream(max_buffer_size=4)
+    app = _make_app(send_stream=send_stream)
+
+    with _client(app) as client:
+        client.post("/webhooks/nextcloud", json=_NOTE_DELETED)
+        client.post("/webhooks/nextcloud", json=_DECK_BOARD_UPDATED)
+
+    assert calls == [("document", "note", "99"), ("doc_type", "deck_card")]
+
+
 def test_deck_card_missing_id_is_ignored():
     """A card event without ``card.id`` can't address Qdrant points, so the
     parser logs a warning and returns None — the polling scanner reconciles."""
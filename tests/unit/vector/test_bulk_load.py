@@ -0,0 +1,160 @@
+"""Unit tests for bulk-load mode (vector/bulk_load.py).
+
+While a large ingest backlog drains, HNSW indexing on the collection is paused
+and a marker point records the ``indexing_threshold`` to restore; once the
+backlog is down to a tenth of the threshold the saved value is put back.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from nextcloud_mcp_server.vector import bulk_load
+from nextcloud_mcp_server.vector.bulk_load import (
+    BULK_LOAD_MARKER_ID,
+    enter_bulk_load,
+    exit_bulk_load,
+    is_bulk_load_active,
+    reconcile_bulk_load,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def _fresh_state(monkeypatch):
+    monkeypatch.setattr(bulk_load, "_active", {})
+
+
+def _client(
+    mocker,
+    *,
+    threshold=20000,
+    marker=None,
+    vectors=None,
+    sparse_vectors=None,
+):
+    client = mocker.AsyncMock()
+    client.get_collection.return_value = SimpleNamespace(
+        config=SimpleNamespace(
+            optimizer_config=SimpleNamespace(indexing_threshold=threshold),
+            params=SimpleNamespace(
+                vectors=vectors or {"dense": SimpleNamespace(size=3)},
+                sparse_vectors=(
+                    {"sparse": SimpleNamespace()}
+                    if sparse_vectors is None
+                    else sparse_vectors
+                ),
+            ),
+        )
+    )
+    client.retrieve.return_value = (
+        [SimpleNamespace(id=BULK_LOAD_MARKER_ID, payload=marker)] if marker else []
+    )
+    return client
+
+
+def _indexing_threshold(client) -> int:
+    return client.update_collection.await_args.kwargs[
+        "optimizers_config"
+    ].indexing_threshold
+
+
+async def test_enter_saves_threshold_in_marker_then_stops_indexing(mocker):
+    client = _client(mocker, threshold=20000)
+
+    assert await enter_bulk_load(client, "col")
+
+    point = client.upsert.await_args.kwargs["points"][0]
+    assert point.id == BULK_LOAD_MARKER_ID
+    assert point.payload == {"_bulk_load": True, "indexing_threshold": 20000}
+    assert _indexing_threshold(client) == 0
+    assert await is_bulk_load_active(client, "col")
+
+
+async def test_marker_vector_follows_the_collection_config(mocker):
+    """The marker carries exactly the collection's vectors, whatever their names."""
+    client = _client(
+        mocker,
+        vectors={"dense": SimpleNamespace(size=3), "title": SimpleNamespace(size=2)},
+        sparse_vectors={"bm25": SimpleNamespace()},
+    )
+
+    assert await enter_bulk_load(client, "col")
+
+    vector = client.upsert.await_args.kwargs["points"][0].vector
+    assert vector["dense"] == [1e-9, 0.0, 0.0]
+    assert vector["title"] == [1e-9, 0.0]
+    assert set(vector) == {"dense", "title", "bm25"}
+
+
+async def test_marker_vector_for_a_single_unnamed_vector(mocker):
+    client = _client(mocker, vectors=SimpleNamespace(size=2), sparse_vectors={})
+
+    assert await enter_bulk_load(client, "col")
+
+    assert client.upsert.await_args.kwargs["points"][0].vector == [1e-9, 0.0]
+
+
+async def test_enter_leaves_operator_disabled_indexing_alone(mocker):
+    client = _client(mocker, threshold=0)
+
+    assert not await enter_bulk_load(client, "col")
+
+    client.upsert.assert_not_awaited()
+    client.update_collection.assert_not_awaited()
+
+
+async def test_exit_restores_saved_threshold_and_drops_marker(mocker):
+    client = _client(mocker, marker={"_bulk_load": True, "indexing_threshold": 20000})
+
+    assert await exit_bulk_load(client, "col")
+
+    assert _indexing_threshold(client) == 20000
+    assert client.delete.await_args.kwargs["points_selector"].points == [
+        BULK_LOAD_MARKER_ID
+    ]
+    assert not await is_bulk_load_active(client, "col")
+
+
+async def test_exit_without_marker_is_a_noop(mocker):
+    client = _client(mocker)
+
+    assert not await exit_bulk_load(client, "col")
+
+    client.update_collection.assert_not_awaited()
+
+
+async def test_unreadable_marker_means_normal_writes(mocker):
+    client = _client(mocker)
+    client.retrieve.side_effect = RuntimeError("collection not found")
+
+    assert not await is_bulk_load_active(client, "col")
+
+
+@pytest.mark.parametrize(
+    ("pending", "marker", "entered", "exited"),
+    [
+        (5000, None, True, False),  # at the threshold: enter
+        (4999, None, False, False),  # below it but not drained: stay out
+        (
+            1000,
+            {"_bulk_load": True, "indexing_threshold": 20000},
+            False,
+            False,
+        ),  # on, above a tenth: stay on
+        (
+            500,
+            {"_bulk_load": True, "indexing_threshold": 20000},
+            False,
+            True,
+        ),  # drained to a tenth: exit
+    ],
+)
+async def test_reconcile_has_hysteresis(mocker, pending, marker, entered, exited):
+    client = _client(mocker, marker=marker)
+
+    await reconcile_bulk_load(client, "col", pending=pending, threshold=5000)
+
+    assert client.upsert.await_count == int(entered)
+    assert client.delete.await_count == int(exited)
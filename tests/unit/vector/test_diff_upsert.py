@@ -0,0 +1,216 @@
+"""Unit tests for chunk-level diff writes on re-index (vector/diff_upsert.py).
+
+A re-index compares the new point set against the document's stored points and
+writes only the difference: changed chunks are upserted, metadata-only changes
+go through ``set_payload`` (grouped by diff), vanished chunk positions are
+deleted, and per-run timestamps alone never dirty a point.
+"""
+
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+from qdrant_client.models import PointStruct
+
+from nextcloud_mcp_server.vector import payload_keys
+from nextcloud_mcp_server.vector.diff_upsert import (
+    PointWritePlan,
+    apply_point_writes,
+    plan_point_writes,
+)
+from nextcloud_mcp_server.vector.embedding_cache import chunk_hash
+
+pytestmark = pytest.mark.unit
+
+IDENTITY = "text-embedding-3-small"
+HYBRID = {"dense": [0.1, 0.2], "sparse": {"indices": [1], "values": [0.5]}}
+
+
+def _payload(text: str, index: int, **overrides: Any) -> dict[str, Any]:
+    payload = {
+        "doc_id": "42",
+        "doc_type": "note",
+        "title": "Groceries",
+        "excerpt": text,
+        "chunk_index": index,
+        payload_keys.CHUNK_HASH: chunk_hash(text),
+        payload_keys.EMBEDDING_IDENTITY: IDENTITY,
+        "acl_principals": ["user:alice"],
+        "indexed_at": 1000,
+        payload_keys.PARSED_AT: 1000,
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _point(index: int, text: str, vector=HYBRID, **overrides: Any) -> PointStruct:
+    return PointStruct(
+        id=f"00000000-0000-0000-0000-{index:012d}",
+        vector=vector,
+        payload=_payload(text, index, **overrides),
+    )
+
+
+def _stored(index: int, text: str, vector=HYBRID, **overrides: Any):
+    return SimpleNamespace(
+        id=f"00000000-0000-0000-0000-{index:012d}",
+        vector=vector,
+        payload=_payload(text, index, **overrides),
+    )
+
+
+def test_only_timestamps_changed_writes_nothing():
+    plan = plan_point_writes(
+        [_point(0, "a", indexed_at=2000, **{payload_keys.PARSED_AT: 2000})],
+        [_stored(0, "a")],
+    )
+
+    assert plan.upserts == []
+    assert plan.payload_patches == []
+    assert plan.deletes == []
+    assert plan.unchanged == 1
+
+
+def test_metadata_change_is_one_grouped_patch_with_fresh_timestamps():
+    new = [
+        _point(
+            i,
+            text,
+            title="Shopping",
+            acl_principals=["user:alice", "user:bob"],
+            indexed_at=2000,
+        )
+        for i, text in enumerate(["a", "b", "c"])
+    ]
+    stored = [_stored(i, text) for i, text in enumerate(["a", "b", "c"])]
+
+    plan = plan_point_writes(new, stored)
+
+    assert plan.upserts == []
+    assert len(plan.payload_patches) == 1
+    diff, ids = plan.payload_patches[0]
+    assert diff == {
+        "title": "Shopping",
+        "acl_principals": ["user:alice", "user:bob"],
+        "indexed_at": 2000,
+        payload_keys.PARSED_AT: 1000,
+    }
+    assert ids == [str(p.id) for p in new]
+
+
+def test_changed_text_added_chunk_and_vanished_tail():
+    stored = [_stored(0, "a"), _stored(1, "b"), _stored(2, "c"), _stored(3, "d")]
+    new = [_point(0, "a"), _point(1, "B"), _point(2, "c")]
+
+    plan = plan_point_writes(new, stored)
+
+    assert [p.id for p in plan.upserts] == [new[1].id]
+    assert plan.deletes == [stored[3].id]
+    assert plan.unchanged == 2
+
+
+def test_window_plan_leaves_positions_outside_the_window():
+    stored = [_stored(0, "a"), _stored(1, "b"), _stored(2, "c"), _stored(3, "d")]
+    window = [_point(2, "c"), _point(3, "D")]
+
+    plan = plan_point_writes(window, stored, delete_missing=False)
+
+    assert [p.id for p in plan.upserts] == [window[1].id]
+    assert plan.deletes == []
+    assert plan.unchanged == 1
+
+
+def test_vector_set_identity_or_legacy_point_forces_upsert():
+    keyword = {"sparse": {"indices": [1], "values": [0.5]}}
+    stored = [
+        _stored(0, "a", vector=keyword),  # keyword -> hybrid
+        _stored(1, "b", **{payload_keys.EMBEDDING_IDENTITY: "nomic-embed-text"}),
+        _stored(2, "c", **{payload_keys.CHUNK_HASH: None}),  # pre-chunk_hash
+    ]
+    new = [_point(0, "a"), _point(1, "b"), _point(2, "c"), _point(3, "d")]
+
+    plan = plan_point_writes(new, stored)
+
+    assert [p.id for p in plan.upserts] == [p.id for p in new]
+
+
+def test_dropped_payload_key_forces_upsert_but_null_does_not():
+    stored = [
+        _stored(0, "a", chunk_bbox=[[0.0, 0.0, 1.0, 1.0]]),
+        _stored(1, "b", author=None),
+    ]
+    new = [_point(0, "a"), _point(1, "b")]
+
+    plan = plan_point_writes(new, stored)
+
+    assert [p.id for p in plan.upserts] == [new[0].id]
+    assert plan.unchanged == 1
+
+
+def test_tuples_compare_equal_to_stored_lists():
+    new = [_point(0, "a", chunk_bbox=[(0.0, 0.0, 1.0, 1.0)])]
+    stored = [_stored(0, "a", chunk_bbox=[[0.0, 0.0, 1.0, 1.0]])]
+
+    assert plan_point_writes(new, stored).unchanged == 1
+
+
+async def test_apply_writes_upserts_then_patches_then_deletes(metric_sample):
+    client = SimpleNamespace(
+        upsert=AsyncMock(), set_payload=AsyncMock(), delete=AsyncMock()
+    )
+    calls: list[str] = []
+    client.upsert.side_effect = lambda **_: calls.append("upsert")
+    client.set_payload.side_effect = lambda **_: calls.append("set_payload")
+    client.delete.side_effect = lambda **_: calls.append("delete")
+    before = metric_sample(
+        "astrolabe_vector_sync_point_writes_total", {"action": "patched"}
+    )
+    plan = PointWritePlan(
+        upserts=[_point(i, str(i)) for i in range(3)],
+        payload_patches=[({"title": "x"}, ["p1", "p2"])],
+        deletes=["gone"],
+    )
+
+    await apply_point_writes(
+        client,  # ty: ignore[invalid-argument-type]
+        collection_name="col",
+        plan=plan,
+        batch_size=2,
+    )
+
+    assert calls == ["upsert", "upsert", "set_payload", "delete"]
+    assert client.set_payload.await_args.kwargs["points"] == ["p1", "p2"]
+    assert client.delete.await_args.kwargs["points_selector"].points == ["gone"]
+    after = metric_sample(
+        "astrolabe_vector_sync_point_writes_total", {"action": "patched"}
+    )
+    assert after - before == 2
+
+
+async def test_bulk_apply_waits_only_on_the_last_upsert_batch():
+    client = SimpleNamespace(
+        upsert=AsyncMock(), set_payload=AsyncMock(), delete=AsyncMock()
+    )
+    plan = PointWritePlan(
+        upserts=[_point(i, str(i)) for i in range(5)],
+        payload_patches=[({"title": "x"}, ["p1"])],
+        deletes=["gone"],
+    )
+
+    await apply_point_writes(
+        client,  # ty: ignore[invalid-argument-type]
+        collection_name="col",
+        plan=plan,
+        batch_size=2,
+        bulk=True,
+    )
+
+    *unwaited, last = client.upsert.await_args_list
+    assert [len(call.kwargs["points"]) for call in unwaited] == [2, 2]
+    assert all(call.kwargs["wait"] is False for call in unwaited)
+    # Applied in arrival order: once the last batch is, the document is written.
+    assert [p.id for p in last.kwargs["points"]] == [_point(4, "4").id]
+    assert last.kwargs["wait"] is True
+    assert client.set_payload.await_args.kwargs["wait"] is True
+    assert client.delete.await_args.kwargs["wait"] is True
@@ -0,0 +1,143 @@
+"""Unit tests for the per-user document manifest (vector/document_manifest_store.py).
+
+Runs against a real temp-SQLite ``RefreshTokenStorage`` (its ``initialize()``
+applies the migrations, incl. ``document_manifest`` / revision 011), so this
+also exercises the migration and the upsert / reconcile SQL on real SQLite.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from nextcloud_mcp_server.auth.storage import RefreshTokenStorage
+from nextcloud_mcp_server.vector.document_manifest_store import DocumentManifestStore
+
+pytestmark = pytest.mark.unit
+
+DAY = 86400
+
+
+@pytest.fixture
+async def store():
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = RefreshTokenStorage(db_path=str(Path(tmp) / "manifest.db"))
+        await storage.initialize()
+        yield DocumentManifestStore(storage)
+
+
+async def _rows(store, user_id="alice", doc_type="note"):
+    async with store._storage.acquire() as db:
+        async with db.execute(
+            "SELECT doc_id, etag, index_mode, chunk_count, updated_at "
+            "FROM document_manifest WHERE user_id = ? AND doc_type = ?",
+            (user_id, doc_type),
+        ) as cursor:
+            return {row[0]: tuple(row[1:]) for row in await cursor.fetchall()}
+
+
+async def test_unreconciled_manifest_is_not_trusted(store):
+    await store.upsert(user_id="alice", doc_type="note", doc_id="1")
+    # Rows alone are not enough: without a reconcile the manifest may be
+    # missing documents indexed before it existed.
+    assert await store.get_index_modes("alice", "note", max_age=DAY) is None
+
+
+async def test_reconcile_then_read(store):
+    await store.reconcile(
+        "alice", "file", {"1": "hybrid", "2": "keyword"}, started_at=1000
+    )
+    assert await store.get_index_modes("alice", "file", max_age=DAY, now=1000 + 60) == {
+        "1": "hybrid",
+        "2": "keyword",
+    }
+
+
+async def test_empty_reconcile_is_a_trusted_empty(store):
+    await store.reconcile("alice", "note", {}, started_at=1000)
+    assert await store.get_index_modes("alice", "note", max_age=DAY, now=1001) == {}
+
+
+async def test_reconcile_expires_after_max_age(store):
+    await store.reconcile("alice", "note", {"1": "hybrid"}, started_at=1000)
+    assert (
+        await store.get_index_modes("alice", "note", max_age=DAY, now=1000 + DAY)
+        is None
+    )
+
+
+async def test_upsert_and_delete_are_visible_between_reconciles(store):
+    await store.reconcile("alice", "note", {"1": "hybrid"}, started_at=1000)
+    await store.upsert(user_id="alice", doc_type="note", doc_id="2", updated_at=1100)
+    await store.delete(user_id="alice", doc_type="note", doc_id="1")
+
+    assert await store.get_index_modes("alice", "note", max_age=DAY, now=1200) == {
+        "2": "hybrid"
+    }
+
+
+async def test_manifest_is_scoped_by_user_and_doc_type(store):
+    await store.reconcile("alice", "note", {"1": "hybrid"}, started_at=1000)
+    await store.reconcile("alice", "deck_card", {"1": "hybrid"}, started_at=1000)
+    await store.reconcile("bob", "note", {"9": "hybrid"}, started_at=1000)
+    await store.delete(user_id="alice", doc_type="deck_card", doc_id="1")
+
+    assert await store.get_index_modes("alice", "note", max_age=DAY, now=1001) == {
+        "1": "hybrid"
+    }
+    assert await store.get_index_modes("bob", "note", max_age=DAY, now=1001) == {
+        "9": "hybrid"
+    }
+    assert (
+        await store.get_index_modes("alice", "deck_card", max_age=DAY, now=1001) == {}
+    )
+
+
+async def test_upsert_without_chunk_count_keeps_stored_count(store):
+    await store.upsert(
+        user_id="alice", doc_type="file", doc_id="1", etag="e1", chunk_count=12
+    )
+    # A dedup claim re-records the file without chunking it.
+    await store.upsert(user_id="alice", doc_type="file", doc_id="1", etag="e2")
+
+    etag, _mode, chunk_count, _updated = (await _rows(store, doc_type="file"))["1"]
+    assert (etag, chunk_count) == ("e2", 12)
+
+
+async def test_reconcile_drops_rows_qdrant_no_longer_has(store):
+    await store.upsert(user_id="alice", doc_type="note", doc_id="gone", updated_at=500)
+    await store.reconcile("alice", "note", {"kept": "hybrid"}, started_at=1000)
+
+    assert set(await _rows(store)) == {"kept"}
+
+
+async def test_reconcile_keeps_rows_written_during_the_scroll(store):
+    # Indexed after the reconciling scroll started, so the scroll missed it.
+    await store.upsert(user_id="alice", doc_type="note", doc_id="new", updated_at=1005)
+    await store.reconcile("alice", "note", {}, started_at=1000)
+
+    assert set(await _rows(store)) == {"new"}
+
+
+async def test_reconcile_preserves_existing_row_details(store):
+    await store.upsert(
+        user_id="alice",
+        doc_type="note",
+        doc_id="1",
+        etag="abc",
+        chunk_count=3,
+        updated_at=500,
+    )
+    await store.reconcile("alice", "note", {"1": "hybrid"}, started_at=1000)
+
+    etag, _mode, chunk_count, updated_at = (await _rows(store))["1"]
+    assert (etag, chunk_count, updated_at) == ("abc", 3, 500)
+
+
+async def test_reconcile_handles_more_rows_than_one_batch(store):
+    indexed = {str(i): "hybrid" for i in range(250)}
+    await store.reconcile("alice", "note", indexed, started_at=1000)
+    assert len(await _rows(store)) == 250
+
+    await store.reconcile("alice", "note", {"7": "hybrid"}, started_at=2000)
+    assert set(await _rows(store)) == {"7"}
@@ -0,0 +1,109 @@
+"""Unit tests for cross-document embedding micro-batching (vector/embedding_batcher.py).
+
+Concurrent callers share one provider request, each gets back exactly its own
+vectors and its share of the tokens, caps flush a batch early, and a failed
+shared request is retried per caller so one bad document doesn't fail the rest.
+"""
+
+from typing import Any
+
+import anyio
+import pytest
+
+from nextcloud_mcp_server.vector.embedding_batcher import MicroBatcher, _apportion
+
+pytestmark = pytest.mark.unit
+
+
+class FakeEmbed:
+    """Records every request; vectors echo the text so routing is checkable."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.requests: list[list[str]] = []
+        self.fail_on = fail_on
+
+    async def __call__(self, texts: list[str]) -> tuple[list[Any], int]:
+        self.requests.append(list(texts))
+        await anyio.sleep(0)
+        if self.fail_on is not None and self.fail_on in texts:
+            raise ValueError(f"cannot embed {self.fail_on!r}")
+        return [[t] for t in texts], sum(len(t) for t in texts)
+
+
+async def _gather(batcher: MicroBatcher, calls: list[list[str]]) -> list[Any]:
+    results: list[Any] = [None] * len(calls)
+
+    async def run(i: int, texts: list[str]) -> None:
+        try:
+            results[i] = await batcher.embed(texts)
+        except Exception as exc:
+            results[i] = exc
+
+    async with anyio.create_task_group() as tg:
+        for i, texts in enumerate(calls):
+            tg.start_soon(run, i, texts)
+    return results
+
+
+async def test_concurrent_callers_share_one_request(metric_sample):
+    embed = FakeEmbed()
+    batcher = MicroBatcher(
+        "dense", embed, max_texts=64, max_chars=10_000, max_wait=0.05
+    )
+    before = metric_sample(
+        "astrolabe_embedding_microbatch_callers_count", {"kind": "dense"}
+    )
+
+    results = await _gather(batcher, [["aa"], ["b", "cccc"], ["dd"]])
+
+    assert len(embed.requests) == 1
+    assert results[0] == ([["aa"]], 2)
+    assert results[1] == ([["b"], ["cccc"]], 5)
+    assert results[2] == ([["dd"]], 2)
+    after = metric_sample(
+        "astrolabe_embedding_microbatch_callers_count", {"kind": "dense"}
+    )
+    assert after - before == 1
+
+
+async def test_text_cap_flushes_before_the_deadline():
+    embed = FakeEmbed()
+    batcher = MicroBatcher("sparse", embed, max_texts=2, max_chars=10_000, max_wait=60)
+
+    with anyio.fail_after(5):
+        results = await _gather(batcher, [["a"], ["b"], ["c"], ["d"]])
+
+    assert sorted(len(r) for r in embed.requests) == [2, 2]
+    assert [r[0] for r in results] == [[["a"]], [["b"]], [["c"]], [["d"]]]
+
+
+async def test_oversized_request_skips_batching():
+    embed = FakeEmbed()
+    batcher = MicroBatcher("dense", embed, max_texts=64, max_chars=4, max_wait=60)
+
+    with anyio.fail_after(5):
+        vectors, tokens = await batcher.embed(["too long"])
+
+    assert vectors == [["too long"]]
+    assert tokens == 8
+
+
+async def test_failed_shared_request_is_retried_per_caller():
+    embed = FakeEmbed(fail_on="poison")
+    batcher = MicroBatcher(
+        "dense", embed, max_texts=64, max_chars=10_000, max_wait=0.05
+    )
+
+    results = await _gather(batcher, [["ok"], ["poison"], ["fine"]])
+
+    assert results[0] == ([["ok"]], 2)
+    assert isinstance(results[1], ValueError)
+    assert results[2] == ([["fine"]], 4)
+    # One shared attempt, then one request per caller.
+    assert len(embed.requests) == 4
+
+
+def test_apportion_sums_to_total():
+    assert _apportion(10, [1, 1, 1]) == [4, 3, 3]
+    assert sum(_apportion(7, [5, 0, 2])) == 7
+    assert _apportion(5, [0, 0]) == [2, 3]
@@ -0,0 +1,190 @@
+"""Unit tests for content-addressed embedding reuse (vector/embedding_cache.py).
+
+Re-indexing an edited document should only embed the chunks whose text changed.
+These cover the two resolution tiers (the document's stored points, then the
+process LRU), the byte bound on the LRU, and the prior-points scroll — including
+points written before ``chunk_hash`` existed and vectors from another model.
+"""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from qdrant_client.models import SparseVector
+
+from nextcloud_mcp_server.vector import payload_keys
+from nextcloud_mcp_server.vector.embedding_cache import (
+    DENSE,
+    SPARSE,
+    SPARSE_IDENTITY,
+    EmbeddingCache,
+    PriorVectors,
+    chunk_hash,
+    load_prior_vectors,
+)
+
+pytestmark = pytest.mark.unit
+
+IDENTITY = "text-embedding-3-small"
+
+
+def test_lookup_misses_then_hits_after_fill(metric_sample):
+    cache = EmbeddingCache(max_bytes=1024 * 1024)
+    before = metric_sample(
+        "astrolabe_embedding_cache_chunks_total", {"kind": DENSE, "source": "memory"}
+    )
+
+    first = cache.lookup(DENSE, IDENTITY, ["alpha", "beta"])
+    assert first.missing == [0, 1]
+    assert first.fill([[0.5, 0.25], [1.0, 0.0]]) == [[0.5, 0.25], [1.0, 0.0]]
+
+    second = cache.lookup(DENSE, IDENTITY, ["beta", "gamma", "alpha"])
+    assert second.missing == [1]
+    assert second.missing_texts == ["gamma"]
+    assert second.vectors[0] == [1.0, 0.0]
+    assert second.vectors[2] == [0.5, 0.25]
+    after = metric_sample(
+        "astrolabe_embedding_cache_chunks_total", {"kind": DENSE, "source": "memory"}
+    )
+    assert after - before == 2
+
+
+def test_identity_is_part_of_the_key():
+    """A model (or Matryoshka width) switch must never reuse the old vectors."""
+    cache = EmbeddingCache(max_bytes=1024 * 1024)
+    cache.lookup(DENSE, IDENTITY, ["alpha"]).fill([[0.5]])
+
+    assert cache.lookup(DENSE, "mistral-embed", ["alpha"]).missing == [0]
+    assert cache.lookup(DENSE, f"{IDENTITY}-256", ["alpha"]).missing == [0]
+
+
+def test_prior_points_resolve_before_the_process_cache():
+    cache = EmbeddingCache(max_bytes=1024 * 1024)
+    prior = PriorVectors(
+        dense={chunk_hash("alpha"): [0.75]},
+        sparse={chunk_hash("alpha"): {"indices": [3], "values": [1.5]}},
+    )
+
+    dense = cache.lookup(DENSE, IDENTITY, ["alpha", "beta"], prior)
+    sparse = cache.lookup(SPARSE, SPARSE_IDENTITY, ["alpha"], prior)
+
+    assert dense.missing == [1]
+    assert dense.vectors[0] == [0.75]
+    assert sparse.missing == []
+    assert sparse.vectors[0] == {"indices": [3], "values": [1.5]}
+    # Promoted into the LRU, so a retry after the prior points are gone hits.
+    assert cache.lookup(DENSE, IDENTITY, ["alpha"]).missing == []
+
+
+def test_fill_rejects_a_short_provider_response():
+    cache = EmbeddingCache(max_bytes=1024 * 1024)
+    lookup = cache.lookup(DENSE, IDENTITY, ["alpha", "beta"])
+
+    with pytest.raises(ValueError, match="Expected 2 dense vectors, got 1"):
+        lookup.fill([[0.5]])
+
+
+def test_lru_evicts_least_recently_used_within_byte_budget():
+    # Each 256-dim float32 vector is 1 KiB plus the fixed entry overhead, so a
+    # 2.5 KiB budget holds exactly two.
+    cache = EmbeddingCache(max_bytes=2560)
+    vector = [0.1] * 256
+    cache.put(DENSE, IDENTITY, "a", vector)
+    cache.put(DENSE, IDENTITY, "b", vector)
+    cache.get(DENSE, IDENTITY, "a")  # touch: "b" is now least recently used
+    cache.put(DENSE, IDENTITY, "c", vector)
+
+    assert len(cache) == 2
+    assert cache.size_bytes <= cache.max_bytes
+    assert cache.get(DENSE, IDENTITY, "b") is None
+    assert cache.get(DENSE, IDENTITY, "a") is not None
+    assert cache.get(DENSE, IDENTITY, "c") is not None
+
+
+def test_zero_budget_disables_the_process_tier():
+    cache = EmbeddingCache(max_bytes=0)
+    cache.lookup(DENSE, IDENTITY, ["alpha"]).fill([[0.5]])
+
+    assert len(cache) == 0
+    assert cache.lookup(DENSE, IDENTITY, ["alpha"]).missing == [0]
+
+
+def _record(payload: dict[str, Any], vector: dict[str, Any]) -> SimpleNamespace:
+    return SimpleNamespace(payload=payload, vector=vector)
+
+
+def _paged_client(pages: list[list[Any]]) -> SimpleNamespace:
+    calls: list[dict[str, Any]] = []
+
+    async def scroll(**kwargs: Any):
+        calls.append(kwargs)
+        index = kwargs.get("offset") or 0
+        next_offset = index + 1 if index + 1 < len(pages) else None
+        return pages[index], next_offset
+
+    return SimpleNamespace(scroll=scroll, calls=calls)
+
+
+async def test_load_prior_vectors_keys_on_hash_and_gates_dense_on_identity():
+    sparse = SparseVector(indices=[1, 7], values=[0.5, 2.0])
+    client = _paged_client(
+        [
+            [
+                _record(
+                    {
+                        payload_keys.CHUNK_HASH: "h-new",
+                        payload_keys.EMBEDDING_IDENTITY: IDENTITY,
+                    },
+                    {"dense": [0.1, 0.2], "sparse": sparse},
+                ),
+            ],
+            [
+                # Indexed before chunk_hash existed: keyed on its excerpt.
+                _record(
+                    {
+                        "excerpt": "legacy text",
+                        payload_keys.EMBEDDING_IDENTITY: IDENTITY,
+                    },
+                    {"dense": [0.3, 0.4], "sparse": sparse},
+                ),
+                # Embedded by another model: sparse reusable, dense is not.
+                _record(
+                    {
+                        payload_keys.CHUNK_HASH: "h-old-model",
+                        payload_keys.EMBEDDING_IDENTITY: "nomic-embed-text",
+                    },
+                    {"dense": [9.0, 9.0], "sparse": sparse},
+                ),
+                # Keyword (sparse-only) point.
+                _record(
+                    {
+                        payload_keys.CHUNK_HASH: "h-keyword",
+                        payload_keys.EMBEDDING_IDENTITY: IDENTITY,
+                    },
+                    {"sparse": sparse},
+                ),
+            ],
+        ]
+    )
+
+    prior = await load_prior_vectors(
+        client,  # ty: ignore[invalid-argument-type]
+        collection_name="col",
+        doc_id="42",
+        doc_type="note",
+        embedding_identity=IDENTITY,
+    )
+
+    assert prior.dense == {
+        "h-new": [0.1, 0.2],
+        chunk_hash("legacy text"): [0.3, 0.4],
+    }
+    assert set(prior.sparse) == {
+        "h-new",
+        chunk_hash("legacy text"),
+        "h-old-model",
+        "h-keyword",
+    }
+    assert prior.sparse["h-new"] == {"indices": [1, 7], "values": [0.5, 2.0]}
+    assert len(client.calls) == 2
+    assert all(call["with_vectors"] is True for call in client.calls)
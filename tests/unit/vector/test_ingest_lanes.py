@@ -0,0 +1,133 @@
+"""Unit tests for the ingest lanes and their fair-share ordering."""
+
+import time
+
+import pytest
+
+from nextcloud_mcp_server.vector.queue.lanes import (
+    INGEST_LANE_BACKFILL,
+    INGEST_LANE_INTERACTIVE,
+    FairShareClock,
+    LaneScheduler,
+    lane_for_task,
+    lane_ticks,
+    wait_histogram,
+)
+from nextcloud_mcp_server.vector.scanner import DocumentTask
+
+pytestmark = pytest.mark.unit
+
+_NOW = int(time.time())
+
+
+def _task(user_id: str, doc_id: str, *, age: int = 10**8, operation="index"):
+    return DocumentTask(
+        user_id=user_id,
+        doc_id=doc_id,
+        doc_type="file",
+        operation=operation,
+        modified_at=_NOW - age,
+    )
+
+
+def _drain(scheduler: LaneScheduler) -> list[str]:
+    return [scheduler.pop().doc_id for _ in range(len(scheduler))]
+
+
+class TestLaneForTask:
+    def test_recent_edit_is_interactive(self):
+        task = _task("u", "1", age=60)
+        assert (
+            lane_for_task(task, interactive_window=3600, now=_NOW)
+            == INGEST_LANE_INTERACTIVE
+        )
+
+    def test_old_document_is_backfill(self):
+        task = _task("u", "1", age=7200)
+        assert (
+            lane_for_task(task, interactive_window=3600, now=_NOW)
+            == INGEST_LANE_BACKFILL
+        )
+
+    def test_delete_is_interactive_whatever_its_age(self):
+        task = _task("u", "1", operation="delete")
+        assert (
+            lane_for_task(task, interactive_window=3600, now=_NOW)
+            == INGEST_LANE_INTERACTIVE
+        )
+
+
+def test_lane_ticks_scale_with_weight():
+    assert lane_ticks({"interactive": 10, "backfill": 1}) == {
+        "interactive": 1,
+        "backfill": 10,
+    }
+    assert lane_ticks({"interactive": 1, "backfill": 1}) == {
+        "interactive": 1,
+        "backfill": 1,
+    }
+
+
+def test_wait_histogram_is_cumulative():
+    buckets = wait_histogram([5, 30, 100_000])
+    assert buckets["10"] == 1
+    assert buckets["60"] == 2
+    assert buckets["43200"] == 2
+    assert buckets["+Inf"] == 3
+
+
+class TestFairShareClock:
+    def test_idle_flow_restarts_from_virtual_time(self):
+        clock = FairShareClock({"backfill": 10})
+        for _ in range(100):
+            clock.stamp("backfill", "alice")
+        clock.advance(500)
+        # Bob has nothing queued: served in the next round, not after Alice's
+        # remaining 50 tasks.
+        assert clock.stamp("backfill", "bob") == 510
+        assert clock.peek("backfill", "alice") == 1010
+
+    def test_peek_does_not_take_a_turn(self):
+        clock = FairShareClock({"backfill": 10})
+        assert clock.peek("backfill", "alice") == 10
+        assert clock.peek("backfill", "alice") == 10
+        clock.commit("backfill", "alice", 10)
+        assert clock.peek("backfill", "alice") == 20
+
+
+class TestLaneScheduler:
+    def test_users_take_turns_within_a_lane(self):
+        scheduler = LaneScheduler()
+        for i in range(3):
+            scheduler.push(_task("alice", f"a{i}"))
+        scheduler.push(_task("bob", "b0"))
+        scheduler.push(_task("bob", "b1"))
+
+        assert _drain(scheduler) == ["a0", "b0", "a1", "b1", "a2"]
+
+    def test_interactive_lane_gets_its_weight_in_turns(self):
+        scheduler = LaneScheduler({"interactive": 2, "backfill": 1})
+        for i in range(4):
+            scheduler.push(_task("alice", f"old{i}"))
+        for i in range(4):
+            scheduler.push(_task("alice", f"new{i}", age=0))
+
+        assert _drain(scheduler) == [
+            "new0",
+            "old0",
+            "new1",
+            "new2",
+            "old1",
+            "new3",
+            "old2",
+            "old3",
+        ]
+
+    def test_wait_by_lane_counts_held_tasks(self):
+        scheduler = LaneScheduler()
+        scheduler.push(_task("alice", "old"))
+        scheduler.push(_task("alice", "new", age=0))
+
+        waits = scheduler.wait_by_lane()
+        assert waits[INGEST_LANE_INTERACTIVE]["+Inf"] == 1
+        assert waits[INGEST_LANE_BACKFILL]["10"] == 1
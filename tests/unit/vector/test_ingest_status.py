@@ -59,6 +59,53 @@ class TestGetIngestPending:
         assert result.pending == 0
         assert result.job_counts == {}
 
+    async def test_postgres_reports_queue_wait(self):
+        producer = AsyncMock()
+        producer.job_counts_by_queue.return_value = {"ingest-fast": {"todo": 1}}
+        wait = {"ingest-fast": {"interactive": {"10": 1, "+Inf": 1}}}
+        producer.queue_wait_by_lane.return_value = wait
+
+        result = await get_ingest_pending(
+            task_producer=producer,
+            document_receive_stream=None,
+            ingest_queue="postgres",
+        )
+        assert result.queue_wait_by_lane == wait
+
+    async def test_postgres_queue_wait_failure_keeps_counts(self):
+        producer = AsyncMock()
+        producer.job_counts_by_queue.return_value = {"ingest-fast": {"todo": 1}}
+        producer.queue_wait_by_lane.side_effect = RuntimeError("db down")
+
+        result = await get_ingest_pending(
+            task_producer=producer,
+            document_receive_stream=None,
+            ingest_queue="postgres",
+        )
+        assert result.pending == 1
+        assert result.queue_wait_by_lane is None
+
+    async def test_memory_reads_producer_queue_depth(self):
+        """The lane scheduler holds the queued tasks, not the worker stream."""
+
+        class MemoryProducer:
+            def queue_depth(self):
+                return 4
+
+            async def queue_wait_by_lane(self):
+                return {"memory": {"backfill": {"+Inf": 4}}}
+
+        stream = SimpleNamespace(
+            statistics=lambda: SimpleNamespace(current_buffer_used=0)
+        )
+        result = await get_ingest_pending(
+            task_producer=MemoryProducer(),
+            document_receive_stream=stream,
+            ingest_queue="memory",
+        )
+        assert result.pending == 4
+        assert result.queue_wait_by_lane == {"memory": {"backfill": {"+Inf": 4}}}
+
     async def test_memory_reads_stream_buffer(self):
         stream = SimpleNamespace(
             statistics=lambda: SimpleNamespace(current_buffer_used=3)
@@ -3,9 +3,11 @@
 Covers the factory's backend selection and each adapter's contract. The
 single-tenant parallelism invariant (cross-user overlap) has its own follow-up
 (Deck #197); here we only assert that ``LocalTransport.run_consumers`` starts the
-requested number of workers off the shared stream.
+requested number of workers off the shared stream, and that its lane dispatcher
+hands them work in lane/fair order.
 """
 
+import time
 from types import SimpleNamespace
 from typing import cast
 from unittest.mock import AsyncMock
@@ -37,9 +39,25 @@ def _settings(**kwargs) -> Settings:
     return cast(Settings, SimpleNamespace(**kwargs))
 
 
+def _task(user_id: str, doc_id: str, modified_at: int = 0) -> DocumentTask:
+    return DocumentTask(
+        user_id=user_id,
+        doc_id=doc_id,
+        doc_type="note",
+        operation="index",
+        modified_at=modified_at,
+    )
+
+
 class TestBuildTransport:
     async def test_memory_returns_local_transport(self):
-        settings = _settings(ingest_queue="memory", vector_sync_queue_max_size=7)
+        settings = _settings(
+            ingest_queue="memory",
+            vector_sync_queue_max_size=7,
+            ingest_interactive_lane_weight=10,
+            ingest_backfill_lane_weight=1,
+            ingest_interactive_window_seconds=86400,
+        )
         transport = await build_transport(settings)
 
         assert isinstance(transport, LocalTransport)
@@ -88,6 +106,8 @@ class TestLocalTransport:
 
         async with anyio.create_task_group() as tg:
             await transport.run_consumers(tg, fake_worker, 3)
+            # Stops the lane dispatcher, which run_consumers started in tg.
+            await transport.aclose()
 
         assert sorted(started) == [0, 1, 2]
         assert transport.active_consumer_count == 3
@@ -104,18 +124,61 @@ class TestLocalTransport:
         # The send end is closed → the producer raises rather than silently
         # dropping (the producer wraps the same stream aclose() closed).
         with pytest.raises(anyio.ClosedResourceError):
-            await transport.producer.send(
-                DocumentTask(
-                    user_id="u",
-                    doc_id="1",
-                    doc_type="note",
-                    operation="index",
-                    modified_at=0,
-                )
-            )
+            await transport.producer.send(_task("u", "1"))
         # Idempotent: closing again is a no-op, not an error.
         await transport.aclose()
 
+    async def test_dispatch_puts_recent_edits_ahead_and_round_robins_users(self):
+        transport = LocalTransport(max_buffer_size=100)
+        gate = anyio.Event()
+        received: list[str] = []
+
+        async def worker(
+            worker_id, receive_stream, *, task_status=anyio.TASK_STATUS_IGNORED
+        ):
+            task_status.started()
+            await gate.wait()
+            async with receive_stream:
+                async for task in receive_stream:
+                    received.append(task.doc_id)
+
+        async with anyio.create_task_group() as tg:
+            await transport.run_consumers(tg, worker, 1)
+            producer = transport.producer
+            for doc_id in ("a1", "a2", "a3"):
+                await producer.send(_task("alice", doc_id))
+            for doc_id in ("b1", "b2", "b3"):
+                await producer.send(_task("bob", doc_id))
+            await producer.send(_task("carol", "c1", modified_at=int(time.time())))
+            await anyio.wait_all_tasks_blocked()
+            # a1 was already waiting for a worker; the rest are queued.
+            assert transport.producer.queue_depth() == 6
+            gate.set()
+            # Closing the only send handle ends the workers' stream once the
+            # dispatcher has drained the queue.
+            await transport.send_stream.aclose()
+
+        # The fresh edit overtakes the backfill, which alternates between users.
+        assert received == ["a1", "c1", "a2", "b1", "a3", "b2", "b3"]
+
+    async def test_full_queue_blocks_the_sender(self):
+        transport = LocalTransport(max_buffer_size=2)
+
+        async def idle_worker(
+            worker_id, receive_stream, *, task_status=anyio.TASK_STATUS_IGNORED
+        ):
+            task_status.started()
+
+        async with anyio.create_task_group() as tg:
+            await transport.run_consumers(tg, idle_worker, 1)
+            # One held by the dispatcher + two queued; the fourth must wait.
+            for doc_id in ("1", "2", "3"):
+                await transport.producer.send(_task("u", doc_id))
+            with anyio.move_on_after(0.1) as scope:
+                await transport.producer.send(_task("u", "4"))
+            assert scope.cancelled_caught
+            await transport.aclose()
+
 
 class TestDistributedTransport:
     async def test_run_consumers_is_noop(self):
@@ -0,0 +1,151 @@
+"""Unit tests for the disk-backed parse-result cache (vector/parse_cache.py).
+
+A retry of the same document version must get its parse back from disk instead
+of re-running the tiers; anything that changes what a parse would return -- the
+etag, the tier, the parse settings -- must miss.
+"""
+
+import os
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nextcloud_mcp_server.config import Settings
+from nextcloud_mcp_server.document_processors.base import ProcessingResult
+from nextcloud_mcp_server.document_processors.escalation import EscalateError
+from nextcloud_mcp_server.document_processors.ocr import OCR_BATCH_PENDING_KEY
+from nextcloud_mcp_server.document_processors.source import MemoryDocumentSource
+from nextcloud_mcp_server.vector import parse_cache, processor
+from nextcloud_mcp_server.vector.parse_cache import (
+    ParseResultCache,
+    parse_cache_key,
+)
+from nextcloud_mcp_server.vector.scanner import DocumentTask
+
+pytestmark = pytest.mark.unit
+
+
+def _result(text: str = "page one text", **metadata) -> ProcessingResult:
+    metadata.setdefault(
+        "page_boundaries", [{"page": 1, "start_offset": 0, "end_offset": len(text)}]
+    )
+    return ProcessingResult(text=text, metadata=metadata, processor="ocr")
+
+
+def _key(**overrides) -> str:
+    values = {
+        "doc_type": "file",
+        "doc_id": "42",
+        "version": "etag-1",
+        "content_type": "application/pdf",
+        "tier": "ocr",
+    }
+    values.update(overrides)
+    return parse_cache_key(**values)
+
+
+def _task(etag: str | None = "etag-1") -> DocumentTask:
+    return DocumentTask(
+        user_id="alice",
+        doc_id="42",
+        doc_type="file",
+        operation="index",
+        modified_at=0,
+        file_path="/scan.pdf",
+        etag=etag,
+    )
+
+
+def test_round_trip_keeps_text_and_geometry(tmp_path):
+    cache = ParseResultCache(tmp_path, max_bytes=1024 * 1024)
+    spans = [{"bbox": [0.1, 0.2, 0.3, 0.4], "start_offset": 0, "end_offset": 4}]
+    cache.put(_key(), _result(ocr_block_spans=spans))
+
+    hit = cache.get(_key())
+
+    assert hit == _result(ocr_block_spans=spans)
+
+
+def test_failed_and_pending_results_are_not_stored(tmp_path):
+    cache = ParseResultCache(tmp_path, max_bytes=1024 * 1024)
+    failed = ProcessingResult(text="", metadata={}, processor="ocr", success=False)
+    cache.put(_key(), failed)
+    cache.put(_key(tier="fast"), _result(**{OCR_BATCH_PENDING_KEY: True}))
+
+    assert cache.get(_key()) is None
+    assert cache.get(_key(tier="fast")) is None
+
+
+def test_key_tracks_version_tier_and_parse_settings(monkeypatch):
+    base = _key()
+
+    assert _key(version="etag-2") != base
+    assert _key(tier="structured") != base
+    assert _key(tier=None) != base
+    monkeypatch.setattr(
+        parse_cache, "get_settings", lambda: Settings(document_ocr_enabled=True)
+    )
+    assert _key() != base
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = ParseResultCache(tmp_path, max_bytes=1024 * 1024)
+    for n in range(3):
+        cache.put(_key(version=f"v{n}"), _result(f"document {n} " * 50))
+    for age, n in ((300, 0), (200, 1), (100, 2)):
+        path = tmp_path / f"{_key(version=f'v{n}')}.json.z"
+        os.utime(path, (path.stat().st_mtime - age,) * 2)
+    # A hit makes v0 the newest, so v1 is now the least recently used.
+    assert cache.get(_key(version="v0")) is not None
+
+    entry = (tmp_path / f"{_key(version='v0')}.json.z").stat().st_size
+    cache.max_bytes = entry * 3
+    cache.put(_key(version="v3"), _result("document 3 " * 50))
+
+    assert cache.get(_key(version="v1")) is None
+    assert cache.get(_key(version="v0")) is not None
+    assert cache.get(_key(version="v3")) is not None
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    cache = ParseResultCache(tmp_path, max_bytes=1024 * 1024)
+    path = tmp_path / f"{_key()}.json.z"
+    path.write_bytes(b"not zlib")
+
+    assert cache.get(_key()) is None
+    assert not path.exists()
+
+
+async def test_retry_reuses_the_parse():
+    source = MemoryDocumentSource(b"%PDF-1.7", "application/pdf", "/scan.pdf")
+    parse = AsyncMock(return_value=_result())
+
+    first = await processor._parse_cached(_task(), source, "ocr", parse)
+    second = await processor._parse_cached(_task(), source, "ocr", parse)
+
+    assert parse.await_count == 1
+    assert second == first
+
+
+async def test_without_etag_the_content_is_the_version():
+    parse = AsyncMock(return_value=_result())
+
+    for content in (b"%PDF-1.7 a", b"%PDF-1.7 a", b"%PDF-1.7 b"):
+        source = MemoryDocumentSource(content, "application/pdf", "/scan.pdf")
+        await processor._parse_cached(_task(etag=None), source, None, parse)
+
+    assert parse.await_count == 2
+
+
+async def test_escalated_parse_is_not_cached():
+    source = MemoryDocumentSource(b"%PDF-1.7", "application/pdf", "/scan.pdf")
+    escalate = AsyncMock(
+        side_effect=EscalateError(from_tier="fast", to_tier="ocr", reason="empty_text")
+    )
+
+    with pytest.raises(EscalateError):
+        await processor._parse_cached(_task(), source, "fast", escalate)
+    parse = AsyncMock(return_value=_result())
+    await processor._parse_cached(_task(), source, "fast", parse)
+
+    assert parse.await_count == 1
@@ -30,6 +30,7 @@ def _source(content: bytes = b"%PDF", filename: str = "f.pdf"):
 def _registry(result: ProcessingResult, decision):
     reg = MagicMock()
     reg.process_tier_source = AsyncMock(return_value=result)
+    reg.scan_image_coverage = AsyncMock(return_value=None)
     reg.evaluate_escalation_source = MagicMock(return_value=decision)
     return reg
 
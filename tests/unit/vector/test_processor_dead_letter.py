@@ -48,6 +48,8 @@ def _settings(*, ocr_enabled: bool) -> SimpleNamespace:
         # Also part of escalation_tiers_signature (Deck #399): changing the
         # markdown page ceiling re-drives timeout-dead-lettered documents.
         document_markdown_max_pages=150,
+        # Keeps the cross-fileid content-hash lookup out of these failure paths.
+        vector_sync_content_dedup=False,
         get_collection_name=lambda: "c",
     )
 
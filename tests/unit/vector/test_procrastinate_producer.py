@@ -4,6 +4,7 @@ Uses procrastinate's in-memory connector so no live Postgres is required.
 """
 
 import inspect
+import time
 from dataclasses import fields
 from types import SimpleNamespace
 from typing import cast
@@ -73,6 +74,49 @@ class TestProcrastinateTaskProducer:
         assert job["args"]["doc_id"] == "42"
         assert job["args"]["etag"] == "etag-abc"
 
+    async def test_send_records_lane_and_priority(self, app):
+        async with app.open_async():
+            producer = pq.ProcrastinateTaskProducer(app)
+            await producer.send(_task(doc_id="old"))
+            await producer.send(
+                DocumentTask(
+                    user_id="bob",
+                    doc_id="new",
+                    doc_type="note",
+                    operation="index",
+                    modified_at=int(time.time()),
+                )
+            )
+
+        jobs = {job["args"]["doc_id"]: job for job in app.connector.jobs.values()}
+        assert jobs["old"]["args"]["lane"] == "backfill"
+        assert jobs["new"]["args"]["lane"] == "interactive"
+        assert jobs["new"]["args"]["enqueued_at"] > 0
+        # procrastinate runs higher priorities first: the fresh edit goes ahead.
+        assert jobs["new"]["priority"] > jobs["old"]["priority"]
+
+    async def test_users_alternate_in_priority(self, app):
+        async with app.open_async():
+            producer = pq.ProcrastinateTaskProducer(app)
+            for doc_id in ("a1", "a2"):
+                await producer.send(_task(doc_id=doc_id))
+            await producer.send(
+                DocumentTask(
+                    user_id="bob",
+                    doc_id="b1",
+                    doc_type="note",
+                    operation="index",
+                    modified_at=100,
+                )
+            )
+
+        priority = {
+            job["args"]["doc_id"]: job["priority"]
+            for job in app.connector.jobs.values()
+        }
+        # Bob's first document ties with Alice's first, ahead of her second.
+        assert priority["a1"] == priority["b1"] > priority["a2"]
+
     async def test_duplicate_send_is_deduped(self, app):
         async with app.open_async():
             producer = pq.ProcrastinateTaskProducer(app)
@@ -0,0 +1,241 @@
+"""Unit tests for the multi-user scan scheduler (vector/scan_scheduler.py).
+
+Admission tests hold the only slot and queue scanners behind it to check the
+lane order. Cadence tests drive a fake clock, so the adaptive interval and
+jitter arithmetic is checked without sleeping.
+"""
+
+import random
+
+import anyio
+import pytest
+
+from nextcloud_mcp_server.vector.scan_scheduler import ScanLane, ScanScheduler
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(**overrides) -> ScanScheduler:
+    kwargs = {
+        "max_concurrent": 1,
+        "base_interval": 300,
+        "min_interval": 60,
+        "max_interval": 1800,
+        "jitter": 0.0,
+    }
+    kwargs.update(overrides)
+    return ScanScheduler(**kwargs)
+
+
+async def _admission_order(
+    scheduler: ScanScheduler, users: list[str], before_release=None
+) -> list[str]:
+    """Hold the only slot as "holder", queue ``users`` behind it in order, call
+    ``before_release``, then release and return the order they were admitted."""
+    order: list[str] = []
+    holder_in = anyio.Event()
+    release = anyio.Event()
+    scheduler.register("holder", initial=True)
+
+    async def hold():
+        async with scheduler.scan_slot("holder"):
+            holder_in.set()
+            await release.wait()
+
+    async def scan(user_id):
+        async with scheduler.scan_slot(user_id):
+            order.append(user_id)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(hold)
+        await holder_in.wait()
+        for user_id in users:
+            tg.start_soon(scan, user_id)
+            await anyio.sleep(0.01)  # fix the arrival order
+        if before_release is not None:
+            before_release()
+        release.set()
+    return order
+
+
+async def test_concurrent_scans_are_capped():
+    scheduler = _scheduler(max_concurrent=2)
+    running = peak = 0
+
+    async def scan(user_id):
+        nonlocal running, peak
+        async with scheduler.scan_slot(user_id):
+            running += 1
+            peak = max(peak, running)
+            await anyio.sleep(0.02)
+            running -= 1
+
+    async with anyio.create_task_group() as tg:
+        for i in range(6):
+            scheduler.register(f"u{i}", initial=True)
+            tg.start_soon(scan, f"u{i}")
+
+    assert peak == 2
+
+
+async def test_lanes_admit_wake_then_initial_then_backstop():
+    scheduler = _scheduler()
+    scheduler.register("idle")
+    scheduler.register("new", initial=True)
+    scheduler.register("hot")
+    scheduler.wake("hot")
+
+    order = await _admission_order(scheduler, ["idle", "new", "hot"])
+    assert order == ["hot", "new", "idle"]
+
+
+async def test_wake_moves_an_already_queued_scan_up():
+    scheduler = _scheduler()
+    scheduler.register("first")
+    scheduler.register("second")
+
+    order = await _admission_order(
+        scheduler, ["first", "second"], before_release=lambda: scheduler.wake("second")
+    )
+    assert order == ["second", "first"]
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    scheduler = _scheduler()
+    for user_id in ("holder", "gone", "next"):
+        scheduler.register(user_id, initial=True)
+    admitted: list[str] = []
+    release = anyio.Event()
+
+    async def hold():
+        async with scheduler.scan_slot("holder"):
+            await release.wait()
+
+    async def scan(user_id):
+        async with scheduler.scan_slot(user_id):
+            admitted.append(user_id)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(hold)
+        await anyio.sleep(0.01)
+        async with anyio.create_task_group() as gone_tg:
+            gone_tg.start_soon(scan, "gone")
+            await anyio.sleep(0.01)
+            gone_tg.cancel_scope.cancel()
+        tg.start_soon(scan, "next")
+        await anyio.sleep(0.01)
+        release.set()
+
+    assert admitted == ["next"]
+    assert scheduler._waiters == []
+    assert scheduler._available == 1
+
+
+async def test_interval_adapts_to_change_rate():
+    clock = _Clock()
+    scheduler = _scheduler(clock=clock)
+    scheduler.register("alice", initial=True)
+
+    for expected in (150, 75, 60, 60):
+        scheduler.record_scan("alice", queued=3)
+        assert scheduler._users["alice"].interval == expected
+    for expected in (90, 135, 202.5):
+        scheduler.record_scan("alice", queued=0)
+        assert scheduler._users["alice"].interval == expected
+    for _ in range(20):
+        scheduler.record_scan("alice", queued=0)
+    assert scheduler._users["alice"].interval == 1800
+
+
+async def test_next_scan_is_jittered_around_the_interval():
+    clock = _Clock()
+    scheduler = _scheduler(clock=clock, jitter=0.1, rng=random.Random(7))
+    due_offsets = []
+    for i in range(50):
+        scheduler.register(f"u{i}", initial=True)
+        async with scheduler.scan_slot(f"u{i}"):
+            pass
+        due_offsets.append(scheduler._users[f"u{i}"].due_at - clock.now)
+
+    assert all(270 <= offset <= 330 for offset in due_offsets)
+    assert len(set(due_offsets)) > 1
+
+
+async def test_startup_users_are_spread_over_the_first_jitter_window():
+    clock = _Clock()
+    scheduler = _scheduler(clock=clock, jitter=0.1, rng=random.Random(7))
+    for i in range(50):
+        scheduler.register(f"u{i}")
+
+    offsets = [state.due_at - clock.now for state in scheduler._users.values()]
+    assert all(0 <= offset <= 30 for offset in offsets)
+    assert {state.lane for state in scheduler._users.values()} == {ScanLane.BACKSTOP}
+
+
+async def test_wake_waits_out_the_minimum_interval():
+    clock = _Clock()
+    scheduler = _scheduler(clock=clock)
+    scheduler.register("alice", initial=True)
+    async with scheduler.scan_slot("alice"):
+        pass
+
+    clock.now += 10
+    assert scheduler.wake("alice")
+    state = scheduler._users["alice"]
+    assert state.due_at == 1000 + 60
+    assert state.lane is ScanLane.WAKE
+
+
+async def test_wake_during_a_scan_is_kept_for_the_next_one():
+    clock = _Clock()
+    scheduler = _scheduler(clock=clock)
+    scheduler.register("alice", initial=True)
+    async with scheduler.scan_slot("alice"):
+        clock.now += 5
+        scheduler.wake("alice")
+
+    state = scheduler._users["alice"]
+    assert state.due_at == 1000 + 60  # not the 300s interval
+    assert state.lane is ScanLane.WAKE
+
+
+async def test_wake_for_unknown_user_is_ignored():
+    assert not _scheduler().wake("nobody")
+
+
+async def test_wait_until_due_returns_on_wake():
+    scheduler = _scheduler(min_interval=0.01)
+    scheduler.register("alice", initial=True)
+    async with scheduler.scan_slot("alice"):
+        pass  # next scan due in 300s
+
+    woke = anyio.Event()
+
+    async def sleeper():
+        await scheduler.wait_until_due("alice")
+        woke.set()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(sleeper)
+        await anyio.sleep(0.05)
+        assert not woke.is_set()
+        scheduler.wake("alice")
+        with anyio.fail_after(1):
+            await woke.wait()
+
+
+async def test_unregister_forgets_the_user():
+    scheduler = _scheduler()
+    scheduler.register("alice")
+    scheduler.unregister("alice")
+
+    assert not scheduler.is_registered("alice")
+    assert not scheduler.wake("alice")
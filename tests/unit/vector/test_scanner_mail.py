@@ -46,7 +46,11 @@ def _patch_incremental(mocker, *, indexed_ids, existing_metadata, interval=1):
     mocker.patch.object(
         scanner_module,
         "get_settings",
-        return_value=MagicMock(vector_sync_scan_interval=interval),
+        # Manifest disabled so deletion tracking reads the patched scroll.
+        return_value=MagicMock(
+            vector_sync_scan_interval=interval,
+            vector_sync_manifest_reconcile_interval=0,
+        ),
     )
 
 
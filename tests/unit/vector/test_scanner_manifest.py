@@ -0,0 +1,156 @@
+"""Unit tests for the scanner's manifest-backed deletion tracking.
+
+``_indexed_doc_ids`` / ``_indexed_files_by_mode`` read a user's indexed doc_ids
+from the document manifest while it is trusted, and otherwise scroll Qdrant and
+reconcile the manifest from the result. Backed by a real temp-SQLite manifest
+and a fake paged Qdrant client.
+"""
+
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from nextcloud_mcp_server.auth.storage import RefreshTokenStorage
+from nextcloud_mcp_server.vector import payload_keys
+from nextcloud_mcp_server.vector import scanner as scanner_module
+from nextcloud_mcp_server.vector.document_manifest_store import DocumentManifestStore
+from nextcloud_mcp_server.vector.processor import _record_manifest_entry
+from nextcloud_mcp_server.vector.scanner import (
+    DocumentTask,
+    _indexed_doc_ids,
+    _indexed_files_by_mode,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def store(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = RefreshTokenStorage(db_path=str(Path(tmp) / "manifest.db"))
+        await storage.initialize()
+        manifest = DocumentManifestStore(storage)
+        monkeypatch.setattr(
+            DocumentManifestStore, "shared", AsyncMock(return_value=manifest)
+        )
+        yield manifest
+
+
+def _settings(monkeypatch, interval: int = 86400) -> None:
+    monkeypatch.setattr(
+        scanner_module,
+        "get_settings",
+        lambda: SimpleNamespace(
+            get_collection_name=lambda: "c",
+            vector_sync_manifest_reconcile_interval=interval,
+        ),
+    )
+
+
+def _client(payloads: list[dict[str, Any]]) -> SimpleNamespace:
+    """Fake AsyncQdrantClient returning ``payloads`` as one scroll page."""
+    scroll = AsyncMock(
+        return_value=([SimpleNamespace(payload=p) for p in payloads], None)
+    )
+    return SimpleNamespace(scroll=scroll)
+
+
+async def test_first_scan_scrolls_and_seeds_the_manifest(store, monkeypatch):
+    _settings(monkeypatch)
+    client = _client([{"doc_id": "1"}, {"doc_id": "2"}])
+
+    assert await _indexed_doc_ids(client, "alice", "note") == {"1", "2"}
+    client.scroll.assert_awaited_once()
+    assert await store.get_index_modes("alice", "note", max_age=60) == {
+        "1": "hybrid",
+        "2": "hybrid",
+    }
+
+
+async def test_reconciled_manifest_replaces_the_scroll(store, monkeypatch):
+    _settings(monkeypatch)
+    client = _client([{"doc_id": "1"}])
+    await _indexed_doc_ids(client, "alice", "note")
+
+    # The processor indexes note 3 and releases note 1 between scans.
+    await store.upsert(user_id="alice", doc_type="note", doc_id="3")
+    await store.delete(user_id="alice", doc_type="note", doc_id="1")
+
+    assert await _indexed_doc_ids(client, "alice", "note") == {"3"}
+    client.scroll.assert_awaited_once()
+
+
+async def test_zero_interval_always_scrolls(store, monkeypatch):
+    _settings(monkeypatch, interval=0)
+    client = _client([{"doc_id": "1"}])
+
+    await _indexed_doc_ids(client, "alice", "note")
+    await _indexed_doc_ids(client, "alice", "note")
+
+    assert client.scroll.await_count == 2
+    assert await store.get_index_modes("alice", "note", max_age=60) is None
+
+
+async def test_manifest_failure_falls_back_to_the_scroll(monkeypatch):
+    _settings(monkeypatch)
+    monkeypatch.setattr(
+        DocumentManifestStore, "shared", AsyncMock(side_effect=RuntimeError("db"))
+    )
+    client = _client([{"doc_id": "1"}])
+
+    assert await _indexed_doc_ids(client, "alice", "note") == {"1"}
+
+
+async def test_files_are_bucketed_by_index_mode(store, monkeypatch):
+    _settings(monkeypatch)
+    client = _client(
+        [
+            {"doc_id": "1", payload_keys.INDEX_MODE: payload_keys.INDEX_MODE_KEYWORD},
+            {"doc_id": "1", payload_keys.INDEX_MODE: payload_keys.INDEX_MODE_KEYWORD},
+            # Pre-INDEX_MODE point: hybrid.
+            {"doc_id": "2"},
+        ]
+    )
+    expected = {
+        payload_keys.INDEX_MODE_KEYWORD: {"1"},
+        payload_keys.INDEX_MODE_HYBRID: {"2"},
+    }
+
+    assert await _indexed_files_by_mode(client, "alice") == expected
+    # The second scan reads the same buckets from the manifest.
+    assert await _indexed_files_by_mode(client, "alice") == expected
+    client.scroll.assert_awaited_once()
+
+
+async def test_shared_file_is_tracked_for_every_principal(store, monkeypatch):
+    """A file indexed by a reader who is not its owner still lands in the
+    owner's (and earlier claimers') manifests, as the acl_principals scroll
+    the manifest replaces would have found it."""
+    _settings(monkeypatch)
+    client = _client([])
+    for user in ("alice", "bob", "carol"):
+        assert await _indexed_files_by_mode(client, user) == {}
+
+    await _record_manifest_entry(
+        DocumentTask(
+            user_id="bob",
+            doc_id="7",
+            doc_type="file",
+            operation="index",
+            modified_at=1,
+            owner_id="alice",
+        ),
+        etag="e1",
+        chunk_count=3,
+        acl_principals=["user:alice", "user:bob", "user:carol"],
+    )
+
+    for user in ("alice", "bob", "carol"):
+        assert await _indexed_files_by_mode(client, user) == {
+            payload_keys.INDEX_MODE_HYBRID: {"7"}
+        }
+    assert client.scroll.await_count == 3  # only the seeding scans scrolled
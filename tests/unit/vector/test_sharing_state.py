@@ -92,6 +92,93 @@ class TestFindIndexedContent:
         client.scroll.assert_not_called()
 
 
+def _record(index: int, **payload) -> SimpleNamespace:
+    """A scrolled chunk point with vectors, as clone_indexed_content reads it."""
+    return SimpleNamespace(
+        id=f"src-{index}",
+        payload={"chunk_index": index, "doc_id": "7", **payload},
+        vector={"dense": [0.1, 0.2], "sparse": {"indices": [1], "values": [0.5]}},
+    )
+
+
+_SOURCE = {
+    "doc_id": "7",
+    "total_chunks": 2,
+    payload_keys.CONTENT_HASH: "sha256:abc",
+    payload_keys.EMBEDDING_IDENTITY: _MODEL,
+}
+
+
+class TestFindIdenticalContent:
+    async def test_matches_hash_on_another_file(self, client) -> None:
+        client.scroll.return_value = ([_point(_SOURCE)], None)
+
+        assert await ss.find_identical_content("sha256:abc", "42", _MODEL) == _SOURCE
+        flt = client.scroll.await_args.kwargs["scroll_filter"]
+        assert _must_keys(flt) == [
+            payload_keys.CONTENT_HASH,
+            "doc_type",
+            "is_placeholder",
+        ]
+        # The document's own points are never their own dedup source.
+        assert [c.key for c in flt.must_not] == ["doc_id"]
+
+    async def test_none_on_embedding_model_mismatch(self, client) -> None:
+        client.scroll.return_value = (
+            [_point({**_SOURCE, payload_keys.EMBEDDING_IDENTITY: "other-model"})],
+            None,
+        )
+        assert await ss.find_identical_content("sha256:abc", "42", _MODEL) is None
+
+    async def test_hybrid_claim_misses_keyword_source(self, client) -> None:
+        keyword = {**_SOURCE, payload_keys.INDEX_MODE: payload_keys.INDEX_MODE_KEYWORD}
+        client.scroll.return_value = ([_point(keyword)], None)
+        assert await ss.find_identical_content("sha256:abc", "42", _MODEL) is None
+
+
+class TestCloneIndexedContent:
+    async def test_copies_every_chunk_under_new_ids(self, client) -> None:
+        client.count.return_value = SimpleNamespace(count=2)
+        client.scroll.return_value = (
+            [_record(0, title="a.pdf"), _record(1, title="a.pdf")],
+            None,
+        )
+
+        copied = await ss.clone_indexed_content(
+            _SOURCE,
+            point_id=lambda i: f"new-{i}",
+            overrides={"doc_id": "42", "title": "b.pdf"},
+        )
+
+        assert copied == 2
+        points = client.upsert.await_args.kwargs["points"]
+        assert [p.id for p in points] == ["new-0", "new-1"]
+        assert {p.payload["doc_id"] for p in points} == {"42"}
+        assert {p.payload["title"] for p in points} == {"b.pdf"}
+        assert "dense" in points[0].vector
+
+    async def test_keyword_copy_drops_the_dense_vector(self, client) -> None:
+        client.count.return_value = SimpleNamespace(count=2)
+        client.scroll.return_value = ([_record(0), _record(1)], None)
+
+        await ss.clone_indexed_content(
+            _SOURCE, point_id=str, overrides={}, keep_dense=False
+        )
+
+        points = client.upsert.await_args.kwargs["points"]
+        assert all(set(p.vector) == {"sparse"} for p in points)
+
+    async def test_incomplete_source_is_not_copied(self, client) -> None:
+        # Still being written window by window: fewer points than total_chunks.
+        client.count.return_value = SimpleNamespace(count=1)
+
+        assert (
+            await ss.clone_indexed_content(_SOURCE, point_id=str, overrides={}) is None
+        )
+        client.scroll.assert_not_called()
+        client.upsert.assert_not_called()
+
+
 class TestAddPrincipal:
     async def test_noop_when_principal_already_present(self, client) -> None:
         added = await ss.add_principal("42", "file", "alice", ["user:alice"])
@@ -73,6 +73,17 @@ async def test_provision_signal_rearms_for_next_cycle():
 # ── user_manager_task wake-on-provision ──────────────────────────────────────
 
 
+def _settings() -> MagicMock:
+    settings = MagicMock()
+    settings.vector_sync_user_poll_interval = 1000
+    settings.vector_sync_max_concurrent_scans = 4
+    settings.vector_sync_scan_interval = 300
+    settings.vector_sync_scan_interval_min = 60
+    settings.vector_sync_scan_interval_max = 1800
+    settings.vector_sync_scan_jitter = 0.1
+    return settings
+
+
 class _FakeStorage:
     """Storage stub whose provisioned-user set the test mutates between polls."""
 
@@ -87,8 +98,7 @@ async def test_user_manager_wakes_on_provision_signal(mocker):
     """Ringing the signal makes the manager re-poll and spawn the new user's
     scanner well before the (long) poll interval elapses."""
     # Long poll interval so any prompt spawn proves it was the signal, not poll.
-    settings = MagicMock()
-    settings.vector_sync_user_poll_interval = 1000
+    settings = _settings()
     mocker.patch(
         "nextcloud_mcp_server.vector.oauth_sync.get_settings", return_value=settings
     )
@@ -107,6 +117,7 @@ async def test_user_manager_wakes_on_provision_signal(mocker):
         wake_event,
         nextcloud_host,
         user_states,
+        scan_scheduler,
     ):
         spawned.add(user_id)
         if user_id in spawn_events:
@@ -158,8 +169,7 @@ async def test_user_manager_wakes_on_provision_signal(mocker):
 async def test_user_manager_shutdown_still_breaks_sleep(mocker):
     """Setting shutdown wakes the manager out of its sleep promptly even with a
     long poll interval (the doorbell race must not regress shutdown latency)."""
-    settings = MagicMock()
-    settings.vector_sync_user_poll_interval = 1000
+    settings = _settings()
     mocker.patch(
         "nextcloud_mcp_server.vector.oauth_sync.get_settings", return_value=settings
     )
@@ -0,0 +1,199 @@
+"""Unit tests for the webhook debounce buffer (vector/webhook_coalescer.py).
+
+A fake clock drives the debounce arithmetic and ``flush()`` is called directly,
+so nothing sleeps; the producer records what it was sent.
+"""
+
+import pytest
+
+from nextcloud_mcp_server.vector.scanner import DocumentTask
+from nextcloud_mcp_server.vector.webhook_coalescer import WebhookCoalescer
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Producer:
+    def __init__(self, fail: bool = False) -> None:
+        self.sent: list[DocumentTask] = []
+        self.fail = fail
+
+    async def send(self, task: DocumentTask) -> None:
+        if self.fail:
+            raise RuntimeError("queue closed")
+        self.sent.append(task)
+
+    def clone(self) -> "_Producer":
+        return self
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _task(doc_id="1", operation="index", doc_type="note", user_id="alice", mtime=0):
+    return DocumentTask(
+        user_id=user_id,
+        doc_id=doc_id,
+        doc_type=doc_type,
+        operation=operation,
+        modified_at=mtime,
+    )
+
+
+def _coalescer(producer, clock, **overrides) -> WebhookCoalescer:
+    kwargs = {
+        "window": 2.0,
+        "max_delay": 30.0,
+        "max_pending": 100,
+        "folder_batch": 3,
+        "clock": clock,
+    }
+    kwargs.update(overrides)
+    return WebhookCoalescer(producer, **kwargs)
+
+
+async def test_task_is_held_until_the_window_closes():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock)
+    assert coalescer.submit(_task())
+
+    clock.now += 1.9
+    assert await coalescer.flush() == 0
+    clock.now += 0.1
+    assert await coalescer.flush() == 1
+    assert coalescer.pending == 0
+
+
+async def test_burst_for_one_document_sends_the_last_task():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock)
+    for mtime in range(5):
+        coalescer.submit(_task(mtime=mtime))
+        clock.now += 1
+
+    clock.now += 2
+    await coalescer.flush()
+    assert [task.modified_at for task in producer.sent] == [4]
+
+
+async def test_index_after_a_buffered_delete_wins():
+    """Restoring from the trash (or a Deck undo) brings the document back
+    under its old id, so the re-index must not be dropped."""
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock)
+    coalescer.submit(_task(operation="delete"))
+    coalescer.submit(_task(operation="index", mtime=5))
+
+    await coalescer.flush(force=True)
+    assert [(task.operation, task.modified_at) for task in producer.sent] == [
+        ("index", 5)
+    ]
+
+
+async def test_index_then_delete_sends_the_delete():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock)
+    coalescer.submit(_task(operation="index"))
+    coalescer.submit(_task(operation="delete"))
+
+    await coalescer.flush(force=True)
+    assert [task.operation for task in producer.sent] == ["delete"]
+
+
+async def test_documents_are_keyed_by_user_and_type():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock)
+    coalescer.submit(_task(user_id="alice"))
+    coalescer.submit(_task(user_id="bob"))
+    coalescer.submit(_task(doc_type="deck_card"))
+
+    assert coalescer.pending == 3
+
+
+async def test_max_delay_bounds_a_continuously_saved_document():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock, max_delay=10.0)
+    for _ in range(10):
+        coalescer.submit(_task())
+        clock.now += 1
+        await coalescer.flush()
+
+    assert len(producer.sent) == 1
+
+
+async def test_folder_activity_holds_back_its_files():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock, folder_batch=0)
+    coalescer.submit(_task("a", doc_type="file"), folder="/alice/files/Docs")
+    clock.now += 1.5
+    coalescer.submit(_task("b", doc_type="file"), folder="/alice/files/Docs")
+
+    clock.now += 1.0  # "a" has been quiet for 2.5s, but its folder has not
+    assert await coalescer.flush() == 0
+    clock.now += 1.0
+    assert await coalescer.flush() == 2
+
+
+async def test_folder_burst_becomes_one_scan_wake():
+    clock, producer = _Clock(), _Producer()
+    woken: list[str] = []
+    coalescer = _coalescer(
+        producer, clock, scan_waker=lambda user_id: woken.append(user_id) or True
+    )
+    for doc_id in ("a", "b", "c"):
+        coalescer.submit(_task(doc_id, doc_type="file"), folder="/alice/files/Docs")
+    coalescer.submit(
+        _task("d", doc_type="file", operation="delete"), folder="/alice/files/Docs"
+    )
+
+    await coalescer.flush(force=True)
+    assert woken == ["alice"]
+    assert [task.doc_id for task in producer.sent] == ["d"]
+
+
+async def test_folder_burst_is_sent_when_no_scanner_can_take_it():
+    for waker in (None, lambda _user_id: False):
+        clock, producer = _Clock(), _Producer()
+        coalescer = _coalescer(producer, clock, scan_waker=waker)
+        for doc_id in ("a", "b", "c"):
+            coalescer.submit(_task(doc_id, doc_type="file"), folder="/alice/files/Docs")
+
+        await coalescer.flush(force=True)
+        assert len(producer.sent) == 3
+
+
+async def test_full_buffer_refuses_new_documents():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock, max_pending=2)
+    assert coalescer.submit(_task("1"))
+    assert coalescer.submit(_task("2"))
+    assert not coalescer.submit(_task("3"))
+    # Folding into a buffered document needs no new slot.
+    assert coalescer.submit(_task("1", mtime=9))
+
+
+async def test_close_sends_the_buffer_and_refuses_new_tasks():
+    clock, producer = _Clock(), _Producer()
+    coalescer = _coalescer(producer, clock)
+    coalescer.submit(_task("1"))
+    coalescer.submit(_task("2"))
+
+    await coalescer.close()
+    assert len(producer.sent) == 2
+    assert not coalescer.submit(_task("3"))
+
+
+async def test_send_failure_drops_the_task():
+    clock, producer = _Clock(), _Producer(fail=True)
+    coalescer = _coalescer(producer, clock)
+    coalescer.submit(_task())
+
+    assert await coalescer.flush(force=True) == 0
+    assert coalescer.pending == 0